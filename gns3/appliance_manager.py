@@ -49,9 +49,10 @@ class ApplianceManager(QtCore.QObject):
             settings = LocalConfig.instance().loadSectionSettings("MainWindow", GENERAL_SETTINGS)
             symbol_theme = settings["symbol_theme"]
             if update is True:
+                self._controller.httpClient().invalidateResponseCache("/appliances")
                 self._controller.get("/appliances?update=yes&symbol_theme={}".format(symbol_theme), self._listAppliancesCallback, progressText="Downloading appliances from online registry...")
             else:
-                self._controller.get("/appliances?symbol_theme={}".format(symbol_theme), self._listAppliancesCallback)
+                self._controller.get("/appliances?symbol_theme={}".format(symbol_theme), self._listAppliancesCallback, cache=True)
 
     def _controllerDisconnectedSlot(self):
         """
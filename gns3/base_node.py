@@ -41,6 +41,8 @@ class BaseNode(QtCore.QObject):
     stopped_signal = QtCore.Signal()
     suspended_signal = QtCore.Signal()
     updated_signal = QtCore.Signal()
+    # frozenset of the changed fields (see BaseNode.CHANGES)
+    changed_signal = QtCore.Signal(object)
     loaded_signal = QtCore.Signal()
     deleted_signal = QtCore.Signal()
     error_signal = QtCore.Signal(int, str)
@@ -59,6 +61,9 @@ class BaseNode(QtCore.QObject):
     end_devices = "guest"
     security_devices = "firewall"
 
+    # fields of a change set
+    CHANGES = ("name", "status", "position", "z", "locked", "symbol", "label", "console", "ports", "properties", "links")
+
     def __init__(self, module, compute, project):
 
         super().__init__()
@@ -75,6 +80,9 @@ class BaseNode(QtCore.QObject):
         self._loading = False
         self._status = BaseNode.stopped
         self._ports = []
+        # indexes of the ports by (adapter number, port number) and by name
+        self._ports_by_number = {}
+        self._ports_by_name = {}
         self._links = set()
 
     def links(self):
@@ -187,6 +195,18 @@ class BaseNode(QtCore.QObject):
 
         return self._status
 
+    def notifyChanges(self, changes):
+        """
+        Lets the views know that some fields of this node have changed.
+
+        :param changes: iterable of changed fields (see BaseNode.CHANGES)
+        """
+
+        changes = frozenset(changes)
+        if changes:
+            self.changed_signal.emit(changes)
+        self.updated_signal.emit()
+
     def setStatus(self, status):
         """
         Sets a status for this node.
@@ -251,6 +271,48 @@ class BaseNode(QtCore.QObject):
 
         return self._ports
 
+    def _indexPorts(self):
+        """
+        Rebuilds the port indexes.
+        """
+
+        self._ports_by_number = {}
+        self._ports_by_name = {}
+        for port in self._ports:
+            self._ports_by_number.setdefault((port.adapterNumber(), port.portNumber()), port)
+            self._ports_by_name.setdefault(port.name(), port)
+
+    def getPort(self, adapter_number, port_number):
+        """
+        Returns a port by adapter and port number.
+
+        :param adapter_number: adapter number
+        :param port_number: port number
+        :returns: Port instance or None
+        """
+
+        port = self._ports_by_number.get((adapter_number, port_number))
+        if port is None or port.adapterNumber() != adapter_number or port.portNumber() != port_number:
+            # the ports have been changed since the index was built
+            self._indexPorts()
+            port = self._ports_by_number.get((adapter_number, port_number))
+        return port
+
+    def getPortFromName(self, name):
+        """
+        Returns a port by name.
+
+        :param name: port name
+        :returns: Port instance or None
+        """
+
+        port = self._ports_by_name.get(name)
+        if port is None or port.name() != name:
+            # the ports have been changed or renamed since the index was built
+            self._indexPorts()
+            port = self._ports_by_name.get(name)
+        return port
+
     def controllerHttpPost(self, path, callback, body=None, context=None, **kwargs):
         """
         POST on current server / project
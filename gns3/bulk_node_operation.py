@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Start, stop, suspend or reload many nodes at once.
+"""
+
+import uuid
+import collections
+
+from .qt import QtCore, qpartial
+from .transfer_manager import TransferManager
+
+import logging
+log = logging.getLogger(__name__)
+
+
+def wave_by_compute(node):
+    """
+    Wave key grouping the nodes by compute.
+    """
+
+    return node.compute().id()
+
+
+def wave_by_node_type(node):
+    """
+    Wave key grouping the nodes by type (e.g. qemu, dynamips, docker).
+    """
+
+    return getattr(node, "URL_PREFIX", "")
+
+
+class BulkNodeOperation(QtCore.QObject):
+    """
+    Runs a lifecycle operation on a list of nodes with a bounded
+    number of queries sent at the same time and a single progress entry
+    in the transfers dock (the GUI is not blocked).
+
+    Nodes can be processed in waves: all the nodes of a wave must be
+    done before the nodes of the next wave are processed.
+
+    :param operation: "start", "stop", "suspend" or "reload"
+    :param nodes: list of nodes
+    :param max_queries: maximum number of queries sent at the same time
+    :param wave_key: optional function returning the wave of a node
+    :param wave_order: optional list of wave keys in processing order
+    (waves missing from the list are processed last, in sorted order)
+    :param show_progress: display the progress of the operation
+    """
+
+    OPERATIONS = {
+        "start": ("Starting", "started"),
+        "stop": ("Stopping", "stopped"),
+        "suspend": ("Suspending", "suspended"),
+        "reload": ("Reloading", "reloaded"),
+    }
+
+    DEFAULT_MAX_QUERIES = 10
+
+    # done, total
+    progress_signal = QtCore.Signal(int, int)
+    finished_signal = QtCore.Signal()
+
+    # keep the running operations alive until they are finished
+    _running_operations = set()
+
+    def __init__(self, operation, nodes, max_queries=DEFAULT_MAX_QUERIES, wave_key=None, wave_order=None, show_progress=True, parent=None):
+
+        super().__init__(parent)
+        if operation not in self.OPERATIONS:
+            raise ValueError("Unknown node operation: {}".format(operation))
+        self._operation = operation
+        self._max_queries = max_queries
+        self._show_progress = show_progress
+        self._progress_id = str(uuid.uuid4())
+        self._running = 0
+        self._done = 0
+        self._canceled = False
+        self._finished = False
+        self._report = {"done": [], "skipped": [], "failed": {}, "canceled": []}
+
+        self._nodes = []
+        for node in nodes:
+            if hasattr(node, operation) and node.initialized():
+                self._nodes.append(node)
+            else:
+                self._report["skipped"].append(node.name())
+        self._waves = self._buildWaves(self._nodes, wave_key, wave_order)
+        self._queue = collections.deque()
+
+    @staticmethod
+    def _buildWaves(nodes, wave_key, wave_order):
+
+        if wave_key is None:
+            return collections.deque([nodes]) if nodes else collections.deque()
+        waves = {}
+        for node in nodes:
+            waves.setdefault(wave_key(node), []).append(node)
+        wave_order = list(wave_order or [])
+        keys = [key for key in wave_order if key in waves]
+        keys.extend(sorted((key for key in waves if key not in wave_order), key=str))
+        return collections.deque(waves[key] for key in keys)
+
+    def operation(self):
+
+        return self._operation
+
+    def total(self):
+        """
+        Returns the number of nodes the operation is applied to.
+        """
+
+        return len(self._nodes)
+
+    def report(self):
+        """
+        Returns the aggregated result of the operation.
+
+        :returns: dictionary with the names of the nodes "done", "skipped",
+        "canceled" and a dictionary node name -> error message for "failed"
+        """
+
+        return self._report
+
+    def isRunning(self):
+
+        return self in BulkNodeOperation._running_operations
+
+    def run(self):
+        """
+        Runs the operation.
+        """
+
+        BulkNodeOperation._running_operations.add(self)
+        if self._show_progress:
+            TransferManager.instance().addTransfer(self._progress_id, self._progressText(), self._operation, cancel_callback=self.cancel, unit="nodes")
+            TransferManager.instance().updateTransfer(self._progress_id, 0, self.total())
+        self.progress_signal.emit(0, self.total())
+        self._nextWave()
+
+    def cancel(self):
+        """
+        Cancels the nodes not processed yet, queries already sent are not canceled.
+        """
+
+        if self._finished:
+            return
+        self._canceled = True
+        for node in self._queue:
+            self._report["canceled"].append(node.name())
+        self._queue.clear()
+        for wave in self._waves:
+            for node in wave:
+                self._report["canceled"].append(node.name())
+        self._waves.clear()
+        if self._running == 0:
+            self._finish()
+
+    def _progressText(self):
+
+        return "{} nodes".format(self.OPERATIONS[self._operation][0])
+
+    def _nextWave(self):
+
+        if not self._waves:
+            self._finish()
+            return
+        self._queue.extend(self._waves.popleft())
+        self._sendQueries()
+
+    def _sendQueries(self):
+
+        while self._queue and self._running < self._max_queries:
+            node = self._queue.popleft()
+            self._running += 1
+            sent = getattr(node, self._operation)(callback=qpartial(self._nodeCallback, node))
+            if sent is False:
+                # the node is already in the requested state
+                self._report["skipped"].append(node.name())
+                self._running -= 1
+                self._updateProgress()
+
+        if not self._queue and self._running == 0:
+            self._nextWave()
+
+    def _nodeCallback(self, node, result, error=False, **kwargs):
+
+        if error:
+            message = result.get("message", "unknown") if isinstance(result, dict) else str(result)
+            self._report["failed"][node.name()] = message
+        else:
+            self._report["done"].append(node.name())
+        self._running -= 1
+        self._updateProgress()
+        self._sendQueries()
+
+    def _updateProgress(self):
+
+        self._done += 1
+        self.progress_signal.emit(self._done, self.total())
+        if self._show_progress:
+            TransferManager.instance().updateTransfer(self._progress_id, self._done, self.total())
+
+    def _finish(self):
+
+        if self._finished:
+            return
+        self._finished = True
+        if self._show_progress:
+            TransferManager.instance().removeTransfer(self._progress_id)
+
+        report = self._report
+        summary = "{} node(s) {}".format(len(report["done"]), self.OPERATIONS[self._operation][1])
+        if report["skipped"]:
+            summary += ", {} skipped".format(len(report["skipped"]))
+        if report["canceled"]:
+            summary += ", {} canceled".format(len(report["canceled"]))
+        if report["failed"]:
+            summary += ", {} failed: {}".format(len(report["failed"]),
+                                                "; ".join("{}: {}".format(name, message) for name, message in sorted(report["failed"].items())))
+            log.error(summary, extra={"show": True})
+        else:
+            log.info(summary)
+
+        self.finished_signal.emit()
+        BulkNodeOperation._running_operations.discard(self)
@@ -36,26 +36,59 @@ class ComputeManager(QtCore.QObject):
 
     created_signal = QtCore.Signal(str)
     updated_signal = QtCore.Signal(str)
+    # only the CPU and memory usage of the compute have changed
+    usage_updated_signal = QtCore.Signal(str)
     deleted_signal = QtCore.Signal(str)
 
+    # Poll intervals of the compute list (in milliseconds):
+    # fast while a compute is connecting or in error, backing off to the
+    # maximum while the notification feed keeps the computes up to date.
+    POLL_MIN_INTERVAL = 1000
+    POLL_QUIET_INTERVAL = 5000
+    POLL_MAX_INTERVAL = 30000
+
     def __init__(self):
 
         super().__init__()
         self._computes = {}
+        self._compute_states = {}
+        self._last_notification = None
         self._controller = Controller.instance()
         self._controller.connected_signal.connect(self._controllerConnectedSlot)
         self._controller.disconnected_signal.connect(self._controllerDisconnectedSlot)
         self._controllerConnectedSlot()
 
-        # No need to refresh via an API call if we received fresh data from the notification feed
-        self._last_computes_refresh = datetime.datetime.now().timestamp()
-
         self._timer = QtCore.QTimer()
-        self._timer.setInterval(1000)
+        self._timer.setInterval(self.POLL_MIN_INTERVAL)
         self._refreshingComputes = False
         self._timer.timeout.connect(self._refreshComputesSlot)
         self._timer.start()
 
+    def pollInterval(self):
+        """
+        Returns the effective poll interval of the compute list.
+
+        :returns: interval in milliseconds
+        """
+
+        return self._timer.interval()
+
+    def _setPollInterval(self, interval):
+
+        if interval != self._timer.interval():
+            log.debug("Compute list poll interval set to {}ms".format(interval))
+            self._timer.setInterval(interval)
+
+    def _unhealthyComputes(self):
+        """
+        Returns True if a compute is connecting or in error.
+        """
+
+        for compute in self._computes.values():
+            if not compute.connected() or compute.lastError():
+                return True
+        return False
+
     def _refreshComputesSlot(self):
         """
         Called when computes are refreshed.
@@ -63,8 +96,19 @@ class ComputeManager(QtCore.QObject):
 
         if self._refreshingComputes:
             return
-        if self._controller.connected() and datetime.datetime.now().timestamp() - self._last_computes_refresh > 1:
-            self._last_computes_refresh = datetime.datetime.now().timestamp()
+
+        now = datetime.datetime.now().timestamp()
+        notifications_healthy = self._last_notification is not None and \
+            now - self._last_notification <= self._timer.interval() / 1000
+        if self._unhealthyComputes():
+            self._setPollInterval(self.POLL_MIN_INTERVAL)
+        elif notifications_healthy:
+            # the notification feed keeps the computes up to date, back off
+            self._setPollInterval(min(self._timer.interval() * 2, self.POLL_MAX_INTERVAL))
+        else:
+            self._setPollInterval(self.POLL_QUIET_INTERVAL)
+
+        if self._controller.connected():
             self._refreshingComputes = True
             self._controller.get("/computes", self._listComputesCallback, showProgress=False, timeout=30)
 
@@ -84,6 +128,7 @@ class ComputeManager(QtCore.QObject):
 
         for compute_id in list(self._computes):
             del self._computes[compute_id]
+            self._compute_states.pop(compute_id, None)
             self.deleted_signal.emit(compute_id)
 
     def _listComputesCallback(self, result, error=False, **kwargs):
@@ -97,20 +142,38 @@ class ComputeManager(QtCore.QObject):
             return
 
         for compute in result:
-            self.computeDataReceivedCallback(compute)
+            self.computeDataReceivedCallback(compute, notification=False)
 
-    def computeDataReceivedCallback(self, compute):
+    @staticmethod
+    def _computeState(compute):
+
+        # the CPU and memory usage change on almost every poll and are not part of the state
+        return (compute.name(),
+                compute.connected(),
+                compute.protocol(),
+                compute.host(),
+                compute.port(),
+                compute.user(),
+                compute.capabilities(),
+                compute.lastError())
+
+    def computeDataReceivedCallback(self, compute, notification=True):
         """
         Called when we received data from a compute node.
+
+        :param compute: compute data
+        :param notification: True if the data comes from the notification feed
         """
 
-        self._last_computes_refresh = datetime.datetime.now().timestamp()
+        if notification:
+            self._last_notification = datetime.datetime.now().timestamp()
 
         new_node = False
         compute_id = compute["compute_id"]
         if compute_id not in self._computes:
             new_node = True
             self._computes[compute_id] = Compute(compute_id)
+        usage = (self._computes[compute_id].cpuUsagePercent(), self._computes[compute_id].memoryUsagePercent())
 
         self._computes[compute_id].setName(compute["name"])
         self._computes[compute_id].setConnected(compute["connected"])
@@ -123,6 +186,17 @@ class ComputeManager(QtCore.QObject):
         self._computes[compute_id].setCapabilities(compute["capabilities"])
         self._computes[compute_id].setLastError(compute.get("last_error"))
 
+        state = self._computeState(self._computes[compute_id])
+        if self._compute_states.get(compute_id) == state and not new_node:
+            if usage != (compute["cpu_usage_percent"], compute["memory_usage_percent"]):
+                self.usage_updated_signal.emit(compute_id)
+            return
+        self._compute_states[compute_id] = state
+
+        if state[1] is False or state[-1]:
+            # poll faster until the compute is connected
+            self._setPollInterval(self.POLL_MIN_INTERVAL)
+
         if new_node:
             self.created_signal.emit(compute_id)
         else:
@@ -217,6 +291,7 @@ class ComputeManager(QtCore.QObject):
 
         if compute_id in self._computes:
             del self._computes[compute_id]
+            self._compute_states.pop(compute_id, None)
             self._controller.delete("/computes/{compute_id}".format(compute_id=compute_id), None)
             self.deleted_signal.emit(compute_id)
 
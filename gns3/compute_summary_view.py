@@ -46,6 +46,16 @@ class ComputeItem(QtWidgets.QTreeWidgetItem):
 
         self._refreshStatusSlot()
 
+    def refreshUsage(self):
+        """
+        Displays the CPU and memory usage of the compute.
+        """
+
+        text = self._compute.name()
+        if self._compute.cpuUsagePercent() is not None:
+            text = "{} CPU {}%, RAM {}%".format(text, self._compute.cpuUsagePercent(), self._compute.memoryUsagePercent())
+        self.setText(0, text)
+
     def _refreshStatusSlot(self):
         """
         Changes the icon to show the node status (started, stopped etc.)
@@ -55,12 +65,7 @@ class ComputeItem(QtWidgets.QTreeWidgetItem):
             return
 
         usage = None
-        text = self._compute.name()
-
-        if self._compute.cpuUsagePercent() is not None:
-            text = "{} CPU {}%, RAM {}%".format(text, self._compute.cpuUsagePercent(), self._compute.memoryUsagePercent())
-
-        self.setText(0, text)
+        self.refreshUsage()
         if self._compute.connected():
             self._status = "connected"
             self.setToolTip(0, "Server {} version {} running on {}".format(self._compute.name(),
@@ -114,6 +119,7 @@ class ComputeSummaryView(QtWidgets.QTreeWidget):
         self._computes = {}
         ComputeManager.instance().created_signal.connect(self._computeAddedSlot)
         ComputeManager.instance().updated_signal.connect(self._computeUpdatedSlot)
+        ComputeManager.instance().usage_updated_signal.connect(self._computeUsageUpdatedSlot)
         ComputeManager.instance().deleted_signal.connect(self._computeRemovedSlot)
         for compute in ComputeManager.instance().computes():
             self._computeAddedSlot(compute.id())
@@ -147,6 +153,16 @@ class ComputeSummaryView(QtWidgets.QTreeWidget):
         else:
             self._computeAddedSlot(compute_id)
 
+    def _computeUsageUpdatedSlot(self, compute_id):
+        """
+        Called when the CPU or memory usage of a compute is updated
+
+        :params compute_id: compute identifier
+        """
+
+        if compute_id in self._computes:
+            self._computes[compute_id].refreshUsage()
+
     def _computeRemovedSlot(self, compute_id):
         """
         Called when a compute is removed to the list of computes
@@ -0,0 +1,424 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Bulk export and import of the node configs.
+"""
+
+import io
+import os
+import json
+import time
+import hashlib
+import pathlib
+import tarfile
+import zipfile
+import tempfile
+import collections
+
+from .qt import QtCore, qpartial
+from .utils.normalize_filename import normalize_filename
+
+import logging
+log = logging.getLogger(__name__)
+
+
+# name of the file listing the checksums of the exported or imported configs
+MANIFEST_FILENAME = "manifest.json"
+
+
+class ConfigTransferManager(QtCore.QObject):
+    """
+    Exports or imports the configs of many nodes with a bounded
+    number of queries running at the same time.
+
+    Configs are exported to a directory or streamed into a zip or tar archive
+    (depending on the file extension) along with a manifest of their checksums.
+    On import, the configs matching the manifest can be skipped.
+
+    :param nodes: list of nodes
+    :param max_queries: maximum number of queries sent at the same time
+    """
+
+    # done, total
+    progress_signal = QtCore.Signal(int, int)
+    # node name, message
+    node_error_signal = QtCore.Signal(str, str)
+    finished_signal = QtCore.Signal()
+
+    # keep the running transfers alive until they are finished
+    _running_transfers = set()
+
+    def __init__(self, nodes, max_queries=8, parent=None):
+
+        super().__init__(parent)
+        self._nodes = [node for node in nodes if not hasattr(node, "initialized") or node.initialized()]
+        self._max_queries = max_queries
+        self._queue = collections.deque()
+        self._running = 0
+        self._done = 0
+        self._total = 0
+        self._canceled = False
+        self._finished = False
+        self._report = {}
+        self._unsupported_nodes = []
+        self._path = None
+        self._archive = None
+        self._manifest = {}
+        self._temporary_directory = None
+        self._start_time = None
+
+    @staticmethod
+    def configFilename(node, config_file):
+        """
+        Returns the name of a config file on the local side.
+
+        :param node: node instance
+        :param config_file: config file path on the node
+        """
+
+        # we can have / in the case of Docker
+        return normalize_filename(node.name()) + "_{}".format(config_file.replace("/", "_"))
+
+    def report(self):
+        """
+        Returns the result of the transfer for each node.
+
+        :returns: dictionary node name -> {"transferred": [...], "skipped": [...], "errors": [...]}
+        """
+
+        return self._report
+
+    def unsupportedNodes(self):
+        """
+        :returns: names of the nodes without config files
+        """
+
+        return self._unsupported_nodes
+
+    def _nodeReport(self, node):
+
+        return self._report.setdefault(node.name(), {"transferred": [], "skipped": [], "errors": []})
+
+    def exportConfigs(self, path):
+        """
+        Exports the configs of the nodes.
+
+        :param path: destination directory or archive path (.zip, .tar, .tar.gz or .tgz)
+        """
+
+        self._path = path
+        if self.isArchive(path):
+            try:
+                if path.endswith(".zip"):
+                    self._archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+                else:
+                    self._archive = tarfile.open(path, "w:gz" if path.endswith("gz") else "w")
+            except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+                log.error("Could not create archive {}: {}".format(path, e))
+                self._finish()
+                return
+        else:
+            self._manifest = self._loadManifest(path)
+
+        for node in self._nodes:
+            config_files = node.configFiles()
+            if not config_files:
+                self._unsupported_nodes.append(node.name())
+                continue
+            for config_file in config_files:
+                self._queue.append(qpartial(self._exportConfig, node, config_file))
+        self._start()
+
+    def importConfigs(self, path, skip_unchanged=False):
+        """
+        Imports the configs of the nodes.
+
+        :param path: source directory or archive path (.zip, .tar, .tar.gz or .tgz)
+        :param skip_unchanged: skip the configs matching the checksums in the manifest
+        """
+
+        self._path = path
+        directory = path
+        if self.isArchive(path):
+            directory = self._extractArchive(path)
+            if directory is None:
+                self._finish()
+                return
+
+        # the directory is only listed once for all the nodes
+        try:
+            contents = set(os.listdir(directory))
+        except OSError as e:
+            log.error("Cannot list file in {}: {}".format(directory, e))
+            self._finish()
+            return
+        self._manifest = self._loadManifest(directory)
+
+        for node in self._nodes:
+            config_files = node.configFiles()
+            if not config_files:
+                self._unsupported_nodes.append(node.name())
+                continue
+            for config_file in config_files:
+                filename = self.configFilename(node, config_file)
+                if filename not in contents:
+                    log.warning("{}: config file '{}' not found".format(node.name(), filename))
+                    continue
+                config_path = os.path.join(directory, filename)
+                if skip_unchanged and self._isUnchanged(filename, config_path):
+                    self._nodeReport(node)["skipped"].append(config_file)
+                    continue
+                self._queue.append(qpartial(self._importConfig, node, config_file, config_path))
+        self._start()
+
+    def unchangedConfigs(self, path):
+        """
+        Returns the number of configs in a directory that match the manifest checksums.
+
+        :param path: directory path
+        """
+
+        if self.isArchive(path) or not os.path.isdir(path):
+            return 0
+        manifest = self._loadManifest(path)
+        count = 0
+        for filename in manifest:
+            if self._isUnchanged(filename, os.path.join(path, filename), manifest):
+                count += 1
+        return count
+
+    def cancel(self):
+        """
+        Cancels the queries not sent yet.
+        """
+
+        self._canceled = True
+        self._total -= len(self._queue)
+        self._queue.clear()
+        if self._running == 0:
+            self._finish()
+
+    def _start(self):
+
+        self._total = len(self._queue)
+        self._start_time = time.monotonic()
+        ConfigTransferManager._running_transfers.add(self)
+        self.progress_signal.emit(0, self._total)
+        if self._total == 0:
+            self._finish()
+        else:
+            self._sendQueries()
+
+    def _sendQueries(self):
+
+        while self._queue and self._running < self._max_queries:
+            self._running += 1
+            query = self._queue.popleft()
+            query()
+
+    def _queryDone(self):
+
+        self._running -= 1
+        self._done += 1
+        self.progress_signal.emit(self._done, self._total)
+        if self._queue:
+            self._sendQueries()
+        elif self._running == 0:
+            self._finish()
+
+    def _finish(self):
+
+        if self._finished:
+            return
+        self._finished = True
+
+        if self._archive is not None:
+            self._writeToArchive(MANIFEST_FILENAME, json.dumps(self._manifest, indent=4, sort_keys=True).encode())
+            try:
+                self._archive.close()
+            except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+                log.error("Could not write archive {}: {}".format(self._path, e))
+            self._archive = None
+        elif self._temporary_directory is None and self._path and self._manifest:
+            self._saveManifest(self._path)
+
+        if self._temporary_directory is not None:
+            self._temporary_directory.cleanup()
+            self._temporary_directory = None
+
+        if self._start_time is not None:
+            log.debug("Config transfer of {} files done in {:.2f} seconds".format(self._done, time.monotonic() - self._start_time))
+        self.finished_signal.emit()
+        ConfigTransferManager._running_transfers.discard(self)
+
+    def _exportConfig(self, node, config_file):
+
+        node.get("/files/{file}".format(file=config_file),
+                 qpartial(self._exportConfigCallback, node, config_file),
+                 raw=True,
+                 showProgress=False)
+
+    def _exportConfigCallback(self, node, config_file, result, error=False, raw_body=None, **kwargs):
+
+        try:
+            if error:
+                # The file could be missing if there is no private-config for example.
+                if isinstance(result, dict) and result.get("status") == 404:
+                    self._nodeReport(node)["skipped"].append(config_file)
+                else:
+                    self._nodeError(node, config_file, "could not export '{}': {}".format(config_file, result.get("message", "unknown")))
+                return
+
+            filename = self.configFilename(node, config_file)
+            if self._archive is not None:
+                if not self._writeToArchive(filename, raw_body):
+                    self._nodeError(node, config_file, "could not write {} to {}".format(filename, self._path))
+                    return
+            else:
+                config_path = os.path.join(self._path, filename)
+                try:
+                    with open(config_path, "wb") as f:
+                        log.debug("saving {} config to {}".format(node.name(), config_path))
+                        f.write(raw_body)
+                except OSError as e:
+                    self._nodeError(node, config_file, "could not export config to {}: {}".format(config_path, e))
+                    return
+
+            self._manifest[filename] = {"node": node.name(), "file": config_file, "md5": hashlib.md5(raw_body).hexdigest()}
+            self._nodeReport(node)["transferred"].append(config_file)
+        finally:
+            self._queryDone()
+
+    def _importConfig(self, node, config_file, config_path):
+
+        node.post("/files/{file}".format(file=config_file),
+                  qpartial(self._importConfigCallback, node, config_file, config_path),
+                  pathlib.Path(config_path),
+                  showProgress=False)
+
+    def _importConfigCallback(self, node, config_file, config_path, result, error=False, **kwargs):
+
+        try:
+            if error:
+                self._nodeError(node, config_file, "error while importing config: {}".format(result.get("message", "unknown")))
+                return
+            filename = self.configFilename(node, config_file)
+            md5sum = self._md5sum(config_path)
+            if md5sum:
+                self._manifest[filename] = {"node": node.name(), "file": config_file, "md5": md5sum}
+            self._nodeReport(node)["transferred"].append(config_file)
+        finally:
+            self._queryDone()
+
+    def _nodeError(self, node, config_file, message):
+
+        log.error("{}: {}".format(node.name(), message))
+        self._nodeReport(node)["errors"].append(config_file)
+        self.node_error_signal.emit(node.name(), message)
+
+    @staticmethod
+    def isArchive(path):
+        """
+        Returns True if the path is a supported archive.
+
+        :param path: file path
+        """
+
+        return path.endswith((".zip", ".tar", ".tar.gz", ".tgz"))
+
+    def _writeToArchive(self, filename, data):
+
+        try:
+            if isinstance(self._archive, zipfile.ZipFile):
+                self._archive.writestr(filename, data)
+            else:
+                info = tarfile.TarInfo(filename)
+                info.size = len(data)
+                info.mtime = time.time()
+                self._archive.addfile(info, io.BytesIO(data))
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            log.error("Could not write {} to archive {}: {}".format(filename, self._path, e))
+            return False
+        return True
+
+    def _extractArchive(self, path):
+        """
+        Extracts the configs from an archive to a temporary directory.
+        Only the files at the root of the archive are extracted.
+
+        :returns: directory path or None
+        """
+
+        self._temporary_directory = tempfile.TemporaryDirectory(suffix="-gns3-configs")
+        directory = self._temporary_directory.name
+        try:
+            if path.endswith(".zip"):
+                with zipfile.ZipFile(path) as archive:
+                    for name in archive.namelist():
+                        if os.path.basename(name) == name:
+                            with open(os.path.join(directory, name), "wb") as f:
+                                f.write(archive.read(name))
+            else:
+                with tarfile.open(path) as archive:
+                    for member in archive.getmembers():
+                        if member.isfile() and os.path.basename(member.name) == member.name:
+                            with open(os.path.join(directory, member.name), "wb") as f:
+                                f.write(archive.extractfile(member).read())
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as e:
+            log.error("Could not read archive {}: {}".format(path, e))
+            return None
+        return directory
+
+    @staticmethod
+    def _md5sum(path):
+
+        try:
+            with open(path, "rb") as f:
+                return hashlib.md5(f.read()).hexdigest()
+        except OSError as e:
+            log.debug("Could not compute checksum of {}: {}".format(path, e))
+            return None
+
+    def _isUnchanged(self, filename, path, manifest=None):
+
+        if manifest is None:
+            manifest = self._manifest
+        entry = manifest.get(filename)
+        return entry is not None and entry.get("md5") is not None and entry["md5"] == self._md5sum(path)
+
+    @staticmethod
+    def _loadManifest(directory):
+
+        try:
+            with open(os.path.join(directory, MANIFEST_FILENAME), encoding="utf-8") as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict):
+                return manifest
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            log.warning("Could not read the configs manifest in {}: {}".format(directory, e))
+        return {}
+
+    def _saveManifest(self, directory):
+
+        try:
+            with open(os.path.join(directory, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=4, sort_keys=True)
+        except OSError as e:
+            log.warning("Could not write the configs manifest in {}: {}".format(directory, e))
@@ -26,7 +26,10 @@ import struct
 from .qt import sip
 
 from .node import Node
+from .bulk_node_operation import BulkNodeOperation, wave_by_compute, wave_by_node_type
 from .qt import QtCore
+from .stall_watchdog import StallWatchdog
+from .memory_monitor import MemoryMonitor
 from .version import __version__
 
 import logging
@@ -62,55 +65,73 @@ class ConsoleCmd(cmd.Cmd):
         print("PyQt version is {}".format(QtCore.PYQT_VERSION_STR))
         print("SIP version is {}".format(sip.SIP_VERSION_STR))
 
+    def _nodesFromArgs(self, devices, operation, error_message):
+        """
+        Returns the nodes named in the command arguments.
+
+        :param devices: list of device names or "/all"
+        :param operation: node method that must be supported
+        :param error_message: message printed for the devices not supporting the operation
+        """
+
+        if '/all' in devices:
+            return [node for node in self._topology.nodes() if hasattr(node, operation) and node.initialized()]
+
+        nodes = []
+        for device in devices:
+            node = self._topology.getNodeFromName(device)
+            if node is None:
+                continue
+            if hasattr(node, operation) and node.initialized():
+                nodes.append(node)
+            else:
+                print(error_message.format(device))
+        return nodes
+
+    def _bulkNodeOperation(self, operation, args, error_message):
+
+        devices = args.split()
+        wave_key = None
+        for option in [device for device in devices if device.startswith("/waves=")]:
+            devices.remove(option)
+            wave = option.split("=", 1)[1]
+            if wave == "compute":
+                wave_key = wave_by_compute
+            elif wave == "type":
+                wave_key = wave_by_node_type
+            else:
+                print("Unknown wave type {}".format(wave))
+                return
+
+        nodes = self._nodesFromArgs(devices, operation, error_message)
+        if len(nodes) == 1 and wave_key is None:
+            getattr(nodes[0], operation)()
+        elif nodes:
+            BulkNodeOperation(operation, nodes, wave_key=wave_key).run()
+
     def do_start(self, args):
         """
         Start all or a specific device(s)
-        start {/all | device1 [device2] ...}
+        start {/all | device1 [device2] ...} [/waves=compute|type]
         """
 
         if '?' in args or args.strip() == "":
             print(self.do_start.__doc__)
             return
 
-        devices = args.split()
-        if '/all' in devices:
-            for node in self._topology.nodes():
-                if hasattr(node, "start") and node.initialized():
-                    node.start()
-        else:
-            for device in devices:
-                for node in self._topology.nodes():
-                    if node.name() == device:
-                        if hasattr(node, "start") and node.initialized():
-                            node.start()
-                        else:
-                            print("{} cannot be started".format(device))
-                        break
+        self._bulkNodeOperation("start", args, "{} cannot be started")
 
     def do_stop(self, args):
         """
         Stop all or a specific device(s)
-        stop {/all | device1 [device2] ...}
+        stop {/all | device1 [device2] ...} [/waves=compute|type]
         """
 
         if '?' in args or args.strip() == "":
             print(self.do_stop.__doc__)
             return
 
-        devices = args.split()
-        if '/all' in devices:
-            for node in self._topology.nodes():
-                if hasattr(node, "stop") and node.initialized():
-                    node.stop()
-        else:
-            for device in devices:
-                for node in self._topology.nodes():
-                    if node.name() == device:
-                        if hasattr(node, "stop") and node.initialized():
-                            node.stop()
-                        else:
-                            print("{} cannot be stopped".format(device))
-                        break
+        self._bulkNodeOperation("stop", args, "{} cannot be stopped")
 
     def do_suspend(self, args):
         """
@@ -122,20 +143,7 @@ class ConsoleCmd(cmd.Cmd):
             print(self.do_suspend.__doc__)
             return
 
-        devices = args.split()
-        if '/all' in devices:
-            for node in self._topology.nodes():
-                if hasattr(node, "suspend") and node.initialized():
-                    node.suspend()
-        else:
-            for device in devices:
-                for node in self._topology.nodes():
-                    if node.name() == device:
-                        if hasattr(node, "suspend") and node.initialized():
-                            node.suspend()
-                        else:
-                            print("{} cannot be suspended".format(device))
-                        break
+        self._bulkNodeOperation("suspend", args, "{} cannot be suspended")
 
     def do_reload(self, args):
         """
@@ -147,20 +155,7 @@ class ConsoleCmd(cmd.Cmd):
             print(self.do_reload.__doc__)
             return
 
-        devices = args.split()
-        if '/all' in devices:
-            for node in self._topology.nodes():
-                if hasattr(node, "reload") and node.initialized():
-                    node.reload()
-        else:
-            for device in devices:
-                for node in self._topology.nodes():
-                    if node.name() == device:
-                        if hasattr(node, "reload") and node.initialized():
-                            node.reload()
-                        else:
-                            print("{} cannot be reloaded".format(device))
-                        break
+        self._bulkNodeOperation("reload", args, "{} cannot be reloaded")
 
     def do_console(self, args):
         """
@@ -179,13 +174,13 @@ class ConsoleCmd(cmd.Cmd):
                     self._start_console(node)
         else:
             for device in devices:
-                for node in self._topology.nodes():
-                    if node.name() == device:
-                        if hasattr(node, "console") and node.initialized() and node.status() == Node.started:
-                            self._start_console(node)
-                        else:
-                            print("Cannot console to {}".format(device))
-                        break
+                node = self._topology.getNodeFromName(device)
+                if node is None:
+                    continue
+                if hasattr(node, "console") and node.initialized() and node.status() == Node.started:
+                    self._start_console(node)
+                else:
+                    print("Cannot console to {}".format(device))
 
     def do_log(self, args):
         """
@@ -259,16 +254,25 @@ class ConsoleCmd(cmd.Cmd):
             params.pop(0)
             for param in params:
                 node_name = param
-                found = False
-                for node in self._topology.nodes():
-                    if hasattr(node, "info") and node.name() == node_name:
-                        print(node.info())
-                        found = True
-                        break
-
-                if found is False:
+                node = self._topology.getNodeFromName(node_name)
+                if node is None or not hasattr(node, "info"):
                     print("{}: no such device".format(node_name))
                     continue
+                print(node.info())
+
+    def _show_computes(self):
+        """
+        Handles the 'show computes' command.
+        """
+
+        from .compute_manager import ComputeManager
+        compute_manager = ComputeManager.instance()
+        for compute in compute_manager.computes():
+            status = "connected" if compute.connected() else "disconnected"
+            if compute.lastError():
+                status += " ({})".format(compute.lastError())
+            print("{} [{}]: {}".format(compute.name(), compute.id(), status))
+        print("Compute list poll interval: {:.1f}s".format(compute_manager.pollInterval() / 1000))
 
     def do_show(self, args):
         """
@@ -277,6 +281,9 @@ class ConsoleCmd(cmd.Cmd):
 
         Show detail information about a device:
         show device <device_name>
+
+        Show the computes and the effective poll rate of the compute list:
+        show computes
         """
 
         if '?' in args or args.strip() == "":
@@ -286,9 +293,69 @@ class ConsoleCmd(cmd.Cmd):
         params = args.split()
         if params[0] == "device":
             self._show_device(params)
+        elif params[0] == "computes":
+            self._show_computes()
         else:
             print(self.do_show.__doc__)
 
+    def do_stalls(self, args):
+        """
+        Show the recent periods during which the GUI was blocked,
+        with the most sampled stack of the GUI thread:
+        stalls
+
+        Forget the recorded stalls:
+        stalls clear
+        """
+
+        if '?' in args:
+            print(self.do_stalls.__doc__)
+            return
+
+        watchdog = StallWatchdog.instance()
+        if args.strip() == "clear":
+            watchdog.clear()
+        elif args.strip() == "":
+            print(watchdog.report())
+        else:
+            print(self.do_stalls.__doc__)
+
+    def do_memory(self, args):
+        """
+        Show the objects and approximate memory used by each subsystem:
+        memory
+
+        Start or stop tracing the Python allocations (slows down the GUI):
+        memory trace start|stop
+
+        Show the allocations since the last diff or trace start:
+        memory diff
+
+        Show the Python objects kept after their Qt object was deleted:
+        memory leaks
+        """
+
+        if '?' in args:
+            print(self.do_memory.__doc__)
+            return
+
+        monitor = MemoryMonitor.instance()
+        params = args.split()
+        if not params:
+            print(monitor.report())
+        elif params == ["trace", "start"]:
+            monitor.startTracing()
+            print("Memory tracing started")
+        elif params == ["trace", "stop"]:
+            monitor.stopTracing()
+            print("Memory tracing stopped")
+        elif params[0] == "diff":
+            print(monitor.diff())
+        elif params[0] == "leaks":
+            print(monitor.leakReport())
+        else:
+            print(self.do_memory.__doc__)
+
     def do_help(self, args):
         """
         Get help on commands
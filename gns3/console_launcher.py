@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Opens the consoles of many nodes at once.
+"""
+
+import sys
+import time
+import shlex
+import collections
+
+from .qt import QtCore, qpartial
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class ConsoleLauncher(QtCore.QObject):
+    """
+    Telnet consoles using the same command are opened in a single terminal
+    (tabs or tmux windows) when the terminal supports it. Terminals are
+    launched one after the other, the delay between two launches follows
+    the time the previous terminals took to come up when it can be measured.
+    """
+
+    # maximum number of consoles opened in the same terminal
+    MAX_BATCH_SIZE = 16
+
+    # bounds of the delay between two launches (in milliseconds)
+    MIN_DELAY = 100
+    MAX_DELAY_FACTOR = 4
+
+    def __init__(self, parent=None):
+
+        super().__init__(parent)
+        self._queue = collections.deque()
+        self._delay = 0
+        self._configured_delay = 0
+        self._job_id = 0
+        self._job_started = 0
+        self._running = False
+
+    def delay(self):
+        """
+        Returns the current delay between two terminal launches.
+
+        :returns: delay in milliseconds
+        """
+
+        return self._delay
+
+    def isRunning(self):
+
+        return self._running
+
+    def launch(self, nodes, delay, aux=False, open_console=None):
+        """
+        Opens the consoles of nodes.
+
+        :param nodes: list of nodes, in the order the consoles are opened
+        :param delay: configured delay between two console launches (in milliseconds)
+        :param aux: open the auxiliary consoles
+        :param open_console: function opening the console of a single node
+        (used for the consoles that are not telnet)
+        """
+
+        if self._configured_delay != delay or not self._running:
+            self._configured_delay = delay
+            self._delay = delay
+        self._queue.extend(self.jobs(nodes, aux, open_console))
+        if not self._running:
+            self._next()
+
+    def jobs(self, nodes, aux=False, open_console=None):
+        """
+        Groups the consoles to open.
+
+        :returns: list of jobs, a job is a list of (node, port) telnet consoles
+        with their command or a function to call for a single console
+        """
+
+        if open_console is None:
+            open_console = qpartial(self._openConsole, aux=aux)
+        jobs = []
+        telnet_consoles = collections.OrderedDict()
+        for node in nodes:
+            if not node.initialized() or not node.isStarted():
+                continue
+            if aux:
+                if not hasattr(node, "auxConsole") or node.auxConsole() is None:
+                    continue
+                command = node.consoleCommand(console_type="telnet")
+                port = node.auxConsole()
+            elif node.consoleType() == "telnet" and node.console() is not None:
+                if node.bringToFront() is True:
+                    continue
+                command = node.consoleCommand()
+                port = node.console()
+            else:
+                jobs.append((None, qpartial(open_console, node)))
+                continue
+            if command and command.strip():
+                telnet_consoles.setdefault(command, []).append((node, port))
+
+        for command, consoles in telnet_consoles.items():
+            batch_size = self.MAX_BATCH_SIZE if self.supportsBatch(command) else 1
+            for index in range(0, len(consoles), batch_size):
+                jobs.append((command, consoles[index:index + batch_size]))
+        return jobs
+
+    @staticmethod
+    def supportsBatch(command):
+        """
+        Returns True if the terminal command can open several consoles at once.
+
+        :param command: console command
+        """
+
+        if sys.platform.startswith("win"):
+            return False
+        from .telnet_console import batch_console_args
+        try:
+            args = shlex.split(command)
+        except ValueError:
+            return False
+        return len(args) > 0 and batch_console_args([args, args]) is not None
+
+    @staticmethod
+    def _openConsole(node, aux=False):
+
+        try:
+            node.openConsole(aux=aux)
+        except (OSError, ValueError) as e:
+            log.error("Cannot start console application for {}: {}".format(node.name(), e))
+
+    def _next(self):
+
+        if not self._queue:
+            self._running = False
+            return
+        self._running = True
+        self._job_id += 1
+        self._job_started = time.monotonic()
+        command, job = self._queue.popleft()
+
+        if command is None:
+            job()
+        else:
+            (node, port), batch = job[0], job[1:]
+            from .telnet_console import nodeTelnetConsole
+            log.debug("Opening {} console(s) with '{}'".format(len(job), command))
+            console_thread = nodeTelnetConsole(node, port, command, batch=batch)
+            if console_thread is not None:
+                # wait for the terminal to come up before launching the next one,
+                # a terminal that doesn't report it in time doesn't block the queue
+                console_thread.terminalLaunched.connect(qpartial(self._consoleStartedSlot, console_thread, self._job_id))
+                console_thread.finished.connect(qpartial(self._consoleStartedSlot, console_thread, self._job_id))
+                QtCore.QTimer.singleShot(self._maxDelay(), qpartial(self._consoleTimeoutSlot, self._job_id))
+                return
+        self._scheduleNext(self._delay)
+
+    def _scheduleNext(self, delay):
+
+        QtCore.QTimer.singleShot(max(0, int(delay)), qpartial(self._nextSlot, self._job_id))
+
+    def _nextSlot(self, job_id):
+
+        # ignore the launches scheduled before a cancellation
+        if job_id == self._job_id and self._running:
+            self._next()
+
+    def _consoleStartedSlot(self, console_thread, job_id):
+
+        if job_id != self._job_id or not self._running:
+            return
+        startup_time = console_thread.startupTime()
+        # the delay is only adapted to a measured startup time
+        if startup_time is not None:
+            self._adaptDelay(startup_time * 1000)
+        # make sure the timeout of this job is ignored
+        self._job_id += 1
+        self._scheduleNext(self._delay - (time.monotonic() - self._job_started) * 1000)
+
+    def _consoleTimeoutSlot(self, job_id):
+
+        if job_id != self._job_id or not self._running:
+            return
+        # the delay is not raised: the terminal may be up without being able to report it
+        log.debug("Terminal did not report it was up after {} ms".format(self._maxDelay()))
+        self._next()
+
+    def _maxDelay(self):
+
+        return max(self.MIN_DELAY, self._configured_delay * self.MAX_DELAY_FACTOR)
+
+    def _adaptDelay(self, startup_time):
+        """
+        Adapts the delay between launches to the startup time of the last terminal.
+
+        :param startup_time: time in milliseconds
+        """
+
+        delay = (self._delay + startup_time) / 2
+        self._delay = int(min(max(delay, self.MIN_DELAY), self._maxDelay()))
+        log.debug("Console launch delay adapted to {} ms".format(self._delay))
+
+    def cancel(self):
+        """
+        Cancels the consoles not opened yet.
+        """
+
+        self._queue.clear()
+        self._running = False
+        self._job_id += 1
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of ConsoleLauncher.
+
+        :returns: instance of ConsoleLauncher
+        """
+
+        if not hasattr(ConsoleLauncher, "_instance") or ConsoleLauncher._instance is None:
+            ConsoleLauncher._instance = ConsoleLauncher()
+        return ConsoleLauncher._instance
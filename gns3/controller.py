@@ -61,6 +61,9 @@ class Controller(QtCore.QObject):
         # If we do multiple call in order to download the same symbol we queue them
         self._static_asset_download_queue = {}
 
+        # (local server config, generation, value) of the last isRemote() call
+        self._is_remote_cache = None
+
     def host(self):
 
         return self._http_client.host()
@@ -73,8 +76,24 @@ class Controller(QtCore.QObject):
         :returns Boolean: True if the controller is remote
         """
 
+        config = LocalServerConfig.instance()
+        if self._is_remote_cache is not None:
+            cached_config, generation, is_remote = self._is_remote_cache
+            if cached_config is config and generation == config.generation():
+                return is_remote
+        settings = config.loadSettings("Server", LOCAL_SERVER_SETTINGS)
+        is_remote = not settings["auto_start"]
+        self._is_remote_cache = (config, config.generation(), is_remote)
+        return is_remote
+
+    def cacheKey(self):
+        """
+        :returns: identifier of the controller used to name cached data on disk
+        """
+
         settings = LocalServerConfig.instance().loadSettings("Server", LOCAL_SERVER_SETTINGS)
-        return not settings["auto_start"]
+        url = "{}://{}:{}".format(settings["protocol"], settings["host"], settings["port"])
+        return hashlib.md5(url.encode()).hexdigest()
 
     def connecting(self):
         """
@@ -104,12 +123,22 @@ class Controller(QtCore.QObject):
 
         self._http_client = http_client
         if self._http_client:
+            self._setupResponseCache()
             if self.isRemote():
                 self._http_client.setMaxTimeDifferenceBetweenQueries(120)
             self._http_client.connection_connected_signal.connect(self._httpClientConnectedSlot)
             self._http_client.connection_disconnected_signal.connect(self._httpClientDisconnectedSlot)
             self._connectingToServer()
 
+    def _setupResponseCache(self):
+        """
+        Configures the cache used for the large collections that rarely change.
+        """
+
+        self._http_client.responseCache().setDirectory(os.path.join(LocalConfig.instance().cacheDirectory(), "http", self.cacheKey()))
+        self._http_client.setResponseCacheTTL("/appliances", 600)
+        self._http_client.setResponseCacheTTL("/symbols", 600)
+
     def getHttpClient(self):
         """
         :return: Instance of HTTP client to communicate with the server
@@ -376,12 +405,15 @@ class Controller(QtCore.QObject):
             log.error("Error while uploading symbol: {}: {}".format(path, result.get("message", "unknown")))
             return
 
+        # the symbols listing is cached and the upload only invalidates /symbols/<symbol_id>
+        self._http_client.invalidateResponseCache("/symbols")
+
         # Refresh the templates list
         from .template_manager import TemplateManager
         TemplateManager.instance().templates_changed_signal.emit()
 
     def getSymbols(self, callback):
-        self.get('/symbols', callback=callback)
+        self.get('/symbols', callback=callback, cache=True)
 
     def deleteProject(self, project_id, callback=None):
         Controller.instance().delete("/projects/{}".format(project_id), qpartial(self._deleteProjectCallback, callback=callback, project_id=project_id))
@@ -399,7 +431,7 @@ class Controller(QtCore.QObject):
 
     @qslot
     def refreshProjectList(self, *args):
-        self.get("/projects", self._projectListCallback)
+        self.get("/projects", self._projectListCallback, cache=True)
 
     def _projectListCallback(self, result, error=False, **kwargs):
         if not error:
@@ -21,8 +21,10 @@ import os
 import stat
 import sys
 import struct
+import time
+import concurrent.futures
 
-from gns3.qt import QtWidgets
+from gns3.qt import QtCore, QtGui, QtWidgets
 from gns3.ui.doctor_dialog_ui import Ui_DoctorDialog
 from gns3.local_server import LocalServer
 from gns3.local_config import LocalConfig
@@ -41,27 +43,100 @@ class DoctorDialog(QtWidgets.QDialog, Ui_DoctorDialog):
     check return a tuple result and a message in case of failure.
     """
 
+    # maximum number of checks running at the same time
+    MAX_WORKERS = 8
+
+    # time after which a check is reported as failed (in seconds)
+    CHECK_TIMEOUT = 30
+
     def __init__(self, parent, console=False):
 
         super().__init__(parent)
         self._console = console
         self.setupUi(self)
         self.uiOkButton.clicked.connect(self._okButtonClickedSlot)
-        for method in sorted(dir(self)):
-            if method.startswith('check'):
+
+        # make sure the singletons used by the checks are created in the GUI thread
+        LocalServer.instance()
+        LocalConfig.instance()
+
+        self._started = time.monotonic()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="doctor")
+        self._running_checks = {}
+        for method in self._checks():
+            self._running_checks[self._executor.submit(self._runCheck, method)] = (method, time.monotonic())
+
+        if self._console:
+            while self._running_checks:
+                concurrent.futures.wait(self._running_checks, timeout=0.05, return_when=concurrent.futures.FIRST_COMPLETED)
+                self._collectResults()
+        else:
+            self._timer = QtCore.QTimer(self)
+            self._timer.setInterval(50)
+            self._timer.timeout.connect(self._collectResults)
+            self._timer.start()
+            self.finished.connect(self._stopChecks)
+
+    def _checks(self):
+        """
+        Returns the names of the check methods.
+        """
+
+        return [method for method in sorted(dir(self)) if method.startswith('check')]
+
+    def _runCheck(self, method):
+        """
+        Runs a check in a worker thread.
+
+        :returns: tuple (result, message, duration in seconds)
+        """
+
+        start = time.monotonic()
+        (res, msg) = getattr(self, method)()
+        return res, msg, time.monotonic() - start
+
+    def _collectResults(self):
+        """
+        Writes the results of the finished checks and the checks that timed out.
+        """
+
+        now = time.monotonic()
+        for future, (method, started) in list(self._running_checks.items()):
+            if future.done():
+                del self._running_checks[future]
                 try:
-                    self.write(getattr(self, method).__doc__ + "...")
-                    (res, msg) = getattr(self, method)()
-                    if res == 0:
-                        self.write('<span style="color: green"><strong>OK</strong></span>')
-                    elif res == 1:
-                        self.write('<span style="color: orange"><strong>WARNING</strong> {}</span>'.format(msg))
-                    elif res == 2:
-                        self.write('<span style="color: red"><strong>ERROR</strong> {}</span>'.format(msg))
+                    (res, msg, duration) = future.result()
                 except Exception as e:
                     log.error("GNS3 doctor exception detected: {}".format(e), exc_info=1)
-                    self.write('<span style="color: red"><strong>FAIL</strong> The doctor failed during this test with error: {} Please check on the forum.</span>'.format(str(e)))
-                self.write("<br/>")
+                    self._writeResult(method, '<span style="color: red"><strong>FAIL</strong> The doctor failed during this test with error: {} Please check on the forum.</span>'.format(str(e)), now - started)
+                    continue
+                if res == 0:
+                    self._writeResult(method, '<span style="color: green"><strong>OK</strong></span>', duration)
+                elif res == 1:
+                    self._writeResult(method, '<span style="color: orange"><strong>WARNING</strong> {}</span>'.format(msg), duration)
+                elif res == 2:
+                    self._writeResult(method, '<span style="color: red"><strong>ERROR</strong> {}</span>'.format(msg), duration)
+            elif now - started > self.CHECK_TIMEOUT:
+                del self._running_checks[future]
+                future.cancel()
+                self._writeResult(method, '<span style="color: red"><strong>TIMEOUT</strong> The test did not complete within {} seconds</span>'.format(self.CHECK_TIMEOUT), now - started)
+
+        if not self._running_checks:
+            self.write("All checks completed in {:.0f} ms<br/>".format((now - self._started) * 1000))
+            self._stopChecks()
+
+    def _writeResult(self, method, result, duration):
+
+        self.write("{}... {} ({:.0f} ms)<br/>".format(getattr(self, method).__doc__, result, duration * 1000))
+
+    def _stopChecks(self):
+        """
+        Stops collecting results, checks still running are abandoned.
+        """
+
+        if not self._console:
+            self._timer.stop()
+        self._executor.shutdown(wait=False)
 
     def write(self, text):
         """
@@ -69,7 +144,9 @@ class DoctorDialog(QtWidgets.QDialog, Ui_DoctorDialog):
         """
         if self._console:
             print(text)
-        self.uiDoctorResultTextEdit.setHtml(self.uiDoctorResultTextEdit.toHtml() + text)
+        cursor = self.uiDoctorResultTextEdit.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        cursor.insertHtml(text)
 
     def _okButtonClickedSlot(self):
         self.accept()
@@ -16,16 +16,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
-from zipfile import ZipFile
-import platform
-import psutil
 import os
 
-from gns3.version import __version__
-from gns3.qt import QtWidgets, QtCore
+from gns3.qt import QtWidgets
 from gns3.ui.export_debug_dialog_ui import Ui_ExportDebugDialog
 from gns3.local_config import LocalConfig
 from gns3.controller import Controller
+from gns3.stall_watchdog import StallWatchdog
+from gns3.utils.progress_dialog import ProgressDialog
+from gns3.utils.export_debug_worker import ExportDebugWorker, get_debug_data
 
 import logging
 log = logging.getLogger(__name__)
@@ -64,78 +63,39 @@ class ExportDebugDialog(QtWidgets.QDialog, Ui_ExportDebugDialog):
     def _exportDebugCallback(self, result, error=False, **kwargs):
         log.debug("Export debug information to %s", self._path)
 
-        try:
-            with ZipFile(self._path, 'w') as zip:
-                zip.writestr("debug.txt", self._getDebugData())
-                dir = LocalConfig.instance().configDirectory()
-                for filename in os.listdir(dir):
-                    path = os.path.join(dir, filename)
-                    if os.path.isfile(path):
-                        zip.write(path, filename)
-
-                dir = os.path.join(LocalConfig.instance().configDirectory(), "debug")
-                if os.path.exists(dir):
-                    for filename in os.listdir(dir):
-                        path = os.path.join(dir, filename)
-                        if os.path.isfile(path):
-                            zip.write(path, filename)
-
-                if self._project:
-                    dir = self._project.filesDir()
-                    if dir:
-                        for filename in os.listdir(dir):
-                            path = os.path.join(dir, filename)
-                            if os.path.isfile(path):
-                                zip.write(path, filename)
-        except OSError as e:
-            QtWidgets.QMessageBox.critical(self, "Debug", "Can't export debug information: {}".format(str(e)))
+        worker = ExportDebugWorker(self._path, self._debugFiles(), [("stalls.txt", StallWatchdog.instance().report())])
+        progress_dialog = ProgressDialog(worker, "Debug", "Exporting debug information...", "Cancel", parent=self)
+        progress_dialog.show()
+        progress_dialog.exec()
         self.accept()
 
-    def _getDebugData(self):
-        try:
-            connections = psutil.net_connections()
-        # You need to be root for OSX
-        except psutil.AccessDenied:
-            connections = None
-
-        try:
-            addrs = ["* {}: {}".format(key, val) for key, val in psutil.net_if_addrs().items()]
-        except UnicodeDecodeError:
-            addrs = ["INVALID ADDR WITH UNICODE CHARACTERS"]
-
-        data = """Version: {version}
-OS: {os}
-Python: {python}
-Qt: {qt}
-PyQt: {pyqt}
-CPU: {cpu}
-Memory: {memory}
-
-Networks:
-{addrs}
-
-Open connections:
-{connections}
-
-Processus:
-""".format(
-            version=__version__,
-            qt=QtCore.QT_VERSION_STR,
-            pyqt=QtCore.PYQT_VERSION_STR,
-            os=platform.platform(),
-            python=platform.python_version(),
-            memory=psutil.virtual_memory(),
-            cpu=psutil.cpu_times(),
-            connections=connections,
-            addrs="\n".join(addrs)
-        )
-        for proc in psutil.process_iter():
+    def _debugFiles(self):
+        """
+        Returns the files to export: the config directory, the debug
+        directory and the project files directory.
+
+        :returns: list of (path, name in the archive) tuples
+        """
+
+        directories = [LocalConfig.instance().configDirectory(),
+                       os.path.join(LocalConfig.instance().configDirectory(), "debug")]
+        if self._project and self._project.filesDir():
+            directories.append(self._project.filesDir())
+
+        files = []
+        for dir in directories:
+            if not os.path.exists(dir):
+                continue
             try:
-                psinfo = proc.as_dict(attrs=["name", "exe"])
-                data += "* {} {}\n".format(psinfo["name"], psinfo["exe"])
-            except psutil.NoSuchProcess:
-                pass
-        return data
+                for entry in os.scandir(dir):
+                    if entry.is_file():
+                        files.append((entry.path, entry.name))
+            except OSError as e:
+                log.warning("Could not list the files in {}: {}".format(dir, e))
+        return files
+
+    def _getDebugData(self):
+        return get_debug_data()
 
 if __name__ == '__main__':
     import sys
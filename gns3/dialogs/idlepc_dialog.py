@@ -20,6 +20,7 @@ import re
 
 from ..qt import QtWidgets
 from ..topology import Topology
+from ..modules.dynamips.idlepc_knowledge_base import IdlePCKnowledgeBase
 from ..ui.idlepc_dialog_ui import Ui_IdlePCDialog
 
 
@@ -39,6 +40,16 @@ class IdlePCDialog(QtWidgets.QDialog, Ui_IdlePCDialog):
         self._router = router
         self._idlepcs = idlepcs
 
+        # values already validated for this IOS image come first
+        known_idlepcs = set()
+        router_settings = self._router.settings()
+        for idlepc, cpu_usage in IdlePCKnowledgeBase.instance().values(router_settings["image_md5sum"], router_settings["platform"]):
+            if cpu_usage is None:
+                self.uiComboBox.addItem("{} (validated)".format(idlepc), idlepc)
+            else:
+                self.uiComboBox.addItem("{} (validated, CPU {}%)".format(idlepc, cpu_usage), idlepc)
+            known_idlepcs.add(idlepc)
+
         for value in self._idlepcs:
             # validate idle-pc format, e.g. 0x60c09aa0
             match = re.search(r"^(0x[0-9a-f]{8})\s+\[(\d+)\]$", value)
@@ -47,7 +58,8 @@ class IdlePCDialog(QtWidgets.QDialog, Ui_IdlePCDialog):
                 count = int(match.group(2))
                 if 50 <= count <= 60:
                     value += "*"
-                self.uiComboBox.addItem(value, idlepc)
+                if idlepc not in known_idlepcs:
+                    self.uiComboBox.addItem(value, idlepc)
 
     def _helpSlot(self):
         """
@@ -78,6 +90,7 @@ Select each value that appears in the list and click Apply, and note the CPU usa
             if hasattr(node, "idlepc") and node.settings()["image"] == ios_image:
                 node.setIdlepc(idlepc)
 
+        self._router.recordIdlepc(idlepc)
         if update_template:
             # apply the idle-pc to templates with the same IOS image
             self._router.module().updateImageIdlepc(ios_image, idlepc)
@@ -21,7 +21,7 @@ import datetime
 
 from gns3.qt import QtCore, QtWidgets
 from ..local_server import LocalServer
-from ..utils.progress_dialog import ProgressDialog
+from ..transfer_manager import TransferManager
 from ..utils.export_project_worker import ExportProjectWorker
 from ..ui.export_project_wizard_ui import Ui_ExportProjectWizard
 
@@ -138,7 +138,6 @@ class ExportProjectWizard(QtWidgets.QWizard, Ui_ExportProjectWizard):
 
             compression = self.uiCompressionComboBox.currentData()
             export_worker = ExportProjectWorker(self._project, self._path, include_images, include_snapshots, reset_mac_addresses, keep_compute_ids, compression)
-            progress_dialog = ProgressDialog(export_worker, "Exporting project", "Exporting portable project files...", "Cancel", parent=self, create_thread=False)
-            progress_dialog.show()
-            progress_dialog.exec()
+            # the export is displayed in the transfers dock
+            TransferManager.instance().runWorker(export_worker)
         super().done(result)
@@ -22,11 +22,11 @@ Dialog to change node symbols.
 import os
 import pathlib
 
-from ..qt import QtCore, QtGui, QtWidgets, qpartial, sip_is_deleted
-from ..qt.qimage_svg_renderer import QImageSvgRenderer
+from ..qt import QtCore, QtWidgets, qpartial, sip_is_deleted
 from ..ui.symbol_selection_dialog_ui import Ui_SymbolSelectionDialog
 from ..controller import Controller
 from ..symbol import Symbol
+from ..symbol_thumbnail_cache import SymbolThumbnailCache
 
 
 import logging
@@ -64,10 +64,24 @@ class SymbolSelectionDialog(QtWidgets.QDialog, Ui_SymbolSelectionDialog):
         self.uiBuiltInSymbolRadioButton.setChecked(True)
         self.uiSymbolTreeWidget.setFocus()
         self.uiSymbolTreeWidget.setIconSize(QtCore.QSize(64, 64))
+
+        # search index: list of (lower case name, item)
         self._symbol_items = []
+        self._hidden_items = set()
+        self._search_text = ""
         self._parents = {}
 
-        Controller.instance().clearStaticCache()  # TODO: use etag to know when to refresh the cache
+        # thumbnails are only loaded for the rows that become visible
+        self._requested_thumbnails = set()
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(50)
+        self._render_timer.timeout.connect(self._renderVisibleSymbols)
+        self.uiSymbolTreeWidget.itemExpanded.connect(self._render_timer.start)
+        self.uiSymbolTreeWidget.verticalScrollBar().valueChanged.connect(self._render_timer.start)
+
+        # custom symbols are downloaded again to check if their content has changed
+        Controller.instance().clearStaticCache()
         Controller.instance().get("/symbols", self._listSymbolsCallback)
 
     def _listSymbolsCallback(self, result, error=False, **kwargs):
@@ -76,6 +90,8 @@ class SymbolSelectionDialog(QtWidgets.QDialog, Ui_SymbolSelectionDialog):
             return
 
         self._symbol_items = []
+        self._hidden_items = set()
+        self._requested_thumbnails = set()
         for symbol in result:
             symbol = Symbol(**symbol)
             theme = symbol.theme()
@@ -94,26 +110,62 @@ class SymbolSelectionDialog(QtWidgets.QDialog, Ui_SymbolSelectionDialog):
             item = QtWidgets.QTreeWidgetItem(parent)
             item.setData(0, QtCore.Qt.ItemDataRole.UserRole, symbol)
             item.setToolTip(0, symbol.id())
-            self._symbol_items.append(item)
+            self._symbol_items.append((name.lower(), item))
             item.setText(0, name)
 
-            def render(item, path):
-                if sip_is_deleted(item):
-                    return
-                svg_renderer = QImageSvgRenderer(path)
-                image = QtGui.QImage(64, 64, QtGui.QImage.Format.Format_ARGB32)
-                # Set the ARGB to 0 to prevent rendering artifacts
-                image.fill(0x00000000)
-                svg_renderer.render(QtGui.QPainter(image))
-                icon = QtGui.QIcon(QtGui.QPixmap.fromImage(image))
-                item.setIcon(0, icon)
-
-            Controller.instance().getStatic(symbol.url(), qpartial(render, item))
-
         for parent in self._parents.values():
             parent.sortChildren(0, QtCore.Qt.SortOrder.AscendingOrder)
+        self._search_text = ""
+        self._filter()
         self.adjustSize()
 
+    def _renderVisibleSymbols(self):
+        """
+        Loads the thumbnails of the symbols displayed in the viewport.
+        """
+
+        tree = self.uiSymbolTreeWidget
+        viewport_bottom = tree.viewport().rect().bottom()
+        item = tree.itemAt(QtCore.QPoint(0, 0))
+        while item is not None and tree.visualItemRect(item).top() <= viewport_bottom:
+            if item.parent() is not None:
+                self._loadThumbnail(item)
+            item = tree.itemBelow(item)
+
+    def _loadThumbnail(self, item):
+
+        symbol = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if symbol.id() in self._requested_thumbnails:
+            return
+        self._requested_thumbnails.add(symbol.id())
+
+        # built-in symbols only change with the controller version
+        version = Controller.instance().version() if symbol.builtin() else None
+        icon = SymbolThumbnailCache.instance().thumbnail(symbol.id(), version)
+        if icon is not None:
+            item.setIcon(0, icon)
+            if version is not None:
+                return
+        Controller.instance().getStatic(symbol.url(), qpartial(self._symbolDownloadedSlot, item, symbol.id(), version))
+
+    def _symbolDownloadedSlot(self, item, symbol_id, version, path):
+
+        if sip_is_deleted(item):
+            return
+        icon = SymbolThumbnailCache.instance().update(symbol_id, path, version)
+        if icon is not None:
+            item.setIcon(0, icon)
+
+    def showEvent(self, event):
+
+        super().showEvent(event)
+        self._render_timer.start()
+
+    def resizeEvent(self, event):
+
+        super().resizeEvent(event)
+        self._render_timer.start()
+
     def _searchTextChangedSlot(self, text):
         self._filter()
 
@@ -121,15 +173,25 @@ class SymbolSelectionDialog(QtWidgets.QDialog, Ui_SymbolSelectionDialog):
         """
         Hide element not matching the search
         """
-        text = self.uiSearchLineEdit.text()
-        for item in self._symbol_items:
-            # if not item.data(0, QtCore.Qt.ItemDataRole.UserRole).builtin():
-            #     item.setHidden(True)
-            # else:
-            if not text.strip() or text.strip().lower() in item.text(0).lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+
+        text = self.uiSearchLineEdit.text().strip().lower()
+        if self._search_text and text.startswith(self._search_text):
+            # the search is refined, hidden items stay hidden
+            candidates = (index for index in range(len(self._symbol_items)) if index not in self._hidden_items)
+        else:
+            candidates = range(len(self._symbol_items))
+        self._search_text = text
+
+        for index in list(candidates):
+            name, item = self._symbol_items[index]
+            hidden = bool(text) and text not in name
+            if hidden != (index in self._hidden_items):
+                item.setHidden(hidden)
+                if hidden:
+                    self._hidden_items.add(index)
+                else:
+                    self._hidden_items.discard(index)
+        self._render_timer.start()
 
     def _customSymbolToggledSlot(self, checked):
         """
@@ -197,6 +259,7 @@ class SymbolSelectionDialog(QtWidgets.QDialog, Ui_SymbolSelectionDialog):
         if error:
             log.error("Error while uploading symbol: {}: {}".format(path, result.get("message", "unknown")))
             return
+        SymbolThumbnailCache.instance().invalidate(os.path.basename(path))
         self.uiSymbolLineEdit.clear()
         self.uiSymbolLineEdit.setText(path)
         self.uiSymbolLineEdit.setToolTip('<img src="{}"/>'.format(path))
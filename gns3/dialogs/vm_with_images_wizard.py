@@ -17,8 +17,8 @@
 
 
 from .vm_wizard import VMWizard
-from gns3.qt import QtWidgets
-from gns3.controller import Controller
+from gns3.qt import QtWidgets, qslot
+from gns3.image_catalogue import ImageCatalogue
 
 
 class VMWithImagesWizard(VMWizard):
@@ -36,7 +36,11 @@ class VMWithImagesWizard(VMWizard):
         # The list of radio button for existing image or new images
         self._radio_existing_images_buttons = set()
 
+        # emulator of the images displayed in the combo boxes
+        self._images_emulator = None
+
         super().__init__(devices, parent)
+        ImageCatalogue.instance().images_changed_signal.connect(self._imagesChangedSlot)
 
     def refreshImageStepsButtons(self):
         """
@@ -142,7 +146,18 @@ class VMWithImagesWizard(VMWizard):
         :param endpoint: server endpoint with the list of Images
         """
 
-        Controller.instance().getCompute(endpoint, self._compute_id, self._getImagesFromServerCallback)
+        self._images_emulator = endpoint.strip("/").split("/")[0]
+        ImageCatalogue.instance().images(self._compute_id, self._images_emulator, self._getImagesFromServerCallback)
+
+    @qslot
+    def _imagesChangedSlot(self, compute_id, emulator, *args):
+        """
+        Slot called when the images listed in the combo boxes
+        have been refreshed in the background.
+        """
+
+        if self._images_emulator == emulator and self._compute_id == compute_id:
+            ImageCatalogue.instance().images(compute_id, emulator, self._getImagesFromServerCallback)
 
     def _getImagesFromServerCallback(self, result, error=False, **kwargs):
         """
@@ -177,9 +192,14 @@ class VMWithImagesWizard(VMWizard):
 
         for combo_box in self._images_combo_boxes:
             if self._widgetOnCurrentPage(combo_box):
+                # keep the selected image when the list is refreshed
+                selected = combo_box.currentText()
                 combo_box.clear()
                 for vm in result:
                     combo_box.addItem(vm["path"], vm)
+                index = combo_box.findText(selected)
+                if index >= 0:
+                    combo_box.setCurrentIndex(index)
 
     def _widgetOnCurrentPage(self, widget):
         """
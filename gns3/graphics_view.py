@@ -23,6 +23,8 @@ import logging
 import os
 from .qt import sip
 import sys
+import time
+import contextlib
 
 from .qt import QtCore, QtGui, QtNetwork, QtWidgets, qpartial, qslot
 from .items.node_item import NodeItem
@@ -46,6 +48,8 @@ from .local_config import LocalConfig
 from .progress import Progress
 from .utils.server_select import server_select
 from .compute_manager import ComputeManager
+from .bulk_node_operation import BulkNodeOperation
+from .console_launcher import ConsoleLauncher
 from .utils.get_icon import get_icon
 
 # link items
@@ -100,6 +104,16 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self._node_grid_color = self.DEFAULT_NODE_GRID_COLOR
         self._last_mouse_position = None
         self._topology = Topology.instance()
+
+        # registry of the node and link items on the scene (node or link ID -> item)
+        self._node_items = {}
+        self._link_items = {}
+
+        # bulk scene mutation state
+        self._bulk_mutation_depth = 0
+        self._bulk_mutation_index_method = None
+        self._bulk_mutation_items = 0
+        self._bulk_mutation_start = None
         self._background_warning_msgbox = QtWidgets.QErrorMessage(self)
         self._background_warning_msgbox.setWindowTitle("Layer position")
 
@@ -195,6 +209,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
         self._main_window.uiLockAllAction.setChecked(False)
 
         # clear all objects on the scene
+        self._node_items.clear()
+        self._link_items.clear()
         self.scene().clear()
 
         # reset zoom / scale
@@ -239,7 +255,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         if enabled:
             self.setCursor(QtCore.Qt.CursorShape.CrossCursor)
         else:
-            if self._newlink and self._newlink in self.scene().items():
+            if self._newlink and self._newlink.scene():
                 self.scene().removeItem(self._newlink)
             self._newlink = None
             self.setCursor(QtCore.Qt.CursorShape.ArrowCursor)
@@ -353,20 +369,12 @@ class GraphicsView(QtWidgets.QGraphicsView):
         link = self._topology.getLink(link_id)
         if not link:
             return
-        source_item = None
-        destination_item = None
         source_port = link.sourcePort()
         destination_port = link.destinationPort()
 
         # find the correct source and destination node items
-        for item in self.scene().items():
-            if isinstance(item, NodeItem):
-                if item.node().id() == link.sourceNode().id():
-                    source_item = item
-                if item.node().id() == link.destinationNode().id():
-                    destination_item = item
-            if source_item and destination_item:
-                break
+        source_item = self.nodeItem(link.sourceNode().id())
+        destination_item = self.nodeItem(link.destinationNode().id())
 
         if not source_item or not destination_item:
             log.error("Could not find a source or destination item for the link!")
@@ -378,6 +386,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         else:
             link_item = EthernetLinkItem(source_item, source_port, destination_item, destination_port, link)
         self.scene().addItem(link_item)
+        self._link_items[link_id] = link_item
 
     def deleteLinkSlot(self, link_id):
         """
@@ -387,6 +396,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         :param link_id: link identifier
         """
 
+        self._link_items.pop(link_id, None)
         link = self._topology.getLink(link_id)
         self._topology.removeLink(link)
 
@@ -426,7 +436,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
                 QtWidgets.QMessageBox.warning(self, "Create link", "Can't create the link the destination port is not free")
                 return
 
-            if self._newlink in self.scene().items():
+            if self._newlink.scene():
                 self.scene().removeItem(self._newlink)
             self._newlink = None
             self.addLink(source_item.node(), source_port, destination_item.node(), destination_port)
@@ -452,9 +462,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
         if item and (isinstance(item, LogoItem) or isinstance(item.parentItem(), LogoItem)):
             is_not_logo = False
         else:
-            for it in self.scene().items():
-                if isinstance(it, LinkItem):
-                    it.setHovered(False)
+            for link_item in self.linkItems():
+                link_item.setHovered(False)
 
         if (event.buttons() == QtCore.Qt.MouseButton.LeftButton and event.modifiers() == QtCore.Qt.KeyboardModifier.ShiftModifier) or event.buttons() == QtCore.Qt.MouseButton.MiddleButton:
             # checks to see if either the middle mouse is pressed
@@ -532,17 +541,15 @@ class GraphicsView(QtWidgets.QGraphicsView):
         if item and (isinstance(item, LogoItem) or isinstance(item.parentItem(), LogoItem)):
             is_not_logo = False
         else:
-            for it in self.scene().items():
-                if isinstance(it, LinkItem):
-                    it.setHovered(False)
+            for link_item in self.linkItems():
+                link_item.setHovered(False)
 
         if is_not_link and is_not_logo and not self._adding_link:
             if item and not sip.isdeleted(item):
                 # Prevent right clicking on a selected item from de-selecting all other items
                 if not item.isSelected():
                     if not (event.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier):
-                        for it in self.scene().items():
-                            it.setSelected(False)
+                        self.scene().clearSelection()
                     item.setSelected(True)
                 self._showDeviceContextualMenu(event.globalPos())
             # when more than one item is selected display the contextual menu even if mouse is not above an item
@@ -639,7 +646,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
             hBar.setValue(int(hBar.value() + (delta.x() if QtWidgets.QApplication.isRightToLeft() else -delta.x())))
             vBar.setValue(int(vBar.value() - delta.y()))
             self._last_mouse_position = mapped_global_pos
-        if self._adding_link and self._newlink and self._newlink in self.scene().items():
+        if self._adding_link and self._newlink and self._newlink.scene():
             # update the mouse position when the user is adding a link.
             self._newlink.setMousePoint(self.mapToScene(event.position().toPoint()))
             event.ignore()
@@ -769,8 +776,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         # Make sure to deselect all items.
         # This is to prevent a bug on Windows
         # see https://github.com/GNS3/gns3-gui/issues/2986
-        for it in self.scene().items():
-            it.setSelected(False)
+        self.scene().clearSelection()
 
     def populateDeviceContextualMenu(self, menu):
         """
@@ -977,9 +983,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         contextual menu.
         """
 
-        for item in self.scene().selectedItems():
-            if isinstance(item, NodeItem) and hasattr(item.node(), "start") and item.node().initialized():
-                item.node().start()
+        self._selectedNodesOperation("start")
 
     def stopActionSlot(self):
         """
@@ -987,9 +991,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         contextual menu.
         """
 
-        for item in self.scene().selectedItems():
-            if isinstance(item, NodeItem) and hasattr(item.node(), "stop") and item.node().initialized():
-                item.node().stop()
+        self._selectedNodesOperation("stop")
 
     def suspendActionSlot(self):
         """
@@ -997,9 +999,7 @@ class GraphicsView(QtWidgets.QGraphicsView):
         contextual menu.
         """
 
-        for item in self.scene().selectedItems():
-            if isinstance(item, NodeItem) and hasattr(item.node(), "suspend") and item.node().initialized():
-                item.node().suspend()
+        self._selectedNodesOperation("suspend")
 
     def reloadActionSlot(self):
         """
@@ -1007,9 +1007,23 @@ class GraphicsView(QtWidgets.QGraphicsView):
         contextual menu.
         """
 
+        self._selectedNodesOperation("reload")
+
+    def _selectedNodesOperation(self, operation):
+        """
+        Starts, stops, suspends or reloads the selected nodes.
+
+        :param operation: node operation
+        """
+
+        nodes = []
         for item in self.scene().selectedItems():
-            if isinstance(item, NodeItem) and hasattr(item.node(), "reload") and item.node().initialized():
-                item.node().reload()
+            if isinstance(item, NodeItem) and hasattr(item.node(), operation) and item.node().initialized():
+                nodes.append(item.node())
+        if len(nodes) == 1:
+            getattr(nodes[0], operation)()
+        elif nodes:
+            BulkNodeOperation(operation, nodes).run()
 
     def configureActionSlot(self):
         """
@@ -1136,20 +1150,15 @@ class GraphicsView(QtWidgets.QGraphicsView):
                 QtWidgets.QMessageBox.warning(self, "Console", "This node must be started before a console can be opened")
 
         delay = self._main_window.settings()["delay_console_all"]
-        counter = 0
-        for name in sorted(nodes.keys(), key=str.casefold):
-            node = nodes[name]
-            callback = qpartial(self.consoleToNode, node)
-            self._main_window.run_later(counter, callback)
-            counter += delay
+        nodes = [nodes[name] for name in sorted(nodes.keys(), key=str.casefold)]
+        ConsoleLauncher.instance().launch(nodes, delay, open_console=self.consoleToNode)
 
     def consoleFromAllItems(self):
         """
         Console from all scene items with console type different than "none"
         """
 
-        items = [item for item in self.scene().items()
-                 if isinstance(item, NodeItem) and item.node().consoleType() != "none"]
+        items = [item for item in self.nodeItems() if item.node().consoleType() != "none"]
         nb_items = len(items)
         if nb_items > 10:
             proceed = QtWidgets.QMessageBox.question(self,
@@ -1215,12 +1224,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
                 QtWidgets.QMessageBox.warning(self, "Console", "This node must be started before a console can be opened")
 
         delay = self._main_window.settings()["delay_console_all"]
-        counter = 0
-        for name in sorted(nodes.keys(), key=str.casefold):
-            node = nodes[name]
-            callback = qpartial(self.consoleToNode, node, aux=True)
-            self._main_window.run_later(counter, callback)
-            counter += delay
+        nodes = [nodes[name] for name in sorted(nodes.keys(), key=str.casefold)]
+        ConsoleLauncher.instance().launch(nodes, delay, aux=True, open_console=qpartial(self.consoleToNode, aux=True))
 
     def auxConsoleActionSlot(self):
         """
@@ -1380,7 +1385,18 @@ class GraphicsView(QtWidgets.QGraphicsView):
         item = items[0]
         if isinstance(item, NodeItem) and hasattr(item.node(), "idlepc") and item.node().initialized():
             router = item.node()
-            router.computeAutoIdlepc(self._autoIdlepcCallback)
+            force = False
+            known_idlepc = router.knownIdlepc()
+            if known_idlepc:
+                reply = QtWidgets.QMessageBox.question(self,
+                                                       "Auto Idle-PC",
+                                                       "Idle-PC value {} has already been validated for this IOS image, apply it?\n\n"
+                                                       "Choose No to search for a new value.".format(known_idlepc),
+                                                       QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No | QtWidgets.QMessageBox.StandardButton.Cancel)
+                if reply == QtWidgets.QMessageBox.StandardButton.Cancel:
+                    return
+                force = reply == QtWidgets.QMessageBox.StandardButton.No
+            router.computeAutoIdlepc(self._autoIdlepcCallback, force=force)
 
     def _autoIdlepcCallback(self, result, error=False, context={}, **kwargs):
         """
@@ -1394,6 +1410,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
             idlepc = result["idlepc"]
             log.debug("{} has received the auto idle-pc value: {}".format(router.name(), idlepc))
             router.setIdlepc(idlepc)
+            if not kwargs.get("known"):
+                router.recordIdlepc(idlepc)
             # apply Idle-PC to all routers with the same IOS image
             ios_image = os.path.basename(router.settings()["image"])
             for node in Topology.instance().nodes():
@@ -1626,6 +1644,8 @@ class GraphicsView(QtWidgets.QGraphicsView):
         node_item = NodeItem(node)
 
         self.scene().addItem(node_item)
+        self._node_items[node.id()] = node_item
+        node.deleted_signal.connect(qpartial(self._nodeItemDeletedSlot, node.id()))
         self._topology.addNode(node)
 
         node.error_signal.connect(self._displayNodeErrorSlot)
@@ -1633,6 +1653,107 @@ class GraphicsView(QtWidgets.QGraphicsView):
 
         return node_item
 
+    @contextlib.contextmanager
+    def bulkSceneMutation(self):
+        """
+        Context manager used when adding or removing many items on the scene
+        (e.g. opening a project or restoring a snapshot).
+
+        The scene index, viewport updates and topology summary signals are
+        suspended and everything is rebuilt and repainted once at the end.
+        Contexts can be nested, only the outermost one has an effect.
+        """
+
+        self._bulk_mutation_depth += 1
+        if self._bulk_mutation_depth == 1:
+            self._beginBulkSceneMutation()
+        try:
+            yield
+        finally:
+            self._bulk_mutation_depth -= 1
+            if self._bulk_mutation_depth == 0:
+                self._endBulkSceneMutation()
+
+    def inBulkSceneMutation(self):
+        """
+        Returns True if the scene is being mutated in bulk.
+        """
+
+        return self._bulk_mutation_depth > 0
+
+    def _beginBulkSceneMutation(self):
+
+        self._bulk_mutation_start = time.monotonic()
+        scene = self.scene()
+        self._bulk_mutation_index_method = scene.itemIndexMethod()
+        self._bulk_mutation_items = len(self._node_items) + len(self._link_items)
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
+        scene.blockSignals(True)
+        self.viewport().setUpdatesEnabled(False)
+        self._main_window.uiTopologySummaryTreeWidget.beginBulkUpdate()
+
+    def _endBulkSceneMutation(self):
+
+        scene = self.scene()
+        # switching the index method back rebuilds the scene index once
+        scene.setItemIndexMethod(self._bulk_mutation_index_method)
+        scene.blockSignals(False)
+        self.viewport().setUpdatesEnabled(True)
+        self._main_window.uiTopologySummaryTreeWidget.endBulkUpdate()
+        self.viewport().update()
+        scene.selectionChanged.emit()
+        items = len(self._node_items) + len(self._link_items)
+        log.debug("Bulk scene mutation ({} -> {} nodes and links) done in {:.3f} seconds".format(self._bulk_mutation_items,
+                                                                                              items,
+                                                                                              time.monotonic() - self._bulk_mutation_start))
+
+    def _nodeItemDeletedSlot(self, node_id, *args):
+        """
+        Slot called when a node has been deleted.
+
+        :param node_id: node identifier
+        """
+
+        self._node_items.pop(node_id, None)
+
+    def nodeItem(self, node_id):
+        """
+        Returns the item representing a node on the scene.
+
+        :param node_id: node identifier
+        :returns: NodeItem instance or None
+        """
+
+        return self._node_items.get(node_id)
+
+    def nodeItems(self):
+        """
+        Returns all the node items on the scene.
+
+        :returns: list of NodeItem instances
+        """
+
+        return list(self._node_items.values())
+
+    def linkItem(self, link_id):
+        """
+        Returns the item representing a link on the scene.
+
+        :param link_id: link identifier
+        :returns: LinkItem instance or None
+        """
+
+        return self._link_items.get(link_id)
+
+    def linkItems(self):
+        """
+        Returns all the link items on the scene.
+
+        :returns: list of LinkItem instances
+        """
+
+        return list(self._link_items.values())
+
     @qslot
     def _displayNodeErrorSlot(self, node_id, message, *args):
         """
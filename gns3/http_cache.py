@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Cache for the responses of GET queries sent to the controller.
+"""
+
+import os
+import json
+import time
+import hashlib
+import collections
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class HTTPResponseCache:
+    """
+    Stores response bodies with their ETag / Last-Modified validators
+    so GET queries can be revalidated with If-None-Match / If-Modified-Since.
+
+    A response can be served without any query while its endpoint
+    time-to-live (TTL) has not expired, by default responses are always revalidated.
+
+    The most recently used response bodies are kept in memory, the
+    others are read again from the directory when it is set.
+
+    :param directory: optional directory where the responses are persisted
+    """
+
+    # bounds of the response bodies kept in memory
+    MAX_MEMORY_ENTRIES = 64
+    MAX_MEMORY_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, directory=None):
+
+        self._entries = collections.OrderedDict()
+        self._memory_size = 0
+        self._ttls = {}
+        self._directory = directory
+        # keys of the responses persisted on disk, loaded on first use
+        self._disk_keys = None
+        self._hits = 0
+        self._misses = 0
+
+    def setDirectory(self, directory):
+        """
+        Sets the directory where the responses are persisted.
+
+        :param directory: path or None to keep the responses in memory only
+        """
+
+        self._directory = directory
+        self._entries = collections.OrderedDict()
+        self._memory_size = 0
+        self._disk_keys = None
+
+    def directory(self):
+
+        return self._directory
+
+    def setTTL(self, path, ttl):
+        """
+        Sets how long the responses of an endpoint can be used without being revalidated.
+
+        :param path: path prefix of the endpoint (e.g. "/appliances")
+        :param ttl: time-to-live in seconds (0 to always revalidate)
+        """
+
+        self._ttls[path] = ttl
+
+    def ttl(self, key):
+        """
+        Returns the time-to-live for a cache key (the longest matching path prefix wins).
+
+        :param key: cache key
+        :returns: time-to-live in seconds
+        """
+
+        ttl = 0
+        matched = -1
+        for path, path_ttl in self._ttls.items():
+            if key.startswith(path) and len(path) > matched:
+                ttl = path_ttl
+                matched = len(path)
+        return ttl
+
+    def _entryPath(self, key):
+
+        return os.path.join(self._directory, hashlib.md5(key.encode()).hexdigest())
+
+    def _diskKeys(self):
+        """
+        Returns the keys of the responses persisted on disk.
+        """
+
+        if self._disk_keys is None:
+            self._disk_keys = set()
+            if self._directory and os.path.isdir(self._directory):
+                for filename in os.listdir(self._directory):
+                    if not filename.endswith(".json"):
+                        continue
+                    try:
+                        with open(os.path.join(self._directory, filename), encoding="utf-8") as f:
+                            self._disk_keys.add(json.load(f)["key"])
+                    except (OSError, ValueError, KeyError) as e:
+                        log.debug("Invalid cached response {}: {}".format(filename, e))
+        return self._disk_keys
+
+    def get(self, key):
+        """
+        Returns a cached response.
+
+        :param key: cache key
+        :returns: dictionary or None
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self._directory and key in self._diskKeys():
+            path = self._entryPath(key)
+            try:
+                with open(path + ".json", encoding="utf-8") as f:
+                    entry = json.load(f)
+                if entry.get("key") != key:
+                    return None
+                with open(path + ".body", "rb") as f:
+                    entry["body"] = f.read()
+                self._keep(entry)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                log.debug("Could not load cached response for {}: {}".format(key, e))
+                return None
+        return entry
+
+    def isFresh(self, key):
+        """
+        Returns True if the response can be used without revalidating it.
+
+        :param key: cache key
+        """
+
+        entry = self.get(key)
+        if entry is None:
+            return False
+        return time.time() - entry["stored"] < self.ttl(key)
+
+    def validationHeaders(self, key):
+        """
+        Returns the conditional headers to send for a cache key.
+
+        :param key: cache key
+        :returns: list of (header, value) tuples
+        """
+
+        entry = self.get(key)
+        headers = []
+        if entry is not None:
+            if entry.get("etag"):
+                headers.append((b"If-None-Match", entry["etag"].encode()))
+            if entry.get("last_modified"):
+                headers.append((b"If-Modified-Since", entry["last_modified"].encode()))
+        return headers
+
+    def store(self, key, body, content_type, etag=None, last_modified=None):
+        """
+        Stores a response.
+
+        :param key: cache key
+        :param body: raw body (bytes)
+        :param content_type: content type of the response
+        :param etag: value of the ETag header
+        :param last_modified: value of the Last-Modified header
+        """
+
+        entry = {
+            "key": key,
+            "body": body,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored": time.time()
+        }
+        self._keep(entry)
+        self._misses += 1
+        self._save(entry)
+
+    def revalidated(self, key):
+        """
+        Called when the controller replied that a cached response has not been modified.
+
+        :param key: cache key
+        :returns: the cached entry
+        """
+
+        entry = self.get(key)
+        if entry is not None:
+            self._hits += 1
+            # the time of storage only matters for responses used without revalidation
+            if self.ttl(key) > 0:
+                entry["stored"] = time.time()
+                self._save(entry, with_body=False)
+        return entry
+
+    def hit(self, key):
+        """
+        Returns a fresh entry and counts it as a cache hit.
+
+        :param key: cache key
+        """
+
+        self._hits += 1
+        return self.get(key)
+
+    def _keep(self, entry):
+        """
+        Keeps an entry in memory, the least recently used ones are dropped.
+        """
+
+        previous = self._entries.pop(entry["key"], None)
+        if previous is not None:
+            self._memory_size -= len(previous["body"])
+        self._entries[entry["key"]] = entry
+        self._memory_size += len(entry["body"])
+        while len(self._entries) > 1 and (len(self._entries) > self.MAX_MEMORY_ENTRIES or self._memory_size > self.MAX_MEMORY_SIZE):
+            _, dropped = self._entries.popitem(last=False)
+            self._memory_size -= len(dropped["body"])
+
+    def _save(self, entry, with_body=True):
+
+        if not self._directory:
+            return
+        metadata = dict(entry)
+        del metadata["body"]
+        path = self._entryPath(entry["key"])
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            if with_body:
+                with open(path + ".body", "wb") as f:
+                    f.write(entry["body"])
+            with open(path + ".json", "w", encoding="utf-8") as f:
+                json.dump(metadata, f)
+            self._diskKeys().add(entry["key"])
+        except OSError as e:
+            log.debug("Could not save cached response for {}: {}".format(entry["key"], e))
+
+    def invalidate(self, path=None):
+        """
+        Removes the cached responses.
+
+        :param path: path prefix of the responses to remove (None = all)
+        """
+
+        for key in list(self._entries):
+            if path is None or key.startswith(path):
+                self._memory_size -= len(self._entries.pop(key)["body"])
+
+        if self._directory:
+            disk_keys = self._diskKeys()
+            for key in list(disk_keys):
+                if path is None or key.startswith(path):
+                    disk_keys.discard(key)
+                    entry_path = self._entryPath(key)
+                    for extension in (".json", ".body"):
+                        try:
+                            os.remove(entry_path + extension)
+                        except FileNotFoundError:
+                            pass
+                        except OSError as e:
+                            log.debug("Could not remove cached response {}: {}".format(entry_path, e))
+
+    def stats(self):
+        """
+        Returns the number of cache hits and misses.
+
+        :returns: tuple (hits, misses)
+        """
+
+        return self._hits, self._misses
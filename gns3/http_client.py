@@ -17,6 +17,7 @@
 
 from .qt import sip
 import json
+import time
 import copy
 import uuid
 import pathlib
@@ -28,6 +29,7 @@ import urllib.parse
 from .version import __version__, __version_info__
 from .qt import QtCore, QtNetwork, QtWidgets, qpartial, sip_is_deleted
 from .utils import parse_version
+from .http_cache import HTTPResponseCache
 
 import logging
 log = logging.getLogger(__name__)
@@ -51,6 +53,12 @@ class HTTPClient(QtCore.QObject):
     # Callback class used for displaying progress
     _progress_callback = None
 
+    # Callback class used for displaying the file transfers
+    _transfer_callback = None
+
+    # minimum delay between two progress notifications of a query (in seconds)
+    PROGRESS_INTERVAL = 0.1
+
     connection_connected_signal = QtCore.Signal()
     connection_disconnected_signal = QtCore.Signal()
 
@@ -99,6 +107,11 @@ class HTTPClient(QtCore.QObject):
         # A buffer used by progress download
         self._buffer = {}
 
+        # time of the last progress notification for each query
+        self._progress_timestamps = {}
+        # queries displayed as file transfers
+        self._transfers = set()
+
         # List of query waiting for the connection
         self._query_waiting_connections = []
 
@@ -108,6 +121,40 @@ class HTTPClient(QtCore.QObject):
         # Store SSL error exceptions
         self._ssl_exceptions = {}
 
+        # Cache for the GET queries sent with cache=True
+        self._response_cache = HTTPResponseCache()
+
+    def responseCache(self):
+        """
+        :returns: HTTPResponseCache instance used for the GET queries sent with cache=True
+        """
+
+        return self._response_cache
+
+    def setResponseCacheTTL(self, path, ttl, prefix="/v2"):
+        """
+        Sets how long the cached responses of an endpoint are used without asking the server.
+
+        :param path: path prefix of the endpoint
+        :param ttl: time-to-live in seconds (0 to always revalidate)
+        :param prefix: prefix of the path
+        """
+
+        self._response_cache.setTTL(prefix + path, ttl)
+
+    def invalidateResponseCache(self, path=None, prefix="/v2"):
+        """
+        Removes cached responses.
+
+        :param path: path prefix of the responses to remove (None = all)
+        :param prefix: prefix of the path
+        """
+
+        if path is None:
+            self._response_cache.invalidate()
+        else:
+            self._response_cache.invalidate(prefix + path)
+
     def setMaxTimeDifferenceBetweenQueries(self, value):
         self._max_time_difference_between_queries = value
 
@@ -199,39 +246,71 @@ class HTTPClient(QtCore.QObject):
         """
         return self._max_retry_connection
 
-    def _notify_progress_start_query(self, query_id, progress_text, response):
+    def _notify_progress_start_query(self, query_id, progress_text, response, transfer=None):
         """
         Called when a query start
+
+        :param transfer: "upload" or "download" if the query is a file transfer
         """
+
+        if transfer and HTTPClient._transfer_callback is not None:
+            # file transfers are displayed without blocking the GUI
+            self._transfers.add(query_id)
+            HTTPClient._transfer_callback.addTransfer(query_id,
+                                                      progress_text or "{} {}".format(transfer.capitalize(), response.url().path()),
+                                                      transfer,
+                                                      cancel_callback=qpartial(self._requestCanceled, response, {"query_id": query_id}))
+            return
         if not sip_is_deleted(HTTPClient._progress_callback):
             if progress_text:
                 HTTPClient._progress_callback.add_query_signal.emit(query_id, progress_text, response)
             else:
                 HTTPClient._progress_callback.add_query_signal.emit(query_id, "Waiting for {}".format(self.url()), response)
 
-    def _notify_progress_end_query(cls, query_id):
+    def _notify_progress_end_query(self, query_id):
         """
         Called when a query is over
         """
 
-        if not sip_is_deleted(HTTPClient._progress_callback):
+        self._progress_timestamps.pop(query_id, None)
+        if query_id in self._transfers:
+            self._transfers.discard(query_id)
+            HTTPClient._transfer_callback.removeTransfer(query_id)
+        elif not sip_is_deleted(HTTPClient._progress_callback):
             HTTPClient._progress_callback.remove_query_signal.emit(query_id)
 
+    def _notify_progress(self, query_id, sent, total):
+        """
+        Called when a query upload or download progress, the notifications
+        are throttled to PROGRESS_INTERVAL.
+        """
+
+        now = time.monotonic()
+        if sent != total and now - self._progress_timestamps.get(query_id, 0) < self.PROGRESS_INTERVAL:
+            return
+        self._progress_timestamps[query_id] = now
+
+        if query_id in self._transfers:
+            # a negative total means the size is unknown
+            HTTPClient._transfer_callback.updateTransfer(query_id, abs(sent), total)
+        elif not sip_is_deleted(HTTPClient._progress_callback):
+            # abs() for maximum because sometimes the system send negative
+            # values
+            HTTPClient._progress_callback.progress_signal.emit(query_id, abs(sent), abs(total))
+
     def _notify_progress_upload(self, query_id, sent, total):
         """
         Called when a query upload progress
         """
-        if not sip_is_deleted(HTTPClient._progress_callback):
-            HTTPClient._progress_callback.progress_signal.emit(query_id, str(abs(sent)), str(abs(total)))
+
+        self._notify_progress(query_id, sent, total)
 
     def _notify_progress_download(self, query_id, sent, total):
         """
         Called when a query download progress
         """
-        if not sip_is_deleted(HTTPClient._progress_callback):
-            # abs() for maximum because sometimes the system send negative
-            # values
-            HTTPClient._progress_callback.progress_signal.emit(query_id, str(abs(sent)), str(abs(total)))
+
+        self._notify_progress(query_id, sent, total)
 
     @classmethod
     def setProgressCallback(cls, progress_callback):
@@ -241,6 +320,14 @@ class HTTPClient(QtCore.QObject):
 
         cls._progress_callback = progress_callback
 
+    @classmethod
+    def setTransferCallback(cls, transfer_callback):
+        """
+        :param transfer_callback: A transfer manager instance
+        """
+
+        cls._transfer_callback = transfer_callback
+
     def connected(self):
         """
         Returns if the client is connected.
@@ -292,6 +379,7 @@ class HTTPClient(QtCore.QObject):
             params=None,
             networkManager=None,
             eventsHandler=None,
+            cache=False,
             **kwargs
     ):
         """
@@ -303,7 +391,8 @@ class HTTPClient(QtCore.QObject):
         :param callback: callback method to call when the server replies
         :param context: Pass a context to the response callback
         :param downloadProgressCallback: Callback called when received something, it can be an incomplete response
-        :param showProgress: Display progress to the user
+        :param showProgress: Display progress to the user (file uploads and streamed downloads
+        are displayed in the transfers dock instead of the progress dialog)
         :param progressText: Text display to user in the progress dialog. None for auto generated
         :param ignoreErrors: Ignore connection error (usefull to not closing a connection when notification feed is broken)
         :param server: The server where the query will run
@@ -313,7 +402,9 @@ class HTTPClient(QtCore.QObject):
         :param eventsHandler: Handler receiving and triggering events like `updated`, `cancelled`.
                               If not specified and showProgress is `True` then `ProgressDialog` receives them.
         :param params: Query arguments parameters
-        :returns: QNetworkReply
+        :param cache: Cache the response of a GET query and revalidate it with the server (ETag / Last-Modified)
+        :returns: QNetworkReply, or None when no query is sent right away (shutdown in progress,
+        waiting for the connection or response served from the cache)
         """
 
         if "dev" in __version__:
@@ -335,6 +426,18 @@ class HTTPClient(QtCore.QObject):
         #         return
         #     self._last_query_timestamp = now
 
+        if method == "GET" and cache:
+            cache_key = "{}{}{}".format(prefix, path, self._paramsToQueryString(params))
+            if self._response_cache.isFresh(cache_key):
+                # the callback is always called asynchronously
+                QtCore.QTimer.singleShot(0, qpartial(self._processCachedResponse, cache_key, qpartial(callback), server, context))
+                return None
+        else:
+            cache_key = None
+            if method != "GET":
+                # modifying a resource invalidates the cached collection it belongs to
+                self._response_cache.invalidate("{}{}".format(prefix, path.split("?")[0].rsplit("/", 1)[0] or path))
+
         request = qpartial(
             self._executeHTTPQuery,
             method,
@@ -351,7 +454,8 @@ class HTTPClient(QtCore.QObject):
             timeout=timeout,
             prefix=prefix,
             eventsHandler=eventsHandler,
-            params=params
+            params=params,
+            cache_key=cache_key
         )
 
         if self._connected:
@@ -570,6 +674,8 @@ class HTTPClient(QtCore.QObject):
             params=None,
             networkManager=None,
             eventsHandler=None,
+            cache_key=None,
+            revalidate=True,
             **kwargs
     ):
         """
@@ -590,6 +696,8 @@ class HTTPClient(QtCore.QObject):
         :param eventsHandler: Handler receiving and triggering events like `updated`, `cancelled`.
                       If not specified and showProgress is `True` then `ProgressDialog` receives them.
         :param params: Query arguments parameters
+        :param cache_key: Key of the response in the response cache
+        :param revalidate: Send the validators of the cached response
         :returns: QNetworkReply
         """
 
@@ -605,6 +713,33 @@ class HTTPClient(QtCore.QObject):
         request = self._request(url)
         request = self._addAuth(request)
         request.setRawHeader(b"User-Agent", "GNS3 QT Client v{version}".format(version=__version__).encode())
+        retry = None
+        if cache_key is not None and revalidate:
+            validation_headers = self._response_cache.validationHeaders(cache_key)
+            for header, value in validation_headers:
+                request.setRawHeader(header, value)
+            if validation_headers:
+                # the query is sent again without validators if the cached response is gone when the reply arrives
+                retry = qpartial(self._executeHTTPQuery, method, path, callback, body, context,
+                                 downloadProgressCallback=downloadProgressCallback,
+                                 showProgress=showProgress,
+                                 ignoreErrors=ignoreErrors,
+                                 progressText=progressText,
+                                 server=server,
+                                 timeout=timeout,
+                                 prefix=prefix,
+                                 params=params,
+                                 networkManager=networkManager,
+                                 eventsHandler=eventsHandler,
+                                 cache_key=cache_key,
+                                 revalidate=False)
+
+        # file uploads and streamed downloads are file transfers
+        transfer = None
+        if isinstance(body, pathlib.Path):
+            transfer = "upload"
+        elif downloadProgressCallback is not None:
+            transfer = "download"
 
         # By default, QT doesn't support GET with body even if it's in the RFC that's why we need to use sendCustomRequest
         body = self._addBodyToRequest(body, request)
@@ -624,7 +759,7 @@ class HTTPClient(QtCore.QObject):
             context = dict()
         context["query_id"] = str(uuid.uuid4())
 
-        response.finished.connect(qpartial(self._processResponse, response, server, callback, context, body, ignoreErrors))
+        response.finished.connect(qpartial(self._processResponse, response, server, callback, context, body, ignoreErrors, cache_key=cache_key, retry=retry))
         response.errorOccurred.connect(qpartial(self._processError, response, server, callback, context, body, ignoreErrors))
 
         if downloadProgressCallback is not None:
@@ -632,17 +767,22 @@ class HTTPClient(QtCore.QObject):
 
         request_canceled = qpartial(self._requestCanceled, response, context)
 
+        if not showProgress or HTTPClient._transfer_callback is None:
+            transfer = None
+
         if eventsHandler is not None:
             eventsHandler.canceled.connect(request_canceled)
-        elif not sip_is_deleted(HTTPClient._progress_callback) and HTTPClient._progress_callback.progress_dialog():
+        elif transfer is None and not sip_is_deleted(HTTPClient._progress_callback) and HTTPClient._progress_callback.progress_dialog():
             HTTPClient._progress_callback.progress_dialog().canceled.connect(request_canceled)
 
         if showProgress:
-            response.uploadProgress.connect(qpartial(self._notify_progress_upload, context["query_id"]))
-            response.downloadProgress.connect(qpartial(self._notify_progress_download, context["query_id"]))
+            if transfer != "download":
+                response.uploadProgress.connect(qpartial(self._notify_progress_upload, context["query_id"]))
+            if transfer != "upload":
+                response.downloadProgress.connect(qpartial(self._notify_progress_download, context["query_id"]))
             # Should be the last operation otherwise we have race condition in Qt
             # where query start before finishing connect to everything
-            self._notify_progress_start_query(context["query_id"], progressText, response)
+            self._notify_progress_start_query(context["query_id"], progressText, response, transfer=transfer)
 
         if timeout is not None:
             QtCore.QTimer.singleShot(timeout * 1000, qpartial(self._timeoutSlot, response, timeout))
@@ -676,7 +816,10 @@ class HTTPClient(QtCore.QObject):
                     callback(answer, server=server, context=context)
                     content = content[index:]
             except ValueError:  # Partial JSON
-                self._buffer[context["query_id"]] = content
+                if content:
+                    self._buffer[context["query_id"]] = content
+                else:
+                    self._buffer.pop(context["query_id"], None)
         else:
             callback(content, server=server, context=context)
 
@@ -705,6 +848,7 @@ class HTTPClient(QtCore.QObject):
             response.abort()
         if "query_id" in context:
             self._notify_progress_end_query(context["query_id"])
+            self._buffer.pop(context["query_id"], None)
 
     def _processError(self, response, server, callback, context, request_body, ignore_errors, error_code):
         if error_code != QtNetwork.QNetworkReply.NetworkError.NoError:
@@ -756,45 +900,102 @@ class HTTPClient(QtCore.QObject):
                 except (ValueError, KeyError):
                     log.error(error_message)
 
-    def _processResponse(self, response, server, callback, context, request_body, ignore_errors):
+    def _processCachedResponse(self, cache_key, callback, server, context):
+        """
+        Calls the callback with a response from the cache.
+        """
+
+        entry = self._response_cache.hit(cache_key)
+        if entry is None or callback is None:
+            return
+        log.debug("Response for {} served from cache".format(cache_key))
+        if context:
+            context = copy.copy(context)
+        else:
+            context = dict()
+        self._callbackWithBody(callback, 200, entry["body"], entry["content_type"], server, context)
+
+    def _processResponse(self, response, server, callback, context, request_body, ignore_errors, cache_key=None, retry=None):
         if request_body is not None:
             request_body.close()
 
         if "query_id" in context:
             self._notify_progress_end_query(context["query_id"])
+            self._buffer.pop(context["query_id"], None)
 
         if response.error() == QtNetwork.QNetworkReply.NetworkError.NoError:
             status = response.attribute(QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute)
             log.debug("Decoding response from {} response {}".format(response.url().toString(), status))
-            try:
-                raw_body = bytes(response.readAll())
-                body = raw_body.decode("utf-8").strip("\0")
-            # Some time anti-virus intercept our query and reply with garbage content
-            except UnicodeDecodeError:
-                body = None
+            raw_body = bytes(response.readAll())
             content_type = response.header(QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader)
-            if body and len(body.strip(" \n\t")) > 0 and content_type == "application/json":
-                try:
-                    params = json.loads(body)
-                except ValueError:  # Partial JSON
-                    params = {}
-                    status = 504
-            else:
+            if cache_key is not None:
+                if status == 304:
+                    entry = self._response_cache.revalidated(cache_key)
+                    if entry is None:
+                        # the cached response has been removed while the query was running
+                        if retry is not None:
+                            log.debug("Response for {} not modified but no longer cached, sending the query again".format(cache_key))
+                            retry()
+                            return
+                        log.error("Response for {} not modified but no longer cached".format(cache_key))
+                        status = 504
+                        raw_body = json.dumps({"message": "Cached response for {} is missing".format(cache_key)}).encode()
+                        content_type = "application/json"
+                    else:
+                        log.debug("Response for {} not modified, served from cache".format(cache_key))
+                        status = 200
+                        raw_body = entry["body"]
+                        content_type = entry["content_type"]
+                elif status == 200:
+                    etag = self._rawHeader(response, b"ETag")
+                    last_modified = self._rawHeader(response, b"Last-Modified")
+                    # a response that can neither be revalidated nor reused is not worth keeping
+                    if etag or last_modified or self._response_cache.ttl(cache_key) > 0:
+                        self._response_cache.store(cache_key, raw_body, content_type, etag=etag, last_modified=last_modified)
+            self._callbackWithBody(callback, status, raw_body, content_type, server, context)
+
+    @staticmethod
+    def _rawHeader(response, header):
+        """
+        Returns the value of a response header or None.
+        """
+
+        if not response.hasRawHeader(header):
+            return None
+        return bytes(response.rawHeader(header)).decode("utf-8", errors="replace")
+
+    def _callbackWithBody(self, callback, status, raw_body, content_type, server, context):
+        """
+        Decodes a response body and calls the callback.
+        """
+
+        try:
+            body = raw_body.decode("utf-8").strip("\0")
+        # Some time anti-virus intercept our query and reply with garbage content
+        except UnicodeDecodeError:
+            body = None
+        if body and len(body.strip(" \n\t")) > 0 and content_type == "application/json":
+            try:
+                params = json.loads(body)
+            except ValueError:  # Partial JSON
                 params = {}
-            if callback is not None:
-                if status >= 400:
-                    callback(params, error=True, server=server, context=context)
-                else:
-                    callback(params, server=server, context=context, raw_body=raw_body)
-            if status == 400:
-                try:
-                    params = json.loads(body)
-                    e = HttpBadRequest(body)
-                    e.fingerprint = params["path"]
-                # If something goes wrong for a any reason just raise the bad request
-                except Exception:
-                    e = HttpBadRequest(body)
-                raise e
+                status = 504
+        else:
+            params = {}
+        if callback is not None:
+            if status >= 400:
+                callback(params, error=True, server=server, context=context)
+            else:
+                callback(params, server=server, context=context, raw_body=raw_body)
+        if status == 400:
+            try:
+                params = json.loads(body)
+                e = HttpBadRequest(body)
+                e.fingerprint = params["path"]
+            # If something goes wrong for a any reason just raise the bad request
+            except Exception:
+                e = HttpBadRequest(body)
+            raise e
 
     def getSynchronous(self, method, endpoint, prefix="/v2", timeout=5):
         """
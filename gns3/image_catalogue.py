@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Images available on the computes, shared by the wizards and the registry.
+"""
+
+import time
+import posixpath
+
+from .qt import QtCore, qpartial
+from .controller import Controller
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class ImageListing:
+    """
+    Images of an emulator on a compute, indexed by filename and MD5.
+
+    :param images: list of images sent by the API
+    """
+
+    def __init__(self, images):
+
+        self.images = images
+        self.updated = time.monotonic()
+        self.by_filename = {}
+        self.by_md5 = {}
+        for image in images:
+            name = image.get("path") or image.get("image")
+            if name:
+                self.by_filename.setdefault(posixpath.basename(name.replace("\\", "/")), image)
+            if image.get("md5sum"):
+                self.by_md5.setdefault(image["md5sum"], image)
+
+    def age(self):
+
+        return time.monotonic() - self.updated
+
+
+class ImageCatalogue(QtCore.QObject):
+    """
+    Lists the images of each emulator on each compute. A listing is
+    fetched once, then returned from memory and refreshed in the
+    background when it is older than REFRESH_INTERVAL.
+    """
+
+    # compute ID and emulator of a listing that has changed
+    images_changed_signal = QtCore.Signal(str, str)
+
+    # seconds before a listing is refreshed in the background
+    REFRESH_INTERVAL = 60
+
+    def __init__(self):
+
+        super().__init__()
+        self._listings = {}
+        # callbacks waiting for a listing being fetched
+        self._pending = {}
+        # listings invalidated while they were fetched
+        self._outdated = set()
+        Controller.instance().disconnected_signal.connect(self.invalidate)
+
+    def images(self, compute_id, emulator, callback, progressText=None):
+        """
+        Gets the images of an emulator on a compute.
+
+        :param compute_id: compute identifier
+        :param emulator: emulator (qemu, iou, dynamips, docker...)
+        :param callback: called with the list of images, like an API callback
+        :param progressText: text displayed while the listing is fetched
+        """
+
+        listing = self._listings.get((compute_id, emulator))
+        if listing is not None:
+            callback(list(listing.images))
+            if listing.age() > self.REFRESH_INTERVAL:
+                self._fetch(compute_id, emulator)
+            return
+        self._fetch(compute_id, emulator, callback, progressText=progressText)
+
+    def _fetch(self, compute_id, emulator, callback=None, progressText=None):
+
+        key = (compute_id, emulator)
+        fetching = key in self._pending
+        callbacks = self._pending.setdefault(key, [])
+        if callback is not None:
+            callbacks.append(callback)
+        if fetching:
+            return
+        if progressText is None:
+            # a listing refreshed in the background doesn't show progress
+            kwargs = {"showProgress": callback is not None}
+        else:
+            kwargs = {"progressText": progressText}
+        Controller.instance().getCompute("/{}/images".format(emulator),
+                                         compute_id,
+                                         qpartial(self._listImagesCallback, compute_id, emulator),
+                                         cache=True,
+                                         **kwargs)
+
+    def _listImagesCallback(self, compute_id, emulator, result, error=False, **kwargs):
+
+        callbacks = self._pending.pop((compute_id, emulator), [])
+        if error:
+            if "message" in result:
+                log.error("Error while listing the {} images on {}: {}".format(emulator, compute_id, result["message"]))
+            for callback in callbacks:
+                callback(result, error=True, **kwargs)
+            return
+
+        for callback in callbacks:
+            callback(list(result))
+        if (compute_id, emulator) in self._outdated:
+            self._outdated.discard((compute_id, emulator))
+            return
+        previous = self._listings.get((compute_id, emulator))
+        self._listings[(compute_id, emulator)] = ImageListing(result)
+        if previous is None or previous.images != result:
+            self.images_changed_signal.emit(compute_id, emulator)
+
+    def findByFilename(self, compute_id, emulator, filename):
+        """
+        Returns an image listed on a compute by its filename.
+
+        :param compute_id: compute identifier
+        :param emulator: emulator
+        :param filename: image filename
+        :returns: image sent by the API or None
+        """
+
+        listing = self._listings.get((compute_id, emulator))
+        if listing is None:
+            return None
+        return listing.by_filename.get(filename)
+
+    def findByMd5(self, compute_id, emulator, md5sum):
+        """
+        Returns an image listed on a compute by its MD5 checksum.
+
+        :param compute_id: compute identifier
+        :param emulator: emulator
+        :param md5sum: image MD5 checksum
+        :returns: image sent by the API or None
+        """
+
+        listing = self._listings.get((compute_id, emulator))
+        if listing is None:
+            return None
+        return listing.by_md5.get(md5sum)
+
+    def invalidate(self, compute_id=None, emulator=None):
+        """
+        Forgets listings, they will be fetched again when requested.
+
+        :param compute_id: compute identifier, all the computes if None
+        :param emulator: emulator, all the emulators if None
+        """
+
+        keys = set(self._listings) | set(self._pending)
+        if compute_id is not None and emulator is not None:
+            keys.add((compute_id, emulator))
+        http_client = Controller.instance().getHttpClient()
+        for key in keys:
+            if compute_id in (None, key[0]) and emulator in (None, key[1]):
+                self._listings.pop(key, None)
+                if key in self._pending:
+                    self._outdated.add(key)
+                if http_client is not None:
+                    http_client.invalidateResponseCache("/computes/{}/{}/images".format(*key))
+
+    @staticmethod
+    def reset():
+
+        ImageCatalogue._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of ImageCatalogue.
+
+        :returns: instance of ImageCatalogue
+        """
+
+        if not hasattr(ImageCatalogue, "_instance") or ImageCatalogue._instance is None:
+            ImageCatalogue._instance = ImageCatalogue()
+        return ImageCatalogue._instance
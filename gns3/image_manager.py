@@ -19,10 +19,11 @@ import os
 import copy
 import pathlib
 
-from gns3.qt import QtWidgets
+from gns3.qt import QtWidgets, qpartial
 from gns3.local_server_config import LocalServerConfig
 from gns3.settings import LOCAL_SERVER_SETTINGS
 from gns3.controller import Controller
+from gns3.image_catalogue import ImageCatalogue
 from gns3.utils.file_copy_worker import FileCopyWorker
 from gns3.utils.progress_dialog import ProgressDialog
 from gns3.registry.image import Image
@@ -135,9 +136,15 @@ class ImageManager:
             raise Exception('Invalid node type')
 
         filename = self._getRelativeImagePath(path, node_type).replace("\\", "/")
-        Controller.instance().postCompute('{}/{}'.format(upload_endpoint, filename), server, None, body=pathlib.Path(path), progressText="Uploading {}".format(filename), timeout=None)
+        Controller.instance().postCompute('{}/{}'.format(upload_endpoint, filename), server, qpartial(self._imageUploadedCallback, server, node_type.lower()),
+                                          body=pathlib.Path(path), progressText="Uploading {}".format(filename), timeout=None)
         return filename
 
+    def _imageUploadedCallback(self, server, emulator, result, error=False, **kwargs):
+
+        if not error:
+            ImageCatalogue.instance().invalidate(server, emulator)
+
     def _getRelativeImagePath(self, path, node_type):
         """
         Get a path relative to images directory path
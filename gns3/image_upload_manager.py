@@ -20,6 +20,7 @@ import pathlib
 import urllib.parse
 
 from gns3.http_client import HTTPClient
+from gns3.image_catalogue import ImageCatalogue
 
 import logging
 log = logging.getLogger(__name__)
@@ -72,7 +73,14 @@ class ImageUploadManager(object):
                 if "message" in result:
                     log.error("Error while direct file upload: {}".format(result["message"]))
             return
-        self._callback(result, error, **kwargs)
+        self._uploadedCallback(result, error, **kwargs)
+
+    def _uploadedCallback(self, result, error=False, **kwargs):
+        if not error:
+            # the listing of the images on the compute is outdated
+            ImageCatalogue.instance().invalidate(self._compute_id, self._image.emulator.lower())
+        if self._callback is not None:
+            self._callback(result, error, **kwargs)
 
     def _fileUploadToCompute(self, endpoint):
         log.debug("Uploading image '{}' to compute".format(self._image.path))
@@ -86,5 +94,5 @@ class ImageUploadManager(object):
 
     def _fileUploadToController(self):
         log.debug("Uploading image '{}' to controller".format(self._image.path))
-        self._controller.postCompute(self._getComputePath(), self._compute_id, self._callback, body=pathlib.Path(self._image.path),
+        self._controller.postCompute(self._getComputePath(), self._compute_id, self._uploadedCallback, body=pathlib.Path(self._image.path),
                                      context={"image_path": self._image.path}, progressText="Uploading {}".format(self._image.filename), timeout=None)
@@ -59,6 +59,9 @@ class DrawingItem:
         # Store a hash of the SVG to avoid him
         # to be sent if he doesn't change
         self._hash_svg = None
+        # Hash of the SVG known by the controller to
+        # avoid reloading it if he doesn't change
+        self._loaded_hash_svg = None
 
         if pos:
             self.setPos(pos)
@@ -118,7 +121,21 @@ class DrawingItem:
         self.setLocked(result["locked"])
         self.setRotation(result["rotation"])
         if "svg" in result:
-            self.fromSvg(result["svg"])
+            self.loadSvg(result["svg"])
+
+    def loadSvg(self, svg):
+        """
+        Loads the SVG sent by the controller unless it is
+        the one already displayed.
+
+        :param svg: SVG content
+        """
+
+        hash_svg = binascii.crc32(svg.encode())
+        if hash_svg == self._loaded_hash_svg:
+            return
+        self.fromSvg(svg)
+        self._loaded_hash_svg = hash_svg
 
     def handleKeyPressEvent(self, event):
         """
@@ -179,6 +196,8 @@ class DrawingItem:
         if hash_svg != self._hash_svg:
             data["svg"] = svg
             self._hash_svg = hash_svg
+            # the controller sends back the SVG we have sent
+            self._loaded_hash_svg = hash_svg
         return data
 
     def locked(self):
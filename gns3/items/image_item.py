@@ -40,8 +40,8 @@ class ImageItem(QtSvgWidgets.QGraphicsSvgItem, DrawingItem):
             super().__init__(**kws)
 
         if self._image_path:
-            renderer = QImageSvgRenderer(image_path)
-            self.setSharedRenderer(renderer)
+            self._renderer = QImageSvgRenderer(image_path)
+            self.setSharedRenderer(self._renderer)
 
         # By default center the image
         if pos is None:
@@ -50,7 +50,7 @@ class ImageItem(QtSvgWidgets.QGraphicsSvgItem, DrawingItem):
             self.setPos(x, y)
 
         if svg:
-            svg = self.fromSvg(svg)
+            self.loadSvg(svg)
 
         if 'z' in kws.keys():
             self.setZValue(kws['z'])
@@ -68,8 +68,9 @@ class ImageItem(QtSvgWidgets.QGraphicsSvgItem, DrawingItem):
         self.drawLayerInfo(painter)
 
     def fromSvg(self, svg):
-        renderer = QImageSvgRenderer(svg)
-        self.setSharedRenderer(renderer)
+        # the items are keeping their renderer alive
+        self._renderer = QImageSvgRenderer.shared(svg)
+        self.setSharedRenderer(self._renderer)
 
     def toSvg(self):
         """
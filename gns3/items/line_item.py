@@ -23,6 +23,7 @@ import xml.etree.ElementTree as ET
 
 from ..qt import QtCore, QtGui, QtWidgets
 from .drawing_item import DrawingItem
+from .utils import parseSvg
 
 
 class LineItem(QtWidgets.QGraphicsLineItem, DrawingItem):
@@ -47,7 +48,7 @@ class LineItem(QtWidgets.QGraphicsLineItem, DrawingItem):
                 pen = QtGui.QPen(QtCore.Qt.GlobalColor.black, 2, QtCore.Qt.PenStyle.SolidLine, QtCore.Qt.PenCapStyle.RoundCap, QtCore.Qt.PenJoinStyle.RoundJoin)
                 self.setPen(pen)
         else:
-            self.fromSvg(svg)
+            self.loadSvg(svg)
         if self._id is None:
             self.create()
 
@@ -86,7 +87,7 @@ class LineItem(QtWidgets.QGraphicsLineItem, DrawingItem):
         """
         Import element informations from an SVG
         """
-        svg = ET.fromstring(svg)
+        svg = parseSvg(svg)
         width = float(svg.get("width", 0))
         height = float(svg.get("height", 0))
 
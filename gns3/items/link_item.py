@@ -125,8 +125,7 @@ class LinkItem(QtWidgets.QGraphicsPathItem):
             self.scene().removeItem(self._destination_port.label())
 
         if self.scene():
-            if self in self.scene().items():
-                self.scene().removeItem(self)
+            self.scene().removeItem(self)
 
     @qslot
     def _filterActionSlot(self, *args):
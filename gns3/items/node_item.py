@@ -90,7 +90,7 @@ class NodeItem(QtSvgWidgets.QGraphicsSvgItem):
         node.started_signal.connect(self.startedSlot)
         node.stopped_signal.connect(self.stoppedSlot)
         node.suspended_signal.connect(self.suspendedSlot)
-        node.updated_signal.connect(self.updatedSlot)
+        node.changed_signal.connect(self.changedSlot)
         node.deleted_signal.connect(self.deletedSlot)
         node.error_signal.connect(self.errorSlot)
         node.server_error_signal.connect(self.serverErrorSlot)
@@ -183,14 +183,14 @@ class NodeItem(QtSvgWidgets.QGraphicsSvgItem):
             self._links.append(link_item)
             link_item.link().delete_link_signal.connect(self._removeLink)
             link_item.link().updated_link_signal.connect(self._linkUpdatedSlot)
-            self._node.updated_signal.emit()
+            self._node.notifyChanges({"links"})
 
     @qslot
     def _linkUpdatedSlot(self, *args):
         """
         When a link change we also notify the listener of the node
         """
-        self._node.updated_signal.emit()
+        self._node.notifyChanges({"links"})
 
     @qslot
     def _removeLink(self, link_id, *args):
@@ -258,22 +258,28 @@ class NodeItem(QtSvgWidgets.QGraphicsSvgItem):
             link.update()
 
     @qslot
-    def updatedSlot(self, *args):
+    def changedSlot(self, changes, *args):
         """
         Slot to receive events from the attached Node instance
-        when a the node has been updated.
-        """
+        when some fields of the node have changed.
 
-        self.setSymbol(self._node.settings().get("symbol"))
-        self.setPos(self._node.settings().get("x", 0), self._node.settings().get("y", 0))
-        self.setZValue(self._node.settings().get("z", 0))
-        self.setLocked(self._node.settings().get("locked", False))
-        self._updateLabel()
+        :param changes: frozenset of changed fields
+        """
 
-        # update the link tooltips in case the
-        # node name has changed
-        for link in self._links:
-            link.setCustomToolTip()
+        settings = self._node.settings()
+        if "symbol" in changes:
+            self.setSymbol(settings.get("symbol"))
+        if "position" in changes:
+            self.setPos(settings.get("x", 0), settings.get("y", 0))
+        if "z" in changes:
+            self.setZValue(settings.get("z", 0))
+        if "locked" in changes:
+            self.setLocked(settings.get("locked", False))
+        if "label" in changes or "name" in changes:
+            self._updateLabel()
+        if "name" in changes or "ports" in changes or "links" in changes:
+            for link in self._links:
+                link.setCustomToolTip()
 
     @qslot
     def deletedSlot(self, *args):
@@ -282,9 +288,7 @@ class NodeItem(QtSvgWidgets.QGraphicsSvgItem):
         when the node has been deleted.
         """
 
-        if not self.scene():
-            return
-        if self in self.scene().items():
+        if self.scene():
             self.scene().removeItem(self)
 
     @qslot
@@ -454,13 +458,8 @@ class NodeItem(QtSvgWidgets.QGraphicsSvgItem):
         :param action: QAction instance
         """
 
-        ports = self._node.ports()
-
         # get the Port instance based on the selected port name.
-        for port in ports:
-            if port.name() == str(action.text()):
-                self._selected_port = port
-                break
+        self._selected_port = self._node.getPortFromName(str(action.text()))
 
     def itemChange(self, change, value):
         """
@@ -23,6 +23,7 @@ import xml.etree.ElementTree as ET
 
 from ..qt import QtCore, QtGui, QtWidgets
 from .shape_item import ShapeItem
+from .utils import parseSvg
 
 
 class RectangleItem(QtWidgets.QGraphicsRectItem, ShapeItem):
@@ -83,7 +84,7 @@ class RectangleItem(QtWidgets.QGraphicsRectItem, ShapeItem):
         return ET.tostring(svg, encoding="utf-8").decode("utf-8")
 
     def fromSvg(self, svg):
-        svg_elem = ET.fromstring(svg)
+        svg_elem = parseSvg(svg)
         if len(svg_elem):
             # handle horizontal corner radius and vertical corner radius (specific to rectangles)
             rx = svg_elem[0].get("rx")
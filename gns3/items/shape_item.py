@@ -19,10 +19,9 @@
 Base class for shape items (Rectangle, ellipse etc.).
 """
 
-import xml.etree.ElementTree as ET
 from ..qt import QtCore, QtGui, QtWidgets
 from .drawing_item import DrawingItem
-from .utils import colorFromSvg
+from .utils import colorFromSvg, parseSvg
 
 import logging
 log = logging.getLogger(__name__)
@@ -49,7 +48,7 @@ class ShapeItem(DrawingItem):
             brush = QtGui.QBrush(QtGui.QColor(255, 255, 255, 255))  # default color is white and not transparent
             self.setBrush(brush)
         else:
-            self.fromSvg(svg)
+            self.loadSvg(svg)
         if self._id is None:
             self.create()
 
@@ -178,7 +177,7 @@ class ShapeItem(DrawingItem):
         """
         Import element information from SVG
         """
-        svg = ET.fromstring(svg)
+        svg = parseSvg(svg)
         width = float(svg.get("width", self.rect().width()))
         height = float(svg.get("height", self.rect().height()))
         self.setRect(0, 0, width, height)
@@ -19,7 +19,7 @@ import xml.etree.ElementTree as ET
 
 from ..qt import QtCore, QtWidgets, QtGui
 from .drawing_item import DrawingItem
-from .utils import colorFromSvg
+from .utils import colorFromSvg, parseSvg
 
 
 import logging
@@ -46,7 +46,7 @@ class TextItem(QtWidgets.QGraphicsTextItem, DrawingItem):
 
         if svg:
             try:
-                svg = self.fromSvg(svg)
+                self.loadSvg(svg)
             except ET.ParseError as e:
                 log.warning(str(e))
 
@@ -146,7 +146,7 @@ class TextItem(QtWidgets.QGraphicsTextItem, DrawingItem):
             pass
 
         try:
-            svg = ET.fromstring(svg)
+            svg = parseSvg(svg)
         except ET.ParseError:
             self.setPlainText("Unable to parse `text_item`")
             return
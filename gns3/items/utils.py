@@ -15,6 +15,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import xml.etree.ElementTree as ET
+
 from ..qt import QtGui
 
 
@@ -29,3 +32,50 @@ def colorFromSvg(value):
         value = "ff" + value
     value = int(value, base=16)
     return QtGui.QColor.fromRgba(value)
+
+
+# SVG larger than this (e.g. images embedded in base64) are not cached
+PARSE_SVG_CACHE_MAX_LENGTH = 4096
+
+
+@functools.lru_cache(maxsize=64)
+def _parseSmallSvg(svg):
+
+    return ET.fromstring(svg)
+
+
+def parseSvg(svg):
+    """
+    Parses the SVG of a drawing. The SVG of shapes and texts is parsed
+    only once when the topology and the item need it, large SVG (images)
+    are not kept in memory. The returned element may be shared and must
+    not be modified.
+
+    :param svg: SVG content
+    :returns: ElementTree element
+    """
+
+    if len(svg) > PARSE_SVG_CACHE_MAX_LENGTH:
+        return ET.fromstring(svg)
+    return _parseSmallSvg(svg)
+
+
+def drawingType(svg):
+    """
+    Returns the item type used to display a drawing.
+
+    :param svg: parsed SVG element
+    :returns: ellipse, rect, text, line or image
+    """
+
+    try:
+        # If SVG is more complex we consider it as an image
+        if len(svg[0]) != 0:
+            return "image"
+        tag = svg[0].tag
+        if tag in ("ellipse", "rect", "text", "line"):
+            return tag
+        return "image"
+    except IndexError:
+        # If unknow we render it as a raw SVG image
+        return "image"
@@ -351,10 +351,10 @@ class Link(QtCore.QObject):
 
         self._source_port.setFree()
         self._source_node.deleteLink(self)
-        self._source_node.updated_signal.emit()
+        self._source_node.notifyChanges({"links"})
         self._destination_port.setFree()
         self._destination_node.deleteLink(self)
-        self._destination_node.updated_signal.emit()
+        self._destination_node.notifyChanges({"links"})
 
         # let the GUI know about this link has been deleted
         self.delete_link_signal.emit(self._id)
@@ -41,6 +41,9 @@ class LocalConfig(QtCore.QObject):
 
     config_changed_signal = QtCore.Signal()
 
+    # changes made during this delay are written together (milliseconds)
+    WRITE_DELAY = 500
+
     def __init__(self, config_file=None):
         """
         :param config_file: Path to the config file (override all other config, useful for tests)
@@ -49,6 +52,8 @@ class LocalConfig(QtCore.QObject):
         super().__init__()
         self._profile = None
         self._config_file = config_file
+        self._write_timer = None
+        self._watcher = None
         self._migrateOldConfigPath()
         self._resetLoadConfig()
 
@@ -121,6 +126,8 @@ class LocalConfig(QtCore.QObject):
         self._settings.update(user_settings)
         self._migrateOldConfig()
         self.writeConfig()
+        if self._watcher is not None:
+            self.watchConfigFile()
 
     def profile(self):
         """
@@ -129,6 +136,7 @@ class LocalConfig(QtCore.QObject):
         return self._profile
 
     def setProfile(self, profile):
+        self.flushConfig()
         previous_profile = self._profile
         if profile == "default":
             self._profile = None
@@ -161,6 +169,13 @@ class LocalConfig(QtCore.QObject):
 
         return os.path.normpath(path)
 
+    def cacheDirectory(self):
+        """
+        Get the directory where data downloaded from the controller is cached
+        """
+
+        return os.path.join(self.configDirectory(), "cache")
+
     def runAsRootPath(self):
         """
         Gets run as root filename
@@ -277,10 +292,41 @@ class LocalConfig(QtCore.QObject):
         return dict()
 
     def writeConfig(self):
+        """
+        Schedules writing the configuration file, the changes
+        made until it is written are saved together.
+        """
+
+        app = QtCore.QCoreApplication.instance()
+        # settings are loaded before Qt init and timers only work in the thread of the object
+        if app is None or QtCore.QThread.currentThread() != self.thread():
+            self._writeConfig()
+            return
+
+        if self._write_timer is None:
+            self._write_timer = QtCore.QTimer(self)
+            self._write_timer.setSingleShot(True)
+            self._write_timer.setInterval(self.WRITE_DELAY)
+            self._write_timer.timeout.connect(self._writeConfig)
+            app.aboutToQuit.connect(self.flushConfig)
+        if not self._write_timer.isActive():
+            self._write_timer.start()
+
+    def flushConfig(self):
+        """
+        Writes the configuration file now if changes are pending.
+        """
+
+        if self._write_timer is not None and self._write_timer.isActive():
+            self._writeConfig()
+
+    def _writeConfig(self):
         """
         Write the configuration file.
         """
 
+        if self._write_timer is not None:
+            self._write_timer.stop()
         self._settings["version"] = __version__
         try:
             temporary = os.path.join(os.path.dirname(self._config_file), "gns3_gui.tmp")
@@ -292,6 +338,32 @@ class LocalConfig(QtCore.QObject):
         except (ValueError, OSError) as e:
             log.error("Could not write the config file {}: {}".format(self._config_file, e))
 
+    def watchConfigFile(self):
+        """
+        Reloads the configuration when the file is changed by
+        another process. The directory is watched as well because
+        the file is replaced when it is written.
+        """
+
+        if self._watcher is None:
+            self._watcher = QtCore.QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self._configFileChangedSlot)
+            self._watcher.directoryChanged.connect(self._configFileChangedSlot)
+
+        watched = self._watcher.files() + self._watcher.directories()
+        if watched:
+            self._watcher.removePaths(watched)
+        paths = [path for path in (self._config_file, os.path.dirname(self._config_file)) if os.path.exists(path)]
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def _configFileChangedSlot(self, path):
+
+        # the watch is lost when the file is replaced
+        if self._config_file not in self._watcher.files() and os.path.exists(self._config_file):
+            self._watcher.addPath(self._config_file)
+        self.checkConfigChanged()
+
     def checkConfigChanged(self):
 
         try:
@@ -318,6 +390,7 @@ class LocalConfig(QtCore.QObject):
         :returns: path to the config file.
         """
 
+        self.flushConfig()
         self._config_file = config_file
         self._resetLoadConfig()
 
@@ -351,7 +424,10 @@ class LocalConfig(QtCore.QObject):
         :returns: settings (dict)
         """
 
-        settings = self.settings().get(section, dict())
+        # only the requested section is copied
+        settings = self._settings.get(section)
+        if not isinstance(settings, dict):
+            settings = {}
         changed = False
 
         def _copySettings(local, default):
@@ -364,7 +440,7 @@ class LocalConfig(QtCore.QObject):
             # use default values for missing settings
             for name, value in default.items():
                 if name not in local:
-                    local[name] = value
+                    local[name] = copy.deepcopy(value)
                     changed = True
                 elif isinstance(value, dict):
                     local[name] = _copySettings(local[name], default[name])
@@ -17,6 +17,7 @@
 
 import os
 import sys
+import time
 import copy
 import stat
 import shlex
@@ -34,7 +35,8 @@ from gns3.qt import QtWidgets, QtCore, qslot
 from gns3.settings import LOCAL_SERVER_SETTINGS, DEFAULT_LOCAL_SERVER_HOST
 from gns3.local_config import LocalConfig
 from gns3.local_server_config import LocalServerConfig
-from gns3.utils.wait_for_connection_worker import WaitForConnectionWorker
+from gns3.utils.wait_for_local_server_worker import WaitForLocalServerWorker, probe_server, PROBE_READY
+from gns3.utils.server_output_reader import ServerOutputReader
 from gns3.utils.progress_dialog import ProgressDialog
 from gns3.utils.sudo import sudo
 from gns3.http_client import HTTPClient
@@ -87,6 +89,9 @@ class LocalServer(QtCore.QObject):
         self._server_started_by_me = False
         self._local_server_path = ""
         self._local_server_process = None
+        self._output_reader = None
+        # duration of each startup phase in milliseconds
+        self._startup_timings = {}
 
         super().__init__()
         self._parent = parent
@@ -330,7 +335,11 @@ class LocalServer(QtCore.QObject):
             Controller.instance().setHttpClient(self._http_client)
             return
 
-        if self.isLocalServerRunning() and self._server_started_by_me:
+        self._startup_timings = {}
+        begin = time.monotonic()
+        server_running = self.isLocalServerRunning()
+        self._addStartupTiming("probe", begin)
+        if server_running and self._server_started_by_me:
             return True
 
         # We check if two gui are not launched at the same time
@@ -341,22 +350,31 @@ class LocalServer(QtCore.QObject):
             Controller.instance().setHttpClient(self._http_client)
             return True
 
-        if self.isLocalServerRunning():
+        if server_running:
             log.debug("A local server already running on this host")
             # Try to kill the server. The server can be still running after
             # if the server was started by hand
             self._killAlreadyRunningServer()
+            begin = time.monotonic()
+            server_running = self.isLocalServerRunning()
+            self._addStartupTiming("kill", begin)
 
-        if not self.isLocalServerRunning():
+        process = None
+        if not server_running:
+            begin = time.monotonic()
             if not self.initLocalServer():
                 QtWidgets.QMessageBox.critical(self.parent(), "Local server", "Could not start the local server process: {}".format(self._settings["path"]))
                 return False
+            self._addStartupTiming("init", begin)
+            begin = time.monotonic()
             if not self.startLocalServer():
                 QtWidgets.QMessageBox.critical(self.parent(), "Local server", "Could not start the local server process: {}".format(self._settings["path"]))
                 return False
+            self._addStartupTiming("spawn", begin)
+            process = self._local_server_process
 
         if self.parent():
-            worker = WaitForConnectionWorker(self._settings["host"], self._port)
+            worker = WaitForLocalServerWorker(self._settings, self._port, process=process, output_reader=self._output_reader)
             progress_dialog = ProgressDialog(worker,
                                              "Local server",
                                              "Connecting to server {} on port {}...".format(self._settings["host"], self._port),
@@ -364,11 +382,27 @@ class LocalServer(QtCore.QObject):
             progress_dialog.show()
             if not progress_dialog.exec():
                 return False
+            for phase, duration in worker.timings().items():
+                self._startup_timings[phase] = duration
+        log.info("Local server startup timings: {}".format(", ".join("{} {} ms".format(phase, duration) for phase, duration in self._startup_timings.items())))
         self._server_started_by_me = True
         self._http_client = HTTPClient(self._settings)
         Controller.instance().setHttpClient(self._http_client)
         return True
 
+    def _addStartupTiming(self, phase, begin):
+
+        self._startup_timings[phase] = int((time.monotonic() - begin) * 1000)
+
+    def startupTimings(self):
+        """
+        Returns the duration of each phase of the last local server startup.
+
+        :returns: dictionary phase -> duration in milliseconds
+        """
+
+        return dict(self._startup_timings)
+
     def initLocalServer(self):
         """
         Initialize the local server.
@@ -480,32 +514,41 @@ class LocalServer(QtCore.QObject):
 
         log.debug("Starting local server process with {}".format(command))
         try:
+            # the output is drained by a reader thread, stderr is merged to stdout
             if sys.platform.startswith("win"):
                 # use the string on Windows
                 self._local_server_process = subprocess.Popen(
                     command,
                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
-                    stderr=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
                     env=os.environ)
             else:
                 # use arguments on other platforms
                 args = shlex.split(command)
-                self._local_server_process = subprocess.Popen(args, stderr=subprocess.PIPE, env=os.environ)
+                self._local_server_process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=os.environ)
         except (OSError, subprocess.SubprocessError) as e:
             log.warning('Could not start local server "{}": {}'.format(command, e))
             return False
 
         log.debug("Local server process has started (PID={})".format(self._local_server_process.pid))
+        output_path = None
+        if os.path.isdir(settings_dir):
+            output_path = os.path.join(settings_dir, "gns3_server_output.log")
+        self._output_reader = ServerOutputReader(self._local_server_process.stdout, output_path)
+        self._output_reader.start()
         return True
 
     def _checkLocalServerRunningSlot(self):
         if self._local_server_process and not self._stopping:
             if not self.localServerProcessIsRunning():
                 log.error("Local server process has stopped")
-                try:
-                    log.error(self._local_server_process.stderr.read().decode())
-                except (OSError, UnicodeDecodeError):
-                    pass
+                if self._output_reader:
+                    self._output_reader.join(timeout=1)
+                    tail = self._output_reader.tail()
+                    if tail:
+                        log.error("\n".join(tail))
+                    self._output_reader = None
                 self._local_server_process = None
 
     def localServerProcessIsRunning(self):
@@ -524,24 +567,17 @@ class LocalServer(QtCore.QObject):
 
     def isLocalServerRunning(self):
         """
-        Synchronous check if a server is already running on this host.
+        Checks if a server is already running on this host
+        (a single probe without running a nested event loop).
 
         :returns: boolean
         """
 
-        status, json_data = HTTPClient(self._settings).getSynchronous("GET", "/version")
-        if status == 401:  # Auth issue that need to be solved later
-            return True
-        elif json_data is None:
-            return False
-        elif status != 200:
-            return False
-        else:
-            version = json_data.get("version", None)
-            if version is None:
-                log.debug("Server is not a GNS3 server")
-                return False
-        return True
+        return probe_server(self._settings["host"],
+                            self._settings["port"],
+                            protocol=self._settings.get("protocol", "http"),
+                            user=self._settings.get("user"),
+                            password=self._settings.get("password")) == PROBE_READY
 
     def stopLocalServer(self, wait=False):
         """
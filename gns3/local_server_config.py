@@ -35,6 +35,8 @@ class LocalServerConfig:
         appname = "GNS3"
 
         self._config = configparser.RawConfigParser()
+        # incremented on every change to invalidate the values derived from the settings
+        self._generation = 0
 
         if config_file:
             self._config_file = config_file
@@ -65,11 +67,19 @@ class LocalServerConfig:
         self._config_file = path
         self.readConfig()
 
+    def generation(self):
+        """
+        :returns: number changing every time the configuration changes
+        """
+
+        return self._generation
+
     def readConfig(self):
         """
         Read the configuration file.
         """
 
+        self._generation += 1
         try:
             self._config.read(self._config_file, encoding="utf-8")
         except (OSError, configparser.Error, UnicodeEncodeError, UnicodeDecodeError) as e:
@@ -80,6 +90,7 @@ class LocalServerConfig:
         Write the configuration file.
         """
 
+        self._generation += 1
         try:
             log.debug("Write configuration file %s", self._config_file)
             with open(self._config_file, "w", encoding="utf-8") as fp:
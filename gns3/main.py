@@ -47,6 +47,7 @@ from gns3.logger import init_logger
 from gns3.crash_report import CrashReport
 from gns3.local_config import LocalConfig
 from gns3.application import Application
+from gns3.stall_watchdog import StallWatchdog
 from gns3.utils import parse_version
 from gns3.dialogs.profile_select import ProfileSelectDialog
 from gns3.version import __version__
@@ -296,7 +297,11 @@ def main():
 
     mainwindow.show()
 
+    # record where the event loop is blocked
+    StallWatchdog.instance().start()
+
     exit_code = app.exec()
+    StallWatchdog.instance().stop()
     signal.signal(signal.SIGINT, orig_sigint)
     signal.signal(signal.SIGTERM, orig_sigterm)
 
@@ -48,6 +48,8 @@ from .items.label_item import LabelItem
 from .topology import Topology
 from .http_client import HTTPClient
 from .progress import Progress
+from .transfer_manager import TransferManager
+from .transfers_dock_widget import TransfersDockWidget
 from .update_manager import UpdateManager
 from .dialogs.appliance_wizard import ApplianceWizard
 from .dialogs.new_template_wizard import NewTemplateWizard
@@ -56,6 +58,7 @@ from .status_bar import StatusBarHandler
 from .registry.appliance import ApplianceError
 from .template_manager import TemplateManager
 from .appliance_manager import ApplianceManager
+from .config_transfer_manager import ConfigTransferManager
 
 log = logging.getLogger(__name__)
 
@@ -117,6 +120,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         LocalServer.instance().setParent(self)
 
         HTTPClient.setProgressCallback(Progress.instance(self))
+        HTTPClient.setTransferCallback(TransferManager.instance())
 
         self._first_file_load = True
         self._open_project_path = None
@@ -129,12 +133,15 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self._start_time = time.time()
         local_config = LocalConfig.instance()
         #local_config.config_changed_signal.connect(self._localConfigChangedSlot)
-        self._local_config_timer = QtCore.QTimer(self)
-        self._local_config_timer.timeout.connect(local_config.checkConfigChanged)
-        self._local_config_timer.start(1000)  # milliseconds
+        local_config.watchConfigFile()
         self._template_manager = TemplateManager().instance()
         self._appliance_manager = ApplianceManager().instance()
 
+        # file transfers are displayed in a dock that doesn't block the GUI
+        self.uiTransfersDockWidget = TransfersDockWidget(self)
+        self.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.uiTransfersDockWidget)
+        self.uiTransfersDockWidget.setVisible(False)
+
         # restore the geometry and state of the main window.
         self._save_gui_state_geometry = True
         self.restoreGeometry(QtCore.QByteArray().fromBase64(self._settings["geometry"].encode()))
@@ -144,6 +151,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.uiDocksMenu.addAction(self.uiTopologySummaryDockWidget.toggleViewAction())
         self.uiDocksMenu.addAction(self.uiComputeSummaryDockWidget.toggleViewAction())
         self.uiDocksMenu.addAction(self.uiConsoleDockWidget.toggleViewAction())
+        self.uiDocksMenu.addAction(self.uiTransfersDockWidget.toggleViewAction())
         action = self.uiNodesDockWidget.toggleViewAction()
         action.setIconText("All devices")
         self.uiDocksMenu.addAction(action)
@@ -401,6 +409,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.uiComputeSummaryDockWidget.setFloating(False)
         self.uiConsoleDockWidget.setFloating(False)
         self.uiNodesDockWidget.setFloating(False)
+        self.uiTransfersDockWidget.setFloating(False)
 
     def _newProjectActionSlot(self):
         """
@@ -586,39 +595,113 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         for the entire project.
         """
 
-        options = ["Export configs to a directory", "Import configs from a directory"]
+        options = ["Export configs to a directory",
+                   "Export configs to an archive",
+                   "Import configs from a directory",
+                   "Import configs from an archive"]
         selection, ok = QtWidgets.QInputDialog.getItem(self, "Import/Export configs", "Please choose an option:", options, 0, False)
         if ok:
             if selection == options[0]:
                 self._exportConfigs()
-            else:
+            elif selection == options[1]:
+                self._exportConfigs(archive=True)
+            elif selection == options[2]:
                 self._importConfigs()
+            else:
+                self._importConfigs(archive=True)
+
+    def _moduleNodes(self):
+        """
+        Returns the nodes of all the modules.
+        """
 
-    def _exportConfigs(self):
+        nodes = []
+        for module in MODULES:
+            instance = module.instance()
+            if hasattr(instance, "nodes"):
+                nodes.extend(instance.nodes())
+        return nodes
+
+    def _exportConfigs(self, archive=False):
         """
-        Exports all configs to a directory.
+        Exports all configs to a directory or an archive.
+
+        :param archive: export to a zip or tar archive
         """
 
-        path = QtWidgets.QFileDialog.getExistingDirectory(self, "Export directory", self._export_configs_to_dir, QtWidgets.QFileDialog.Option.ShowDirsOnly)
+        if archive:
+            path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export archive", self._export_configs_to_dir, "Zip archive (*.zip);;Tar archive (*.tar.gz *.tgz *.tar)")
+            if path and not ConfigTransferManager.isArchive(path):
+                path += ".zip"
+        else:
+            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Export directory", self._export_configs_to_dir, QtWidgets.QFileDialog.Option.ShowDirsOnly)
         if path:
             self._export_configs_to_dir = os.path.dirname(path)
-            for module in MODULES:
-                instance = module.instance()
-                if hasattr(instance, "exportConfigs"):
-                    instance.exportConfigs(path)
+            transfer = ConfigTransferManager(self._moduleNodes())
+            self._showConfigTransferProgress(transfer, "Exporting configs...")
+            transfer.exportConfigs(path)
 
-    def _importConfigs(self):
+    def _importConfigs(self, archive=False):
         """
-        Imports all configs from a directory.
+        Imports all configs from a directory or an archive.
+
+        :param archive: import from a zip or tar archive
         """
 
-        path = QtWidgets.QFileDialog.getExistingDirectory(self, "Import directory", self._import_configs_from_dir, QtWidgets.QFileDialog.Option.ShowDirsOnly)
+        if archive:
+            path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import archive", self._import_configs_from_dir, "Config archive (*.zip *.tar.gz *.tgz *.tar)")
+        else:
+            path = QtWidgets.QFileDialog.getExistingDirectory(self, "Import directory", self._import_configs_from_dir, QtWidgets.QFileDialog.Option.ShowDirsOnly)
         if path:
             self._import_configs_from_dir = os.path.dirname(path)
-            for module in MODULES:
-                instance = module.instance()
-                if hasattr(instance, "importConfigs"):
-                    instance.importConfigs(path)
+            transfer = ConfigTransferManager(self._moduleNodes())
+            skip_unchanged = False
+            unchanged = transfer.unchangedConfigs(path)
+            if unchanged:
+                reply = QtWidgets.QMessageBox.question(self,
+                                                       "Import configs",
+                                                       "{} config(s) have not changed since they were last exported or imported, skip them?".format(unchanged),
+                                                       QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
+                skip_unchanged = reply == QtWidgets.QMessageBox.StandardButton.Yes
+            self._showConfigTransferProgress(transfer, "Importing configs...")
+            transfer.importConfigs(path, skip_unchanged=skip_unchanged)
+
+    def _showConfigTransferProgress(self, transfer, label):
+        """
+        Shows the progress of a config transfer.
+
+        :param transfer: ConfigTransferManager instance
+        :param label: progress dialog label
+        """
+
+        progress_dialog = QtWidgets.QProgressDialog(label, "Cancel", 0, 0, self)
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        progress_dialog.setWindowTitle("Configs")
+        progress_dialog.setMinimumDuration(500)
+        progress_dialog.canceled.connect(transfer.cancel)
+
+        def progress(done, total):
+            progress_dialog.setMaximum(total)
+            progress_dialog.setValue(done)
+
+        def finished():
+            progress_dialog.canceled.disconnect(transfer.cancel)
+            progress_dialog.reset()
+            progress_dialog.deleteLater()
+            transferred = skipped = errors = 0
+            for node_report in transfer.report().values():
+                transferred += len(node_report["transferred"])
+                skipped += len(node_report["skipped"])
+                errors += len(node_report["errors"])
+            if transfer.unsupportedNodes():
+                log.warning("Config transfer is not supported by the following nodes: {}".format(" ".join(transfer.unsupportedNodes())))
+            if errors:
+                log.error("{} config(s) transferred, {} skipped, {} failed".format(transferred, skipped, errors), extra={"show": True})
+            else:
+                log.info("{} config(s) transferred, {} skipped".format(transferred, skipped), extra={"show": True})
+
+        transfer.progress_signal.connect(progress)
+        transfer.finished_signal.connect(finished)
 
     def createScreenshot(self, path):
         """
@@ -675,9 +758,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         :return: None
         """
         LinkItem.showPortLabels(show_interface_labels)
-        for item in self.uiGraphicsView.scene().items():
-            if isinstance(item, LinkItem):
-                item.adjust()
+        for item in self.uiGraphicsView.linkItems():
+            item.adjust()
         
     def _updateZoomSettings(self, zoom=None):
         """
@@ -741,9 +823,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Slot called to none of the items on the scene.
         """
 
-        scene = self.uiGraphicsView.scene()
-        for item in scene.items():
-            item.setSelected(False)
+        self.uiGraphicsView.scene().clearSelection()
 
     def _fullScreenActionSlot(self):
         """
@@ -810,10 +890,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Slot called to reset the port labels on the scene.
         """
 
-        for item in self.uiGraphicsView.scene().items():
-            if isinstance(item, LinkItem):
-                item.resetPortLabels()
-                item.adjust()
+        for item in self.uiGraphicsView.linkItems():
+            item.resetPortLabels()
+            item.adjust()
 
     def _showPortNamesActionSlot(self):
         """
@@ -910,7 +989,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Slot called when connecting to all the nodes using the AUX console.
         """
 
-        self.uiGraphicsView.auxConsoleFromItems(self.uiGraphicsView.scene().items())
+        self.uiGraphicsView.auxConsoleFromItems(self.uiGraphicsView.nodeItems())
 
     def _consoleAllActionSlot(self):
         """
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Memory introspection: usage per subsystem, tracemalloc snapshot diffs
+and Python wrappers kept alive after their Qt object was deleted.
+
+Nothing is collected until asked for, tracemalloc only runs
+between "memory trace start" and "memory trace stop".
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import collections
+
+from .qt import QtWidgets, sip
+
+import logging
+log = logging.getLogger(__name__)
+
+
+def approximate_size(obj, depth=4):
+    """
+    Returns the approximate size in bytes of an object and of the
+    containers and strings it references, up to a given depth.
+
+    :param obj: Python object
+    :param depth: maximum depth to follow
+    :returns: size in bytes
+    """
+
+    seen = set()
+
+    def _size(obj, depth):
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        if depth <= 0:
+            return size
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                size += _size(key, depth - 1) + _size(value, depth - 1)
+        elif isinstance(obj, (list, tuple, set, frozenset, collections.deque)):
+            for value in obj:
+                size += _size(value, depth - 1)
+        return size
+
+    return _size(obj, depth)
+
+
+def _main_window():
+
+    from .main_window import MainWindow
+    return getattr(MainWindow, "_instance", None)
+
+
+def _tree_items(tree_widget):
+
+    count = 0
+    iterator = QtWidgets.QTreeWidgetItemIterator(tree_widget)
+    while iterator.value():
+        count += 1
+        iterator += 1
+    return count
+
+
+def topology_usage():
+
+    from .topology import Topology
+    topology = Topology.instance()
+    items = list(topology.nodes()) + list(topology.links()) + list(topology.drawings())
+    return len(items), sum(approximate_size(item.__dict__) for item in items)
+
+
+def scene_usage():
+
+    main_window = _main_window()
+    if main_window is None:
+        return 0, None
+    return len(main_window.uiGraphicsView.scene().items()), None
+
+
+def renderer_usage():
+
+    main_window = _main_window()
+    if main_window is None:
+        return 0, None
+    renderers = {}
+    for item in main_window.uiGraphicsView.scene().items():
+        renderer = getattr(item, "renderer", None)
+        if renderer is not None:
+            renderer = renderer()
+            if renderer is not None:
+                renderers[id(renderer)] = renderer
+    return len(renderers), sum(len(getattr(renderer, "_svg", "")) for renderer in renderers.values())
+
+
+def summary_views_usage():
+
+    main_window = _main_window()
+    if main_window is None:
+        return 0, None
+    return _tree_items(main_window.uiTopologySummaryTreeWidget) + _tree_items(main_window.uiComputeSummaryTreeWidget), None
+
+
+def console_usage():
+
+    main_window = _main_window()
+    if main_window is None:
+        return 0, None
+    document = main_window.uiConsoleTextEdit.document()
+    # QString uses 2 bytes per character
+    return document.blockCount(), document.characterCount() * 2
+
+
+def http_buffers_usage():
+
+    from .controller import Controller
+    http_client = Controller.instance().httpClient()
+    if http_client is None:
+        return 0, 0
+    buffers = getattr(http_client, "_buffer", {})
+    return len(buffers), approximate_size(buffers)
+
+
+def static_assets_usage():
+
+    from .controller import Controller
+    queue = Controller.instance()._static_asset_download_queue
+    return sum(len(callbacks) for callbacks in queue.values()), approximate_size(queue)
+
+
+def http_cache_usage():
+
+    from .controller import Controller
+    http_client = Controller.instance().httpClient()
+    if http_client is None:
+        return 0, 0
+    entries = http_client.responseCache()._entries
+    return len(entries), approximate_size(entries)
+
+
+class MemoryMonitor:
+    """
+    Reports object counts and approximate memory per subsystem. Each
+    subsystem is measured by a probe returning a (count, bytes) tuple,
+    bytes is None when the memory is owned by Qt and cannot be measured.
+    """
+
+    DEFAULT_PROBES = (("Topology", topology_usage),
+                      ("Scene items", scene_usage),
+                      ("Renderers", renderer_usage),
+                      ("Summary views", summary_views_usage),
+                      ("Console", console_usage),
+                      ("HTTP buffers", http_buffers_usage),
+                      ("Static asset queue", static_assets_usage),
+                      ("HTTP response cache", http_cache_usage))
+
+    # number of frames kept by tracemalloc, more frames are more expensive
+    TRACE_FRAMES = 1
+    TOP = 15
+
+    def __init__(self):
+
+        self._probes = collections.OrderedDict(self.DEFAULT_PROBES)
+        self._snapshot = None
+        self._snapshot_time = None
+
+    def addProbe(self, name, probe):
+        """
+        Adds a subsystem to the report.
+
+        :param name: subsystem name
+        :param probe: callable returning a (count, bytes) tuple
+        """
+
+        self._probes[name] = probe
+
+    def usage(self):
+        """
+        Measures every subsystem.
+
+        :returns: list of (name, count, bytes) tuples
+        """
+
+        usage = []
+        for name, probe in self._probes.items():
+            try:
+                count, size = probe()
+            except Exception as e:
+                log.debug("Could not measure {}: {}".format(name, e))
+                continue
+            usage.append((name, count, size))
+        return usage
+
+    def report(self):
+
+        lines = ["{:<24}{:>10}{:>14}".format("Subsystem", "Objects", "Bytes")]
+        for name, count, size in self.usage():
+            lines.append("{:<24}{!s:>10}{!s:>14}".format(name, count, "-" if size is None else size))
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append("Traced memory: {} bytes (peak {} bytes)".format(current, peak))
+        return "\n".join(lines)
+
+    def startTracing(self, frames=None):
+        """
+        Starts tracemalloc and takes a first snapshot.
+
+        :param frames: number of frames kept for each allocation
+        """
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames or self.TRACE_FRAMES)
+        self.snapshot()
+
+    def stopTracing(self):
+
+        self._snapshot = None
+        self._snapshot_time = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def snapshot(self):
+        """
+        Takes the snapshot the next diff will be compared to.
+        """
+
+        if not tracemalloc.is_tracing():
+            return False
+        self._snapshot = self._takeSnapshot()
+        self._snapshot_time = time.monotonic()
+        return True
+
+    @staticmethod
+    def _takeSnapshot():
+
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def diff(self, limit=None):
+        """
+        Compares the memory allocated now with the last snapshot,
+        the current state becomes the new snapshot.
+
+        :param limit: number of lines reported
+        :returns: text
+        """
+
+        if self._snapshot is None:
+            return "Memory tracing is not started, use 'memory trace start'"
+        snapshot = self._takeSnapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        lines = ["Allocations since the snapshot of {:.0f}s ago:".format(time.monotonic() - self._snapshot_time)]
+        lines.extend(str(stat) for stat in stats[:limit or self.TOP])
+        self._snapshot = snapshot
+        self._snapshot_time = time.monotonic()
+        return "\n".join(lines)
+
+    @staticmethod
+    def deletedQtObjects():
+        """
+        Finds the Python wrappers still alive after their Qt object
+        has been deleted, they are kept by a forgotten reference.
+
+        :returns: Counter of type names
+        """
+
+        gc.collect()
+        leaks = collections.Counter()
+        for obj in gc.get_objects():
+            if isinstance(obj, sip.simplewrapper) and sip.isdeleted(obj):
+                leaks[type(obj).__qualname__] += 1
+        return leaks
+
+    def leakReport(self):
+
+        leaks = self.deletedQtObjects()
+        if not leaks:
+            return "No Python object found for deleted Qt objects"
+        lines = ["Python objects kept after their Qt object was deleted:"]
+        lines.extend("{:>8} {}".format(count, name) for name, count in leaks.most_common())
+        return "\n".join(lines)
+
+    @staticmethod
+    def reset():
+
+        if getattr(MemoryMonitor, "_instance", None) is not None:
+            MemoryMonitor._instance.stopTracing()
+        MemoryMonitor._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of MemoryMonitor.
+
+        :returns: instance of MemoryMonitor
+        """
+
+        if not hasattr(MemoryMonitor, "_instance") or MemoryMonitor._instance is None:
+            MemoryMonitor._instance = MemoryMonitor()
+        return MemoryMonitor._instance
@@ -21,6 +21,7 @@ Docker module implementation.
 
 from gns3.local_config import LocalConfig
 from gns3.controller import Controller
+from gns3.image_catalogue import ImageCatalogue
 from gns3.template_manager import TemplateManager
 from gns3.template import Template
 
@@ -93,7 +94,7 @@ class Docker(Module):
         :param callback: callback for the reply from the server
         """
 
-        Controller.instance().getCompute("/docker/images", compute_id, callback)
+        ImageCatalogue.instance().images(compute_id, "docker", callback)
 
     @staticmethod
     def getNodeClass(node_type, platform=None):
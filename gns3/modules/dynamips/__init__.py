@@ -42,6 +42,7 @@ from .nodes.c7200 import C7200
 from .nodes.etherswitch_router import EtherSwitchRouter
 from .settings import DYNAMIPS_SETTINGS, IOS_ROUTER_SETTINGS
 from .settings import DEFAULT_IDLEPC
+from .idlepc_knowledge_base import IdlePCKnowledgeBase
 
 PLATFORM_TO_CLASS = {
     "c1700": C1700,
@@ -65,12 +66,17 @@ class Dynamips(Module):
     def __init__(self):
         super().__init__()
         self._loadSettings()
+        # routers created from a template, waiting to be added to the module
+        self._new_router_ids = set()
+        TemplateManager.instance().node_created_signal.connect(self._nodeCreatedFromTemplateSlot)
 
     @staticmethod
-    def getDefaultIdlePC(path):
+    def imageMd5sum(path):
         """
-        Returns the default IDLE PC for an image if the image
-        exists or None otherwise
+        Returns the MD5 checksum of a local IOS image.
+
+        :param path: image path (absolute or relative to the IOS images directory)
+        :returns: MD5 checksum or None if the image doesn't exist
         """
 
         if not os.path.isfile(path):
@@ -78,14 +84,33 @@ class Dynamips(Module):
             if not os.path.isfile(path):
                 return None
         try:
-            md5sum = Dynamips._md5sum(path)
-            log.debug("Get idlePC for %s. md5sum %s", path, md5sum)
-            if md5sum in DEFAULT_IDLEPC:
-                log.debug("IDLEPC found for %s", path)
-                return DEFAULT_IDLEPC[md5sum]
+            return Dynamips._md5sum(path)
         except OSError:
             return None
 
+    @staticmethod
+    def getDefaultIdlePC(path, platform=None):
+        """
+        Returns the default IDLE PC for an image if the image
+        exists or None otherwise
+
+        Values validated by the user (Idle-PC knowledge base) take
+        precedence over the built-in values.
+        """
+
+        md5sum = Dynamips.imageMd5sum(path)
+        if md5sum is None:
+            return None
+        log.debug("Get idlePC for %s. md5sum %s", path, md5sum)
+        idlepc = IdlePCKnowledgeBase.instance().lookup(md5sum, platform)
+        if idlepc:
+            log.debug("IDLEPC found in the knowledge base for %s", path)
+            return idlepc
+        if md5sum in DEFAULT_IDLEPC:
+            log.debug("IDLEPC found for %s", path)
+            return DEFAULT_IDLEPC[md5sum]
+        return None
+
     @staticmethod
     def _md5sum(path):
         """
@@ -177,6 +202,37 @@ class Dynamips(Module):
                     log.debug("Idle-PC value {} saved into '{}' template".format(idlepc, template.name()))
                     TemplateManager.instance().updateTemplate(template)
 
+    def _nodeCreatedFromTemplateSlot(self, node_data):
+        """
+        Slot called when a node has been created from a template.
+
+        Only the routers created by the user get a known Idle-PC,
+        not the ones of an opened project.
+
+        :param node_data: node data sent by the controller
+        """
+
+        if node_data.get("node_type") != "dynamips":
+            return
+        for node in self._nodes:
+            if node.node_id() == node_data.get("node_id"):
+                node.applyKnownIdlepc()
+                return
+        # the node.created notification has not been received yet
+        self._new_router_ids.add(node_data.get("node_id"))
+
+    def addNode(self, node):
+        """
+        Adds a node to this module.
+
+        :param node: Node instance
+        """
+
+        super().addNode(node)
+        if node.node_id() in self._new_router_ids:
+            self._new_router_ids.discard(node.node_id())
+            node.applyKnownIdlepc()
+
     @staticmethod
     def configurationPage():
         """
@@ -32,6 +32,7 @@ from gns3.controller import Controller
 from ..ui.ios_router_wizard_ui import Ui_IOSRouterWizard
 from ..settings import PLATFORMS_DEFAULT_RAM, PLATFORMS_DEFAULT_NVRAM, CHASSIS, ADAPTER_MATRIX, WIC_MATRIX
 from .. import Dynamips
+from ..idlepc_knowledge_base import IdlePCKnowledgeBase
 from ..nodes.c1700 import C1700
 from ..nodes.c2600 import C2600
 from ..nodes.c2691 import C2691
@@ -266,6 +267,11 @@ class IOSRouterWizard(VMWithImagesWizard, Ui_IOSRouterWizard):
         else:
             idlepc = result["idlepc"]
             self.uiIdlepcLineEdit.setText(idlepc)
+            md5sum = Dynamips.imageMd5sum(self.uiIOSImageLineEdit.text())
+            IdlePCKnowledgeBase.instance().record(md5sum,
+                                                  self.uiPlatformComboBox.currentText(),
+                                                  idlepc,
+                                                  image=self.uiIOSImageLineEdit.text())
             QtWidgets.QMessageBox.information(self, "Idle-PC finder", "Idle-PC value {} has been found suitable for your IOS image".format(idlepc))
 
     def done(self, result):
@@ -349,7 +355,7 @@ class IOSRouterWizard(VMWithImagesWizard, Ui_IOSRouterWizard):
 
         elif self.page(page_id) == self.uiIdlePCWizardPage:
             path = self.uiIOSImageLineEdit.text()
-            idle_pc = Dynamips.getDefaultIdlePC(path)
+            idle_pc = Dynamips.getDefaultIdlePC(path, self.uiPlatformComboBox.currentText())
             if idle_pc is not None:
                 self.uiIdlepcLineEdit.setText(idle_pc)
 
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Persistent knowledge base of the Idle-PC values validated for IOS images.
+"""
+
+import os
+import json
+import time
+
+from gns3.local_config import LocalConfig
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class IdlePCKnowledgeBase:
+    """
+    Idle-PC values are stored per IOS image MD5 checksum and platform.
+    Values with a measured CPU usage (e.g. imported) come first, lowest
+    usage first, then the most recently validated values.
+
+    :param path: path of the knowledge base file (None = default file in the config directory)
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None):
+
+        if path is None:
+            path = os.path.join(LocalConfig.instance().configDirectory(), "idlepc_knowledge_base.json")
+        self._path = path
+        self._images = None
+
+    @staticmethod
+    def _key(md5sum, platform):
+
+        return "{}:{}".format(md5sum, platform)
+
+    def _load(self):
+
+        if self._images is None:
+            self._images = {}
+            try:
+                self._images = self._read(self._path)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                log.warning("Could not load the Idle-PC knowledge base {}: {}".format(self._path, e))
+        return self._images
+
+    @staticmethod
+    def _read(path):
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or not isinstance(data.get("images"), dict):
+            raise ValueError("invalid Idle-PC knowledge base format")
+        return data["images"]
+
+    def _write(self, path):
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "images": self._load()}, f, indent=4, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+    def _save(self):
+
+        try:
+            self._write(self._path)
+        except OSError as e:
+            log.warning("Could not save the Idle-PC knowledge base {}: {}".format(self._path, e))
+
+    def values(self, md5sum, platform):
+        """
+        Returns the known Idle-PC values for an IOS image, best value first.
+
+        :param md5sum: MD5 checksum of the IOS image
+        :param platform: Dynamips platform (e.g. c7200)
+        :returns: list of (idlepc, cpu_usage) tuples
+        """
+
+        if not md5sum or not platform:
+            return []
+        entry = self._load().get(self._key(md5sum, platform))
+        if entry is None:
+            return []
+
+        def sort_key(item):
+            idlepc, info = item
+            cpu_usage = info.get("cpu_usage")
+            # values without a measured CPU usage come last, most recent first
+            return (cpu_usage is None, cpu_usage or 0, -info.get("updated", 0))
+
+        return [(idlepc, info.get("cpu_usage")) for idlepc, info in sorted(entry["values"].items(), key=sort_key)]
+
+    def lookup(self, md5sum, platform):
+        """
+        Returns the best known Idle-PC value for an IOS image.
+
+        :param md5sum: MD5 checksum of the IOS image
+        :param platform: Dynamips platform (e.g. c7200)
+        :returns: Idle-PC value or None
+        """
+
+        values = self.values(md5sum, platform)
+        if values:
+            return values[0][0]
+        return None
+
+    def record(self, md5sum, platform, idlepc, cpu_usage=None, image=None):
+        """
+        Records a validated Idle-PC value for an IOS image.
+
+        :param md5sum: MD5 checksum of the IOS image
+        :param platform: Dynamips platform (e.g. c7200)
+        :param idlepc: Idle-PC value
+        :param cpu_usage: CPU usage measured with this value (percentage)
+        :param image: image filename (informational)
+        """
+
+        if not md5sum or not platform or not idlepc or idlepc == "0x0":
+            return
+        entry = self._load().setdefault(self._key(md5sum, platform), {"platform": platform, "values": {}})
+        if image:
+            entry["image"] = os.path.basename(image)
+        info = entry["values"].setdefault(idlepc, {})
+        if cpu_usage is not None:
+            info["cpu_usage"] = cpu_usage
+        info["updated"] = time.time()
+        log.debug("Idle-PC value {} recorded for {} ({})".format(idlepc, entry.get("image", md5sum), platform))
+        self._save()
+
+    def forget(self, md5sum, platform, idlepc=None):
+        """
+        Removes the known Idle-PC values for an IOS image.
+
+        :param md5sum: MD5 checksum of the IOS image
+        :param platform: Dynamips platform (e.g. c7200)
+        :param idlepc: value to remove (None = all the values)
+        """
+
+        images = self._load()
+        key = self._key(md5sum, platform)
+        if key not in images:
+            return
+        if idlepc is None:
+            del images[key]
+        else:
+            images[key]["values"].pop(idlepc, None)
+            if not images[key]["values"]:
+                del images[key]
+        self._save()
+
+    def exportFile(self, path):
+        """
+        Exports the knowledge base so it can be shared.
+
+        :param path: destination file
+        """
+
+        self._write(path)
+
+    def importFile(self, path):
+        """
+        Merges a knowledge base exported by another user, the lowest
+        measured CPU usage wins when both contain the same value.
+
+        :param path: source file
+        :returns: number of imported values
+        """
+
+        imported = 0
+        images = self._load()
+        for key, other_entry in self._read(path).items():
+            if not isinstance(other_entry, dict) or not isinstance(other_entry.get("values"), dict):
+                continue
+            for idlepc, other_info in other_entry["values"].items():
+                other_info = self._validInfo(idlepc, other_info)
+                if other_info is None:
+                    log.warning("Invalid Idle-PC value {!r} skipped in {}".format(idlepc, path))
+                    continue
+                entry = images.setdefault(key, {"platform": other_entry.get("platform"), "values": {}})
+                if "image" not in entry and isinstance(other_entry.get("image"), str):
+                    entry["image"] = other_entry["image"]
+                info = entry["values"].get(idlepc)
+                if info is None:
+                    entry["values"][idlepc] = other_info
+                    imported += 1
+                elif other_info.get("cpu_usage") is not None and \
+                        (info.get("cpu_usage") is None or other_info["cpu_usage"] < info["cpu_usage"]):
+                    info.update(other_info)
+                    imported += 1
+        if imported:
+            self._save()
+        return imported
+
+    @staticmethod
+    def _validInfo(idlepc, info):
+        """
+        Returns the imported information of an Idle-PC value
+        or None if the value is invalid.
+        """
+
+        if not idlepc or idlepc == "0x0" or not isinstance(info, dict):
+            return None
+        valid_info = {}
+        for name in ("cpu_usage", "updated"):
+            value = info.get(name)
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            valid_info[name] = value
+        return valid_info
+
+    @staticmethod
+    def reset():
+
+        IdlePCKnowledgeBase._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of IdlePCKnowledgeBase.
+
+        :returns: instance of IdlePCKnowledgeBase
+        """
+
+        if not hasattr(IdlePCKnowledgeBase, "_instance") or IdlePCKnowledgeBase._instance is None:
+            IdlePCKnowledgeBase._instance = IdlePCKnowledgeBase()
+        return IdlePCKnowledgeBase._instance
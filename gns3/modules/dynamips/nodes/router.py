@@ -26,6 +26,7 @@ from gns3.node import Node
 
 from ..adapters import ADAPTER_MATRIX
 from ..wics import WIC_MATRIX
+from ..idlepc_knowledge_base import IdlePCKnowledgeBase
 
 import logging
 log = logging.getLogger(__name__)
@@ -95,6 +96,47 @@ class Router(Node):
 
         self._dynamips_id = result.get("dynamips_id")
 
+    def knownIdlepc(self):
+        """
+        Returns the best Idle-PC value validated for the IOS image of this router.
+
+        :returns: Idle-PC value or None
+        """
+
+        return IdlePCKnowledgeBase.instance().lookup(self._settings["image_md5sum"], self._settings["platform"])
+
+    def applyKnownIdlepc(self):
+        """
+        Applies the Idle-PC value validated for the IOS image of this router
+        if it has no Idle-PC.
+
+        :returns: True if a value has been applied
+        """
+
+        if self._settings["idlepc"]:
+            return False
+        idlepc = self.knownIdlepc()
+        if not idlepc:
+            return False
+        log.info("{} uses the known Idle-PC value {} for IOS image {}".format(self.name(), idlepc, self._settings["image"]))
+        self.update({"idlepc": idlepc})
+        return True
+
+    def recordIdlepc(self, idlepc):
+        """
+        Records a validated Idle-PC value for the IOS image of this router.
+
+        No CPU usage is recorded: only the usage of the whole compute is
+        known, not the one of this router with the value applied.
+
+        :param idlepc: Idle-PC value
+        """
+
+        IdlePCKnowledgeBase.instance().record(self._settings["image_md5sum"],
+                                              self._settings["platform"],
+                                              idlepc,
+                                              image=self._settings["image"])
+
     def computeIdlepcs(self, callback):
         """
         Get idle-PC proposals.
@@ -107,11 +149,24 @@ class Router(Node):
                                context={"router": self},
                                progressText="Computing Idle-PC values, please wait...")
 
-    def computeAutoIdlepc(self, callback):
+    def computeAutoIdlepc(self, callback, force=False):
         """
         Find the best idle-PC value.
+
+        The value validated for the same IOS image is returned
+        without running a search on the server unless forced.
+
+        :param callback: callback for the reply
+        :param force: always run the search on the server
         """
 
+        if not force:
+            idlepc = self.knownIdlepc()
+            if idlepc:
+                log.debug("{} uses the known Idle-PC value {}".format(self.name(), idlepc))
+                callback({"idlepc": idlepc}, context={"router": self}, known=True)
+                return
+
         log.debug("{} is requesting Idle-PC proposals".format(self.name()))
         self.controllerHttpGet("/nodes/{node_id}/dynamips/auto_idlepc".format(node_id=self._node_id),
                                callback,
@@ -38,6 +38,7 @@ from gns3.template_manager import TemplateManager
 from gns3.template import Template
 
 from ..settings import IOS_ROUTER_SETTINGS
+from ..idlepc_knowledge_base import IdlePCKnowledgeBase
 from ..utils.decompress_ios import isIOSCompressed
 from ..utils.decompress_ios_worker import DecompressIOSWorker
 from ..ui.ios_router_preferences_page_ui import Ui_IOSRouterPreferencesPageWidget
@@ -72,6 +73,14 @@ class IOSRouterPreferencesPage(QtWidgets.QWidget, Ui_IOSRouterPreferencesPageWid
         self.uiDecompressIOSPushButton.clicked.connect(self._decompressIOSSlot)
         self.uiIOSRoutersTreeWidget.itemDoubleClicked.connect(self._iosRouterEditSlot)
 
+        # import / export the Idle-PC values validated for IOS images
+        self.uiIdlePCKnowledgeBasePushButton = QtWidgets.QPushButton("&Idle-PC values", parent=self.layoutWidget)
+        menu = QtWidgets.QMenu(self.uiIdlePCKnowledgeBasePushButton)
+        menu.addAction("Import Idle-PC values...", self._importIdlepcsSlot)
+        menu.addAction("Export Idle-PC values...", self._exportIdlepcsSlot)
+        self.uiIdlePCKnowledgeBasePushButton.setMenu(menu)
+        self.horizontalLayout.insertWidget(2, self.uiIdlePCKnowledgeBasePushButton)
+
     def _iosRouterChangedSlot(self):
         """
         Loads a selected an IOS router from the tree widget.
@@ -359,6 +368,34 @@ class IOSRouterPreferencesPage(QtWidgets.QWidget, Ui_IOSRouterPreferencesPageWid
                 ios_router["image"] = decompressed_image_path
                 self._refreshInfo(ios_router)
 
+    def _importIdlepcsSlot(self):
+        """
+        Slot to import Idle-PC values shared by another user.
+        """
+
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Import Idle-PC values", "", "JSON file (*.json);;All files (*)")
+        if not path:
+            return
+        try:
+            imported = IdlePCKnowledgeBase.instance().importFile(path)
+        except (OSError, ValueError) as e:
+            QtWidgets.QMessageBox.critical(self, "Idle-PC values", "Could not import Idle-PC values from {}: {}".format(path, e))
+            return
+        QtWidgets.QMessageBox.information(self, "Idle-PC values", "{} Idle-PC value(s) imported".format(imported))
+
+    def _exportIdlepcsSlot(self):
+        """
+        Slot to export the validated Idle-PC values.
+        """
+
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Idle-PC values", "idlepc_values.json", "JSON file (*.json)")
+        if not path:
+            return
+        try:
+            IdlePCKnowledgeBase.instance().exportFile(path)
+        except OSError as e:
+            QtWidgets.QMessageBox.critical(self, "Idle-PC values", "Could not export Idle-PC values to {}: {}".format(path, e))
+
     def _createSectionItem(self, name):
         """
         Adds a new section to the tree widget.
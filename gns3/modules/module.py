@@ -145,29 +145,11 @@ class Module(QtCore.QObject):
 
         raise NotImplementedError()
 
-    def exportConfigs(self, directory):
+    def nodes(self):
         """
-        Exports all configs for all nodes to a directory.
+        Returns the nodes managed by this module.
 
-        :param directory: destination directory path
+        :returns: list of Node instances
         """
 
-        node_names_cannot_export = []
-        for node in self._nodes:
-            if hasattr(node, "initialized") and node.initialized():
-                if not node.exportConfigsToDirectory(directory):
-                    node_names_cannot_export.append(node.name())
-
-        if node_names_cannot_export:
-            log.warning("Config export is not supported by the following nodes: {}".format(" ".join(node_names_cannot_export)))
-
-    def importConfigs(self, directory):
-        """
-        Imports configs to all nodes from a directory.
-
-        :param directory: source directory path
-        """
-
-        for node in self._nodes:
-            if hasattr(node, "initialized") and node.initialized():
-                node.importConfigsFromDirectory(directory)
+        return self._nodes
@@ -20,7 +20,7 @@ TraceNG node implementation.
 """
 
 from gns3.node import Node
-from gns3.qt import QtWidgets
+from gns3.qt import QtWidgets, qpartial
 
 import logging
 log = logging.getLogger(__name__)
@@ -47,14 +47,18 @@ class TraceNGNode(Node):
         self._last_destination = ""
         self.settings().update(traceng_settings)
 
-    def start(self):
+    def start(self, callback=None):
         """
         Starts this node instance.
+
+        :param callback: optional callback called with the server response,
+        errors are then reported by the caller
+        :returns: False if the node has not been started
         """
 
         if self.isStarted():
             log.debug("{} is already running".format(self.name()))
-            return
+            return False
 
         if self._last_destination:
             destination = self._last_destination
@@ -64,15 +68,17 @@ class TraceNGNode(Node):
         if ok:
             if not destination:
                 QtWidgets.QMessageBox.critical(self, "TraceNG", "Please provide a host or IP address to trace")
-                return
+                return False
             ip_address = self.settings()["ip_address"]
             if destination == ip_address:
                 QtWidgets.QMessageBox.critical(self, "TraceNG", "Destination cannot be the same as this node IP address ({})".format(ip_address))
-                return
+                return False
             self._last_destination = destination
             params = {"destination": destination}
             log.debug("{} is starting".format(self.name()))
-            self.controllerHttpPost("/nodes/{node_id}/start".format(node_id=self._node_id), self._startCallback, body=params, timeout=None, showProgress=False)
+            self.controllerHttpPost("/nodes/{node_id}/start".format(node_id=self._node_id), qpartial(self._startCallback, callback=callback), body=params, timeout=None, showProgress=False)
+            return True
+        return False
 
     def info(self):
         """
@@ -26,8 +26,7 @@ from gns3.controller import Controller
 from gns3.ports.ethernet_port import EthernetPort
 from gns3.ports.serial_port import SerialPort
 from gns3.utils.bring_to_front import bring_window_to_front_from_process_name, bring_window_to_front_from_title
-from gns3.utils.normalize_filename import normalize_filename
-from gns3.qt import QtGui, QtCore
+from gns3.qt import QtGui, QtCore, qpartial
 
 from .base_node import BaseNode
 
@@ -37,6 +36,22 @@ log = logging.getLogger(__name__)
 
 class Node(BaseNode):
 
+    # settings common to all nodes and the field of a change set they belong to
+    _COMMON_FIELDS = {"x": "position",
+                      "y": "position",
+                      "z": "z",
+                      "locked": "locked",
+                      "symbol": "symbol",
+                      "label": "label",
+                      "console_host": "console",
+                      "console": "console",
+                      "console_type": "console",
+                      "console_auto_start": "console",
+                      "custom_adapters": "properties",
+                      "first_port_name": "properties",
+                      "port_name_format": "properties",
+                      "port_segment_size": "properties"}
+
     def __init__(self, module, compute, project):
 
         super().__init__(module, compute, project)
@@ -237,55 +252,72 @@ class Node(BaseNode):
 
         return self.controllerHttpPost("/nodes/{node_id}{path}".format(node_id=self._node_id, path=path), *args, **kwargs)
 
-    def start(self):
+    def start(self, callback=None):
         """
         Starts this node instance.
+
+        :param callback: optional callback called with the server response,
+        errors are then reported by the caller
+        :returns: False if the node is already in the requested state
         """
 
         if self.isStarted():
             log.debug("{} is already running".format(self.name()))
-            return
+            return False
 
         log.debug("{} is starting".format(self.name()))
-        self.post("/start", self._startCallback, timeout=None, showProgress=False)
+        self.post("/start", qpartial(self._startCallback, callback=callback), timeout=None, showProgress=False)
+        return True
 
-    def _startCallback(self, result, error=False, **kwargs):
+    def _startCallback(self, result, error=False, callback=None, **kwargs):
         """
         Callback for start.
 
         :param result: server response (dict)
         :param error: indicates an error (boolean)
+        :param callback: callback passed to start()
         """
 
         if error:
             log.error("error while starting {}: {}".format(self.name(), result["message"]))
-            self.server_error_signal.emit(self.id(), result["message"])
+            if callback is None:
+                self.server_error_signal.emit(self.id(), result["message"])
         else:
             self._parseControllerResponse(result)
 
-    def stop(self):
+        if callback is not None:
+            callback(result, error=error)
+
+    def stop(self, callback=None):
         """
         Stops this node instance.
+
+        :param callback: optional callback called with the server response,
+        errors are then reported by the caller
+        :returns: False if the node is already in the requested state
         """
 
         if self.status() == Node.stopped:
             log.debug("{} is already stopped".format(self.name()))
-            return
+            return False
 
         log.debug("{} is stopping".format(self.name()))
-        self.post("/stop", self._stopCallback, timeout=None, showProgress=False)
+        self.post("/stop", qpartial(self._stopCallback, callback=callback), timeout=None, showProgress=False)
+        return True
 
-    def _stopCallback(self, result, error=False, **kwargs):
+    def _stopCallback(self, result, error=False, callback=None, **kwargs):
         """
         Callback for stop.
 
         :param result: server response (dict)
         :param error: indicates an error (boolean)
+        :param callback: callback passed to stop()
         """
 
         if error:
             log.error("error while stopping {}: {}".format(self.name(), result["message"]))
-            self.server_error_signal.emit(self.id(), result["message"])
+            if callback is None:
+                self.server_error_signal.emit(self.id(), result["message"])
             # To avoid blocking the client we consider node as stopped if the node no longer exists
             # or the server doesn't answer
             if "status" not in result or result["status"] == 404:
@@ -293,54 +325,76 @@ class Node(BaseNode):
         else:
             self._parseControllerResponse(result)
 
-    def suspend(self):
+        if callback is not None:
+            callback(result, error=error)
+
+    def suspend(self, callback=None):
         """
         Suspends this node.
+
+        :param callback: optional callback called with the server response,
+        errors are then reported by the caller
+        :returns: False if the node is already in the requested state
         """
 
         if self.status() == Node.suspended:
             log.debug("{} is already suspended".format(self.name()))
-            return
+            return False
 
         log.debug("{} is being suspended".format(self.name()))
-        self.post("/suspend", self._suspendCallback, timeout=None, showProgress=False)
+        self.post("/suspend", qpartial(self._suspendCallback, callback=callback), timeout=None, showProgress=False)
+        return True
 
-    def _suspendCallback(self, result, error=False, **kwargs):
+    def _suspendCallback(self, result, error=False, callback=None, **kwargs):
         """
         Callback for suspend.
 
         :param result: server response (dict)
         :param error: indicates an error (boolean)
+        :param callback: callback passed to suspend()
         """
 
         if error:
             log.error("error while suspending {}: {}".format(self.name(), result["message"]))
-            self.server_error_signal.emit(self.id(), result["message"])
+            if callback is None:
+                self.server_error_signal.emit(self.id(), result["message"])
         else:
             self._parseControllerResponse(result)
 
-    def reload(self):
+        if callback is not None:
+            callback(result, error=error)
+
+    def reload(self, callback=None):
         """
         Reloads this node instance.
+
+        :param callback: optional callback called with the server response,
+        errors are then reported by the caller
         """
 
         log.debug("{} is being reloaded".format(self.name()))
-        self.post("/reload", self._reloadCallback, timeout=None, showProgress=False)
+        self.post("/reload", qpartial(self._reloadCallback, callback=callback), timeout=None, showProgress=False)
+        return True
 
-    def _reloadCallback(self, result, error=False, **kwargs):
+    def _reloadCallback(self, result, error=False, callback=None, **kwargs):
         """
         Callback for reload.
 
         :param result: server response (dict)
         :param error: indicates an error (boolean)
+        :param callback: callback passed to reload()
         """
 
         if error:
             log.error("error while reloading {}: {}".format(self.name(), result["message"]))
-            self.server_error_signal.emit(self.id(), result["message"])
+            if callback is None:
+                self.server_error_signal.emit(self.id(), result["message"])
         else:
             self._parseControllerResponse(result)
 
+        if callback is not None:
+            callback(result, error=error)
+
     def createNodeCallback(self, result):
         """
         Callback when the node has been created on the controller.
@@ -458,9 +512,10 @@ class Node(BaseNode):
         :param result: server response (dict)
         """
 
-        result = self._parseControllerResponse(result)
+        changes = set()
+        result = self._parseControllerResponse(result, changes=changes)
         self._updateCallback(result)
-        self.updated_signal.emit()
+        self.notifyChanges(changes)
 
     def _updateCallback(self, result):
         """
@@ -522,17 +577,23 @@ class Node(BaseNode):
         if error and "message" in result:
             log.error("Error while duplicating {}: {}".format(self.name(), result["message"]))
 
-    def _parseControllerResponse(self, result):
+    def _parseControllerResponse(self, result, changes=None):
         """
         Parse node object from controller response.
 
         :param result: server response (dict)
+        :param changes: optional set receiving the changed fields (see BaseNode.CHANGES)
         """
 
+        if changes is None:
+            changes = set()
+
         if "node_id" in result:
             self._node_id = result["node_id"]
 
         if "name" in result:
+            if result["name"] != self._settings.get("name"):
+                changes.add("name")
             self.setName(result["name"])
 
         if "command_line" in result:
@@ -542,28 +603,36 @@ class Node(BaseNode):
             self._node_directory = result["node_directory"]
 
         if "status" in result:
+            status = self._status
             if result["status"] == "started":
                 self.setStatus(Node.started)
             elif result["status"] == "stopped":
                 self.setStatus(Node.stopped)
             elif result["status"] == "suspended":
                 self.setStatus(Node.suspended)
+            if self._status != status:
+                changes.add("status")
 
         if "ports" in result:
-            self._updatePorts(result["ports"])
+            if result["ports"] != self._settings.get("ports") or len(result["ports"]) != len(self._ports):
+                changes.add("ports")
+                self._updatePorts(result["ports"])
 
         if "properties" in result:
             for name, value in result["properties"].items():
                 if name in self._settings and self._settings[name] != value:
                     log.debug("{} setting up and updating {} from '{}' to '{}'".format(self.name(), name, self._settings[name], value))
                     self._settings[name] = value
+                    changes.add("properties")
 
             result.update(result["properties"])
             del result["properties"]
 
         # Update common element of all nodes
-        for key in ["x", "y", "z", "locked", "symbol", "label", "console_host", "console", "console_type", "console_auto_start", "custom_adapters", "first_port_name", "port_name_format", "port_segment_size"]:
+        for key, field in self._COMMON_FIELDS.items():
             if key in result:
+                if self._settings.get(key) != result[key]:
+                    changes.add(field)
                 self._settings[key] = result[key]
 
         return result
@@ -576,24 +645,17 @@ class Node(BaseNode):
         """
 
         self._settings["ports"] = ports
-        old_ports = self._ports.copy()
+        old_ports = {(port.adapterNumber(), port.portNumber()): port for port in self._ports}
         self._ports = []
         for port in ports:
-            new_port = None
-
             # Update port if it already exists
-            for old_port in old_ports:
-                if old_port.adapterNumber() == port["adapter_number"] and old_port.portNumber() == port["port_number"]:
-                    new_port = old_port
-                    old_port.setName(port["name"])
-                    old_ports.remove(old_port)
-                    break
-
-            if new_port is None:
-                if port["link_type"] == "serial":
-                    new_port = SerialPort(port["name"])
-                else:
-                    new_port = EthernetPort(port["name"])
+            new_port = old_ports.pop((port["adapter_number"], port["port_number"]), None)
+            if new_port is not None:
+                new_port.setName(port["name"])
+            elif port["link_type"] == "serial":
+                new_port = SerialPort(port["name"])
+            else:
+                new_port = EthernetPort(port["name"])
             new_port.setShortName(port["short_name"])
             new_port.setAdapterNumber(port["adapter_number"])
             new_port.setPortNumber(port["port_number"])
@@ -602,6 +664,7 @@ class Node(BaseNode):
             new_port.setAdapterType(port.get("adapter_type"))
             new_port.setMacAddress(port.get("mac_address"))
             self._ports.append(new_port)
+        self._indexPorts()
 
     def setGraphics(self, node_item):
         """
@@ -812,82 +875,6 @@ class Node(BaseNode):
             except OSError as e:
                 log.error("Cannot export file '{}': {}".format(context["path"], e))
 
-    def exportConfigsToDirectory(self, directory):
-        """
-        Exports the configs to a directory.
-
-        :param directory: destination directory path
-        """
-
-        if not self.configFiles():
-            return False
-        for file in self.configFiles():
-            self.get("/files/{file}".format(file=file),
-                     self._exportConfigsToDirectoryCallback,
-                     context={"directory": directory, "file": file},
-                     raw=True)
-        return True
-
-    def _exportConfigsToDirectoryCallback(self, result, error=False, raw_body=None, context={}, **kwargs):
-        """
-        Callback for exportConfigsToDirectory.
-
-        :param result: server response
-        :param error: indicates an error (boolean)
-        """
-
-        if error:
-            # The file could be missing if there is no private-config for example.
-            return
-
-        export_directory = context["directory"]
-        # we can have / in the case of Docker
-        filename = normalize_filename(self.name()) + "_{}".format(context["file"].replace("/", "_"))
-        config_path = os.path.join(export_directory, filename)
-        try:
-            with open(config_path, "wb") as f:
-                log.debug("saving {} config to {}".format(self.name(), config_path))
-                f.write(raw_body)
-        except OSError as e:
-            self.error_signal.emit(self.id(), "could not export config to {}: {}".format(config_path, e))
-
-    def importConfigsFromDirectory(self, directory):
-        """
-        Imports configs from a directory.
-
-        :param directory: source directory path
-        """
-
-        if not self.configFiles():
-            return
-
-        try:
-            contents = os.listdir(directory)
-        except OSError as e:
-            self.error_signal.emit(self.id(), "Cannot list file in {}: {}".format(directory, str(e)))
-            return
-
-        for file in self.configFiles():
-            # we can have / in the case of Docker
-            filename = normalize_filename(self.name()) + "_{}".format(file.replace("/", "_"))
-            if filename in contents:
-                self.post("/files/{file}".format(file=file),
-                          self._importConfigsFromDirectoryCallback,
-                          pathlib.Path(os.path.join(directory, filename)))
-            else:
-                log.warning("{}: config file '{}' not found".format(self.name(), filename))
-
-    def _importConfigsFromDirectoryCallback(self, result, error=False, **kwargs):
-        """
-        Callback for importConfigsFromDirectory.
-
-        :param result: server response
-        :param error: indicates an error (boolean)
-        """
-
-        if error and "message" in result:
-            log.error("Error while import config: {}".format(result["message"]))
-
     @staticmethod
     def isValidRfc1123Hostname(hostname):
         """
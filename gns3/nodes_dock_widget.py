@@ -25,14 +25,16 @@ class NodesDockWidget(QtWidgets.QDockWidget):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._settings = LocalConfig.instance().loadSectionSettings("NodesView", NODES_VIEW_SETTINGS)
+        self._filter_connected = False
 
     def _filterTextChangedSlot(self, text):
-        self.parent().uiNodesView.setCurrentSearch(text)
-        self.parent().uiNodesView.refresh()
+        # only the proxy filter is updated, the templates are not reloaded
+        self.parent().uiNodesView.setCurrentSearch(text.strip())
 
     def populateNodesView(self, category):
 
-        self.parent().uiNodesFilterLineEdit.textChanged.connect(self._filterTextChangedSlot)
-        self.parent().uiNodesView.clear()
+        if not self._filter_connected:
+            self.parent().uiNodesFilterLineEdit.textChanged.connect(self._filterTextChangedSlot)
+            self._filter_connected = True
         text = self.parent().uiNodesFilterLineEdit.text().strip().lower()
         self.parent().uiNodesView.populateNodesView(category, text)
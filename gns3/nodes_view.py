@@ -66,7 +66,225 @@ TEMPLATE_TYPE_TO_CONFIGURATION_PAGE = {
 }
 
 
-class NodesView(QtWidgets.QTreeWidget):
+class TemplatesModel(QtCore.QAbstractListModel):
+
+    """
+    Model of the available templates.
+
+    Rows are added, updated and removed individually when the template manager
+    reports a change. Icons are cached per symbol and only requested from the
+    controller when a row is displayed for the first time.
+
+    :param parent: parent object
+    """
+
+    def __init__(self, parent=None):
+
+        super().__init__(parent)
+        self._template_ids = []
+        self._index = {}
+        self._icons = {}
+        self._pending_icons = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+
+        if parent.isValid():
+            return 0
+        return len(self._template_ids)
+
+    def flags(self, index):
+
+        if not index.isValid():
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsDragEnabled
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+
+        if not index.isValid() or index.row() >= len(self._template_ids):
+            return None
+
+        template_id = self._template_ids[index.row()]
+        template = TemplateManager.instance().getTemplate(template_id)
+        if template is None:
+            return None
+
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return template.name()
+        elif role == QtCore.Qt.ItemDataRole.UserRole:
+            return template_id
+        elif role == QtCore.Qt.ItemDataRole.DecorationRole:
+            return self._icon(template)
+        elif role == QtCore.Qt.ItemDataRole.SizeHintRole:
+            return QtCore.QSize(32, 32)
+        return None
+
+    def templateId(self, row):
+        """
+        Returns the template ID for a row.
+
+        :param row: row number
+        :returns: template identifier
+        """
+
+        return self._template_ids[row]
+
+    def searchIndex(self):
+        """
+        Returns the search index: a dictionary of template ID to
+        (lower case name, category).
+
+        :returns: dictionary
+        """
+
+        return self._index
+
+    def setTemplates(self, templates):
+        """
+        Replaces all the templates in the model.
+
+        :param templates: list of templates
+        """
+
+        self.beginResetModel()
+        self._template_ids = []
+        self._index = {}
+        for template in templates:
+            self._template_ids.append(template.id())
+            self._index[template.id()] = (template.name().lower(), template.category())
+        self.endResetModel()
+
+    def addTemplate(self, template):
+        """
+        Adds a template or updates it if it is already in the model.
+
+        :param template: template object
+        """
+
+        if template.id() in self._index:
+            self.updateTemplate(template)
+            return
+
+        row = len(self._template_ids)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._template_ids.append(template.id())
+        self._index[template.id()] = (template.name().lower(), template.category())
+        self.endInsertRows()
+
+    def updateTemplate(self, template):
+        """
+        Refreshes the row of a template.
+
+        :param template: template object
+        """
+
+        if template.id() not in self._index:
+            self.addTemplate(template)
+            return
+
+        self._index[template.id()] = (template.name().lower(), template.category())
+        index = self.index(self._template_ids.index(template.id()))
+        self.dataChanged.emit(index, index)
+
+    def removeTemplate(self, template_id):
+        """
+        Removes a template from the model.
+
+        :param template_id: template identifier
+        """
+
+        if template_id not in self._index:
+            return
+
+        row = self._template_ids.index(template_id)
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._template_ids[row]
+        del self._index[template_id]
+        self.endRemoveRows()
+
+    def clearIconCache(self):
+        """
+        Forgets all the cached icons.
+        """
+
+        self._icons = {}
+        if self._template_ids:
+            self.dataChanged.emit(self.index(0), self.index(len(self._template_ids) - 1), [QtCore.Qt.ItemDataRole.DecorationRole])
+
+    def _icon(self, template):
+
+        symbol = template.symbol()
+        fallback = ":/symbols/{}.svg".format(template.category())
+        key = symbol if symbol is not None else fallback
+        if key in self._icons:
+            return self._icons[key]
+
+        if key not in self._pending_icons:
+            self._pending_icons[key] = set()
+            Controller.instance().getSymbolIcon(symbol, qpartial(self._setIcon, key), fallback=fallback)
+        if key in self._pending_icons:
+            # the icon may have been set synchronously if the symbol was already on disk
+            self._pending_icons[key].add(template.id())
+        return self._icons.get(key)
+
+    def _setIcon(self, key, icon):
+
+        self._icons[key] = icon
+        template_ids = self._pending_icons.pop(key, set())
+        if sip.isdeleted(self):
+            return
+        for template_id in template_ids:
+            if template_id in self._index:
+                index = self.index(self._template_ids.index(template_id))
+                self.dataChanged.emit(index, index, [QtCore.Qt.ItemDataRole.DecorationRole])
+
+
+class TemplatesFilterProxyModel(QtCore.QSortFilterProxyModel):
+
+    """
+    Filters and sorts the templates by name.
+
+    Rows are matched against the search index of the source model
+    so that filtering does not need to look up the templates.
+
+    :param parent: parent object
+    """
+
+    def __init__(self, parent=None):
+
+        super().__init__(parent)
+        self._category = None
+        self._search = ""
+        self.setSortCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+        self.setDynamicSortFilter(True)
+
+    def setFilter(self, category, search):
+        """
+        Sets the category and the search text to filter on.
+
+        :param category: category of templates to list (None = all templates)
+        :param search: search text
+        """
+
+        search = search.lower()
+        if category == self._category and search == self._search:
+            return
+        self._category = category
+        self._search = search
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+
+        if self._category is None and not self._search:
+            return True
+
+        model = self.sourceModel()
+        name, category = model.searchIndex()[model.templateId(source_row)]
+        if self._category is not None and self._category != category:
+            return False
+        return self._search in name
+
+
+class NodesView(QtWidgets.QTreeView):
 
     """
     Nodes view to list the nodes.
@@ -81,16 +299,27 @@ class NodesView(QtWidgets.QTreeWidget):
         self._current_category = None
         self._current_search = ""
 
+        self._model = TemplatesModel(self)
+        self._proxy_model = TemplatesFilterProxyModel(self)
+        self._proxy_model.setSourceModel(self._model)
+        self.setModel(self._proxy_model)
+        self._proxy_model.sort(0, QtCore.Qt.SortOrder.AscendingOrder)
+
         # enables the possibility to drag items.
         self.setDragEnabled(True)
-        TemplateManager.instance().templates_changed_signal.connect(self.refresh)
+        template_manager = TemplateManager.instance()
+        template_manager.created_signal.connect(self._templateCreatedSlot)
+        template_manager.updated_signal.connect(self._templateUpdatedSlot)
+        template_manager.deleted_signal.connect(self._templateDeletedSlot)
+        template_manager.templates_changed_signal.connect(self._templatesChangedSlot)
 
     def setCurrentSearch(self, search):
         self._current_search = search
+        self._proxy_model.setFilter(self._current_category, self._current_search)
 
     def refresh(self):
 
-        self.clear()
+        self._model.clearIconCache()
         self.populateNodesView(self._current_category, self._current_search)
 
     def populateNodesView(self, category, search):
@@ -102,36 +331,53 @@ class NodesView(QtWidgets.QTreeWidget):
         :param search: filter
         """
 
-        if not Controller.instance().connected():
-            log.debug("Could not retrieve templates because there is no connection to the controller")
-            return
-
         self.setIconSize(QtCore.QSize(32, 32))
         self._current_category = category
         self._current_search = search
 
-        display_templates = set()
-        for template in TemplateManager.instance().templates().values():
-            if category is not None and category != template.category():
-                continue
-            if search != "" and search.lower() not in template.name().lower():
-                continue
-
-            display_templates.add(template.name())
-            item = QtWidgets.QTreeWidgetItem(self)
-            item.setText(0, template.name())
-            item.setData(0, QtCore.Qt.ItemDataRole.UserRole, template.id())
-            item.setData(1, QtCore.Qt.ItemDataRole.UserRole, "template")
-            item.setSizeHint(0, QtCore.QSize(32, 32))
-            Controller.instance().getSymbolIcon(template.symbol(),
-                                                qpartial(self._setItemIcon, item),
-                                                fallback=":/symbols/{}.svg".format(template.category()))
-
-        self.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
-
-    def _setItemIcon(self, item, icon):
-        if not sip.isdeleted(item):
-            item.setIcon(0, icon)
+        # templates cached from the last connection are listed
+        # while the controller is not connected yet
+        self._proxy_model.setFilter(category, search)
+        self._model.setTemplates(TemplateManager.instance().templates().values())
+
+    def _templateCreatedSlot(self, template_id):
+
+        template = TemplateManager.instance().getTemplate(template_id)
+        if template:
+            self._model.addTemplate(template)
+
+    def _templateUpdatedSlot(self, template_id):
+
+        template = TemplateManager.instance().getTemplate(template_id)
+        if template:
+            self._model.updateTemplate(template)
+
+    def _templateDeletedSlot(self, template_id):
+
+        self._model.removeTemplate(template_id)
+
+    def _templatesChangedSlot(self):
+        """
+        Only rebuilds the model when it went out of sync with the
+        template manager (e.g. after a disconnection), individual
+        changes are handled by the created, updated and deleted slots.
+        """
+
+        templates = TemplateManager.instance().templates()
+        if self._model.rowCount() != len(templates) or any(template_id not in templates for template_id in self._model.searchIndex()):
+            self.populateNodesView(self._current_category, self._current_search)
+
+    def currentTemplateId(self):
+        """
+        Returns the ID of the selected template.
+
+        :returns: template identifier or None
+        """
+
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index.data(QtCore.Qt.ItemDataRole.UserRole)
 
     def _getMainWindow(self):
         from .main_window import MainWindow
@@ -158,9 +404,9 @@ class NodesView(QtWidgets.QTreeWidget):
         :param event: QMouseEvent instance
         """
 
-        item = self.itemAt(event.pos())
-        if item:
-            template = TemplateManager.instance().getTemplate(item.data(0, QtCore.Qt.ItemDataRole.UserRole))
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            template = TemplateManager.instance().getTemplate(index.data(QtCore.Qt.ItemDataRole.UserRole))
             if template:
                 configuration_page = TEMPLATE_TYPE_TO_CONFIGURATION_PAGE.get(template.template_type())
                 if not template.builtin() and configuration_page:
@@ -176,14 +422,13 @@ class NodesView(QtWidgets.QTreeWidget):
         """
 
         # Check that an item has been selected and left button clicked
-        if self.currentItem() is not None and event.buttons() == QtCore.Qt.MouseButton.LeftButton:
-            item = self.currentItem()
-            icon = item.icon(0)
+        template_id = self.currentTemplateId()
+        if template_id is not None and event.buttons() == QtCore.Qt.MouseButton.LeftButton:
+            icon = self.currentIndex().data(QtCore.Qt.ItemDataRole.DecorationRole)
+            if icon is None:
+                icon = QtGui.QIcon()
             mimedata = QtCore.QMimeData()
 
-            assert item.data(1, QtCore.Qt.ItemDataRole.UserRole) == "template"
-            template_id = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-
             mimedata.setData("application/x-gns3-template", template_id.encode())
             drag = QtGui.QDrag(self)
             drag.setMimeData(mimedata)
@@ -200,9 +445,9 @@ class NodesView(QtWidgets.QTreeWidget):
         refresh_action.triggered.connect(self.refresh)
         menu.addAction(refresh_action)
 
-        item = self.currentItem()
-        if item:
-            template = TemplateManager.instance().getTemplate(item.data(0, QtCore.Qt.ItemDataRole.UserRole))
+        template_id = self.currentTemplateId()
+        if template_id is not None:
+            template = TemplateManager.instance().getTemplate(template_id)
             if not template:
                 return
 
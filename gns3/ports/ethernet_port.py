@@ -28,4 +28,5 @@ class EthernetPort(Port):
     """
     Ethernet port.
     """
-    pass
+
+    __slots__ = ()
@@ -40,6 +40,22 @@ class Port:
     started = 1
     suspended = 2
 
+    # large topologies have thousands of ports
+    __slots__ = ("_name",
+                 "_short_name",
+                 "_port_number",
+                 "_adapter_number",
+                 "_adapter_type",
+                 "_port_label",
+                 "_mac_address",
+                 "_status",
+                 "_destination_node",
+                 "_destination_port",
+                 "_data_link_types",
+                 "_link_id",
+                 "_link",
+                 "__weakref__")
+
     def __init__(self, name):
         self._name = name
         self._short_name = None
@@ -27,5 +27,7 @@ class SerialPort(Port):
     Serial port.
     """
 
+    __slots__ = ()
+
     def linkType(self):
         return "Serial"
@@ -34,7 +34,8 @@ class Progress(QtCore.QObject):
 
     add_query_signal = QtCore.Signal(str, str, QtNetwork.QNetworkReply)
     remove_query_signal = QtCore.Signal(str)
-    progress_signal = QtCore.Signal(str, str, str)
+    # query identifier, current bytes, total bytes
+    progress_signal = QtCore.Signal(str, "qint64", "qint64")
     show_signal = QtCore.Signal()
     hide_signal = QtCore.Signal()
 
@@ -91,8 +92,6 @@ class Progress(QtCore.QObject):
         return self._progress_dialog
 
     def _progressSlot(self, query_id, current, maximum):
-        current = int(current)
-        maximum = int(maximum)
 
         if query_id in self._queries:
             self._queries[query_id]["current"] = current
@@ -109,7 +108,8 @@ class Progress(QtCore.QObject):
         if self._allow_cancel_query:
             log.debug("Cancel running queries")
             for query in self._queries.copy().values():
-                query["response"].abort()
+                if query.get("response") is not None:
+                    query["response"].abort()
 
     @qslot
     def _rejectSlot(self, *args):
@@ -221,6 +221,11 @@ class Progress(QtCore.QObject):
         if self._progress_dialog is not None and not self._show_lock:
             progress_dialog = self._progress_dialog
             self._progress_dialog = None
+            # hiding the dialog must not cancel the operations started in the meantime
+            try:
+                progress_dialog.canceled.disconnect(self._cancelSlot)
+            except TypeError:
+                pass
             progress_dialog.cancel()
             progress_dialog.deleteLater()
 
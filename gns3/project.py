@@ -16,11 +16,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import copy
 import json
 from .qt import QtCore, qpartial, QtNetwork, QtWebSockets, qslot
 
 from gns3.controller import Controller
 from gns3.topology import Topology
+from gns3.topology_snapshot_cache import TopologySnapshotCache
+from gns3.modules.module_error import ModuleError
 from gns3.local_config import LocalConfig
 from gns3.settings import GRAPHICS_VIEW_SETTINGS
 from gns3.utils import parse_version
@@ -83,6 +86,12 @@ class Project(QtCore.QObject):
         self._notification_stream = None
         self._websocket = QtWebSockets.QWebSocket()
 
+        # last known nodes, links and drawings (by identifier) saved
+        # in the local snapshot cache to display the project faster next time
+        self._topology_data = {"node": {}, "link": {}, "drawing": {}}
+        self._topology_loaded = False
+        self._show_cached_topology = True
+
         super().__init__()
 
     def name(self):
@@ -526,7 +535,18 @@ class Project(QtCore.QObject):
             self._drawing_grid_size = drawing_grid_size
         self._show_interface_labels = result.get("show_interface_labels", False)
 
-    def load(self, path=None):
+    def load(self, path=None, show_cached_topology=True):
+        """
+        Opens the project on the controller.
+
+        :param path: path of the project file to load
+        :param show_cached_topology: display the last seen topology while the project is opening
+        """
+
+        self._topology_loaded = False
+        self._show_cached_topology = show_cached_topology
+        if show_cached_topology and self._id:
+            self._showCachedTopology()
         if not path:
             path = self.path()
         if not Controller.instance().isRemote() and path:
@@ -551,35 +571,106 @@ class Project(QtCore.QObject):
                 self._startListenNotifications()
         self.project_updated_signal.emit()
 
+        if self._show_cached_topology and not Topology.instance().syncing():
+            # the project identifier is only known now when loading from a file
+            self._showCachedTopology()
         self.get("/nodes", self._listNodesCallback)
 
+    def _showCachedTopology(self):
+        """
+        Displays the last seen topology of the project, read-only,
+        until it is synchronized with the nodes, links and drawings
+        listed by the controller.
+        """
+
+        topo = Topology.instance()
+        if topo.project() is not self or topo.nodes() or topo.links() or topo.drawings():
+            return
+        snapshot_cache = TopologySnapshotCache.instance()
+        snapshot = snapshot_cache.load(self._id)
+        if snapshot is None:
+            return
+
+        log.debug("Display the cached topology of project {}".format(self._id))
+        snapshot_cache.restoreSymbols(snapshot)
+        topo.setSyncing(True)
+        try:
+            with topo.bulkSceneMutation():
+                for node in snapshot["nodes"]:
+                    topo.createNode(node)
+                for link in snapshot["links"]:
+                    topo.createLink(link)
+                for drawing in snapshot["drawings"]:
+                    topo.createDrawing(drawing)
+        except (KeyError, TypeError, ValueError, ModuleError) as e:
+            # the topology is fixed when synchronized with the controller
+            log.debug("Invalid cached topology for project {}: {}".format(self._id, e))
+
+    def _storeTopologyData(self, kind, items):
+        """
+        Keeps a copy of the nodes, links or drawings listed by the controller
+        (the data is modified when the items are created).
+        """
+
+        self._topology_data[kind] = {item[kind + "_id"]: copy.deepcopy(item) for item in items}
+
+    def _saveCachedTopology(self):
+        """
+        Saves the topology in the local snapshot cache.
+        """
+
+        if not self._topology_loaded or not self._id:
+            return
+        TopologySnapshotCache.instance().save(self._id,
+                                              self._topology_data["node"].values(),
+                                              self._topology_data["link"].values(),
+                                              self._topology_data["drawing"].values())
+
     def _listNodesCallback(self, result, error=False, **kwargs):
         if error:
             log.error("Error while listing project: {}".format(result.get("message", "unknown")))
+            Topology.instance().setSyncing(False)
             return
-        topo = Topology.instance()
-        for node in result:
-            topo.createNode(node)
+        self._storeTopologyData("node", result)
         self.get("/links", self._listLinksCallback)
 
     def _listLinksCallback(self, result, error=False, **kwargs):
         if error:
             log.error("Error while listing links: {}".format(result.get("message", "unknown")))
+            self._reconcileTopology(("node",))
+            Topology.instance().setSyncing(False)
             return
-        topo = Topology.instance()
-        for link in result:
-            topo.createLink(link)
+        self._storeTopologyData("link", result)
         self.get("/drawings", self._listDrawingsCallback)
 
     def _listDrawingsCallback(self, result, error=False, **kwargs):
         if error:
             log.error("Error while listing drawings: {}".format(result.get("message", "unknown")))
+            self._reconcileTopology(("node", "link"))
+            Topology.instance().setSyncing(False)
             return
-        topo = Topology.instance()
-        for drawing in result:
-            topo.createDrawing(drawing)
+        self._storeTopologyData("drawing", result)
+        self._reconcileTopology(("node", "link", "drawing"))
+        Topology.instance().setSyncing(False)
+        self._topology_loaded = True
+        self._saveCachedTopology()
         self.project_loaded_signal.emit()
 
+    def _reconcileTopology(self, kinds):
+        """
+        Synchronizes the topology with the nodes, links and drawings listed
+        by the controller, in a single bulk scene mutation once they are all known.
+        The listings are kept up to date by the notifications received meanwhile.
+
+        :param kinds: kinds of items listed ("node", "link" and/or "drawing")
+        """
+
+        topo = Topology.instance()
+        reconcile = {"node": topo.reconcileNodes, "link": topo.reconcileLinks, "drawing": topo.reconcileDrawings}
+        with topo.bulkSceneMutation():
+            for kind in kinds:
+                reconcile[kind]([copy.deepcopy(item) for item in self._topology_data[kind].values()])
+
     def close(self, local_server_shutdown=False):
         """Close project"""
 
@@ -587,6 +678,7 @@ class Project(QtCore.QObject):
             return
         self._closing = True
         if self._id:
+            self._saveCachedTopology()
             self.project_about_to_close_signal.emit()
             Controller.instance().post("/projects/{project_id}/close".format(project_id=self._id), self._projectClosedCallback, progressText="Close the project")
         else:
@@ -599,6 +691,8 @@ class Project(QtCore.QObject):
         """
         Delete the project from all servers
         """
+        self._topology_loaded = False
+        TopologySnapshotCache.instance().remove(self._id)
         self.project_about_to_close_signal.emit()
         Controller.instance().delete("/projects/{project_id}".format(project_id=self._id), self._projectClosedCallback, progressText="Delete the project")
 
@@ -677,11 +771,31 @@ class Project(QtCore.QObject):
             log.error("Invalid event received: {}".format(e))
             return
 
+    def _topologyEventReceived(self, kind, action, event):
+        """
+        Keeps the copy of the topology saved in the snapshot cache up to date.
+
+        :param kind: "node", "link" or "drawing"
+        :param action: "created", "updated" or "deleted"
+        :param event: event data
+        """
+
+        item_id = event.get(kind + "_id")
+        if action == "deleted":
+            self._topology_data[kind].pop(item_id, None)
+        elif action == "created":
+            self._topology_data[kind][item_id] = copy.deepcopy(event)
+        elif action == "updated" and item_id in self._topology_data[kind]:
+            self._topology_data[kind][item_id].update(copy.deepcopy(event))
+
     def _event_received(self, result, *args, **kwargs):
 
         # Log only relevant events
         if result["action"] not in ("ping"):
             log.debug("Event received from project stream: {}".format(result))
+        kind, _, action = result["action"].partition(".")
+        if kind in self._topology_data:
+            self._topologyEventReceived(kind, action, result["event"])
         if result["action"] == "node.created":
             node = Topology.instance().getNodeFromUuid(result["event"]["node_id"])
             if node is None:
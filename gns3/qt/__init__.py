@@ -28,6 +28,7 @@ import os
 import re
 import inspect
 import functools
+import threading
 
 import logging
 log = logging.getLogger("qt/__init__.py")
@@ -249,6 +250,21 @@ def qpartial(func, *args, **kwargs):
     return functools.partial(func, *args, **kwargs)
 
 
+# name of the decorated slot run by each thread
+_running_slots = {}
+
+
+def running_slot(thread_id):
+    """
+    Returns the name of the decorated slot run by a thread.
+
+    :param thread_id: thread identifier
+    :returns: slot name or None
+    """
+
+    return _running_slots.get(thread_id)
+
+
 def qslot(func):
     """
     Decorated slot are protected against already destroyed element
@@ -258,7 +274,16 @@ def qslot(func):
         if len(args) > 0:
             if sip_is_deleted(args[0]):
                 return lambda: True
-        return func(*args, **kwargs)
+        thread_id = threading.get_ident()
+        previous = _running_slots.get(thread_id)
+        _running_slots[thread_id] = func.__qualname__
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if previous is None:
+                _running_slots.pop(thread_id, None)
+            else:
+                _running_slots[thread_id] = previous
     return func_wrapper
 
 
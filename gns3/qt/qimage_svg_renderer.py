@@ -17,11 +17,14 @@
 
 import os
 import re
+import hashlib
+import weakref
 import xml.etree.ElementTree as ET
 
 from . import QtCore
 from . import QtSvg
 from . import QtGui
+from . import sip_is_deleted
 
 import logging
 log = logging.getLogger(__name__)
@@ -35,6 +38,9 @@ class QImageSvgRenderer(QtSvg.QSvgRenderer):
     :param fallback: Image to display if the image is not working
     """
 
+    # renderers shared by the items displaying the same SVG, by content hash
+    _shared_renderers = weakref.WeakValueDictionary()
+
     def __init__(self, path_or_data=None, fallback=None):
 
         super().__init__()
@@ -95,6 +101,23 @@ class QImageSvgRenderer(QtSvg.QSvgRenderer):
             res = super().load(self._svg.encode())
         return res
 
+    @classmethod
+    def shared(cls, svg):
+        """
+        Returns a renderer for SVG data, shared with the other users
+        of the same content. A shared renderer must not be resized.
+
+        :param svg: SVG data
+        :returns: QImageSvgRenderer instance
+        """
+
+        key = hashlib.md5(svg.encode("utf-8")).hexdigest()
+        renderer = cls._shared_renderers.get(key)
+        if renderer is None or sip_is_deleted(renderer):
+            renderer = cls(svg)
+            cls._shared_renderers[key] = renderer
+        return renderer
+
     def resize(self, new_height, new_width=None):
 
         if not self.isValid():
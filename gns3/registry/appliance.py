@@ -19,7 +19,12 @@
 import json
 import copy
 import os
+import sys
+import functools
+import collections
 import collections.abc
+import concurrent.futures
+import multiprocessing
 import jsonschema
 from gns3.utils.get_resource import get_resource
 
@@ -27,21 +32,143 @@ from gns3.utils.get_resource import get_resource
 import logging
 log = logging.getLogger(__name__)
 
+# below this number of files, loading appliances in a process pool is slower than loading them sequentially
+BULK_LOAD_MIN_FILES = 16
+
+ApplianceLoadError = collections.namedtuple("ApplianceLoadError", ["path", "message"])
+
 
 class ApplianceError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_validator(schema_file):
+    """
+    Returns the validator for a schema file, it is only built once per process.
+    """
+
+    with open(get_resource("schemas/{}".format(schema_file))) as f:
+        schema = json.load(f)
+    return jsonschema.Draft4Validator(schema)
+
+
+def validate_appliance(appliance):
+    """
+    Checks an appliance against the schema of its registry version.
+
+    :param appliance: appliance data (dictionary)
+    :returns: registry version
+    """
+
+    if not isinstance(appliance, dict) or "registry_version" not in appliance:
+        raise ApplianceError("Invalid appliance configuration please report the issue on https://github.com/GNS3/gns3-registry/issues")
+
+    registry_version = appliance["registry_version"]
+    if registry_version > 8:
+        # we only support registry version 8 and below
+        raise ApplianceError("Registry version {} is not supported in this version of GNS3".format(registry_version))
+
+    if registry_version == 8:
+        # registry version 8 has a different schema with support for multiple settings sets
+        validator = _schema_validator("appliance_v8.json")
+    else:
+        validator = _schema_validator("appliance.json")
+
+    try:
+        validator.validate(appliance)
+    except jsonschema.ValidationError:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(appliance)).message
+        raise ApplianceError("Invalid appliance file: {}".format(error))
+    return registry_version
+
+
+def _load_appliance_file(path):
+    """
+    Reads and validates an appliance file (runs in a worker).
+
+    :returns: tuple (path, appliance data, error message)
+    """
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            appliance = json.load(f)
+        validate_appliance(appliance)
+    except (OSError, ValueError) as e:
+        return path, None, "Could not read appliance {}: {}".format(os.path.abspath(path), str(e))
+    except ApplianceError as e:
+        return path, None, str(e)
+    return path, appliance, None
+
+
+def _appliance_loader_executor(workers):
+    """
+    Returns the pool used to load the appliance files.
+
+    The frozen application cannot start a Python interpreter
+    for the worker processes, the files are loaded in threads instead.
+    """
+
+    if hasattr(sys, "frozen"):
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    # spawn the workers: forking the GUI process would copy the Qt state
+    return concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def load_appliances(registry, paths, max_workers=None):
+    """
+    Loads many appliance files, parsing and validating them in a worker pool.
+
+    :param registry: Instance of the registry where images are located
+    :param paths: list of appliance file paths
+    :param max_workers: maximum number of workers (None = number of CPUs)
+    :returns: tuple (list of Appliance instances, list of ApplianceLoadError)
+    """
+
+    paths = list(paths)
+    results = None
+    if len(paths) >= BULK_LOAD_MIN_FILES and max_workers != 1:
+        try:
+            workers = max_workers or os.cpu_count() or 1
+            with _appliance_loader_executor(workers) as executor:
+                # a few large chunks per worker so each process builds its validators only once
+                chunksize = max(1, len(paths) // (4 * workers))
+                results = list(executor.map(_load_appliance_file, paths, chunksize=chunksize))
+        except (OSError, RuntimeError, concurrent.futures.process.BrokenProcessPool) as e:
+            log.warning("Could not load the appliances in parallel, loading them sequentially: {}".format(e))
+    if results is None:
+        results = [_load_appliance_file(path) for path in paths]
+
+    appliances = []
+    errors = []
+    for path, appliance_data, error in results:
+        if error:
+            errors.append(ApplianceLoadError(path, error))
+            continue
+        try:
+            appliances.append(Appliance(registry, appliance_data))
+        except ApplianceError as e:
+            errors.append(ApplianceLoadError(path, str(e)))
+    return appliances, errors
+
+
 class Appliance(collections.abc.Mapping):
 
     def __init__(self, registry, path):
         """
         :params registry: Instance of the registry where images are located
-        :params path: Path of the appliance file on disk or file content
+        :params path: Path of the appliance file on disk, file content or
+                      appliance data already validated by load_appliances()
         """
         self._registry = registry
         self._registry_version = None
 
+        if isinstance(path, dict):
+            self._appliance = path
+            self._registry_version = self._appliance["registry_version"]
+            self._resolve_version()
+            return
+
         if os.path.isabs(path):
             try:
                 with open(path, encoding="utf-8") as f:
@@ -60,28 +187,8 @@ class Appliance(collections.abc.Mapping):
         """
         :param appliance: Sanity check on the appliance configuration
         """
-        if "registry_version" not in self._appliance:
-            raise ApplianceError("Invalid appliance configuration please report the issue on https://github.com/GNS3/gns3-registry/issues")
 
-        self._registry_version = self._appliance["registry_version"]
-        if self._registry_version > 8:
-            # we only support registry version 8 and below
-            raise ApplianceError("Registry version {} is not supported in this version of GNS3".format(self._registry_version))
-
-        if self._registry_version == 8:
-            # registry version 8 has a different schema with support for multiple settings sets
-            appliance_file = "appliance_v8.json"
-        else:
-            appliance_file = "appliance.json"
-
-        with open(get_resource("schemas/{}".format(appliance_file))) as f:
-            schema = json.load(f)
-        v = jsonschema.Draft4Validator(schema)
-        try:
-            v.validate(self._appliance)
-        except jsonschema.ValidationError:
-            error = jsonschema.exceptions.best_match(v.iter_errors(self._appliance)).message
-            raise ApplianceError("Invalid appliance file: {}".format(error))
+        self._registry_version = validate_appliance(self._appliance)
 
     def __getitem__(self, key):
         return self._appliance.__getitem__(key)
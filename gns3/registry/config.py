@@ -43,6 +43,8 @@ class Config:
 
         self._path = path
         if self._path is None:
+            # the changes not written yet must be read
+            LocalConfig.instance().flushConfig()
             self._path = LocalConfig.instance().configFilePath()
 
         with open(self._path, encoding="utf-8") as f:
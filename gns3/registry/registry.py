@@ -22,8 +22,8 @@ import logging
 log = logging.getLogger(__name__)
 
 from .image import Image
-from ..controller import Controller
-from ..qt import QtCore
+from ..image_catalogue import ImageCatalogue, ImageListing
+from ..qt import QtCore, qslot
 
 
 class RegistryError(Exception):
@@ -40,6 +40,11 @@ class Registry(QtCore.QObject):
         super().__init__()
         self._images_dirs = images_dirs
         self._remote_images = []
+        # index of the remote images, kept when the catalogue forgets its listing
+        self._remote_listing = None
+        self._emulator = None
+        self._compute_id = None
+        ImageCatalogue.instance().images_changed_signal.connect(self._imagesChangedSlot)
 
     def appendImageDirectory(self, image_directory):
         """
@@ -51,22 +56,46 @@ class Registry(QtCore.QObject):
 
     def getRemoteImageList(self, emulator, compute_id):
         self._emulator = emulator
-        Controller.instance().getCompute("/{}/images".format(emulator), compute_id, self._getRemoteListCallback, progressText="Listing remote images...")
+        self._compute_id = compute_id
+        ImageCatalogue.instance().images(compute_id, emulator, self._getRemoteListCallback, progressText="Listing remote images...")
 
     def _getRemoteListCallback(self, result, error=False, **kwargs):
         if error:
             if "message" in result:
                 log.error("Error while getting the list of remote images: {}".format(result["message"]))
             return
-        self._remote_images = []
-        for res in result:
-            image = Image(self._emulator, res["path"])
-            image.location = "remote"
-            image.md5sum = res.get("md5sum")
-            image.filesize = res.get("filesize")
-            self._remote_images.append(image)
+        self._remote_listing = ImageListing(result)
+        self._remote_images = [self._remoteImage(res) for res in result]
         self.image_list_changed_signal.emit()
 
+    @qslot
+    def _imagesChangedSlot(self, compute_id, emulator, *args):
+        """
+        Slot called when the remote images have been refreshed in the background.
+        """
+
+        if self._compute_id == compute_id and self._emulator == emulator:
+            ImageCatalogue.instance().images(compute_id, emulator, self._remoteListChangedCallback)
+
+    def _remoteListChangedCallback(self, result, error=False, **kwargs):
+
+        # the listing may be the one this registry has just received
+        if not error and (self._remote_listing is None or self._remote_listing.images != result):
+            self._getRemoteListCallback(result)
+
+    def _remoteImage(self, res):
+        """
+        Returns an Image for an image listed on the compute.
+
+        :param res: image sent by the API
+        """
+
+        image = Image(self._emulator, res["path"])
+        image.location = "remote"
+        image.md5sum = res.get("md5sum")
+        image.filesize = res.get("filesize")
+        return image
+
     def search_image_file(self, emulator, filename, md5sum, size, strict_md5_check=True):
         """
         Search an image based on its MD5 checksum
@@ -79,12 +108,14 @@ class Registry(QtCore.QObject):
         :returns: Image object or None
         """
 
-        for remote_image in list(self._remote_images):
-            if remote_image.md5sum == md5sum:
-                return remote_image
-            elif md5sum is None or strict_md5_check is False:  # We create a new version or allow custom files
-                if filename == remote_image.filename:
-                    return remote_image
+        if self._remote_images:
+            res = None
+            if md5sum is not None:
+                res = self._remote_listing.by_md5.get(md5sum)
+            if res is None and (md5sum is None or strict_md5_check is False):  # We create a new version or allow custom files
+                res = self._remote_listing.by_filename.get(filename)
+            if res is not None:
+                return self._remoteImage(res)
 
         for directory in self._images_dirs:
             log.debug("Search image {} (MD5={} SIZE={}) in '{}'".format(filename, md5sum, size, directory))
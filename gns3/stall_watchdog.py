@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Detects when the GUI event loop is blocked and records where.
+"""
+
+import sys
+import time
+import datetime
+import threading
+import traceback
+import collections
+
+from .qt import QtCore, running_slot
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class Stall:
+    """
+    A period during which the event loop was blocked.
+
+    :param started: time when the event loop stopped answering (seconds since epoch)
+    :param duration: duration in seconds
+    :param stack: most sampled stack of the GUI thread (list of lines)
+    :param slot: name of the slot being run or None if unknown
+    :param samples: number of stack samples taken
+    """
+
+    def __init__(self, started, duration, stack, slot=None, samples=0):
+
+        self.started = started
+        self.duration = duration
+        self.stack = stack
+        self.slot = slot
+        self.samples = samples
+
+    def __str__(self):
+
+        text = "{} blocked for {} ms in {} ({} samples)\n".format(datetime.datetime.fromtimestamp(self.started).strftime("%Y-%m-%d %H:%M:%S"),
+                                                                  int(self.duration * 1000),
+                                                                  "slot {}".format(self.slot) if self.slot else "unknown slot",
+                                                                  self.samples)
+        return text + "".join(self.stack)
+
+
+class StallWatchdog(QtCore.QObject):
+    """
+    A timer of the GUI thread sends heartbeats, a thread samples the
+    Python stack of the GUI thread when the heartbeats are late by more
+    than a threshold. The stalls are kept in a ring buffer.
+
+    :param threshold: delay in seconds after which the event loop is considered blocked
+    """
+
+    HEARTBEAT_INTERVAL = 0.1
+    THRESHOLD = 0.5
+    MAX_STALLS = 50
+    MAX_SAMPLES = 50
+    STACK_LIMIT = 40
+
+    def __init__(self, threshold=THRESHOLD, parent=None):
+
+        super().__init__(parent)
+        self._threshold = threshold
+        self._lock = threading.Lock()
+        self._stalls = collections.deque(maxlen=self.MAX_STALLS)
+        self._samples = collections.Counter()
+        self._slot = None
+        self._last_heartbeat = time.monotonic()
+        self._gui_thread_id = threading.get_ident()
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(int(self.HEARTBEAT_INTERVAL * 1000))
+        self._timer.timeout.connect(self._heartbeatSlot)
+
+    def threshold(self):
+
+        return self._threshold
+
+    def start(self):
+        """
+        Starts watching the event loop, must be called from the GUI thread.
+        """
+
+        if self._thread is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._last_heartbeat = time.monotonic()
+        self._stop_event.clear()
+        self._timer.start()
+        self._thread = threading.Thread(target=self._run, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops watching the event loop.
+        """
+
+        self._timer.stop()
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+
+        while not self._stop_event.wait(self.HEARTBEAT_INTERVAL):
+            with self._lock:
+                late = time.monotonic() - self._last_heartbeat - self.HEARTBEAT_INTERVAL
+                if late < self._threshold or sum(self._samples.values()) >= self.MAX_SAMPLES:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread_id)
+                if frame is None:
+                    continue
+                self._samples[tuple(traceback.format_stack(frame, limit=self.STACK_LIMIT))] += 1
+                if self._slot is None:
+                    self._slot = running_slot(self._gui_thread_id)
+            # do not keep a reference on the frames
+            del frame
+
+    def _heartbeatSlot(self):
+
+        stall = None
+        with self._lock:
+            now = time.monotonic()
+            duration = now - self._last_heartbeat - self.HEARTBEAT_INTERVAL
+            if self._samples:
+                stack, _ = self._samples.most_common(1)[0]
+                stall = Stall(time.time() - (now - self._last_heartbeat),
+                              duration,
+                              list(stack),
+                              slot=self._slot,
+                              samples=sum(self._samples.values()))
+                self._stalls.append(stall)
+                self._samples.clear()
+                self._slot = None
+            self._last_heartbeat = now
+        if stall:
+            log.info("The GUI was blocked for {} ms (use the 'stalls' command for details)".format(int(stall.duration * 1000)))
+
+    def stalls(self):
+        """
+        Returns the recorded stalls, oldest first.
+
+        :returns: list of Stall instances
+        """
+
+        with self._lock:
+            return list(self._stalls)
+
+    def clear(self):
+
+        with self._lock:
+            self._stalls.clear()
+
+    def report(self):
+        """
+        Returns the recorded stalls as text.
+        """
+
+        stalls = self.stalls()
+        if not stalls:
+            return "No GUI stall longer than {} ms recorded\n".format(int(self._threshold * 1000))
+        return "\n".join(str(stall) for stall in stalls)
+
+    @staticmethod
+    def reset():
+
+        if getattr(StallWatchdog, "_instance", None) is not None:
+            StallWatchdog._instance.stop()
+        StallWatchdog._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of StallWatchdog.
+
+        :returns: instance of StallWatchdog
+        """
+
+        if not hasattr(StallWatchdog, "_instance") or StallWatchdog._instance is None:
+            StallWatchdog._instance = StallWatchdog()
+        return StallWatchdog._instance
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Persistent cache of the symbol thumbnails displayed by the symbol selection dialog.
+"""
+
+import os
+import json
+import hashlib
+
+from .qt import QtGui
+from .qt.qimage_svg_renderer import QImageSvgRenderer
+from .local_config import LocalConfig
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class SymbolThumbnailCache:
+    """
+    Thumbnails are stored as PNG files named after the hash of the symbol content,
+    an index maps each symbol ID to the hash of its content.
+
+    :param directory: directory where the thumbnails are stored (None = default cache directory)
+    :param size: size of the thumbnails in pixels
+    """
+
+    def __init__(self, directory=None, size=64):
+
+        if directory is None:
+            directory = os.path.join(LocalConfig.instance().cacheDirectory(), "symbol_thumbnails")
+        self._directory = directory
+        self._size = size
+        self._icons = {}
+        self._index = None
+
+    def _indexPath(self):
+
+        return os.path.join(self._directory, "index.json")
+
+    def _loadIndex(self):
+
+        if self._index is None:
+            self._index = {}
+            try:
+                with open(self._indexPath(), encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                log.debug("Could not load the symbol thumbnails index: {}".format(e))
+        return self._index
+
+    def _saveIndex(self):
+
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(self._indexPath() + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(self._indexPath() + ".tmp", self._indexPath())
+        except OSError as e:
+            log.debug("Could not save the symbol thumbnails index: {}".format(e))
+
+    def _thumbnailPath(self, content_hash):
+
+        return os.path.join(self._directory, "{}.png".format(content_hash))
+
+    def _entry(self, symbol_id):
+        """
+        Returns the content hash and the version of an index entry.
+        """
+
+        entry = self._loadIndex().get(symbol_id)
+        if isinstance(entry, list):
+            return entry[0], entry[1]
+        return entry, None
+
+    def thumbnail(self, symbol_id, version=None):
+        """
+        Returns the cached thumbnail of a symbol.
+
+        :param symbol_id: symbol identifier
+        :param version: version the symbol comes with (e.g. the controller version for built-in symbols),
+        a thumbnail cached for another version is not returned
+        :returns: QIcon or None
+        """
+
+        content_hash = self.contentHash(symbol_id, version)
+        if content_hash is None:
+            return None
+        if content_hash not in self._icons:
+            path = self._thumbnailPath(content_hash)
+            if not os.path.exists(path):
+                return None
+            self._icons[content_hash] = QtGui.QIcon(QtGui.QPixmap(path))
+        return self._icons[content_hash]
+
+    def contentHash(self, symbol_id, version=None):
+        """
+        Returns the hash of the symbol content the thumbnail was rendered from.
+
+        :param symbol_id: symbol identifier
+        :param version: version the symbol comes with
+        :returns: MD5 hash or None
+        """
+
+        content_hash, entry_version = self._entry(symbol_id)
+        if entry_version != version:
+            return None
+        return content_hash
+
+    def update(self, symbol_id, path, version=None):
+        """
+        Returns the thumbnail for a downloaded symbol, it is only rendered
+        if no thumbnail exists for the same content.
+
+        :param symbol_id: symbol identifier
+        :param path: path of the symbol file
+        :param version: version the symbol comes with
+        :returns: QIcon
+        """
+
+        try:
+            with open(path, "rb") as f:
+                content_hash = hashlib.md5(f.read()).hexdigest()
+        except OSError as e:
+            log.debug("Could not read symbol {}: {}".format(path, e))
+            return None
+
+        index = self._loadIndex()
+        thumbnail_path = self._thumbnailPath(content_hash)
+        if self._entry(symbol_id) != (content_hash, version):
+            index[symbol_id] = content_hash if version is None else [content_hash, version]
+            self._saveIndex()
+
+        if content_hash in self._icons:
+            return self._icons[content_hash]
+
+        if os.path.exists(thumbnail_path):
+            image = QtGui.QImage(thumbnail_path)
+        else:
+            image = self._render(path)
+            try:
+                os.makedirs(self._directory, exist_ok=True)
+                image.save(thumbnail_path, "PNG")
+            except OSError as e:
+                log.debug("Could not save symbol thumbnail {}: {}".format(thumbnail_path, e))
+        icon = QtGui.QIcon(QtGui.QPixmap.fromImage(image))
+        self._icons[content_hash] = icon
+        return icon
+
+    def _render(self, path):
+
+        svg_renderer = QImageSvgRenderer(path)
+        image = QtGui.QImage(self._size, self._size, QtGui.QImage.Format.Format_ARGB32)
+        # Set the ARGB to 0 to prevent rendering artifacts
+        image.fill(0x00000000)
+        painter = QtGui.QPainter(image)
+        svg_renderer.render(painter)
+        painter.end()
+        return image
+
+    def invalidate(self, symbol_id):
+        """
+        Forgets the thumbnail of a symbol (e.g. when it has been replaced).
+
+        :param symbol_id: symbol identifier
+        """
+
+        if self._loadIndex().pop(symbol_id, None) is not None:
+            self._saveIndex()
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of SymbolThumbnailCache.
+
+        :returns: instance of SymbolThumbnailCache
+        """
+
+        if not hasattr(SymbolThumbnailCache, "_instance") or SymbolThumbnailCache._instance is None:
+            SymbolThumbnailCache._instance = SymbolThumbnailCache()
+        return SymbolThumbnailCache._instance
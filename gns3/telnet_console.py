@@ -27,6 +27,7 @@ import shlex
 import subprocess
 import psutil
 import shutil
+import time
 
 from .main_window import MainWindow
 from .controller import Controller
@@ -37,8 +38,17 @@ log = logging.getLogger(__name__)
 console_mutex = QtCore.QMutex()
 
 
+# gnome-terminal-server process and environment found by gnome_terminal_env()
+_gnome_terminal_env_cache = {"pid": None, "env": {}}
+
+
 def gnome_terminal_env():
 
+    # the environment stays valid as long as the gnome-terminal-server process is running
+    cached_pid = _gnome_terminal_env_cache["pid"]
+    if cached_pid is not None and psutil.pid_exists(cached_pid):
+        return dict(_gnome_terminal_env_cache["env"])
+
     uid = os.getuid()
 
     # get list of processes of current user
@@ -63,18 +73,95 @@ def gnome_terminal_env():
                 env = psutil.Process(proc['pid']).environ()
                 if 'GNOME_TERMINAL_SERVICE' in env and \
                    'GNOME_TERMINAL_SCREEN' in env:
-                    return {'GNOME_TERMINAL_SERVICE': env['GNOME_TERMINAL_SERVICE'],
-                            'GNOME_TERMINAL_SCREEN': env['GNOME_TERMINAL_SCREEN']}
+                    env = {'GNOME_TERMINAL_SERVICE': env['GNOME_TERMINAL_SERVICE'],
+                           'GNOME_TERMINAL_SCREEN': env['GNOME_TERMINAL_SCREEN']}
+                    _gnome_terminal_env_cache["pid"] = gnome_terminal_server_pid
+                    _gnome_terminal_env_cache["env"] = env
+                    return dict(env)
             except psutil.Error:
                 pass
     return {}
 
 
+# terminals able to open several consoles with a single command
+BATCH_TERMINALS = ("mate-terminal", "xfce4-terminal", "tmux")
+
+
+def batch_console_args(commands):
+    """
+    Merges console commands into a single terminal invocation opening
+    one tab (or tmux window) per console.
+
+    :param commands: list of argument lists, one per console
+    :returns: argument list or None if the terminal cannot open several consoles at once
+    """
+
+    program = os.path.basename(commands[0][0])
+    if program not in BATCH_TERMINALS:
+        return None
+    for args in commands:
+        if os.path.basename(args[0]) != program:
+            return None
+
+    args = [commands[0][0]]
+    if program == "tmux":
+        # tmux commands are chained with ';'
+        for index, command in enumerate(commands):
+            if index:
+                args.append(";")
+            args.extend(command[1:])
+        return args
+
+    for command in commands:
+        # the options must describe a tab and not end with a command after '--'
+        if "--tab" not in command or "--" in command:
+            return None
+        args.extend(command[1:])
+    return args
+
+
+def expand_console_command(command, node, port):
+    """
+    Replaces the place-holders of a console command by the actual values.
+
+    :param command: console command
+    :param node: Node instance
+    :param port: console port
+    :returns: command
+    """
+
+    host = node.consoleHost()
+    name = node.name()
+
+    command = command.replace("%h", host)
+    command = command.replace("%p", str(port))
+    command = command.replace("%d", name.replace('"', '\\"'))
+    command = command.replace("%P", node.project().name().replace('"', '\\"'))
+    command = command.replace("%i", node.project().id())
+    command = command.replace("%n", str(node.id()))
+    command = command.replace("%c", Controller.instance().httpClient().fullUrl())
+
+    command = command.replace("{host}", host)
+    command = command.replace("{port}", str(port))
+    command = command.replace("{name}", name.replace('"', '\\"'))
+    command = command.replace("{project}", node.project().name().replace('"', '\\"'))
+    command = command.replace("{project_id}", node.project().id())
+    command = command.replace("{node_id}", str(node.id()))
+    command = command.replace("{url}", Controller.instance().httpClient().fullUrl())
+    return command
+
+
 class ConsoleThread(QtCore.QThread):
 
     consoleError = QtCore.Signal(str)
+    # the terminal has been launched, see startupTime()
+    terminalLaunched = QtCore.Signal()
+
+    # terminal clients (e.g. gnome-terminal) exit once the console is opened,
+    # other terminals still running after this time (in seconds) are considered up
+    STARTUP_GRACE_TIME = 0.2
 
-    def __init__(self, parent, command, node, port):
+    def __init__(self, parent, command, node, port, batch=None):
         super().__init__(parent)
 
         self._command = command
@@ -83,16 +170,32 @@ class ConsoleThread(QtCore.QThread):
         assert self._host
         self._port = port
         self._node = node
+        # other (node, port) consoles to open with the same terminal
+        self._batch = batch or []
+        self._startup_time = None
 
-    def exec_command(self, command):
+    def startupTime(self):
+        """
+        Returns how long the terminal took to come up.
+
+        :returns: time in seconds or None when it could not be measured
+        (the terminal program keeps running while the console is open)
+        """
+
+        return self._startup_time
+
+    def exec_command(self, command, batch_commands=None):
 
         if sys.platform.startswith("win"):
             # use the string on Windows
             subprocess.Popen(command, env=os.environ)
+            self.terminalLaunched.emit()
         else:
             # use arguments on other platforms
             try:
                 args = shlex.split(command)
+                if batch_commands:
+                    args = batch_console_args([args] + [shlex.split(batch_command) for batch_command in batch_commands])
             except ValueError:
                 self.consoleError.emit("Syntax error in command: '{}'".format(command))
                 return
@@ -103,7 +206,15 @@ class ConsoleThread(QtCore.QThread):
                 # inject gnome-terminal environment variables
                 if "GNOME_TERMINAL_SERVICE" not in env or "GNOME_TERMINAL_SCREEN" not in env:
                     env.update(gnome_terminal_env())
+            start = time.monotonic()
             proc = subprocess.Popen(args, env=env)
+            try:
+                proc.wait(timeout=self.STARTUP_GRACE_TIME)
+                # the terminal client exited once the console was opened
+                self._startup_time = time.monotonic() - start
+            except subprocess.TimeoutExpired:
+                pass
+            self.terminalLaunched.emit()
             if sys.platform.startswith("linux"):
                 wmctrl_path = shutil.which("wmctrl")
                 if wmctrl_path:
@@ -120,21 +231,8 @@ class ConsoleThread(QtCore.QThread):
         port = self._port
 
         # replace the place-holders by the actual values
-        command = self._command.replace("%h", host)
-        command = command.replace("%p", str(port))
-        command = command.replace("%d", self._name.replace('"', '\\"'))
-        command = command.replace("%P", self._node.project().name().replace('"', '\\"'))
-        command = command.replace("%i", self._node.project().id())
-        command = command.replace("%n", str(self._node.id()))
-        command = command.replace("%c", Controller.instance().httpClient().fullUrl())
-
-        command = command.replace("{host}", host)
-        command = command.replace("{port}", str(port))
-        command = command.replace("{name}", self._name.replace('"', '\\"'))
-        command = command.replace("{project}", self._node.project().name().replace('"', '\\"'))
-        command = command.replace("{project_id}", self._node.project().id())
-        command = command.replace("{node_id}", str(self._node.id()))
-        command = command.replace("{url}", Controller.instance().httpClient().fullUrl())
+        command = expand_console_command(self._command, self._node, port)
+        batch_commands = [expand_console_command(self._command, node, node_port) for node, node_port in self._batch]
 
         # If the console use an apple script we lock to avoid multiple console
         # to interact at the same time
@@ -142,7 +240,7 @@ class ConsoleThread(QtCore.QThread):
             console_mutex.lock()
 
         try:
-            self.exec_command(command)
+            self.exec_command(command, batch_commands)
         except (OSError, subprocess.SubprocessError) as e:
             self.consoleError.emit("Could not start Telnet console with command '{}': {}".format(command, e))
         finally:
@@ -151,31 +249,36 @@ class ConsoleThread(QtCore.QThread):
                 console_mutex.unlock()
 
 
-def nodeTelnetConsole(node, port, command=None):
+def nodeTelnetConsole(node, port, command=None, batch=None):
     """
     Start a Telnet console program for a node.
 
     :param node: The node
     :param command: Console command
+    :param batch: other (node, port) consoles to open with the same
+    terminal, the command must support it (see batch_console_args)
+
+    :returns: ConsoleThread instance or None
     """
 
     if not node.isStarted():
-        return
+        return None
 
     if command is None:
         general_settings = MainWindow.instance().settings()
         command = general_settings["telnet_console_command"]
         if not command:
-            return
+            return None
 
     if len(command.strip(' ')) == 0:
         log.warning('Telnet console program is not configured')
-        return
+        return None
 
     log.debug('Starting telnet console in thread "{}"'.format(command))
-    console_thread = ConsoleThread(MainWindow.instance(), command, node, port)
+    console_thread = ConsoleThread(MainWindow.instance(), command, node, port, batch=batch)
     console_thread.consoleError.connect(_consoleErrorSlot)
     console_thread.start()
+    return console_thread
 
 
 def _consoleErrorSlot(message):
@@ -15,10 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
+import os
+import json
 
 from .qt import QtCore
 from .controller import Controller
+from .local_config import LocalConfig
 from .template import Template
 from .utils.server_select import server_select
 
@@ -35,6 +37,8 @@ class TemplateManager(QtCore.QObject):
     created_signal = QtCore.Signal(str)
     updated_signal = QtCore.Signal(str)
     deleted_signal = QtCore.Signal(str)
+    # node data of a node created from a template by this client
+    node_created_signal = QtCore.Signal(dict)
 
     def __init__(self):
 
@@ -44,22 +48,86 @@ class TemplateManager(QtCore.QObject):
         self._controller.connected_signal.connect(self.refresh)
         self._controller.disconnected_signal.connect(self._controllerDisconnectedSlot)
 
+        # the templates cache is written once the changes have settled down
+        self._save_cache_timer = QtCore.QTimer(self)
+        self._save_cache_timer.setSingleShot(True)
+        self._save_cache_timer.setInterval(1000)
+        self._save_cache_timer.timeout.connect(self.saveCache)
+
+        # show the templates seen the last time we were connected
+        # until the controller sends us the up to date list
+        self.loadCache()
+
     def refresh(self, update=False):
         """
         Gets the templates from the controller.
         """
 
         if self._controller.connected():
-            self._controller.get("/templates", self._listTemplatesCallback)
+            self._controller.get("/templates", self._listTemplatesCallback, cache=True)
 
     def _controllerDisconnectedSlot(self):
         """
         Called when the controller has been disconnected.
         """
 
-        self._templates = {}
+        for template_id in list(self._templates):
+            del self._templates[template_id]
+            self.deleted_signal.emit(template_id)
+        self.loadCache()
         self.templates_changed_signal.emit()
 
+    def _cachePath(self):
+        """
+        Returns the path of the templates cache for the current controller.
+        """
+
+        return os.path.join(LocalConfig.instance().cacheDirectory(), "templates_{}.json".format(self._controller.cacheKey()))
+
+    def loadCache(self):
+        """
+        Loads the templates cached the last time we were connected to the controller.
+        """
+
+        path = self._cachePath()
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached_templates = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            log.warning("Could not load the templates cache {}: {}".format(path, e))
+            return
+
+        for settings in cached_templates:
+            try:
+                template = Template(settings)
+            except (TypeError, AttributeError) as e:
+                log.warning("Invalid template in cache {}: {}".format(path, e))
+                continue
+            if template.id() not in self._templates:
+                self._templates[template.id()] = template
+                self.created_signal.emit(template.id())
+        log.debug("{} templates loaded from cache {}".format(len(self._templates), path))
+
+    def saveCache(self):
+        """
+        Saves the templates so they can be displayed before the controller is reachable.
+        """
+
+        if not self._controller.connected():
+            return
+
+        path = self._cachePath()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump([template.__json__() for template in self._templates.values()], f)
+            os.replace(temporary, path)
+        except (OSError, ValueError) as e:
+            log.warning("Could not save the templates cache {}: {}".format(path, e))
+
     def createTemplate(self, template, callback=None):
         """
         Creates a template on the controller.
@@ -96,6 +164,7 @@ class TemplateManager(QtCore.QObject):
             del self._templates[template_id]
             self.deleted_signal.emit(template_id)
             self.templates_changed_signal.emit()
+            self._save_cache_timer.start()
 
     def updateTemplate(self, template):
         """
@@ -112,19 +181,19 @@ class TemplateManager(QtCore.QObject):
         Sync an array of templates with the controller.
         """
 
-        for template_id in copy.copy(self._templates):
-            # Delete missing templates
-            if template_id not in [template.id() for template in templates]:
+        templates = {template.id(): template for template in templates}
+        for template_id in list(self._templates):
+            template = templates.get(template_id)
+            if template is None:
+                # Delete missing templates
                 self.deleteTemplate(template_id)
-            else:
+            elif template != self._templates[template_id]:
                 # Update the changed templates
-                for template in templates:
-                    if template.id() == template_id and template != self._templates[template_id]:
-                        self.updateTemplate(template)
+                self.updateTemplate(template)
 
         # Create the new templates
-        for template in templates:
-            if template.id() not in self._templates:
+        for template_id, template in templates.items():
+            if template_id not in self._templates:
                 self.createTemplate(template)
 
     def templateDataReceivedCallback(self, result, error=False, **kwargs):
@@ -146,6 +215,7 @@ class TemplateManager(QtCore.QObject):
             self.updated_signal.emit(template_id)
 
         self.templates_changed_signal.emit()
+        self._save_cache_timer.start()
 
     def templates(self):
         """
@@ -178,21 +248,38 @@ class TemplateManager(QtCore.QObject):
             log.error("Error while getting templates list: {}".format(result.get("message", "unknown")))
             return
 
-        for template in result:
-            template_id = template["template_id"]
+        # apply only the differences with the templates we already know
+        # (for instance the ones loaded from the cache)
+        templates = {}
+        for settings in result:
+            template = Template(settings)
+            templates[template.id()] = template
+
+        for template_id in list(self._templates):
+            if template_id not in templates:
+                del self._templates[template_id]
+                self.deleted_signal.emit(template_id)
+
+        for template_id, template in templates.items():
             if template_id not in self._templates:
-                self._templates[template_id] = Template(template)
+                self._templates[template_id] = template
                 self.created_signal.emit(template_id)
+            elif self._templates[template_id] != template:
+                self._templates[template_id].setSettings(template.settings())
+                self.updated_signal.emit(template_id)
+
         self.templates_changed_signal.emit()
+        self.saveCache()
 
     def createNodeFromTemplateId(self, project, template_id, x, y):
         """
         Creates a new node from a template.
         """
 
-        for template in self._templates.values():
-            if template.id() == template_id:
-                break
+        template = self.getTemplate(template_id)
+        if template is None:
+            log.error("Cannot create node: template {} not found".format(template_id))
+            return
 
         if not self._controller.connected():
             log.error("Cannot create node: not connected to any controller server")
@@ -219,13 +306,16 @@ class TemplateManager(QtCore.QObject):
 
     def _createNodeFromTemplateCallback(self, result, error=False, **kwargs):
         """
-        Callback to create node from template (for errors only).
+        Callback to create node from template.
         """
 
-        if error and "message" in result:
-            log.error("Error while creating node from template: {}".format(result["message"]))
+        if error:
+            if "message" in result:
+                log.error("Error while creating node from template: {}".format(result["message"]))
             return
 
+        self.node_created_signal.emit(result)
+
     def is_name_available(self, name):
         """
         :param name: Template name
@@ -20,13 +20,14 @@ Contains this entire topology: nodes and links.
 """
 
 import os
+import contextlib
 import xml.etree.ElementTree as ET
 
 
 from .local_server import LocalServer
 from .qt import QtCore, QtWidgets
 
-from .utils.progress_dialog import ProgressDialog
+from .transfer_manager import TransferManager
 from .utils.import_project_worker import ImportProjectWorker
 from .dialogs.project_export_wizard import ExportProjectWizard
 from .dialogs.file_editor_dialog import FileEditorDialog
@@ -36,6 +37,7 @@ from .modules import MODULES
 from .modules.module_error import ModuleError
 from .compute_manager import ComputeManager
 from .controller import Controller
+from .items.utils import parseSvg, drawingType
 
 import logging
 log = logging.getLogger(__name__)
@@ -55,11 +57,19 @@ class Topology(QtCore.QObject):
 
         self._nodes = []
         self._links = []
+        # indexes of the nodes and links by identifier
+        self._nodes_by_id = {}
+        self._links_by_id = {}
+        # source endpoints (node, port) of the links
+        self._link_sources = set()
+        # index of the nodes by name, rebuilt when a lookup misses
+        self._nodes_by_name = {}
         self._notes = []
         self._drawings = []
         self._images = []
         self._project = None
         self._main_window = None
+        self._syncing = False
 
         # If set the project is loaded when we got connection to the controller
         # useful when we open a project from cli or when server restart
@@ -123,6 +133,8 @@ class Topology(QtCore.QObject):
             self._project.stopListenNotifications()
 
         self._main_window.uiGraphicsView.reset()
+        if self._syncing:
+            self.setSyncing(False)
         self._project = project
         if project:
             self._project.project_updated_signal.connect(self._projectUpdatedSlot)
@@ -224,7 +236,8 @@ class Topology(QtCore.QObject):
         assert self._project.id() == project_id
         project = self._project
         self.setProject(project, snapshot=True)
-        project.load()
+        # the cached topology is the one before the snapshot was restored
+        project.load(show_cached_topology=False)
         self._main_window.uiStatusBar.showMessage("Snapshot restored", 5000)
 
     def loadProject(self, path):
@@ -276,9 +289,8 @@ class Topology(QtCore.QObject):
                                             name=dialog.getProjectSettings()["project_name"],
                                             path=dialog.getProjectSettings().get("project_files_dir"))
         import_worker.imported.connect(self._projectImportedSlot)
-        progress_dialog = ProgressDialog(import_worker, "Importing project", "Importing portable project files...", "Cancel", parent=self._main_window, create_thread=False)
-        progress_dialog.show()
-        progress_dialog.exec()
+        # the upload is displayed in the transfers dock
+        TransferManager.instance().runWorker(import_worker)
 
     def saveProjectAs(self):
         project = self._project
@@ -303,6 +315,16 @@ class Topology(QtCore.QObject):
         if self._project:
             self._project.destroy()
 
+    def bulkSceneMutation(self):
+        """
+        Returns a context manager to use when adding or removing
+        many nodes, links or drawings at once.
+        """
+
+        if self._main_window is None:
+            return contextlib.nullcontext()
+        return self._main_window.uiGraphicsView.bulkSceneMutation()
+
     def addNode(self, node):
         """
         Adds a new node to this topology.
@@ -311,6 +333,7 @@ class Topology(QtCore.QObject):
         """
 
         self._nodes.append(node)
+        self._nodes_by_id[node.id()] = node
         self.node_added_signal.emit(node.id())
 
     def removeNode(self, node):
@@ -320,8 +343,10 @@ class Topology(QtCore.QObject):
         :param node: Node instance
         """
 
-        if node in self._nodes:
+        if self._nodes_by_id.pop(node.id(), None) is not None:
             self._nodes.remove(node)
+            if self._nodes_by_name.get(node.name()) is node:
+                del self._nodes_by_name[node.name()]
 
     def getNodeFromUuid(self, node_id):
         """
@@ -342,10 +367,25 @@ class Topology(QtCore.QObject):
         :returns: Node instance or None
         """
 
+        return self._nodes_by_id.get(base_node_id)
+
+    def getNodeFromName(self, name):
+        """
+        Lookups for a node using its name.
+
+        :param name: node name
+        :returns: Node instance or None
+        """
+
+        node = self._nodes_by_name.get(name)
+        if node is not None and node.name() == name and node.id() in self._nodes_by_id:
+            return node
+
+        # nodes can be renamed at any time so the index is rebuilt on a miss
+        self._nodes_by_name = {}
         for node in self._nodes:
-            if node.id() == base_node_id:
-                return node
-        return None
+            self._nodes_by_name.setdefault(node.name(), node)
+        return self._nodes_by_name.get(name)
 
     def addLink(self, link):
         """
@@ -355,12 +395,13 @@ class Topology(QtCore.QObject):
         :returns: Boolean false if link already exists
         """
 
-        for l in self._links:
-            if (l._source_node == link._destination_node and l._source_port == link._destination_port) or \
-                    (l._source_node == link._source_node and l._source_port == link._source_port):
-                return False
+        if (link._destination_node, link._destination_port) in self._link_sources or \
+                (link._source_node, link._source_port) in self._link_sources:
+            return False
 
         self._links.append(link)
+        self._links_by_id[link.id()] = link
+        self._link_sources.add((link._source_node, link._source_port))
         return True
 
     def removeLink(self, link):
@@ -370,8 +411,9 @@ class Topology(QtCore.QObject):
         :param link: Link instance
         """
 
-        if link in self._links:
+        if link is not None and self._links_by_id.pop(link.id(), None) is not None:
             self._links.remove(link)
+            self._link_sources.discard((link._source_node, link._source_port))
 
     def getLink(self, link_id):
         """
@@ -380,10 +422,7 @@ class Topology(QtCore.QObject):
         :returns: Link instance or None
         """
 
-        for link in self._links:
-            if link.id() == link_id:
-                return link
-        return None
+        return self._links_by_id.get(link_id)
 
     def getLinkFromUuid(self, link_id):
         """
@@ -489,6 +528,10 @@ class Topology(QtCore.QObject):
 
         self._links.clear()
         self._nodes.clear()
+        self._nodes_by_id.clear()
+        self._links_by_id.clear()
+        self._link_sources.clear()
+        self._nodes_by_name.clear()
         self._notes.clear()
         self._drawings.clear()
         self._images.clear()
@@ -497,30 +540,34 @@ class Topology(QtCore.QObject):
 
         return "GNS3 network topology"
 
-    def createNode(self, node_data):
+    def _nodeModuleAndClass(self, node_data):
         """
-        Creates a new node on the scene.
+        Returns the module and the class to use for a node.
 
-        :param node_data: node data to create a new node
+        :param node_data: node data from the API
+        :returns: tuple (module instance, node class)
         """
 
-        if not self._project:
-            return  # The project has been deleted during the creation request
-
-        node_module = None
         for module in MODULES:
-            instance = module.instance()
             if node_data["node_type"] == "dynamips":
                 node_class = module.getNodeClass(node_data["node_type"], node_data["properties"]["platform"])
             else:
                 node_class = module.getNodeClass(node_data["node_type"])
             if node_class:
-                node_module = module.instance()
-                break
+                return module.instance(), node_class
+        raise ModuleError("Could not find any module for {}".format(node_data["node_type"]))
+
+    def createNode(self, node_data):
+        """
+        Creates a new node on the scene.
+
+        :param node_data: node data to create a new node
+        """
 
-        if not node_module:
-            raise ModuleError("Could not find any module for {}".format(node_class))
+        if not self._project:
+            return  # The project has been deleted during the creation request
 
+        node_module, node_class = self._nodeModuleAndClass(node_data)
         node = node_module.instantiateNode(node_class, ComputeManager.instance().getCompute(node_data["compute_id"]), self._project)
         node.createNodeCallback(node_data)
         self._main_window.uiGraphicsView.createNodeItem(node, node_data["symbol"], node_data["x"], node_data["y"])
@@ -535,16 +582,9 @@ class Topology(QtCore.QObject):
                 return
 
             link_side = link_data["nodes"][0]
-
-            for port in source_node.ports():
-                if port.adapterNumber() == link_side["adapter_number"] and port.portNumber() == link_side["port_number"]:
-                    source_port = port
-                    break
+            source_port = source_node.getPort(link_side["adapter_number"], link_side["port_number"])
             link_side = link_data["nodes"][1]
-            for port in destination_node.ports():
-                if port.adapterNumber() == link_side["adapter_number"] and port.portNumber() == link_side["port_number"]:
-                    destination_port = port
-                    break
+            destination_port = destination_node.getPort(link_side["adapter_number"], link_side["port_number"])
         if source_port is None or destination_port is None:
             return
         self._main_window.uiGraphicsView.addLink(source_node, source_port, destination_node, destination_port, **link_data)
@@ -556,30 +596,130 @@ class Topology(QtCore.QObject):
         :param drawing_data: Dict send by the API
         """
         try:
-            svg = ET.fromstring(drawing_data["svg"])
+            svg = parseSvg(drawing_data["svg"])
         except ET.ParseError as e:
             log.error(str(e))
             return
-        try:
-            # If SVG is more complex we consider it as an image
-            if len(svg[0]) != 0:
-                type = "image"
+        type = drawingType(svg)
+        self._main_window.uiGraphicsView.createDrawingItem(type, drawing_data["x"], drawing_data["y"], drawing_data["z"], locked=drawing_data["locked"], rotation=drawing_data["rotation"], drawing_id=drawing_data["drawing_id"], svg=drawing_data["svg"])
+
+    def _deleteNode(self, node):
+        """
+        Deletes a node and its links from the scene only.
+
+        :param node: Node instance
+        """
+
+        for link in list(node.links()):
+            link.deleteLink(skip_controller=True)
+        node.delete(skip_controller=True)
+        self.removeNode(node)
+
+    def reconcileNodes(self, nodes_data):
+        """
+        Makes the nodes on the scene match the nodes listed by the controller:
+        the missing nodes are created, the known ones updated and the others deleted.
+
+        :param nodes_data: list of nodes sent by the API
+        """
+
+        nodes = {node.node_id(): node for node in self._nodes if hasattr(node, "node_id")}
+        # delete first, the names and ports of the deleted nodes can be reused
+        known_nodes = {}
+        for node_data in nodes_data:
+            node = nodes.pop(node_data["node_id"], None)
+            if node is not None:
+                node_class = self._nodeModuleAndClass(node_data)[1]
+                if type(node) is node_class and node.compute().id() == node_data["compute_id"]:
+                    known_nodes[node_data["node_id"]] = node
+                else:
+                    # the node cannot be updated in place
+                    self._deleteNode(node)
+        for node in nodes.values():
+            self._deleteNode(node)
+
+        for node_data in nodes_data:
+            node = known_nodes.get(node_data["node_id"])
+            if node is None:
+                self.createNode(node_data)
             else:
-                tag = svg[0].tag
-                if tag == "ellipse":
-                    type = "ellipse"
-                elif tag == "rect":
-                    type = "rect"
-                elif tag == "text":
-                    type = "text"
-                elif tag == "line":
-                    type = "line"
+                node.updateNodeCallback(node_data)
+
+    def reconcileLinks(self, links_data):
+        """
+        Makes the links on the scene match the links listed by the controller.
+
+        :param links_data: list of links sent by the API
+        """
+
+        links = {link.link_id(): link for link in self._links}
+        # delete first to free the ports used by the new links
+        known_links = {}
+        for link_data in links_data:
+            link = links.pop(link_data["link_id"], None)
+            if link is not None:
+                endpoints = {(link.sourceNode().node_id(), link.sourcePort().adapterNumber(), link.sourcePort().portNumber()),
+                             (link.destinationNode().node_id(), link.destinationPort().adapterNumber(), link.destinationPort().portNumber())}
+                if endpoints == {(side["node_id"], side["adapter_number"], side["port_number"]) for side in link_data["nodes"]}:
+                    known_links[link_data["link_id"]] = link
                 else:
-                    type = "image"
-        except IndexError:
-            # If unknow we render it as a raw SVG image
-            type = "image"
-        self._main_window.uiGraphicsView.createDrawingItem(type, drawing_data["x"], drawing_data["y"], drawing_data["z"], locked=drawing_data["locked"], rotation=drawing_data["rotation"], drawing_id=drawing_data["drawing_id"], svg=drawing_data["svg"])
+                    link.deleteLink(skip_controller=True)
+        for link in links.values():
+            link.deleteLink(skip_controller=True)
+
+        for link_data in links_data:
+            link = known_links.get(link_data["link_id"])
+            if link is None:
+                self.createLink(link_data)
+            else:
+                link.updateLinkCallback(link_data)
+
+    def reconcileDrawings(self, drawings_data):
+        """
+        Makes the drawings on the scene match the drawings listed by the controller.
+
+        :param drawings_data: list of drawings sent by the API
+        """
+
+        drawings = {drawing.drawing_id(): drawing for drawing in self._drawings}
+        known_drawings = {}
+        for drawing_data in drawings_data:
+            drawing = drawings.pop(drawing_data["drawing_id"], None)
+            if drawing is not None:
+                known_drawings[drawing_data["drawing_id"]] = drawing
+        for drawing in drawings.values():
+            drawing.delete(skip_controller=True)
+
+        for drawing_data in drawings_data:
+            drawing = known_drawings.get(drawing_data["drawing_id"])
+            if drawing is None:
+                self.createDrawing(drawing_data)
+            else:
+                drawing.updateDrawingCallback(drawing_data)
+
+    def setSyncing(self, syncing):
+        """
+        Makes the scene read-only while the topology displayed from
+        the local snapshot is synchronized with the controller.
+
+        :param syncing: boolean
+        """
+
+        self._syncing = syncing
+        if self._main_window is None:
+            return
+        self._main_window.uiGraphicsView.setInteractive(not syncing)
+        if syncing:
+            self._main_window.uiStatusBar.showMessage("Synchronizing the topology with the controller...")
+        else:
+            self._main_window.uiStatusBar.clearMessage()
+
+    def syncing(self):
+        """
+        :returns: True if the topology is being synchronized with the controller
+        """
+
+        return self._syncing
 
     @staticmethod
     def instance():
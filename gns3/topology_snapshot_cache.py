@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Local cache of the last seen topology of the projects, used to display
+a project as soon as it is opened.
+"""
+
+import os
+import gzip
+import json
+import time
+import shutil
+
+from .controller import Controller
+from .local_config import LocalConfig
+from .symbol import Symbol
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class TopologySnapshotCache:
+    """
+    Snapshots are stored as compressed JSON files named after the project ID,
+    one directory per controller. The symbols referenced by the nodes are kept
+    next to them so they are displayed without downloading them again.
+
+    :param directory: directory where the snapshots are stored (None = default cache directory)
+    """
+
+    VERSION = 1
+
+    # number of projects kept in the cache
+    MAX_PROJECTS = 50
+
+    # node fields not needed to display a node
+    SKIPPED_NODE_FIELDS = ("command_line", "node_directory")
+
+    def __init__(self, directory=None):
+
+        self._directory = directory
+
+    def directory(self):
+        """
+        Returns the directory of the snapshots for the current controller.
+        """
+
+        if self._directory is not None:
+            return self._directory
+        return os.path.join(LocalConfig.instance().cacheDirectory(), "topology", Controller.instance().cacheKey())
+
+    def _snapshotPath(self, project_id):
+
+        return os.path.join(self.directory(), project_id + ".json.gz")
+
+    def _symbolPath(self, symbol_id):
+
+        return os.path.join(self.directory(), "symbols", os.path.basename(Controller.instance().getStaticCachedPath(Symbol(symbol_id).url())))
+
+    def load(self, project_id):
+        """
+        Returns the snapshot of a project.
+
+        :param project_id: project identifier
+        :returns: dictionary with the nodes, links, drawings and symbols or None
+        """
+
+        try:
+            with gzip.open(self._snapshotPath(project_id), "rt", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            log.debug("Could not load the topology snapshot of project {}: {}".format(project_id, e))
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get("version") != self.VERSION or snapshot.get("project_id") != project_id:
+            return None
+        return snapshot
+
+    def save(self, project_id, nodes, links, drawings):
+        """
+        Saves the snapshot of a project.
+
+        :param project_id: project identifier
+        :param nodes: list of nodes as returned by the controller
+        :param links: list of links as returned by the controller
+        :param drawings: list of drawings as returned by the controller
+        """
+
+        nodes = [{key: value for key, value in node.items() if key not in self.SKIPPED_NODE_FIELDS} for node in nodes]
+        symbols = sorted({node["symbol"] for node in nodes if node.get("symbol")})
+        snapshot = {
+            "version": self.VERSION,
+            "project_id": project_id,
+            "saved": time.time(),
+            "nodes": nodes,
+            "links": list(links),
+            "drawings": list(drawings),
+            "symbols": symbols
+        }
+
+        path = self._snapshotPath(project_id)
+        try:
+            os.makedirs(self.directory(), exist_ok=True)
+            with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(path + ".tmp", path)
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Could not save the topology snapshot of project {}: {}".format(project_id, e))
+            return
+        self._storeSymbols(symbols)
+        self._prune()
+
+    def _storeSymbols(self, symbols):
+        """
+        Copies the symbols downloaded from the controller next to the snapshots.
+        """
+
+        for symbol_id in symbols:
+            source = Controller.instance().getStaticCachedPath(Symbol(symbol_id).url())
+            destination = self._symbolPath(symbol_id)
+            if os.path.exists(destination) or not os.path.exists(source):
+                continue
+            try:
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copyfile(source, destination)
+            except OSError as e:
+                log.debug("Could not cache symbol {}: {}".format(symbol_id, e))
+
+    def restoreSymbols(self, snapshot):
+        """
+        Puts back the symbols of a snapshot in the controller static cache,
+        so the nodes are displayed with their symbol right away.
+
+        :param snapshot: snapshot returned by load()
+        """
+
+        for symbol_id in snapshot.get("symbols", []):
+            source = self._symbolPath(symbol_id)
+            destination = Controller.instance().getStaticCachedPath(Symbol(symbol_id).url())
+            if os.path.exists(destination) or not os.path.exists(source):
+                continue
+            try:
+                shutil.copyfile(source, destination)
+            except OSError as e:
+                log.debug("Could not restore symbol {}: {}".format(symbol_id, e))
+
+    def remove(self, project_id):
+        """
+        Removes the snapshot of a project.
+
+        :param project_id: project identifier
+        """
+
+        try:
+            os.remove(self._snapshotPath(project_id))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.debug("Could not remove the topology snapshot of project {}: {}".format(project_id, e))
+
+    def _prune(self):
+        """
+        Removes the least recently saved snapshots.
+        """
+
+        directory = self.directory()
+        try:
+            snapshots = [entry for entry in os.scandir(directory) if entry.name.endswith(".json.gz")]
+        except OSError:
+            return
+        if len(snapshots) <= self.MAX_PROJECTS:
+            return
+        snapshots.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in snapshots[self.MAX_PROJECTS:]:
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                log.debug("Could not remove the topology snapshot {}: {}".format(entry.path, e))
+
+    @staticmethod
+    def reset():
+
+        TopologySnapshotCache._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of TopologySnapshotCache.
+
+        :returns: instance of TopologySnapshotCache
+        """
+
+        if not hasattr(TopologySnapshotCache, "_instance") or TopologySnapshotCache._instance is None:
+            TopologySnapshotCache._instance = TopologySnapshotCache()
+        return TopologySnapshotCache._instance
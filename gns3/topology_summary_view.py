@@ -23,7 +23,6 @@ from .qt import QtGui, QtCore, QtWidgets, qslot, sip_is_deleted
 from .node import Node
 from .topology import Topology
 from .items.node_item import NodeItem
-from .items.link_item import LinkItem
 from .packet_capture import PacketCapture
 from .utils import natural_sort_key
 from .utils.get_icon import get_icon
@@ -52,7 +51,7 @@ class TopologyNodeItem(QtWidgets.QTreeWidgetItem):
         node.started_signal.connect(self._refreshStatusSlot)
         node.stopped_signal.connect(self._refreshStatusSlot)
         node.suspended_signal.connect(self._refreshStatusSlot)
-        node.updated_signal.connect(self._refreshNodeSlot)
+        node.changed_signal.connect(self._nodeChangedSlot)
         node.created_signal.connect(self._refreshNodeSlot)
         node.deleted_signal.connect(self._deletedNodeSlot)
 
@@ -72,6 +71,17 @@ class TopologyNodeItem(QtWidgets.QTreeWidgetItem):
         else:
             self.setIcon(0, QtGui.QIcon(':/icons/led_red.svg'))
 
+    @qslot
+    def _nodeChangedSlot(self, changes, *args):
+        """
+        Slot to update the node when the displayed fields have changed.
+
+        :param changes: frozenset of changed fields
+        """
+
+        if changes & {"name", "console", "ports", "links"}:
+            self.refresh()
+
     @qslot
     def _refreshNodeSlot(self, *args):
         """
@@ -93,7 +103,7 @@ class TopologyNodeItem(QtWidgets.QTreeWidgetItem):
         Updates the widget item with the current node name.
         """
 
-        if self._node.name() != self.text(0):
+        if self._node.name() != self.text(0) and not self._parent.inBulkUpdate():
             # refresh all the other item if the node name has changed
             self._parent.refreshAllLinks(source_child=self)
         self.setText(0, self._node.name())
@@ -108,7 +118,8 @@ class TopologyNodeItem(QtWidgets.QTreeWidgetItem):
         else:
             self.setText(1, "none")
         self.refreshLinks()
-        self._parent.invisibleRootItem().sortChildren(0, QtCore.Qt.SortOrder.AscendingOrder)
+        if not self._parent.inBulkUpdate():
+            self._parent.invisibleRootItem().sortChildren(0, QtCore.Qt.SortOrder.AscendingOrder)
 
     def refreshLinks(self):
         """
@@ -173,6 +184,7 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
 
         super().__init__(parent)
         self.nodes_id = set()
+        self._bulk_update = False
         self._topology = Topology.instance()
         self._topology.node_added_signal.connect(self._nodeAddedSlot)
         self._topology.project_changed_signal.connect(self._projectChangedSlot)
@@ -225,8 +237,37 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
             return
         self.nodes_id.add(node.id())
         TopologyNodeItem(self, node)
+        if not self._bulk_update:
+            self.resizeColumnToContents(0)
+
+    def beginBulkUpdate(self):
+        """
+        Stops repainting and emitting signals while many nodes are added or removed.
+        """
+
+        self._bulk_update = True
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+
+    def endBulkUpdate(self):
+        """
+        Repaints the view once all the nodes have been added or removed.
+        """
+
+        self._bulk_update = False
+        self.refreshAllLinks()
+        self.invisibleRootItem().sortChildren(0, QtCore.Qt.SortOrder.AscendingOrder)
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
         self.resizeColumnToContents(0)
 
+    def inBulkUpdate(self):
+        """
+        Returns True if many nodes are being added or removed.
+        """
+
+        return self._bulk_update
+
     @qslot
     def _itemSelectionChangedSlot(self, *args):
         """
@@ -237,17 +278,33 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
         if current_item:
             from .main_window import MainWindow
             view = MainWindow.instance().uiGraphicsView
-            for item in view.scene().items():
+            for item in view.scene().selectedItems():
                 if isinstance(item, NodeItem):
                     item.setSelected(False)
-                    if isinstance(current_item, TopologyNodeItem) and item.node().id() == current_item.node().id():
-                        item.setSelected(True)
-                elif isinstance(item, LinkItem):
-                    item.setHovered(False)
-                    if not isinstance(current_item, TopologyNodeItem):
-                        link = current_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-                        if item.link() == link:
-                            item.setHovered(True)
+            for item in view.linkItems():
+                item.setHovered(False)
+            item = self._graphicsItem(view, current_item)
+            if isinstance(item, NodeItem):
+                item.setSelected(True)
+            elif item is not None:
+                item.setHovered(True)
+
+    @staticmethod
+    def _graphicsItem(view, current_item):
+        """
+        Returns the scene item matching an item of the tree.
+
+        :param view: GraphicsView instance
+        :param current_item: tree item
+        :returns: NodeItem, LinkItem or None
+        """
+
+        if isinstance(current_item, TopologyNodeItem):
+            return view.nodeItem(current_item.node().id())
+        link = current_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if link is None:
+            return None
+        return view.linkItem(link.id())
 
     @qslot
     def _itemDoubleClickedSlot(self, current_item, *args):
@@ -257,15 +314,9 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
         if current_item != 0:
             from .main_window import MainWindow
             view = MainWindow.instance().uiGraphicsView
-            for item in view.scene().items():
-                if isinstance(item, NodeItem):
-                    if isinstance(current_item, TopologyNodeItem) and item.node().id() == current_item.node().id():
-                        view.centerOn(item)
-                elif isinstance(item, LinkItem):
-                    if not isinstance(current_item, TopologyNodeItem):
-                        link = current_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-                        if item.link() == link:
-                            view.centerOn(item)
+            item = self._graphicsItem(view, current_item)
+            if item is not None:
+                view.centerOn(item)
 
     def contextMenuEvent(self, event):
         """
@@ -332,11 +383,9 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
             if isinstance(current_item, TopologyNodeItem):
                 view.populateDeviceContextualMenu(menu)
             else:
-                link = current_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-                for item in view.scene().items():
-                    if isinstance(item, LinkItem) and item.link() == link:
-                        item.populateLinkContextualMenu(menu)
-                        break
+                item = self._graphicsItem(view, current_item)
+                if item is not None:
+                    item.populateLinkContextualMenu(menu)
 
         menu.exec(pos)
 
@@ -429,8 +478,7 @@ class TopologySummaryView(QtWidgets.QTreeWidget):
             if isinstance(current_item, TopologyNodeItem):
                 current_item.node().delete()
             else:
-                link = current_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-                for item in view.scene().items():
-                    if isinstance(item, LinkItem) and item.link() == link:
-                        item.delete()
+                item = self._graphicsItem(view, current_item)
+                if item is not None:
+                    item.delete()
         super().keyPressEvent(event)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Keeps track of the file transfers (uploads and downloads) in progress.
+"""
+
+import time
+import collections
+
+from .qt import QtCore, qpartial
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class Transfer:
+    """
+    A file transfer.
+
+    :param transfer_id: transfer identifier
+    :param name: text describing the transfer
+    :param direction: "upload", "download" or the name of a node operation
+    :param cancel_callback: function called to cancel the transfer
+    :param unit: unit of the progress values (None = bytes)
+    """
+
+    # weight of the last measure in the throughput average
+    SMOOTHING = 0.3
+
+    def __init__(self, transfer_id, name, direction, cancel_callback=None, unit=None):
+
+        self._id = transfer_id
+        self._name = name
+        self._direction = direction
+        self._cancel_callback = cancel_callback
+        self._unit = unit
+        self._current = 0
+        self._total = 0
+        self._started = time.monotonic()
+        self._last_update = self._started
+        self._throughput = None
+
+    def id(self):
+
+        return self._id
+
+    def name(self):
+
+        return self._name
+
+    def direction(self):
+
+        return self._direction
+
+    def unit(self):
+
+        return self._unit
+
+    def current(self):
+
+        return self._current
+
+    def total(self):
+        """
+        Returns the size of the transfer (0 = unknown).
+        """
+
+        return self._total
+
+    def update(self, current, total, now=None):
+        """
+        Updates the progress of the transfer.
+
+        :param current: number of bytes transferred
+        :param total: total number of bytes (0 or negative if unknown)
+        :param now: current time (monotonic clock)
+        """
+
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - self._last_update
+        if elapsed > 0 and current >= self._current:
+            throughput = (current - self._current) / elapsed
+            if self._throughput is None:
+                self._throughput = throughput
+            else:
+                self._throughput = self.SMOOTHING * throughput + (1 - self.SMOOTHING) * self._throughput
+            self._last_update = now
+        self._current = current
+        self._total = max(0, total)
+
+    def percent(self):
+        """
+        Returns the progress in percent or None if the size is unknown.
+        """
+
+        if self._total <= 0:
+            return None
+        return min(100, int(self._current * 100 / self._total))
+
+    def throughput(self):
+        """
+        Returns the average throughput in bytes per second.
+        """
+
+        if self._throughput is None:
+            return 0
+        return int(self._throughput)
+
+    def eta(self):
+        """
+        Returns the estimated remaining time in seconds or None if unknown.
+        """
+
+        if self._total <= 0 or not self._throughput:
+            return None
+        return max(0, int((self._total - self._current) / self._throughput))
+
+    def cancelable(self):
+
+        return self._cancel_callback is not None
+
+    def cancel(self):
+
+        if self._cancel_callback is not None:
+            log.debug("Cancel transfer {}".format(self._name))
+            self._cancel_callback()
+
+
+class TransferManager(QtCore.QObject):
+    """
+    File transfers in progress, displayed by the transfers dock
+    without blocking the rest of the GUI.
+    """
+
+    # transfer identifier
+    transfer_added_signal = QtCore.Signal(str)
+    # transfer identifier, bytes transferred, total bytes
+    transfer_updated_signal = QtCore.Signal(str, "qint64", "qint64")
+    transfer_removed_signal = QtCore.Signal(str)
+
+    def __init__(self, parent=None):
+
+        super().__init__(parent)
+        self._transfers = collections.OrderedDict()
+        # keep the running workers alive until they are finished
+        self._workers = set()
+
+    def transfers(self):
+        """
+        Returns the transfers in progress.
+
+        :returns: list of Transfer instances
+        """
+
+        return list(self._transfers.values())
+
+    def transfer(self, transfer_id):
+
+        return self._transfers.get(transfer_id)
+
+    def addTransfer(self, transfer_id, name, direction, cancel_callback=None, unit=None):
+        """
+        Adds a transfer.
+
+        :param transfer_id: transfer identifier
+        :param name: text describing the transfer
+        :param direction: "upload", "download" or the name of a node operation
+        :param cancel_callback: function called to cancel the transfer
+        :param unit: unit of the progress values (None = bytes)
+        """
+
+        self._transfers[transfer_id] = Transfer(transfer_id, name, direction, cancel_callback=cancel_callback, unit=unit)
+        self.transfer_added_signal.emit(transfer_id)
+
+    def updateTransfer(self, transfer_id, current, total):
+        """
+        Updates the progress of a transfer.
+
+        :param transfer_id: transfer identifier
+        :param current: number of bytes (or units) transferred
+        :param total: total number of bytes (or units)
+        """
+
+        transfer = self._transfers.get(transfer_id)
+        if transfer is not None:
+            transfer.update(current, total)
+            self.transfer_updated_signal.emit(transfer_id, transfer.current(), transfer.total())
+
+    def removeTransfer(self, transfer_id):
+        """
+        Removes a transfer once it is finished.
+
+        :param transfer_id: transfer identifier
+        """
+
+        if self._transfers.pop(transfer_id, None) is not None:
+            self.transfer_removed_signal.emit(transfer_id)
+
+    def cancelTransfer(self, transfer_id):
+        """
+        Cancels a transfer.
+
+        :param transfer_id: transfer identifier
+        """
+
+        transfer = self._transfers.get(transfer_id)
+        if transfer is not None:
+            transfer.cancel()
+
+    def runWorker(self, worker):
+        """
+        Runs a worker whose queries are file transfers without a modal
+        progress dialog. The worker has the same signals as the workers
+        used with ProgressDialog, its errors are displayed in the console.
+
+        :param worker: worker instance
+        """
+
+        self._workers.add(worker)
+        worker.error.connect(qpartial(self._workerErrorSlot, worker))
+        worker.finished.connect(qpartial(self._workerFinishedSlot, worker))
+        worker.run()
+
+    def _workerErrorSlot(self, worker, message, stop=False):
+
+        log.error(message, extra={"show": True})
+        if stop:
+            self._workers.discard(worker)
+
+    def _workerFinishedSlot(self, worker):
+
+        self._workers.discard(worker)
+
+    @staticmethod
+    def reset():
+
+        TransferManager._instance = None
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of TransferManager.
+
+        :returns: instance of TransferManager
+        """
+
+        if not hasattr(TransferManager, "_instance") or TransferManager._instance is None:
+            TransferManager._instance = TransferManager()
+        return TransferManager._instance
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Dock widget listing the file transfers in progress.
+"""
+
+from .qt import QtCore, QtGui, QtWidgets, qpartial, qslot
+from .utils import human_filesize
+from .transfer_manager import TransferManager
+
+
+def format_eta(seconds):
+    """
+    Formats a remaining time.
+
+    :param seconds: time in seconds or None if unknown
+    :returns: string
+    """
+
+    if seconds is None:
+        return "-"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return "{}:{:02d}:{:02d}".format(hours, minutes, seconds)
+    return "{}:{:02d}".format(minutes, seconds)
+
+
+class TransfersDockWidget(QtWidgets.QDockWidget):
+    """
+    Transfers with their progress, throughput, remaining time
+    and a cancel button. The dock is shown when a transfer starts.
+
+    :param parent: parent widget
+    """
+
+    NAME_COLUMN, PROGRESS_COLUMN, THROUGHPUT_COLUMN, ETA_COLUMN, CANCEL_COLUMN = range(5)
+
+    def __init__(self, parent=None):
+
+        super().__init__("Transfers", parent)
+        self.setObjectName("uiTransfersDockWidget")
+        self.setAllowedAreas(QtCore.Qt.DockWidgetArea.AllDockWidgetAreas)
+
+        self._tree = QtWidgets.QTreeWidget(self)
+        self._tree.setObjectName("uiTransfersTreeWidget")
+        self._tree.setRootIsDecorated(False)
+        self._tree.setHeaderLabels(["Transfer", "Progress", "Throughput", "ETA", ""])
+        self._tree.header().setSectionResizeMode(self.NAME_COLUMN, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self._tree.header().setStretchLastSection(False)
+        self.setWidget(self._tree)
+        self._items = {}
+
+        transfer_manager = TransferManager.instance()
+        transfer_manager.transfer_added_signal.connect(self._transferAddedSlot)
+        transfer_manager.transfer_updated_signal.connect(self._transferUpdatedSlot)
+        transfer_manager.transfer_removed_signal.connect(self._transferRemovedSlot)
+        for transfer in transfer_manager.transfers():
+            self._transferAddedSlot(transfer.id())
+
+    @qslot
+    def _transferAddedSlot(self, transfer_id, *args):
+
+        transfer = TransferManager.instance().transfer(transfer_id)
+        if transfer is None or transfer_id in self._items:
+            return
+
+        item = QtWidgets.QTreeWidgetItem(self._tree)
+        item.setText(self.NAME_COLUMN, transfer.name())
+        item.setToolTip(self.NAME_COLUMN, "{} ({})".format(transfer.name(), transfer.direction()))
+        progress_bar = QtWidgets.QProgressBar()
+        progress_bar.setRange(0, 0)
+        self._tree.setItemWidget(item, self.PROGRESS_COLUMN, progress_bar)
+        if transfer.cancelable():
+            cancel_button = QtWidgets.QToolButton()
+            cancel_button.setIcon(QtGui.QIcon(":/icons/cancel.svg"))
+            cancel_button.setToolTip("Cancel this transfer")
+            cancel_button.clicked.connect(qpartial(TransferManager.instance().cancelTransfer, transfer_id))
+            self._tree.setItemWidget(item, self.CANCEL_COLUMN, cancel_button)
+        self._items[transfer_id] = item
+        self._refresh(transfer)
+        self.setVisible(True)
+
+    @qslot
+    def _transferUpdatedSlot(self, transfer_id, *args):
+
+        transfer = TransferManager.instance().transfer(transfer_id)
+        if transfer is not None:
+            self._refresh(transfer)
+
+    @qslot
+    def _transferRemovedSlot(self, transfer_id, *args):
+
+        item = self._items.pop(transfer_id, None)
+        if item is not None:
+            self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(item))
+
+    @staticmethod
+    def _formatAmount(transfer, amount):
+
+        if transfer.unit() is None:
+            return human_filesize(amount)
+        return "{} {}".format(amount, transfer.unit())
+
+    def _refresh(self, transfer):
+
+        item = self._items.get(transfer.id())
+        if item is None:
+            return
+        progress_bar = self._tree.itemWidget(item, self.PROGRESS_COLUMN)
+        percent = transfer.percent()
+        if percent is None:
+            # unknown size
+            progress_bar.setRange(0, 0)
+            progress_bar.setFormat(self._formatAmount(transfer, transfer.current()))
+        else:
+            progress_bar.setRange(0, 100)
+            progress_bar.setValue(percent)
+            progress_bar.setFormat("{} / {}".format(self._formatAmount(transfer, transfer.current()), self._formatAmount(transfer, transfer.total())))
+        item.setText(self.THROUGHPUT_COLUMN, "{}/s".format(self._formatAmount(transfer, transfer.throughput())))
+        item.setText(self.ETA_COLUMN, format_eta(transfer.eta()))
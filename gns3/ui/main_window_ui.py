@@ -577,7 +577,6 @@ class Ui_MainWindow(object):
         self.uiNodesDockWidget.setWindowTitle(_translate("MainWindow", "All templates"))
         self.uiNodesFilterLineEdit.setPlaceholderText(_translate("MainWindow", "Filter"))
         self.uiNodesView.setToolTip(_translate("MainWindow", "Drag a node to the workspace (Press SHIFT while dragging to add multiple identical nodes)."))
-        self.uiNodesView.headerItem().setText(0, _translate("MainWindow", "1"))
         self.uiNewTemplatePushButton.setText(_translate("MainWindow", "New template"))
         self.uiBrowsersToolBar.setWindowTitle(_translate("MainWindow", "Devices"))
         self.uiControlToolBar.setWindowTitle(_translate("MainWindow", "Emulation"))
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Thread to export the debug information without blocking the GUI.
+"""
+
+import os
+import platform
+import zipfile
+import concurrent.futures
+
+import psutil
+
+from ..qt import QtCore
+from ..version import __version__
+
+import logging
+log = logging.getLogger(__name__)
+
+
+def get_debug_data():
+    """
+    Returns information about the system (versions, network interfaces,
+    connections and processes).
+
+    :returns: text
+    """
+
+    try:
+        connections = psutil.net_connections()
+    # You need to be root for OSX
+    except psutil.AccessDenied:
+        connections = None
+
+    try:
+        addrs = ["* {}: {}".format(key, val) for key, val in psutil.net_if_addrs().items()]
+    except UnicodeDecodeError:
+        addrs = ["INVALID ADDR WITH UNICODE CHARACTERS"]
+
+    data = """Version: {version}
+OS: {os}
+Python: {python}
+Qt: {qt}
+PyQt: {pyqt}
+CPU: {cpu}
+Memory: {memory}
+
+Networks:
+{addrs}
+
+Open connections:
+{connections}
+
+Processus:
+""".format(
+        version=__version__,
+        qt=QtCore.QT_VERSION_STR,
+        pyqt=QtCore.PYQT_VERSION_STR,
+        os=platform.platform(),
+        python=platform.python_version(),
+        memory=psutil.virtual_memory(),
+        cpu=psutil.cpu_times(),
+        connections=connections,
+        addrs="\n".join(addrs)
+    )
+    for proc in psutil.process_iter():
+        try:
+            psinfo = proc.as_dict(attrs=["name", "exe"])
+            data += "* {} {}\n".format(psinfo["name"], psinfo["exe"])
+        except psutil.NoSuchProcess:
+            pass
+    return data
+
+
+class ExportDebugWorker(QtCore.QObject):
+
+    """
+    Worker to write the debug information and files to a zip file.
+
+    The system information is collected in parallel with the packing of the files.
+
+    :param path: path of the zip file
+    :param files: list of (path, name in the archive) tuples
+    :param texts: list of (name in the archive, text) tuples
+    """
+
+    # signals to update the progress dialog.
+    error = QtCore.Signal(str, bool)
+    finished = QtCore.Signal()
+    updated = QtCore.Signal(int)
+
+    # only the end of larger log files is exported
+    LOG_SIZE_LIMIT = 10 * 1024 * 1024
+
+    # files already compressed are stored as is
+    STORED_EXTENSIONS = (".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".png", ".jpg", ".jpeg", ".gif")
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path, files, texts=None):
+
+        super().__init__()
+        self._is_running = False
+        self._path = path
+        self._files = files
+        self._texts = texts or []
+        self._total = 0
+        self._written = 0
+        self._progress = 0
+        self._skipped = []
+
+    @classmethod
+    def isLog(cls, path):
+
+        return path.lower().endswith(".log")
+
+    @classmethod
+    def compressType(cls, path):
+        """
+        Returns the compression method for a file.
+
+        :param path: file path
+        """
+
+        if path.lower().endswith(cls.STORED_EXTENSIONS):
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def _exportedSize(self, path):
+
+        size = os.path.getsize(path)
+        if self.isLog(path):
+            return min(size, self.LOG_SIZE_LIMIT)
+        return size
+
+    def run(self):
+        """
+        Worker starting point.
+        """
+
+        self._is_running = True
+        files = []
+        for path, name in self._files:
+            try:
+                self._total += self._exportedSize(path)
+                files.append((path, name))
+            except OSError as e:
+                self._skipped.append("{}: {}".format(path, e))
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            debug_data = executor.submit(get_debug_data)
+            with zipfile.ZipFile(self._path, "w") as zip_file:
+                for path, name in files:
+                    if not self._is_running:
+                        break
+                    try:
+                        source = open(path, "rb")
+                    except OSError as e:
+                        log.warning("Could not export {}: {}".format(path, e))
+                        self._skipped.append("{}: {}".format(path, e))
+                        continue
+                    with source:
+                        self._addFile(zip_file, source, path, name)
+                if self._is_running:
+                    for name, text in self._texts:
+                        zip_file.writestr(name, text, compress_type=zipfile.ZIP_DEFLATED)
+                    zip_file.writestr("debug.txt", self._debugText(debug_data), compress_type=zipfile.ZIP_DEFLATED)
+        except OSError as e:
+            self.error.emit("Can't export debug information: {}".format(e), True)
+            return
+        finally:
+            executor.shutdown(wait=False)
+
+        if not self._is_running:
+            # the export has been canceled
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            return
+        self.finished.emit()
+
+    def _debugText(self, debug_data):
+
+        try:
+            data = debug_data.result()
+        except Exception as e:
+            log.error("Could not collect debug information: {}".format(e), exc_info=1)
+            data = "Could not collect debug information: {}\n".format(e)
+        if self._skipped:
+            data += "\nSkipped files:\n"
+            data += "".join("* {}\n".format(skipped) for skipped in self._skipped)
+        return data
+
+    def _addFile(self, zip_file, source, path, name):
+        """
+        Streams a file into the archive.
+        """
+
+        size = os.fstat(source.fileno()).st_size
+        zinfo = zipfile.ZipInfo.from_file(path, name)
+        zinfo.compress_type = self.compressType(path)
+        with zip_file.open(zinfo, "w") as destination:
+            if self.isLog(path) and size > self.LOG_SIZE_LIMIT:
+                source.seek(size - self.LOG_SIZE_LIMIT)
+                # start at the beginning of a line
+                self._updateProgress(len(source.readline()))
+                destination.write("[... {} truncated, only the last {} bytes are exported ...]\n".format(name, self.LOG_SIZE_LIMIT).encode())
+            while self._is_running:
+                chunk = source.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                destination.write(chunk)
+                self._updateProgress(len(chunk))
+
+    def _updateProgress(self, size):
+
+        self._written += size
+        if self._total:
+            progress = min(100, int(self._written * 100 / self._total))
+            if progress != self._progress:
+                self._progress = progress
+                self.updated.emit(progress)
+
+    def cancel(self):
+        """
+        Cancels this worker.
+        """
+
+        if not self:
+            return
+        self._is_running = False
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+
 from ..qt import QtCore
 
 
@@ -49,6 +51,11 @@ class ExportProjectWorker(QtCore.QObject):
 
     def _exportReceived(self, content, error=False, server=None, context={}, **kwargs):
         if error:
+            # do not leave a truncated project file
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
             if content:
                 self.error.emit(content["message"], True)
             else:
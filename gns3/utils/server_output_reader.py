@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Drains the output of a server process so its pipe never fills up.
+"""
+
+import threading
+import collections
+import logging
+import logging.handlers
+
+log = logging.getLogger(__name__)
+
+
+class ServerOutputReader:
+    """
+    Reads the output of a process in a background thread. Each line
+    is written to a rotating log file and logged (visible in the console
+    view in debug mode), the last lines are kept to report why the
+    process has stopped.
+
+    :param stream: binary stream to read (e.g. Popen.stdout)
+    :param path: path of the output log file (None = no file)
+    :param name: name of the process used in the log messages
+    """
+
+    MAX_BYTES = 5 * 1024 * 1024
+    BACKUP_COUNT = 3
+    TAIL_LINES = 50
+
+    def __init__(self, stream, path=None, name="local server"):
+
+        self._stream = stream
+        self._path = path
+        self._name = name
+        self._tail = collections.deque(maxlen=self.TAIL_LINES)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._file_handler = None
+
+    def path(self):
+
+        return self._path
+
+    def start(self):
+        """
+        Starts reading the output.
+        """
+
+        if self._path:
+            try:
+                self._file_handler = logging.handlers.RotatingFileHandler(self._path,
+                                                                          maxBytes=self.MAX_BYTES,
+                                                                          backupCount=self.BACKUP_COUNT,
+                                                                          encoding="utf-8")
+                self._file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            except OSError as e:
+                log.warning("Could not open the {} output log file {}: {}".format(self._name, self._path, e))
+        self._thread = threading.Thread(target=self._run, name="ServerOutputReader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+
+        try:
+            for raw_line in iter(self._stream.readline, b""):
+                line = raw_line.decode("utf-8", errors="replace").rstrip()
+                if not line:
+                    continue
+                with self._lock:
+                    self._tail.append(line)
+                if self._file_handler:
+                    self._file_handler.emit(logging.makeLogRecord({"msg": line, "levelno": logging.INFO, "levelname": "INFO"}))
+                log.debug("{}: {}".format(self._name, line))
+        except (OSError, ValueError) as e:
+            # the stream has been closed
+            log.debug("Stopped reading the {} output: {}".format(self._name, e))
+        finally:
+            if self._file_handler:
+                self._file_handler.close()
+
+    def tail(self):
+        """
+        Returns the last lines of output.
+
+        :returns: list of lines
+        """
+
+        with self._lock:
+            return list(self._tail)
+
+    def join(self, timeout=None):
+        """
+        Waits for the end of the output (the process has stopped).
+
+        :param timeout: maximum time to wait in seconds
+        """
+
+        if self._thread:
+            self._thread.join(timeout)
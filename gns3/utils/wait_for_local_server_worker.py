@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Thread to wait for the local server to be ready to answer queries.
+"""
+
+import ssl
+import json
+import time
+import base64
+import http.client
+
+from ..qt import QtCore
+from ..version import __version__
+
+import logging
+log = logging.getLogger(__name__)
+
+# results of a server probe
+PROBE_UNREACHABLE = "unreachable"  # nothing listens on the port
+PROBE_LISTENING = "listening"  # the port is open but the server doesn't answer yet
+PROBE_READY = "ready"
+
+
+def probe_server(host, port, protocol="http", user=None, password=None, timeout=2):
+    """
+    Checks once if a GNS3 server answers on a host and port,
+    without running a Qt event loop.
+
+    :param host: server host
+    :param port: server port
+    :param protocol: "http" or "https"
+    :param user: user for the basic authentication
+    :param password: password for the basic authentication
+    :param timeout: timeout in seconds
+
+    :returns: PROBE_UNREACHABLE, PROBE_LISTENING or PROBE_READY
+    """
+
+    if host in (None, "", "0.0.0.0"):
+        host = "127.0.0.1"
+    elif host == "::":
+        host = "::1"
+
+    if protocol == "https":
+        # the local server uses a self-signed certificate
+        connection = http.client.HTTPSConnection(host, port, timeout=timeout, context=ssl._create_unverified_context())
+    else:
+        connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    headers = {"User-Agent": "GNS3 QT Client v{version}".format(version=__version__)}
+    if user:
+        auth_string = base64.b64encode("{}:{}".format(user, password or "").encode("utf-8"))
+        headers["Authorization"] = "Basic {}".format(auth_string.decode())
+
+    try:
+        try:
+            connection.connect()
+        except OSError:
+            return PROBE_UNREACHABLE
+        try:
+            connection.request("GET", "/v2/version", headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            log.debug("Invalid answer from {}:{}: {}".format(host, port, e))
+            return PROBE_LISTENING
+    finally:
+        connection.close()
+
+    if response.status == 401:
+        # authentication issue that need to be solved later
+        return PROBE_READY
+    if response.status != 200:
+        return PROBE_LISTENING
+    try:
+        data = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return PROBE_LISTENING
+    if not isinstance(data, dict) or data.get("version") is None:
+        log.debug("Server is not a GNS3 server")
+        return PROBE_LISTENING
+    return PROBE_READY
+
+
+class WaitForLocalServerWorker(QtCore.QObject):
+    """
+    Probes the local server with an exponential backoff until it answers,
+    its process stops or the timeout expires.
+
+    :param settings: local server settings
+    :param port: local server port
+    :param process: local server process (subprocess.Popen instance) or None
+    :param output_reader: ServerOutputReader of the process, used to report errors
+    """
+
+    # signals to update the progress dialog.
+    error = QtCore.Signal(str, bool)
+    finished = QtCore.Signal()
+    updated = QtCore.Signal(int)
+
+    TIMEOUT = 30.0
+
+    # delays between two probes (in seconds)
+    MIN_BACKOFF = 0.05
+    MAX_BACKOFF = 1.0
+
+    def __init__(self, settings, port, process=None, output_reader=None):
+
+        super().__init__()
+        self._is_running = False
+        self._settings = settings
+        self._port = port
+        self._process = process
+        self._output_reader = output_reader
+        self._backoff = self.MIN_BACKOFF
+        self._begin = None
+        self._attempts = 0
+        self._timings = {}
+
+    def timings(self):
+        """
+        Returns the time it took for the port to be open
+        and for the server to answer.
+
+        :returns: dictionary phase -> duration in milliseconds
+        """
+
+        return dict(self._timings)
+
+    def attempts(self):
+
+        return self._attempts
+
+    def run(self):
+        """
+        Worker starting point.
+        """
+
+        self._is_running = True
+        self._begin = time.monotonic()
+        self._probeSlot()
+
+    def _elapsed(self):
+
+        return int((time.monotonic() - self._begin) * 1000)
+
+    def _probeSlot(self):
+
+        if not self._is_running:
+            return
+
+        if self._process is not None and self._process.poll() is not None:
+            self._is_running = False
+            message = "Local server process has stopped with exit code {}".format(self._process.returncode)
+            if self._output_reader:
+                self._output_reader.join(timeout=1)
+                tail = self._output_reader.tail()
+                if tail:
+                    message += ":\n{}".format("\n".join(tail))
+            self.error.emit(message, True)
+            return
+
+        self._attempts += 1
+        result = probe_server(self._settings["host"],
+                              self._port,
+                              protocol=self._settings.get("protocol", "http"),
+                              user=self._settings.get("user"),
+                              password=self._settings.get("password"))
+
+        if result != PROBE_UNREACHABLE and "port_open" not in self._timings:
+            self._timings["port_open"] = self._elapsed()
+        if result == PROBE_READY:
+            self._is_running = False
+            self._timings["ready"] = self._elapsed()
+            log.debug("Local server ready after {} probe(s)".format(self._attempts))
+            self.finished.emit()
+            return
+
+        if time.monotonic() - self._begin >= self.TIMEOUT:
+            self._is_running = False
+            self.error.emit("Could not connect to {} on port {} after {} seconds".format(self._settings["host"],
+                                                                                        self._port,
+                                                                                        int(self.TIMEOUT)), True)
+            return
+
+        QtCore.QTimer.singleShot(int(self._backoff * 1000), self._probeSlot)
+        self._backoff = min(self._backoff * 2, self.MAX_BACKOFF)
+
+    def cancel(self):
+        """
+        Cancel this worker.
+        """
+
+        if not self:
+            return
+        self._is_running = False
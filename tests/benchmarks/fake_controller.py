@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Stand-in controller serving synthetic projects to the benchmarks.
+"""
+
+import re
+import json
+import uuid
+import random
+import urllib.parse
+
+from gns3.qt import QtCore
+
+SYMBOLS = (":/symbols/computer.svg", ":/symbols/router.svg", ":/symbols/ethernet_switch.svg", ":/symbols/firewall.svg")
+PORTS_PER_NODE = 4
+
+
+def synthetic_project(nodes=100, drawings=10, seed=0):
+    """
+    Builds a project whose nodes are linked in a ring, on a grid.
+
+    :param nodes: number of nodes
+    :param drawings: number of drawings
+    :param seed: seed of the random generator (same seed = same project)
+    :returns: dictionary with the project, nodes, links and drawings
+    """
+
+    rng = random.Random(seed)
+    project_id = str(uuid.UUID(int=rng.getrandbits(128)))
+    columns = max(1, int(nodes ** 0.5))
+
+    node_list = []
+    for index in range(nodes):
+        name = "PC{}".format(index + 1)
+        node_list.append({
+            "node_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "node_type": "vpcs",
+            "compute_id": "local",
+            "project_id": project_id,
+            "name": name,
+            "status": "stopped",
+            "console": 5000 + index,
+            "console_type": "telnet",
+            "console_host": "127.0.0.1",
+            "console_auto_start": False,
+            "x": (index % columns) * 150,
+            "y": (index // columns) * 150,
+            "z": 1,
+            "locked": False,
+            "symbol": SYMBOLS[index % len(SYMBOLS)],
+            "label": {"text": name, "x": 0, "y": -25, "rotation": 0, "style": "font-family: TypeWriter;font-size: 10.0;font-weight: bold;fill: #000000;fill-opacity: 1.0;"},
+            "properties": {},
+            "custom_adapters": [],
+            "first_port_name": None,
+            "port_name_format": "Ethernet{0}",
+            "port_segment_size": 0,
+            "ports": [{"name": "Ethernet{}".format(port),
+                       "short_name": "e{}".format(port),
+                       "adapter_number": 0,
+                       "port_number": port,
+                       "link_type": "ethernet",
+                       "data_link_types": {"Ethernet": "DLT_EN10MB"}} for port in range(PORTS_PER_NODE)]
+        })
+
+    link_list = []
+    if nodes > 1:
+        for index, node in enumerate(node_list):
+            next_node = node_list[(index + 1) % nodes]
+            link_list.append({
+                "link_id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "link_type": "ethernet",
+                "project_id": project_id,
+                "capturing": False,
+                "capture_file_name": None,
+                "capture_file_path": None,
+                "filters": {},
+                "suspend": False,
+                "link_style": {},
+                "nodes": [
+                    {"node_id": node["node_id"], "adapter_number": 0, "port_number": 1, "label": {"text": "e1", "x": 10, "y": 10, "rotation": 0, "style": ""}},
+                    {"node_id": next_node["node_id"], "adapter_number": 0, "port_number": 0, "label": {"text": "e0", "x": 10, "y": 10, "rotation": 0, "style": ""}}
+                ]
+            })
+
+    drawing_list = []
+    for index in range(drawings):
+        drawing_list.append({
+            "drawing_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "project_id": project_id,
+            "x": rng.randint(0, columns * 150),
+            "y": rng.randint(0, columns * 150),
+            "z": 0,
+            "locked": False,
+            "rotation": 0,
+            "svg": '<svg height="100" width="200"><rect height="100" width="200" fill="#ffffff" fill-opacity="1.0" stroke="#000000" stroke-width="2" /></svg>'
+        })
+
+    project = {
+        "project_id": project_id,
+        "name": "benchmark-{}".format(nodes),
+        "status": "opened",
+        "filename": "benchmark.gns3",
+        "path": None,
+        "scene_width": 2000,
+        "scene_height": 1000,
+        "auto_start": False,
+        "auto_open": False,
+        "auto_close": True
+    }
+    return {"project": project, "nodes": node_list, "links": link_list, "drawings": drawing_list}
+
+
+def notification_storm(topology, events=1000, seed=0):
+    """
+    Builds node update notifications, as sent by the controller
+    when nodes are moved or started.
+
+    :param topology: project returned by synthetic_project()
+    :param events: number of notifications
+    :param seed: seed of the random generator
+    :returns: list of notifications
+    """
+
+    rng = random.Random(seed)
+    notifications = []
+    for _ in range(events):
+        node = dict(rng.choice(topology["nodes"]))
+        if rng.random() < 0.5:
+            node["x"] += rng.randint(-50, 50)
+            node["y"] += rng.randint(-50, 50)
+        else:
+            node["status"] = rng.choice(["started", "stopped"])
+        notifications.append({"action": "node.updated", "event": node})
+    return notifications
+
+
+class FakeController(QtCore.QObject):
+    """
+    Answers the queries of the GUI for a synthetic project. The answers
+    are encoded in JSON and delivered from the event loop, like the
+    answers of the real controller.
+
+    :param topology: project returned by synthetic_project()
+    :param latency: delay before answering a query (in milliseconds)
+    """
+
+    def __init__(self, topology, latency=0):
+
+        super().__init__()
+        self._topology = topology
+        self._latency = latency
+        self._queries = 0
+        self._encoded = {}
+        self.encode()
+
+    def encode(self):
+        """
+        Encodes the answers, call it after modifying the topology.
+        """
+
+        for key in ("project", "nodes", "links", "drawings"):
+            self._encoded[key] = json.dumps(self._topology[key]).encode()
+
+    def queries(self):
+
+        return self._queries
+
+    def createHTTPQuery(self, method, path, callback, body=None, **kwargs):
+
+        self._queries += 1
+        project_path = "/projects/{}".format(self._topology["project"]["project_id"])
+        raw_body = None
+        if path in (project_path + "/open", "/projects/load"):
+            result = json.loads(self._encoded["project"])
+        elif path in (project_path + "/nodes", project_path + "/links", project_path + "/drawings"):
+            result = json.loads(self._encoded[path.rsplit("/", 1)[1]])
+        elif method == "PUT" and re.match(re.escape(project_path) + "/nodes/[^/]+$", path):
+            node_id = path.rsplit("/", 1)[1]
+            result = {}
+            for node in self._topology["nodes"]:
+                if node["node_id"] == node_id:
+                    node.update(body or {})
+                    result = json.loads(json.dumps(node))
+        elif path.startswith("/symbols/") and path.endswith("/raw"):
+            symbol_id = urllib.parse.unquote(path[len("/symbols/"):-len("/raw")])
+            symbol_file = QtCore.QFile(symbol_id)
+            if not symbol_file.open(QtCore.QIODeviceBase.OpenModeFlag.ReadOnly):
+                self._answer(callback, {"message": "Symbol {} not found".format(symbol_id)}, error=True)
+                return
+            raw_body = bytes(symbol_file.readAll())
+            result = {}
+        else:
+            result = {}
+
+        if callback is not None:
+            self._answer(callback, result, raw_body=raw_body)
+
+    def _answer(self, callback, result, **kwargs):
+
+        QtCore.QTimer.singleShot(self._latency, lambda: callback(result, server=None, context={}, **kwargs))
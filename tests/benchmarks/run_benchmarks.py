@@ -0,0 +1,437 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Performance benchmarks of the GUI, run offscreen against a stand-in
+controller serving a synthetic project:
+
+    python tests/benchmarks/run_benchmarks.py --nodes 200 --output results.json
+
+Save the results of a reference run with --output, then compare
+the next runs with --baseline results.json: the exit code is 1 when
+a metric is worse than the baseline by more than the tolerance.
+
+The benchmarks are not run by pytest because the tests replace the Qt
+signals by a synchronous version.
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import datetime
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+
+from unittest.mock import MagicMock, patch
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(BENCHMARKS_DIR, "..", ".."))
+for path in (ROOT_DIR, BENCHMARKS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+RESULTS_VERSION = 1
+
+# metric name -> True if a higher value is better
+METRICS = {
+    "startup_ms": False,
+    "open_ms": False,
+    "open_cached_display_ms": False,
+    "open_cached_ms": False,
+    "notifications_per_second": True,
+    "frame_ms": False,
+    "drag_step_ms": False,
+    "memory_per_node_bytes": False,
+    "python_memory_per_node_bytes": False,
+    "appliance_load_uncached_ms": False,
+    "appliance_load_ms": False,
+}
+
+STARTUP_SCRIPT = """
+import os
+import sys
+import json
+import time
+begin = time.perf_counter()
+sys.path.insert(0, {benchmarks!r})
+from run_benchmarks import create_main_window
+from gns3.qt import QtWidgets
+app = QtWidgets.QApplication([])
+window = create_main_window()
+print(json.dumps({{"startup_ms": (time.perf_counter() - begin) * 1000}}))
+sys.stdout.flush()
+# skip the cleanup of Qt objects
+os._exit(0)
+"""
+
+
+def create_main_window():
+    """
+    Creates the main window without starting the local server
+    (the stand-in controller replaces it).
+    """
+
+    from gns3.local_server_config import LocalServerConfig
+    from gns3.main_window import MainWindow
+
+    LocalServerConfig.instance().saveSettings("Server", {"auto_start": False})
+    # the startup loading would connect to the controller or show the setup wizard
+    with patch.object(MainWindow, "startupLoading"):
+        return MainWindow()
+
+
+def compare(results, baseline, tolerance=0.25):
+    """
+    Compares benchmark results with a baseline.
+
+    :param results: results of this run
+    :param baseline: results of the reference run
+    :param tolerance: accepted degradation (0.25 = 25%)
+    :returns: list of (metric, baseline value, value) tuples for the regressions
+    """
+
+    regressions = []
+    for metric, higher_is_better in METRICS.items():
+        value = results["metrics"].get(metric)
+        reference = baseline["metrics"].get(metric)
+        if value is None or not reference:
+            continue
+        if higher_is_better:
+            regressed = value < reference / (1 + tolerance)
+        else:
+            regressed = value > reference * (1 + tolerance)
+        if regressed:
+            regressions.append((metric, reference, value))
+    return regressions
+
+
+def measure_startup(runs=3):
+    """
+    Measures the time to start Python, import the GUI and create the main window.
+
+    :param runs: number of runs, the fastest one is kept
+    :returns: time in milliseconds
+    """
+
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    timings = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as config_dir:
+            env["XDG_CONFIG_HOME"] = config_dir
+            begin = time.perf_counter()
+            output = subprocess.check_output([sys.executable, "-c", STARTUP_SCRIPT.format(benchmarks=BENCHMARKS_DIR)], env=env, timeout=120)
+            total = (time.perf_counter() - begin) * 1000
+        in_process = json.loads(output.decode().strip().splitlines()[-1])["startup_ms"]
+        # includes the interpreter startup
+        timings.append(max(total, in_process))
+    return min(timings)
+
+
+def measure_appliance_loading(copies=10, max_workers=1):
+    """
+    Measures the time to load the test appliances with a new schema
+    validator for each file and with load_appliances().
+
+    :param copies: number of times each test appliance is loaded
+    :param max_workers: number of workers of load_appliances()
+    :returns: tuple (time with a validator per file, time with load_appliances(), number of appliances loaded)
+    in milliseconds per file
+    """
+
+    import jsonschema
+    from gns3.registry.registry import Registry
+    from gns3.registry.appliance import load_appliances, _schema_validator
+    from gns3.utils.get_resource import get_resource
+
+    directory = os.path.join(ROOT_DIR, "tests", "registry", "appliances")
+    paths = sorted(os.path.join(directory, filename) for filename in os.listdir(directory)) * copies
+
+    begin = time.perf_counter()
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            appliance = json.load(f)
+        schema_file = "appliance_v8.json" if appliance.get("registry_version") == 8 else "appliance.json"
+        with open(get_resource("schemas/{}".format(schema_file))) as f:
+            jsonschema.Draft4Validator(json.load(f)).is_valid(appliance)
+    uncached = (time.perf_counter() - begin) * 1000
+
+    _schema_validator.cache_clear()
+    with tempfile.TemporaryDirectory() as images_dir:
+        registry = Registry([images_dir])
+        begin = time.perf_counter()
+        appliances, errors = load_appliances(registry, paths, max_workers=max_workers)
+        cached = (time.perf_counter() - begin) * 1000
+    assert len(appliances) + len(errors) == len(paths)
+    return uncached / len(paths), cached / len(paths), len(appliances)
+
+
+class Benchmark:
+    """
+    Runs the GUI with a stand-in controller.
+
+    :param nodes: number of nodes of the synthetic project
+    :param drawings: number of drawings of the synthetic project
+    :param latency: delay before the controller answers (in milliseconds)
+    """
+
+    TIMEOUT = 300
+
+    def __init__(self, nodes, drawings, latency=0):
+
+        from gns3.qt import QtWidgets
+        from gns3.controller import Controller
+        from fake_controller import FakeController, synthetic_project
+
+        self._app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self._main_window = create_main_window()
+        self._main_window.resize(1280, 800)
+
+        self._nodes = nodes
+        self._topology = synthetic_project(nodes=nodes, drawings=drawings)
+        self._controller = FakeController(self._topology, latency=latency)
+        http_client = MagicMock()
+        http_client.createHTTPQuery.side_effect = self._controller.createHTTPQuery
+        Controller.instance()._http_client = http_client
+
+    def topology(self):
+
+        return self._topology
+
+    def _runUntil(self, condition):
+
+        from gns3.qt import QtCore
+        deadline = time.monotonic() + self.TIMEOUT
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError("Benchmark timeout")
+            self._app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 50)
+
+    def openProject(self):
+        """
+        Opens the project and waits until it is loaded with its symbols.
+
+        :returns: tuple (time to display the first topology, time to load the project) in milliseconds
+        """
+
+        from gns3.topology import Topology
+        from gns3.controller import Controller
+
+        loaded = []
+        begin = time.perf_counter()
+        project = Topology.instance().createLoadProject({"project_id": self._topology["project"]["project_id"],
+                                                         "project_name": self._topology["project"]["name"]})
+        displayed = time.perf_counter()
+        project.project_loaded_signal.connect(lambda: loaded.append(True))
+        self._runUntil(lambda: loaded and not Controller.instance()._static_asset_download_queue)
+        end = time.perf_counter()
+        return (displayed - begin) * 1000, (end - begin) * 1000
+
+    def closeProject(self):
+
+        from gns3.topology import Topology
+        Topology.instance().setProject(None)
+        self._app.processEvents()
+
+    def removeCachedTopology(self):
+
+        from gns3.topology_snapshot_cache import TopologySnapshotCache
+        TopologySnapshotCache.instance().remove(self._topology["project"]["project_id"])
+
+    def notifications(self, events):
+        """
+        :returns: number of notifications handled per second
+        """
+
+        from gns3.topology import Topology
+        from fake_controller import notification_storm
+
+        storm = notification_storm(self._topology, events=events)
+        project = Topology.instance().project()
+        begin = time.perf_counter()
+        for notification in storm:
+            project._event_received(notification)
+        self._app.processEvents()
+        return events / (time.perf_counter() - begin)
+
+    def frameTime(self, frames):
+        """
+        :returns: average time to render the whole scene in milliseconds
+        """
+
+        from gns3.qt import QtCore, QtGui
+
+        scene = self._main_window.uiGraphicsView.scene()
+        source = scene.itemsBoundingRect()
+        image = QtGui.QImage(1280, 800, QtGui.QImage.Format.Format_ARGB32_Premultiplied)
+        timings = []
+        for _ in range(frames):
+            image.fill(QtCore.Qt.GlobalColor.white)
+            begin = time.perf_counter()
+            painter = QtGui.QPainter(image)
+            scene.render(painter, QtCore.QRectF(image.rect()), source)
+            painter.end()
+            timings.append((time.perf_counter() - begin) * 1000)
+        return statistics.mean(timings)
+
+    def dragLatency(self, steps):
+        """
+        Moves a linked node step by step, like a drag with the mouse.
+
+        :returns: median time of a step in milliseconds
+        """
+
+        from gns3.qt import QtCore
+
+        node_item = max(self._main_window.uiGraphicsView.nodeItems(), key=lambda item: len(item.node().links()))
+        timings = []
+        for step in range(steps):
+            offset = QtCore.QPointF(5, 3) if step % 2 == 0 else QtCore.QPointF(-3, -5)
+            begin = time.perf_counter()
+            node_item.setPos(node_item.pos() + offset)
+            self._app.processEvents()
+            timings.append((time.perf_counter() - begin) * 1000)
+        return statistics.median(timings)
+
+    def memoryPerNode(self):
+        """
+        Opens the project and measures the memory used.
+
+        :returns: tuple (resident memory, memory allocated by Python) per node in bytes
+        """
+
+        import psutil
+
+        process = psutil.Process()
+        gc.collect()
+        rss = process.memory_info().rss
+        tracemalloc.start()
+        try:
+            self.openProject()
+            gc.collect()
+            python_memory = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        rss = process.memory_info().rss - rss
+        return max(0, rss) / self._nodes, python_memory / self._nodes
+
+
+def run(args):
+    """
+    Runs the benchmarks.
+
+    :returns: results
+    """
+
+    from gns3.qt import QtCore
+
+    metrics = {}
+    if args.startup_runs:
+        metrics["startup_ms"] = measure_startup(args.startup_runs)
+
+    if args.appliance_copies:
+        metrics["appliance_load_uncached_ms"], metrics["appliance_load_ms"], _ = measure_appliance_loading(args.appliance_copies)
+
+    benchmark = Benchmark(args.nodes, args.drawings, latency=args.latency)
+    metrics["open_ms"] = benchmark.openProject()[1]
+    metrics["notifications_per_second"] = benchmark.notifications(args.events)
+    metrics["frame_ms"] = benchmark.frameTime(args.frames)
+    metrics["drag_step_ms"] = benchmark.dragLatency(args.drag_steps)
+    benchmark.closeProject()
+
+    # the topology has been saved in the snapshot cache by the first opening
+    metrics["open_cached_display_ms"], metrics["open_cached_ms"] = benchmark.openProject()
+    benchmark.closeProject()
+
+    benchmark.removeCachedTopology()
+    metrics["memory_per_node_bytes"], metrics["python_memory_per_node_bytes"] = benchmark.memoryPerNode()
+    benchmark.closeProject()
+
+    return {
+        "version": RESULTS_VERSION,
+        "date": datetime.datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "pyqt": QtCore.PYQT_VERSION_STR,
+            "platform": platform.platform()
+        },
+        "parameters": {
+            "nodes": args.nodes,
+            "drawings": args.drawings,
+            "events": args.events,
+            "latency": args.latency,
+            "appliance_copies": args.appliance_copies
+        },
+        "metrics": metrics
+    }
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Runs the GUI performance benchmarks")
+    parser.add_argument("--nodes", type=int, default=200, help="number of nodes in the project")
+    parser.add_argument("--drawings", type=int, default=20, help="number of drawings in the project")
+    parser.add_argument("--events", type=int, default=2000, help="number of notifications sent by the controller")
+    parser.add_argument("--latency", type=int, default=0, help="delay before the controller answers (in milliseconds)")
+    parser.add_argument("--frames", type=int, default=20, help="number of frames rendered")
+    parser.add_argument("--drag-steps", type=int, default=100, help="number of steps when dragging a node")
+    parser.add_argument("--appliance-copies", type=int, default=10, help="number of times each test appliance is loaded (0 to skip)")
+    parser.add_argument("--startup-runs", type=int, default=3, help="number of GUI startups (0 to skip)")
+    parser.add_argument("--output", help="file where the results are saved (JSON)")
+    parser.add_argument("--baseline", help="results of a reference run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="accepted degradation (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # isolate the settings and caches from the user ones
+    config_dir = tempfile.TemporaryDirectory()
+    os.environ["XDG_CONFIG_HOME"] = config_dir.name
+
+    results = run(args)
+    # the console of the main window redirects the output
+    sys.stdout = sys.__stdout__
+    sys.stderr = sys.__stderr__
+    for metric, value in results["metrics"].items():
+        print("{:<32} {:>12.2f}".format(metric, value))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("parameters") != results["parameters"]:
+            print("The baseline was run with different parameters: {}".format(baseline.get("parameters")))
+        for metric, reference, value in compare(results, baseline, args.tolerance):
+            print("Regression: {} is {:.2f} (baseline {:.2f})".format(metric, value, reference))
+            exit_code = 1
+
+    sys.stdout.flush()
+    # skip the cleanup of Qt objects
+    os._exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import subprocess
+
+from unittest.mock import MagicMock
+
+from gns3.qt import QtWidgets
+
+from fake_controller import FakeController, synthetic_project, notification_storm
+from run_benchmarks import compare, measure_appliance_loading
+
+
+def test_synthetic_project():
+
+    topology = synthetic_project(nodes=10, drawings=3)
+    assert len(topology["nodes"]) == 10
+    assert len(topology["links"]) == 10
+    assert len(topology["drawings"]) == 3
+    assert synthetic_project(nodes=10)["project"]["project_id"] == topology["project"]["project_id"]
+
+    # each port is used by one link
+    endpoints = [(side["node_id"], side["port_number"]) for link in topology["links"] for side in link["nodes"]]
+    assert len(endpoints) == len(set(endpoints))
+
+    storm = notification_storm(topology, events=20)
+    assert len(storm) == 20
+    assert all(notification["action"] == "node.updated" for notification in storm)
+
+
+def test_fake_controller():
+
+    topology = synthetic_project(nodes=3, drawings=0)
+    controller = FakeController(topology)
+    callback = MagicMock()
+    controller.createHTTPQuery("GET", "/projects/{}/nodes".format(topology["project"]["project_id"]), callback)
+    assert not callback.called
+    QtWidgets.QApplication.processEvents()
+    assert callback.call_args[0][0] == topology["nodes"]
+    # the answer is a copy
+    assert callback.call_args[0][0] is not topology["nodes"]
+
+    callback = MagicMock()
+    controller.createHTTPQuery("GET", "/symbols/%3A/symbols/computer.svg/raw", callback)
+    QtWidgets.QApplication.processEvents()
+    assert callback.call_args[1]["raw_body"].startswith(b"<")
+
+
+def test_compare():
+
+    baseline = {"metrics": {"open_ms": 100, "notifications_per_second": 1000, "frame_ms": 10}}
+    results = {"metrics": {"open_ms": 120, "notifications_per_second": 700, "frame_ms": 5}}
+    assert compare(results, baseline, tolerance=0.25) == [("notifications_per_second", 1000, 700)]
+    results["metrics"]["open_ms"] = 130
+    assert compare(results, baseline, tolerance=0.25) == [("open_ms", 100, 130), ("notifications_per_second", 1000, 700)]
+    # metrics missing from the baseline are not compared
+    assert compare({"metrics": {"drag_step_ms": 3}}, baseline) == []
+
+
+def test_measure_appliance_loading():
+
+    from gns3.registry.appliance import _schema_validator
+
+    uncached, cached, loaded = measure_appliance_loading(copies=2)
+    assert uncached > 0
+    assert cached > 0
+    assert loaded > 0
+    # one validator for appliance.json and one for appliance_v8.json
+    assert _schema_validator.cache_info().misses == 2
+
+
+def test_run_benchmarks(tmpdir):
+
+    output = str(tmpdir / "results.json")
+    script = os.path.join(os.path.dirname(__file__), "run_benchmarks.py")
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    subprocess.check_call([sys.executable, script,
+                           "--nodes", "4", "--drawings", "1", "--events", "10", "--frames", "1", "--drag-steps", "2", "--startup-runs", "0",
+                           "--appliance-copies", "1", "--output", output], env=env, stdout=subprocess.DEVNULL, timeout=120)
+    with open(output) as f:
+        results = json.load(f)
+    assert results["parameters"]["nodes"] == 4
+    assert results["metrics"]["open_ms"] > 0
+    assert results["metrics"]["notifications_per_second"] > 0
+    assert results["metrics"]["appliance_load_ms"] > 0
+
+    # same results as the baseline
+    assert subprocess.call([sys.executable, script,
+                            "--nodes", "4", "--drawings", "1", "--events", "10", "--frames", "1", "--drag-steps", "2", "--startup-runs", "0",
+                            "--appliance-copies", "1", "--baseline", output, "--tolerance", "1000"], env=env, stdout=subprocess.DEVNULL, timeout=120) == 0
@@ -36,9 +36,23 @@ def reset_modules():
     from gns3.modules.vpcs.vpcs_node import VPCSNode
     from gns3.modules.virtualbox.virtualbox_vm import VirtualBoxVM
     from gns3.modules.iou.iou_device import IOUDevice
+    from gns3.modules.dynamips.idlepc_knowledge_base import IdlePCKnowledgeBase
     from gns3.compute_manager import ComputeManager
+    from gns3.transfer_manager import TransferManager
+    from gns3.topology_snapshot_cache import TopologySnapshotCache
+    from gns3.stall_watchdog import StallWatchdog
+    from gns3.memory_monitor import MemoryMonitor
+    from gns3.image_catalogue import ImageCatalogue
+    from gns3.http_client import HTTPClient
 
     ComputeManager.reset()
+    TransferManager.reset()
+    TopologySnapshotCache.reset()
+    StallWatchdog.reset()
+    MemoryMonitor.reset()
+    ImageCatalogue.reset()
+    HTTPClient.setTransferCallback(None)
+    IdlePCKnowledgeBase.reset()
     VPCSNode.reset()
     VirtualBoxVM.reset()
     IOUDevice.reset()
@@ -152,9 +166,11 @@ def qemu_vm(local_server, project):
 
 
 @pytest.fixture
-def local_config():
+def local_config(tmpdir, monkeypatch):
     from gns3.local_config import LocalConfig
 
+    # isolate the config directory (caches etc.) from the user one
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmpdir / "config"))
     (fd, config_path) = tempfile.mkstemp()
     os.close(fd)
 
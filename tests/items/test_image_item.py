@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+import unittest.mock
 import xml.etree.ElementTree as ET
 
 from gns3.items.image_item import ImageItem
@@ -46,3 +47,33 @@ def test_json(image):
     assert "svg" not in  image.__json__()
 
 
+
+
+def test_fromSvg_shared_renderer(image, project):
+    image2 = ImageItem(svg=image.toSvg(), project=project)
+    image3 = ImageItem(svg=image.toSvg(), project=project)
+    # same image content, the decoded image is shared
+    assert image2.renderer() is image3.renderer()
+
+
+def test_updateDrawingCallback_same_svg(image, project):
+    image2 = ImageItem(svg=image.toSvg(), project=project)
+    renderer = image2.renderer()
+    with unittest.mock.patch("gns3.items.image_item.ImageItem.fromSvg") as from_svg_mock:
+        image2.updateDrawingCallback({"x": 10, "y": 20, "z": 1, "locked": False, "rotation": 0, "svg": image.toSvg()})
+        assert not from_svg_mock.called
+    assert image2.zValue() == 1
+    assert image2.renderer() is renderer
+
+
+def test_parseSvg_large_svg_not_cached():
+
+    from gns3.items.utils import parseSvg, _parseSmallSvg, PARSE_SVG_CACHE_MAX_LENGTH
+
+    _parseSmallSvg.cache_clear()
+    rect = '<svg height="100" width="100"><rect height="100" width="100" /></svg>'
+    assert parseSvg(rect) is parseSvg(rect)
+
+    image = '<svg height="100" width="100"><image href="data:image/png;base64,{}" /></svg>'.format("A" * PARSE_SVG_CACHE_MAX_LENGTH)
+    assert parseSvg(image) is not parseSvg(image)
+    assert _parseSmallSvg.cache_info().currsize == 1
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import unittest.mock
 import xml.etree.ElementTree as ET
 
 from gns3.items.rectangle_item import RectangleItem
@@ -80,3 +81,18 @@ def test_create(project, controller):
             "rotation": int(rect.rotation())
         }
     )
+
+
+def test_updateDrawingCallback_svg_changed(project, controller):
+    rect = RectangleItem(project=project, svg='<svg height="150" width="250"><rect height="150" width="250" /></svg>')
+    rect.updateDrawingCallback({"x": 0, "y": 0, "z": 1, "locked": False, "rotation": 0, "svg": '<svg height="150" width="250"><rect height="150" width="250" /></svg>'})
+    assert rect.rect().width() == 250
+    rect.updateDrawingCallback({"x": 0, "y": 0, "z": 1, "locked": False, "rotation": 0, "svg": '<svg height="100" width="300"><rect height="100" width="300" /></svg>'})
+    assert rect.rect().width() == 300
+
+    # the controller sends back the SVG we have sent
+    rect.setWidthAndHeight(120, 80)
+    svg = rect.__json__()["svg"]
+    with unittest.mock.patch("gns3.items.rectangle_item.RectangleItem.fromSvg") as from_svg_mock:
+        rect.updateDrawingCallback({"x": 0, "y": 0, "z": 1, "locked": False, "rotation": 0, "svg": svg})
+        assert not from_svg_mock.called
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import pytest
+
+from unittest.mock import patch
+
+from gns3.modules.dynamips import Dynamips
+from gns3.modules.dynamips.nodes.c7200 import C7200
+from gns3.modules.dynamips.idlepc_knowledge_base import IdlePCKnowledgeBase
+
+
+def test_record_lookup(tmpdir):
+
+    path = str(tmpdir / "idlepc.json")
+    kb = IdlePCKnowledgeBase(path)
+    assert kb.lookup("md5", "c7200") is None
+
+    kb.record("md5", "c7200", "0x60189054", cpu_usage=40, image="/images/c7200.image")
+    kb.record("md5", "c7200", "0x6018a0c4", cpu_usage=5)
+    kb.record("md5", "c7200", "0x0")
+    assert kb.lookup("md5", "c7200") == "0x6018a0c4"
+    assert kb.values("md5", "c7200") == [("0x6018a0c4", 5), ("0x60189054", 40)]
+    assert kb.lookup("md5", "c3745") is None
+
+    # the values are persisted
+    kb = IdlePCKnowledgeBase(path)
+    assert kb.lookup("md5", "c7200") == "0x6018a0c4"
+
+    kb.forget("md5", "c7200", "0x6018a0c4")
+    assert kb.lookup("md5", "c7200") == "0x60189054"
+
+
+def test_export_import(tmpdir):
+
+    kb = IdlePCKnowledgeBase(str(tmpdir / "a.json"))
+    kb.record("md5", "c7200", "0x60189054", cpu_usage=10)
+    kb.record("md5", "c3745", "0x60aa1da0", cpu_usage=30)
+    kb.exportFile(str(tmpdir / "export.json"))
+
+    other = IdlePCKnowledgeBase(str(tmpdir / "b.json"))
+    other.record("md5", "c3745", "0x60aa1da0", cpu_usage=50)
+    assert other.importFile(str(tmpdir / "export.json")) == 2
+    assert other.values("md5", "c3745") == [("0x60aa1da0", 30)]
+    assert other.lookup("md5", "c7200") == "0x60189054"
+
+    # nothing new to import
+    assert other.importFile(str(tmpdir / "export.json")) == 0
+
+
+def test_getDefaultIdlePC_knowledge_base(tmpdir):
+
+    fake_img = str(tmpdir / 'fake')
+    open(fake_img, 'w+').close()
+
+    IdlePCKnowledgeBase._instance = IdlePCKnowledgeBase(str(tmpdir / "idlepc.json"))
+    IdlePCKnowledgeBase.instance().record("7f4ae12a098391bc0edcaf4f44caaf9d", "c7200", "0x60189054")
+    with patch('gns3.modules.dynamips.Dynamips._md5sum', return_value='7f4ae12a098391bc0edcaf4f44caaf9d'):
+        assert Dynamips.getDefaultIdlePC(fake_img, "c7200") == "0x60189054"
+        # fallback to the built-in values
+        assert Dynamips.getDefaultIdlePC(fake_img, "c3745") == '0x80358a60'
+
+
+def test_import_invalid_values(tmpdir):
+
+    path = str(tmpdir / "export.json")
+    with open(path, "w") as f:
+        json.dump({"version": 1, "images": {"md5:c7200": {"platform": "c7200", "values": {"0x60189054": "invalid",
+                                                                                            "0x6018a0c4": {"cpu_usage": "high"},
+                                                                                            "0x0": {},
+                                                                                            "0x60aa1da0": {"cpu_usage": 12, "updated": 1}}},
+                                            "md5:c3745": {"platform": "c3745", "values": {"0x60189054": None}}}}, f)
+    kb = IdlePCKnowledgeBase(str(tmpdir / "a.json"))
+    assert kb.importFile(path) == 1
+    assert kb.values("md5", "c7200") == [("0x60aa1da0", 12)]
+    assert kb.lookup("md5", "c3745") is None
+
+
+@pytest.fixture
+def router(tmpdir, local_server, project):
+
+    IdlePCKnowledgeBase._instance = IdlePCKnowledgeBase(str(tmpdir / "idlepc.json"))
+    # connected to the current template manager
+    router = C7200(Dynamips(), local_server, project)
+    router._node_id = "n1"
+    router._settings.update({"name": "R1", "image": "c7200.image", "image_md5sum": "md5"})
+    return router
+
+
+def test_applyKnownIdlepc(router):
+
+    with patch("gns3.modules.dynamips.nodes.router.Router.update") as update_mock:
+        # nothing is known for this image
+        assert router.applyKnownIdlepc() is False
+        assert not update_mock.called
+
+        IdlePCKnowledgeBase.instance().record("md5", "c7200", "0x60189054")
+        assert router.applyKnownIdlepc() is True
+        update_mock.assert_called_with({"idlepc": "0x60189054"})
+
+        # a router with an Idle-PC is not changed
+        update_mock.reset_mock()
+        router._settings["idlepc"] = "0x60aa1da0"
+        assert router.applyKnownIdlepc() is False
+        assert not update_mock.called
+
+
+def test_known_idlepc_applied_from_template_only(router):
+
+    from gns3.template_manager import TemplateManager
+
+    dynamips = router.module()
+    with patch("gns3.modules.dynamips.nodes.router.Router.applyKnownIdlepc") as apply_mock:
+        # the node.created notification is received after the template answer
+        TemplateManager.instance()._createNodeFromTemplateCallback({"node_type": "dynamips", "node_id": "n1", "properties": {}})
+        assert not apply_mock.called
+        dynamips.addNode(router)
+        assert apply_mock.called
+
+        # the node.created notification is received first
+        apply_mock.reset_mock()
+        TemplateManager.instance()._createNodeFromTemplateCallback({"node_type": "dynamips", "node_id": "n1", "properties": {}})
+        assert apply_mock.called
+
+        # routers of an opened project or created from another template type
+        apply_mock.reset_mock()
+        dynamips.removeNode(router)
+        dynamips.addNode(router)
+        TemplateManager.instance()._createNodeFromTemplateCallback({"message": "error"}, error=True)
+        TemplateManager.instance()._createNodeFromTemplateCallback({"node_type": "vpcs", "node_id": "n1", "properties": {}})
+        assert not apply_mock.called
@@ -20,10 +20,13 @@ import pytest
 import json
 import os
 import tempfile
+import sys
 
 from gns3.registry.appliance import Appliance, ApplianceError
 from gns3.registry.registry import Registry
 
+from unittest.mock import patch
+
 
 @pytest.fixture
 def registry(images_dir):
@@ -261,3 +264,65 @@ def test_appliance_without_settings():
 
     with pytest.raises(ApplianceError):
         Appliance(registry, wrong_appliance_file).template_type()
+
+
+def _appliance_files():
+
+    directory = os.path.abspath("tests/registry/appliances")
+    return sorted(os.path.join(directory, filename) for filename in os.listdir(directory))
+
+
+def test_validators_are_cached(registry):
+
+    from gns3.registry.appliance import _schema_validator
+
+    _schema_validator.cache_clear()
+    for path in _appliance_files():
+        try:
+            Appliance(registry, path)
+        except ApplianceError:
+            pass
+    # one validator for appliance.json and one for appliance_v8.json
+    assert _schema_validator.cache_info().currsize == 2
+    assert _schema_validator.cache_info().misses == 2
+    assert _schema_validator.cache_info().hits > 0
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_appliances(registry, max_workers):
+
+    from gns3.registry.appliance import load_appliances, BULK_LOAD_MIN_FILES
+
+    invalid = set()
+    for path in _appliance_files():
+        try:
+            Appliance(registry, path)
+        except ApplianceError:
+            invalid.add(path)
+
+    # make sure the worker pool is used when requested
+    paths = _appliance_files() * (BULK_LOAD_MIN_FILES // len(_appliance_files()) + 1)
+    appliances, errors = load_appliances(registry, paths, max_workers=max_workers)
+
+    assert len(appliances) + len(errors) == len(paths)
+    assert os.path.abspath("tests/registry/appliances/broken-microcore-linux.gns3a") in invalid
+    assert set(error.path for error in errors) == invalid
+    assert all(error.message for error in errors)
+    assert all(isinstance(appliance, Appliance) for appliance in appliances)
+
+
+
+def test_load_appliances_frozen(registry, monkeypatch):
+
+    import concurrent.futures
+    from gns3.registry.appliance import load_appliances, BULK_LOAD_MIN_FILES
+
+    # the frozen application loads the files in threads
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    paths = _appliance_files() * (BULK_LOAD_MIN_FILES // len(_appliance_files()) + 1)
+    with patch("concurrent.futures.ProcessPoolExecutor") as process_pool:
+        with patch("concurrent.futures.ThreadPoolExecutor", wraps=concurrent.futures.ThreadPoolExecutor) as thread_pool:
+            appliances, errors = load_appliances(registry, paths, max_workers=2)
+    assert not process_pool.called
+    assert thread_pool.called
+    assert len(appliances) + len(errors) == len(paths)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from unittest.mock import MagicMock
+
+from gns3.bulk_node_operation import BulkNodeOperation, wave_by_compute
+from gns3.progress import Progress
+from gns3.transfer_manager import TransferManager
+
+
+class FakeNode:
+    """
+    Node replying to the queries only when the test asks for it.
+    """
+
+    def __init__(self, name, pending, compute="local", started=False, error=None):
+        self._name = name
+        self._pending = pending
+        self._started = started
+        self._error = error
+        self._compute = MagicMock()
+        self._compute.id.return_value = compute
+
+    def name(self):
+        return self._name
+
+    def compute(self):
+        return self._compute
+
+    def initialized(self):
+        return True
+
+    def start(self, callback=None):
+        if self._started:
+            return False
+        if self._error:
+            self._pending.append((self, lambda: callback({"message": self._error}, error=True)))
+        else:
+            self._pending.append((self, lambda: callback({})))
+        return True
+
+
+@pytest.fixture
+def pending():
+    return []
+
+
+def _run(pending, max_running=None):
+    order = []
+    while pending:
+        if max_running is not None:
+            assert len(pending) <= max_running
+        node, reply = pending.pop(0)
+        order.append(node.name())
+        reply()
+    return order
+
+
+def test_bulk_start(pending):
+
+    nodes = [FakeNode("PC{}".format(i), pending) for i in range(25)]
+    nodes.append(FakeNode("started", pending, started=True))
+    nodes.append(FakeNode("broken", pending, error="Cannot start"))
+    operation = BulkNodeOperation("start", nodes, max_queries=5)
+    progress = MagicMock()
+    finished = MagicMock()
+    operation.progress_signal.connect(progress)
+    operation.finished_signal.connect(finished)
+    operation.run()
+
+    assert len(pending) == 5
+    assert operation.isRunning()
+    _run(pending, max_running=5)
+    assert finished.called
+    assert not operation.isRunning()
+    progress.assert_called_with(27, 27)
+    report = operation.report()
+    assert len(report["done"]) == 25
+    assert report["skipped"] == ["started"]
+    assert report["failed"] == {"broken": "Cannot start"}
+
+
+def test_bulk_start_single_progress_entry(pending):
+
+    transfer_manager = TransferManager.instance()
+    nodes = [FakeNode("PC{}".format(i), pending) for i in range(3)]
+    operation = BulkNodeOperation("start", nodes)
+    operation.run()
+    # the progress is displayed in the transfers dock, not in the modal progress dialog
+    assert Progress.instance()._queries == {}
+    transfer = transfer_manager.transfer(operation._progress_id)
+    assert transfer.name() == "Starting nodes"
+    assert transfer.unit() == "nodes"
+    assert transfer.current() == 0
+    assert transfer.total() == 3
+    node, reply = pending.pop(0)
+    reply()
+    assert transfer.current() == 1
+    _run(pending)
+    assert transfer_manager.transfer(operation._progress_id) is None
+
+
+def test_bulk_start_cancel_from_transfers(pending):
+
+    nodes = [FakeNode("PC{}".format(i), pending) for i in range(5)]
+    operation = BulkNodeOperation("start", nodes, max_queries=2)
+    operation.run()
+    TransferManager.instance().cancelTransfer(operation._progress_id)
+    _run(pending)
+    assert len(operation.report()["canceled"]) == 3
+    assert TransferManager.instance().transfer(operation._progress_id) is None
+
+
+def test_bulk_start_waves(pending):
+
+    nodes = [FakeNode("A{}".format(i), pending, compute="a") for i in range(3)]
+    nodes += [FakeNode("B{}".format(i), pending, compute="b") for i in range(3)]
+    operation = BulkNodeOperation("start", nodes, max_queries=10, wave_key=wave_by_compute, wave_order=["b", "a"])
+    operation.run()
+    # the second wave only starts when the first one is done
+    assert [node.name() for node, _ in pending] == ["B0", "B1", "B2"]
+    assert _run(pending) == ["B0", "B1", "B2", "A0", "A1", "A2"]
+
+
+def test_bulk_start_cancel(pending):
+
+    nodes = [FakeNode("PC{}".format(i), pending) for i in range(10)]
+    operation = BulkNodeOperation("start", nodes, max_queries=2, show_progress=False)
+    finished = MagicMock()
+    operation.finished_signal.connect(finished)
+    operation.run()
+    operation.cancel()
+    assert not finished.called
+    _run(pending)
+    assert finished.called
+    assert len(operation.report()["done"]) == 2
+    assert len(operation.report()["canceled"]) == 8
+
+
+def test_bulk_unsupported_operation(pending):
+
+    with pytest.raises(ValueError):
+        BulkNodeOperation("destroy", [])
+    operation = BulkNodeOperation("reload", [FakeNode("PC1", pending)])
+    assert operation.report()["skipped"] == ["PC1"]
+    finished = MagicMock()
+    operation.finished_signal.connect(finished)
+    operation.run()
+    assert finished.called
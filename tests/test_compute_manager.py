@@ -174,3 +174,72 @@ def test_updateList_no_change(controller):
     controller._http_client = MagicMock()
     cm.updateList(computes)
     assert not controller._http_client.createHTTPQuery.called
+
+
+def _computeData(**kwargs):
+    data = {
+        "compute_id": "test",
+        "name": "Test server",
+        "connected": True,
+        "protocol": "http",
+        "host": "test.org",
+        "port": 3080,
+        "user": None,
+        "cpu_usage_percent": 10,
+        "memory_usage_percent": 20,
+        "capabilities": {"test": "a"}
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_computeDataReceivedCallback_no_change():
+    callback_update = MagicMock()
+    cm = ComputeManager()
+    cm.computeDataReceivedCallback(_computeData())
+    cm.updated_signal.connect(callback_update)
+    cm.computeDataReceivedCallback(_computeData())
+    assert not callback_update.called
+    # the CPU and memory usage are only refreshed
+    callback_usage = MagicMock()
+    cm.usage_updated_signal.connect(callback_usage)
+    cm.computeDataReceivedCallback(_computeData(cpu_usage_percent=50))
+    assert not callback_update.called
+    callback_usage.assert_called_with("test")
+    assert cm.getCompute("test").cpuUsagePercent() == 50
+    cm.computeDataReceivedCallback(_computeData(cpu_usage_percent=50, name="Renamed"))
+    assert callback_update.called
+
+
+def test_adaptive_poll_interval(controller):
+    cm = ComputeManager()
+    cm.computeDataReceivedCallback(_computeData())
+
+    # the notification feed is healthy: back off
+    for _ in range(10):
+        cm.computeDataReceivedCallback(_computeData())
+        cm._refreshComputesSlot()
+    assert cm.pollInterval() == ComputeManager.POLL_MAX_INTERVAL
+
+    # a compute is in error: poll fast
+    cm.computeDataReceivedCallback(_computeData(last_error="Connection refused"))
+    assert cm.pollInterval() == ComputeManager.POLL_MIN_INTERVAL
+    cm._refreshComputesSlot()
+    assert cm.pollInterval() == ComputeManager.POLL_MIN_INTERVAL
+
+
+def test_poll_interval_quiet_notifications(controller):
+    cm = ComputeManager()
+    cm._listComputesCallback([_computeData()])
+    cm._refreshComputesSlot()
+    assert cm.pollInterval() == ComputeManager.POLL_QUIET_INTERVAL
+
+
+def test_refresh_not_skipped_after_data_received(controller):
+    cm = ComputeManager()
+    controller._connected = True
+    controller._http_client.createHTTPQuery.reset_mock()
+    # data received just before the timer fires does not delay the next poll
+    cm.computeDataReceivedCallback(_computeData())
+    cm._refreshComputesSlot()
+    assert controller._http_client.createHTTPQuery.call_args[0][:2] == ("GET", "/computes")
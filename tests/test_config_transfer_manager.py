@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import zipfile
+import tarfile
+
+import pytest
+from unittest.mock import MagicMock
+
+from gns3.config_transfer_manager import ConfigTransferManager, MANIFEST_FILENAME
+
+
+class FakeNode:
+    """
+    Node replying to the queries only when the test asks for it.
+    """
+
+    def __init__(self, name, pending, config_files=("startup-config.cfg",)):
+        self._name = name
+        self._pending = pending
+        self._config_files = list(config_files)
+        self.posted = []
+
+    def name(self):
+        return self._name
+
+    def initialized(self):
+        return True
+
+    def configFiles(self):
+        return self._config_files
+
+    def get(self, path, callback, **kwargs):
+        self._pending.append(lambda: callback({}, raw_body="{} {}".format(self._name, path).encode()))
+
+    def post(self, path, callback, body=None, **kwargs):
+        self.posted.append(path)
+        self._pending.append(lambda: callback({}))
+
+
+def _run(pending, max_running=None):
+    while pending:
+        if max_running is not None:
+            assert len(pending) <= max_running
+        pending.pop(0)()
+
+
+@pytest.fixture
+def pending():
+    return []
+
+
+@pytest.fixture
+def nodes(pending):
+    return [FakeNode("R{}".format(i), pending) for i in range(20)]
+
+
+def test_export_bounded(tmpdir, pending, nodes):
+
+    transfer = ConfigTransferManager(nodes + [FakeNode("PC", pending, config_files=())], max_queries=4)
+    progress = MagicMock()
+    finished = MagicMock()
+    transfer.progress_signal.connect(progress)
+    transfer.finished_signal.connect(finished)
+    transfer.exportConfigs(str(tmpdir))
+
+    assert len(pending) == 4
+    _run(pending, max_running=4)
+    assert finished.called
+    progress.assert_called_with(20, 20)
+    assert transfer.unsupportedNodes() == ["PC"]
+    assert transfer.report()["R3"]["transferred"] == ["startup-config.cfg"]
+    with open(str(tmpdir / "R3_startup-config.cfg"), "rb") as f:
+        assert f.read() == b"R3 /files/startup-config.cfg"
+    assert os.path.exists(str(tmpdir / MANIFEST_FILENAME))
+
+
+@pytest.mark.parametrize("archive", ["configs.zip", "configs.tar.gz"])
+def test_export_import_archive(tmpdir, pending, nodes, archive):
+
+    path = str(tmpdir / archive)
+    transfer = ConfigTransferManager(nodes)
+    transfer.exportConfigs(path)
+    _run(pending)
+
+    if archive.endswith(".zip"):
+        with zipfile.ZipFile(path) as f:
+            names = f.namelist()
+    else:
+        with tarfile.open(path) as f:
+            names = f.getnames()
+    assert MANIFEST_FILENAME in names
+    assert "R0_startup-config.cfg" in names
+
+    # everything matches the manifest
+    transfer = ConfigTransferManager(nodes)
+    transfer.importConfigs(path, skip_unchanged=True)
+    assert pending == []
+    assert transfer.report()["R0"]["skipped"] == ["startup-config.cfg"]
+
+    transfer = ConfigTransferManager(nodes)
+    transfer.importConfigs(path)
+    _run(pending)
+    assert nodes[0].posted == ["/files/startup-config.cfg"]
+
+
+def test_import_skip_unchanged(tmpdir, pending, nodes):
+
+    transfer = ConfigTransferManager(nodes)
+    transfer.exportConfigs(str(tmpdir))
+    _run(pending)
+    assert transfer.unchangedConfigs(str(tmpdir)) == 20
+
+    with open(str(tmpdir / "R1_startup-config.cfg"), "w") as f:
+        f.write("hostname R1")
+    os.remove(str(tmpdir / "R2_startup-config.cfg"))
+
+    transfer = ConfigTransferManager(nodes)
+    transfer.importConfigs(str(tmpdir), skip_unchanged=True)
+    _run(pending)
+    assert nodes[1].posted == ["/files/startup-config.cfg"]
+    assert nodes[2].posted == []
+    assert nodes[3].posted == []
+    assert transfer.unchangedConfigs(str(tmpdir)) == 19
+
+
+def test_cancel(tmpdir, pending, nodes):
+
+    transfer = ConfigTransferManager(nodes, max_queries=2)
+    finished = MagicMock()
+    transfer.finished_signal.connect(finished)
+    transfer.exportConfigs(str(tmpdir))
+    transfer.cancel()
+    assert not finished.called
+    _run(pending)
+    assert finished.called
+    assert len(transfer.report()) == 2
+
+
+def test_export_error(tmpdir, pending):
+
+    node = FakeNode("R1", pending)
+    node.get = lambda path, callback, **kwargs: pending.append(lambda: callback({"message": "boom", "status": 500}, error=True))
+    transfer = ConfigTransferManager([node])
+    errors = MagicMock()
+    transfer.node_error_signal.connect(errors)
+    transfer.exportConfigs(str(tmpdir))
+    _run(pending)
+    assert transfer.report()["R1"]["errors"] == ["startup-config.cfg"]
+    assert errors.called
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from gns3.console_launcher import ConsoleLauncher
+from gns3.telnet_console import batch_console_args
+
+
+def _node(name, console, command="mate-terminal --tab -e 'telnet %h %p'", console_type="telnet"):
+
+    node = MagicMock()
+    node.name.return_value = name
+    node.initialized.return_value = True
+    node.isStarted.return_value = True
+    node.bringToFront.return_value = False
+    node.consoleType.return_value = console_type
+    node.console.return_value = console
+    node.consoleCommand.return_value = command
+    return node
+
+
+def test_batch_console_args():
+
+    tab = ["mate-terminal", "--tab", "-t", "R1", "-e", "telnet localhost 5000"]
+    assert batch_console_args([tab, tab]) == ["mate-terminal"] + tab[1:] + tab[1:]
+
+    tmux = ["tmux", "new-window", "-n", "R1", "telnet localhost 5000"]
+    assert batch_console_args([tmux, tmux]) == ["tmux"] + tmux[1:] + [";"] + tmux[1:]
+
+    gnome = ["gnome-terminal", "--tab", "--", "telnet", "localhost", "5000"]
+    assert batch_console_args([gnome, gnome]) is None
+
+    # a window per console cannot be merged
+    window = ["mate-terminal", "-e", "telnet localhost 5000"]
+    assert batch_console_args([window, window]) is None
+
+
+def test_jobs():
+
+    with patch("sys.platform", new="linux"):
+        launcher = ConsoleLauncher()
+        open_console = MagicMock()
+        nodes = [_node("R1", 5000), _node("R2", 5001), _node("PC1", 5900, console_type="vnc")]
+        jobs = launcher.jobs(nodes, open_console=open_console)
+
+    assert len(jobs) == 2
+    command, func = jobs[0]
+    assert command is None
+    func()
+    open_console.assert_called_with(nodes[2])
+    command, consoles = jobs[1]
+    assert command == nodes[0].consoleCommand()
+    assert consoles == [(nodes[0], 5000), (nodes[1], 5001)]
+
+
+def test_jobs_without_batch_support():
+
+    launcher = ConsoleLauncher()
+    command = "xterm -e 'telnet %h %p'"
+    nodes = [_node("R1", 5000, command), _node("R2", 5001, command)]
+    jobs = launcher.jobs(nodes)
+    assert [consoles for _, consoles in jobs] == [[(nodes[0], 5000)], [(nodes[1], 5001)]]
+
+
+def test_jobs_skip_stopped_nodes():
+
+    launcher = ConsoleLauncher()
+    node = _node("R1", 5000)
+    node.isStarted.return_value = False
+    assert launcher.jobs([node]) == []
+
+
+def test_adapt_delay():
+
+    launcher = ConsoleLauncher()
+    launcher._configured_delay = 500
+    launcher._delay = 500
+
+    launcher._adaptDelay(100)
+    assert launcher.delay() == 300
+    launcher._adaptDelay(0)
+    assert launcher.delay() == 150
+    launcher._adaptDelay(0)
+    assert launcher.delay() == ConsoleLauncher.MIN_DELAY
+    launcher._adaptDelay(100000)
+    assert launcher.delay() == 500 * ConsoleLauncher.MAX_DELAY_FACTOR
+
+
+def test_delay_not_adapted_without_startup_time():
+
+    launcher = ConsoleLauncher()
+    launcher._configured_delay = 500
+    launcher._delay = 500
+    launcher._running = True
+
+    console_thread = MagicMock()
+    console_thread.startupTime.return_value = None
+    with patch("gns3.console_launcher.ConsoleLauncher._scheduleNext"):
+        launcher._consoleStartedSlot(console_thread, launcher._job_id)
+    assert launcher.delay() == 500
+
+    # a terminal that doesn't report it is up doesn't raise the delay
+    with patch("gns3.console_launcher.ConsoleLauncher._next"):
+        launcher._consoleTimeoutSlot(launcher._job_id)
+    assert launcher.delay() == 500
+
+
+def test_console_thread_startup_time():
+
+    from gns3.telnet_console import ConsoleThread
+
+    node = _node("R1", 5000)
+    node.consoleHost.return_value = "127.0.0.1"
+    console_thread = ConsoleThread(None, "xterm", node, 5000)
+    proc = MagicMock()
+    with patch("sys.platform", new="darwin"), patch("subprocess.Popen", return_value=proc):
+        # the terminal client exited once the console was opened
+        console_thread.exec_command("xterm")
+        assert console_thread.startupTime() is not None
+
+        # the terminal keeps running, its startup time is unknown
+        console_thread._startup_time = None
+        proc.wait.side_effect = subprocess.TimeoutExpired("xterm", ConsoleThread.STARTUP_GRACE_TIME)
+        console_thread.exec_command("xterm")
+        assert console_thread.startupTime() is None
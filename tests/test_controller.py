@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+import unittest.mock
 from unittest.mock import MagicMock
 
 from gns3.controller import Controller
@@ -49,3 +50,22 @@ def test_connected(controller):
     controller._httpClientConnectedSlot()
     assert controller.connected() is True
     assert callback.called
+
+
+def test_isRemote_cached(controller, local_server_config):
+
+    local_server_config.saveSettings("Server", {"auto_start": True})
+    assert not controller.isRemote()
+    with unittest.mock.patch("gns3.local_server_config.LocalServerConfig.loadSettings") as load_settings_mock:
+        assert not controller.isRemote()
+        assert not load_settings_mock.called
+
+    # the cache is invalidated when the settings change
+    local_server_config.saveSettings("Server", {"auto_start": False})
+    assert controller.isRemote()
+
+
+def test_finishSymbolUpload_invalidates_symbols(controller):
+
+    controller._finishSymbolUpload("/tmp/test.svg", {})
+    controller._http_client.invalidateResponseCache.assert_called_with("/symbols")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import threading
+
+from gns3.qt import QtWidgets
+from gns3.dialogs.doctor_dialog import DoctorDialog
+
+
+class FakeDoctorDialog(DoctorDialog):
+
+    CHECK_TIMEOUT = 0.2
+
+    def __init__(self, *args, **kwargs):
+        self._blocked = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _checks(self):
+        return ["checkBlocked", "checkError", "checkException", "checkOk"]
+
+    def checkBlocked(self):
+        """Blocked check"""
+        self._blocked.wait(5)
+        return (0, None)
+
+    def checkError(self):
+        """Error check"""
+        return (2, "Something is wrong")
+
+    def checkException(self):
+        """Exception check"""
+        raise ValueError("Boom")
+
+    def checkOk(self):
+        """OK check"""
+        return (0, None)
+
+
+def test_doctor_checks(local_config):
+
+    parent = QtWidgets.QMainWindow()
+    dialog = FakeDoctorDialog(parent, console=True)
+    dialog._blocked.set()
+    text = dialog.uiDoctorResultTextEdit.toPlainText()
+
+    assert "OK check... OK" in text
+    assert "Error check... ERROR Something is wrong" in text
+    assert "Exception check... FAIL" in text
+    assert "Blocked check... TIMEOUT" in text
+    assert "All checks completed in" in text
+    # the blocked check doesn't prevent the other results to be displayed first
+    assert text.index("Blocked check") > text.index("OK check")
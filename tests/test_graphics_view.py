@@ -15,9 +15,16 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import pytest
+
 from unittest.mock import MagicMock, patch
+from gns3.qt import QtWidgets
 from gns3.graphics_view import GraphicsView
 from gns3.node import Node
+from gns3.topology import Topology
+from gns3.ports.ethernet_port import EthernetPort
+from gns3.modules.vpcs.vpcs_node import VPCSNode
+from gns3.modules.vpcs import VPCS
 
 
 def test_console_to_node_vncviewer_and_ipv6():
@@ -32,3 +39,72 @@ def test_console_to_node_vncviewer_and_ipv6():
         view.consoleToNode(node)
         assert warning_mock.called
         assert warning_mock.call_args[0][1] == 'TightVNC'
+
+
+@pytest.fixture
+def graphics_view(controller, project):
+
+    window = QtWidgets.QMainWindow()
+    window.uiTopologySummaryTreeWidget = MagicMock()
+    view = GraphicsView(QtWidgets.QWidget(window))
+    yield view
+    Topology.instance().reset()
+    window.deleteLater()
+
+
+def _vpcs(local_server, project, name):
+
+    device = VPCSNode(VPCS(), local_server, project)
+    device._settings.update({"name": name})
+    device.setInitialized(True)
+    port = EthernetPort("e0")
+    port.setAdapterNumber(0)
+    port.setPortNumber(0)
+    device._ports.append(port)
+    return device
+
+
+def test_scene_item_registry(graphics_view, local_server, project):
+
+    node1 = _vpcs(local_server, project, "PC1")
+    node2 = _vpcs(local_server, project, "PC2")
+    node_item1 = graphics_view.createNodeItem(node1, ":/symbols/vpcs_guest.svg", 0, 0)
+    node_item2 = graphics_view.createNodeItem(node2, ":/symbols/vpcs_guest.svg", 100, 0)
+    assert graphics_view.nodeItem(node1.id()) is node_item1
+    assert graphics_view.nodeItem(node2.id()) is node_item2
+    assert len(graphics_view.nodeItems()) == 2
+
+    link = graphics_view.addLink(node1, node1.ports()[0], node2, node2.ports()[0])
+    graphics_view.addLinkSlot(link.id())
+    link_item = graphics_view.linkItem(link.id())
+    assert link_item.link() is link
+    assert graphics_view.linkItems() == [link_item]
+
+    link.delete_link_signal.emit(link.id())
+    assert graphics_view.linkItem(link.id()) is None
+    assert link_item.scene() is None
+
+    node1.deleted_signal.emit()
+    assert graphics_view.nodeItem(node1.id()) is None
+    assert node_item1.scene() is None
+
+
+def test_bulk_scene_mutation(graphics_view):
+
+    scene = graphics_view.scene()
+    summary = graphics_view._main_window.uiTopologySummaryTreeWidget
+    index_method = scene.itemIndexMethod()
+    with graphics_view.bulkSceneMutation():
+        with graphics_view.bulkSceneMutation():
+            assert graphics_view.inBulkSceneMutation()
+            assert scene.itemIndexMethod() == QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex
+            assert scene.signalsBlocked()
+            assert not graphics_view.viewport().updatesEnabled()
+        # only the outermost context restores the scene
+        assert scene.signalsBlocked()
+    assert not graphics_view.inBulkSceneMutation()
+    assert scene.itemIndexMethod() == index_method
+    assert not scene.signalsBlocked()
+    assert graphics_view.viewport().updatesEnabled()
+    summary.beginBulkUpdate.assert_called_once_with()
+    summary.endBulkUpdate.assert_called_once_with()
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import pytest
+import unittest.mock
+
+from gns3.qt import QtCore, QtNetwork, FakeQtSignal
+from gns3.http_client import HTTPClient
+
+
+class FakeResponse:
+
+    def __init__(self, request, status, body, headers):
+
+        self._request = request
+        self._status = status
+        self._body = body
+        self._headers = headers
+        self.finished = FakeQtSignal()
+        self.errorOccurred = FakeQtSignal()
+        self.uploadProgress = FakeQtSignal()
+        self.downloadProgress = FakeQtSignal()
+
+    def error(self):
+        return QtNetwork.QNetworkReply.NetworkError.NoError
+
+    def attribute(self, attribute):
+        return self._status
+
+    def header(self, header):
+        return "application/json"
+
+    def hasRawHeader(self, header):
+        return header in self._headers
+
+    def rawHeader(self, header):
+        return QtCore.QByteArray(self._headers[header])
+
+    def readAll(self):
+        return QtCore.QByteArray(self._body)
+
+    def url(self):
+        return self._request.url()
+
+    def request(self):
+        return self._request
+
+
+class FakeController:
+    """
+    Stand-in controller serving collections with an ETag.
+    """
+
+    def __init__(self):
+
+        self.collections = {}
+        self.requests = []
+        self.sslErrors = FakeQtSignal()
+
+    def setCollection(self, path, data, version):
+        self.collections[path] = (json.dumps(data).encode(), '"{}"'.format(version).encode())
+
+    def sendCustomRequest(self, request, method, body=None):
+
+        path = request.url().path()
+        if_none_match = bytes(request.rawHeader(b"If-None-Match"))
+        self.requests.append((method, path, if_none_match))
+        body, etag = self.collections[path]
+        if if_none_match == etag:
+            response = FakeResponse(request, 304, b"", {b"ETag": etag})
+        else:
+            response = FakeResponse(request, 200, body, {b"ETag": etag})
+        # the reply is received later
+        QtCore.QTimer.singleShot(0, response.finished.emit)
+        return response
+
+
+def _wait():
+    QtCore.QCoreApplication.processEvents()
+    QtCore.QCoreApplication.processEvents()
+
+
+@pytest.fixture
+def fake_controller():
+    return FakeController()
+
+
+@pytest.fixture
+def http_client(fake_controller):
+
+    client = HTTPClient({"protocol": "http", "host": "127.0.0.1", "port": "3080"}, network_manager=fake_controller)
+    client._connected = True
+    return client
+
+
+def test_cache_miss_then_not_modified(http_client, fake_controller):
+
+    fake_controller.setCollection("/v2/templates", [{"name": "a"}], 1)
+    callback = unittest.mock.MagicMock()
+
+    http_client.createHTTPQuery("GET", "/templates", callback, cache=True)
+    _wait()
+    assert fake_controller.requests == [(b"GET", "/v2/templates", b"")]
+    assert callback.call_args[0][0] == [{"name": "a"}]
+
+    http_client.createHTTPQuery("GET", "/templates", callback, cache=True)
+    _wait()
+    # the second query is conditional and the body comes from the cache
+    assert fake_controller.requests[1] == (b"GET", "/v2/templates", b'"1"')
+    assert callback.call_count == 2
+    assert callback.call_args[0][0] == [{"name": "a"}]
+    assert http_client.responseCache().stats() == (1, 1)
+
+    fake_controller.setCollection("/v2/templates", [{"name": "b"}], 2)
+    http_client.createHTTPQuery("GET", "/templates", callback, cache=True)
+    _wait()
+    assert callback.call_args[0][0] == [{"name": "b"}]
+    assert http_client.responseCache().stats() == (1, 2)
+
+
+def test_cache_not_used_by_default(http_client, fake_controller):
+
+    fake_controller.setCollection("/v2/templates", [], 1)
+    http_client.createHTTPQuery("GET", "/templates", None)
+    _wait()
+    http_client.createHTTPQuery("GET", "/templates", None)
+    _wait()
+    assert [request[2] for request in fake_controller.requests] == [b"", b""]
+
+
+def test_cache_ttl(http_client, fake_controller):
+
+    fake_controller.setCollection("/v2/appliances", [{"name": "a"}], 1)
+    http_client.setResponseCacheTTL("/appliances", 60)
+    callback = unittest.mock.MagicMock()
+
+    http_client.createHTTPQuery("GET", "/appliances", callback, cache=True)
+    _wait()
+    http_client.createHTTPQuery("GET", "/appliances", callback, cache=True)
+    _wait()
+    # fresh responses are served without asking the controller
+    assert len(fake_controller.requests) == 1
+    assert callback.call_count == 2
+    assert callback.call_args[0][0] == [{"name": "a"}]
+
+    http_client.invalidateResponseCache("/appliances")
+    http_client.createHTTPQuery("GET", "/appliances", callback, cache=True)
+    _wait()
+    assert fake_controller.requests[1] == (b"GET", "/v2/appliances", b"")
+
+
+def test_cache_disk(http_client, fake_controller, tmpdir):
+
+    http_client.responseCache().setDirectory(str(tmpdir))
+    fake_controller.setCollection("/v2/templates", [{"name": "a"}], 1)
+    http_client.createHTTPQuery("GET", "/templates", None, cache=True)
+    _wait()
+
+    # a new client (e.g. after a restart) revalidates the response stored on disk
+    client = HTTPClient({"protocol": "http", "host": "127.0.0.1", "port": "3080"}, network_manager=fake_controller)
+    client._connected = True
+    client.responseCache().setDirectory(str(tmpdir))
+    callback = unittest.mock.MagicMock()
+    client.createHTTPQuery("GET", "/templates", callback, cache=True)
+    _wait()
+    assert fake_controller.requests[1] == (b"GET", "/v2/templates", b'"1"')
+    assert callback.call_args[0][0] == [{"name": "a"}]
+
+
+def test_cache_invalidated_by_modification(http_client, fake_controller):
+
+    fake_controller.setCollection("/v2/templates", [], 1)
+    fake_controller.setCollection("/v2/templates/a", {}, 1)
+    http_client.createHTTPQuery("GET", "/templates", None, cache=True)
+    _wait()
+    assert http_client.responseCache().get("/v2/templates") is not None
+    http_client.createHTTPQuery("PUT", "/templates/a", None)
+    assert http_client.responseCache().get("/v2/templates") is None
+
+
+def test_cache_not_modified_without_entry(http_client, fake_controller):
+
+    fake_controller.setCollection("/v2/templates", [{"name": "a"}], 1)
+    callback = unittest.mock.MagicMock()
+    http_client.createHTTPQuery("GET", "/templates", None, cache=True)
+    _wait()
+
+    # the cached response is removed while the conditional query is running
+    http_client.createHTTPQuery("GET", "/templates", callback, cache=True)
+    http_client.invalidateResponseCache()
+    _wait()
+    _wait()
+    assert fake_controller.requests[1:] == [(b"GET", "/v2/templates", b'"1"'), (b"GET", "/v2/templates", b"")]
+    assert callback.call_count == 1
+    assert callback.call_args[0][0] == [{"name": "a"}]
+    assert "error" not in callback.call_args[1]
+    assert http_client.responseCache().get("/v2/templates") is not None
+
+
+def test_cache_memory_bounded(tmpdir):
+
+    from gns3.http_cache import HTTPResponseCache
+
+    cache = HTTPResponseCache()
+    with unittest.mock.patch.object(HTTPResponseCache, "MAX_MEMORY_ENTRIES", 2):
+        cache.store("/v2/a", b"a", "application/json", etag='"1"')
+        cache.store("/v2/b", b"b", "application/json", etag='"1"')
+        cache.get("/v2/a")
+        cache.store("/v2/c", b"c", "application/json", etag='"1"')
+    # the least recently used response is dropped
+    assert cache.get("/v2/b") is None
+    assert cache.get("/v2/a") is not None
+
+    # responses persisted on disk are read again
+    cache = HTTPResponseCache(str(tmpdir))
+    with unittest.mock.patch.object(HTTPResponseCache, "MAX_MEMORY_SIZE", 10):
+        cache.store("/v2/a", b"a" * 8, "application/json", etag='"1"')
+        cache.store("/v2/b", b"b" * 8, "application/json", etag='"1"')
+        assert list(cache._entries) == ["/v2/b"]
+        assert cache.get("/v2/a")["body"] == b"a" * 8
+
+
+def test_cache_revalidated_without_ttl_not_saved(tmpdir):
+
+    from gns3.http_cache import HTTPResponseCache
+
+    cache = HTTPResponseCache(str(tmpdir))
+    cache.store("/v2/templates", b"[]", "application/json", etag='"1"')
+    with unittest.mock.patch.object(HTTPResponseCache, "_save") as save_mock:
+        assert cache.revalidated("/v2/templates") is not None
+        assert not save_mock.called
+        cache.setTTL("/v2/templates", 60)
+        cache.revalidated("/v2/templates")
+        assert save_mock.called
@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import pytest
+import pathlib
 import unittest.mock
 
 from gns3.qt import QtCore, QtNetwork, FakeQtSignal, QtWebSockets
@@ -198,6 +199,44 @@ def test_progress_callback(http_client, response):
     assert progress.remove_query_signal.emit.called
 
 
+def test_progress_throttled(http_client):
+
+    progress = unittest.mock.MagicMock()
+    http_client.setProgressCallback(progress)
+
+    for sent in range(0, 100, 10):
+        http_client._notify_progress_upload("query", sent, 100)
+    # only the first notification and the last one are sent
+    http_client._notify_progress_upload("query", 100, 100)
+    assert progress.progress_signal.emit.call_count == 2
+    progress.progress_signal.emit.assert_called_with("query", 100, 100)
+
+
+def test_transfer_callback(http_client, response):
+
+    http_client._connected = True
+    callback = unittest.mock.MagicMock()
+    progress = unittest.mock.MagicMock()
+    transfer_manager = unittest.mock.MagicMock()
+
+    http_client.setProgressCallback(progress)
+    http_client.setTransferCallback(transfer_manager)
+    with unittest.mock.patch("gns3.http_client.HTTPClient._addBodyToRequest"):
+        http_client.createHTTPQuery("POST", "/test", callback, body=pathlib.Path("test.qcow2"), progressText="Uploading test.qcow2")
+
+    transfer_id = transfer_manager.addTransfer.call_args[0][0]
+    assert transfer_manager.addTransfer.call_args[0][1:] == ("Uploading test.qcow2", "upload")
+    http_client._notify_progress_upload(transfer_id, 42, 100)
+    transfer_manager.updateTransfer.assert_called_with(transfer_id, 42, 100)
+
+    # Trigger the completion
+    response.finished.emit()
+
+    transfer_manager.removeTransfer.assert_called_with(transfer_id)
+    assert not progress.add_query_signal.emit.called
+    assert not progress.progress_signal.emit.called
+
+
 def test_readyReadySlot(http_client):
 
     callback = unittest.mock.MagicMock()
@@ -214,6 +253,8 @@ def test_readyReadySlot(http_client):
     assert callback.called
     args, kwargs = callback.call_args
     assert args[0] == {"action": "ping"}
+    # nothing is kept once the content is decoded
+    assert http_client._buffer == {}
 
 
 def test_readyReadySlotHTTPError(http_client):
@@ -266,6 +307,7 @@ def test_readyReadySlotPartialJSON(http_client):
     assert callback.call_count == 1
     args, kwargs = callback.call_args
     assert args[0] == {"action": "ping"}
+    assert http_client._buffer == {"bla": '{"a": "b"'}
 
 
 def test_readyReadySlotPartialBytes(http_client):
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock
+
+from gns3.image_catalogue import ImageCatalogue
+from gns3.registry.registry import Registry
+
+
+IMAGES = [
+    {"filename": "linux.qcow2", "path": "linux.qcow2", "md5sum": "5d41402abc4b2a76b9719d911017c592", "filesize": 5},
+    {"filename": "router.img", "path": "cisco/router.img", "md5sum": "7d793037a0760186574b0282f2f435e7", "filesize": 5}
+]
+
+
+def _answer(controller, result, error=False):
+    """
+    Answers the last query sent to the controller.
+    """
+
+    args, kwargs = controller._http_client.createHTTPQuery.call_args
+    args[2](result, error=error)
+
+
+def test_images_fetched_once(controller):
+
+    catalogue = ImageCatalogue.instance()
+    callback1 = MagicMock()
+    callback2 = MagicMock()
+    catalogue.images("local", "qemu", callback1)
+    catalogue.images("local", "qemu", callback2)
+    assert controller._http_client.createHTTPQuery.call_count == 1
+    assert controller._http_client.createHTTPQuery.call_args[0][:2] == ("GET", "/computes/local/qemu/images")
+    assert controller._http_client.createHTTPQuery.call_args[1]["cache"]
+
+    _answer(controller, IMAGES)
+    callback1.assert_called_with(IMAGES)
+    callback2.assert_called_with(IMAGES)
+
+    # the listing is returned from memory
+    callback3 = MagicMock()
+    catalogue.images("local", "qemu", callback3)
+    callback3.assert_called_with(IMAGES)
+    assert controller._http_client.createHTTPQuery.call_count == 1
+
+    assert catalogue.findByMd5("local", "qemu", "7d793037a0760186574b0282f2f435e7")["path"] == "cisco/router.img"
+    assert catalogue.findByFilename("local", "qemu", "router.img")["path"] == "cisco/router.img"
+    assert catalogue.findByFilename("local", "qemu", "missing.img") is None
+    assert catalogue.findByMd5("remote", "qemu", "7d793037a0760186574b0282f2f435e7") is None
+
+
+def test_images_error(controller):
+
+    catalogue = ImageCatalogue.instance()
+    callback = MagicMock()
+    catalogue.images("local", "iou", callback)
+    _answer(controller, {"message": "Compute not connected"}, error=True)
+    callback.assert_called_with({"message": "Compute not connected"}, error=True)
+
+    # errors are not cached
+    catalogue.images("local", "iou", callback)
+    assert controller._http_client.createHTTPQuery.call_count == 2
+
+
+def test_images_refreshed_in_background(controller):
+
+    catalogue = ImageCatalogue.instance()
+    catalogue.images("local", "qemu", MagicMock())
+    _answer(controller, IMAGES)
+    catalogue._listings[("local", "qemu")].updated -= ImageCatalogue.REFRESH_INTERVAL + 1
+
+    changed = MagicMock()
+    catalogue.images_changed_signal.connect(changed)
+    callback = MagicMock()
+    catalogue.images("local", "qemu", callback)
+    # the cached listing is returned while the new one is fetched
+    callback.assert_called_with(IMAGES)
+    assert controller._http_client.createHTTPQuery.call_count == 2
+    assert controller._http_client.createHTTPQuery.call_args[1]["showProgress"] is False
+
+    _answer(controller, IMAGES[:1])
+    assert callback.call_count == 1
+    changed.assert_called_with("local", "qemu")
+    assert catalogue.findByFilename("local", "qemu", "router.img") is None
+
+
+def test_invalidate(controller):
+
+    catalogue = ImageCatalogue.instance()
+    catalogue.images("local", "qemu", MagicMock())
+    _answer(controller, IMAGES)
+    catalogue.images("local", "docker", MagicMock())
+    _answer(controller, [{"image": "alpine:latest"}])
+    assert catalogue.findByFilename("local", "docker", "alpine:latest") is not None
+
+    catalogue.invalidate("local", "qemu")
+    controller._http_client.invalidateResponseCache.assert_called_with("/computes/local/qemu/images")
+    assert catalogue.findByMd5("local", "qemu", "5d41402abc4b2a76b9719d911017c592") is None
+    assert catalogue.findByFilename("local", "docker", "alpine:latest") is not None
+
+    # a listing invalidated while it is fetched is not kept
+    catalogue.images("local", "qemu", MagicMock())
+    catalogue.invalidate("local", "qemu")
+    _answer(controller, IMAGES)
+    assert catalogue.findByMd5("local", "qemu", "5d41402abc4b2a76b9719d911017c592") is None
+
+
+def test_registry_search_remote_image(controller, tmpdir):
+
+    registry = Registry([str(tmpdir)])
+    registry.getRemoteImageList("qemu", "remote")
+    _answer(controller, IMAGES)
+
+    image = registry.search_image_file("qemu", "router.img", "7d793037a0760186574b0282f2f435e7", 5)
+    assert image.path == "cisco/router.img"
+    assert image.location == "remote"
+    assert registry.search_image_file("qemu", "router.img", "00000000000000000000000000000000", 5) is None
+    assert registry.search_image_file("qemu", "router.img", "00000000000000000000000000000000", 5, strict_md5_check=False).path == "cisco/router.img"
+    assert registry.search_image_file("qemu", "linux.qcow2", None, None).md5sum == "5d41402abc4b2a76b9719d911017c592"
+
+    # the registry keeps its own index when the catalogue forgets the listing
+    ImageCatalogue.instance().invalidate("remote", "qemu")
+    assert registry.search_image_file("qemu", "router.img", "7d793037a0760186574b0282f2f435e7", 5).path == "cisco/router.img"
+
+
+def test_registry_images_refreshed_in_background(controller, tmpdir):
+
+    registry = Registry([str(tmpdir)])
+    changed = MagicMock()
+    registry.image_list_changed_signal.connect(changed)
+    registry.getRemoteImageList("qemu", "remote")
+    _answer(controller, IMAGES)
+    assert changed.call_count == 1
+
+    catalogue = ImageCatalogue.instance()
+    catalogue._listings[("remote", "qemu")].updated -= ImageCatalogue.REFRESH_INTERVAL + 1
+    catalogue.images("remote", "qemu", MagicMock())
+    _answer(controller, IMAGES[:1])
+    assert changed.call_count == 2
+    assert registry.search_image_file("qemu", "router.img", "7d793037a0760186574b0282f2f435e7", 5) is None
+
+    # the listings of other computes are ignored
+    catalogue.images("local", "qemu", MagicMock())
+    _answer(controller, IMAGES)
+    assert changed.call_count == 2
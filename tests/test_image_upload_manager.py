@@ -69,7 +69,7 @@ def test_direct_file_upload_fallback_to_controller(image, controller, callback):
     controller.postCompute.assert_called_with(
         '/QEMU/images/{}'.format(image.filename),
         callback,
-        None,
+        manager._uploadedCallback,
         body=pathlib.Path(image.path),
         context={'image_path': image.path},
         progressText='Uploading {}'.format(image.filename),
@@ -83,10 +83,21 @@ def test_upload_via_controller(image, controller, callback):
     controller.postCompute.assert_called_with(
         '/QEMU/images/{}'.format(image.filename),
         callback,
-        None,
+        manager._uploadedCallback,
         body=pathlib.Path(image.path),
         context={'image_path': image.path},
         progressText='Uploading {}'.format(image.filename),
         timeout=None
     )
 
+
+
+def test_upload_invalidates_image_listing(image, controller, callback):
+    manager = ImageUploadManager(image, controller, 'compute_id', callback)
+    with unittest.mock.patch('gns3.image_catalogue.ImageCatalogue.invalidate') as invalidate_mock:
+        manager._uploadedCallback({}, error=True)
+        assert not invalidate_mock.called
+        callback.assert_called_with({}, True)
+        manager._uploadedCallback({})
+        invalidate_mock.assert_called_with('compute_id', 'qemu')
+        callback.assert_called_with({}, False)
@@ -365,3 +365,48 @@ def test_migrateRemoveInternetVM(tmpdir):
 
 def test_runAsRootPath(local_config):
     assert 'run_as_root' in local_config.runAsRootPath()
+
+
+def test_loadSectionSettingsCopy(local_config):
+
+    settings = local_config.loadSectionSettings("Test", {"a": {"b": 1}})
+    settings["a"]["b"] = 2
+    assert local_config.loadSectionSettings("Test", {"a": {"b": 1}}) == {"a": {"b": 1}}
+
+
+def test_writeConfigBatched(local_config):
+
+    local_config.flushConfig()
+    with patch.object(local_config, "_writeConfig", wraps=local_config._writeConfig) as write_config_mock:
+        local_config.saveSectionSettings("Test", {"a": 1})
+        local_config.saveSectionSettings("Test", {"a": 2})
+        assert not write_config_mock.called
+        local_config.flushConfig()
+        assert write_config_mock.call_count == 1
+
+    with open(local_config.configFilePath(), encoding="utf-8") as f:
+        assert json.load(f)["Test"] == {"a": 2}
+
+
+def test_configFileChanged(local_config):
+
+    local_config.flushConfig()
+    local_config.watchConfigFile()
+    assert local_config.configFilePath() in local_config._watcher.files()
+
+    config_changed = MagicMock()
+    local_config.config_changed_signal.connect(config_changed)
+
+    # the file is replaced by another process
+    with open(local_config.configFilePath(), encoding="utf-8") as f:
+        settings = json.load(f)
+    settings["Test"] = {"a": "external"}
+    os.remove(local_config.configFilePath())
+    with open(local_config.configFilePath(), "w", encoding="utf-8") as f:
+        json.dump(settings, f)
+    os.utime(local_config.configFilePath(), (local_config._last_config_changed + 10, local_config._last_config_changed + 10))
+
+    local_config._configFileChangedSlot(local_config.configFilePath())
+    assert config_changed.called
+    assert local_config.loadSectionSettings("Test", {}) == {"a": "external"}
+    assert local_config.configFilePath() in local_config._watcher.files()
@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import sys
 import pytest
 import logging
@@ -75,6 +76,7 @@ def test_startLocalServer(tmpdir, local_server, local_server_path):
     logging.getLogger().setLevel(logging.DEBUG)  # Make sure we are using debug level in order to get the --debug
 
     process_mock = MagicMock()
+    process_mock.stdout = io.BytesIO(b"Server output\n")
     with patch("subprocess.Popen", return_value=process_mock) as mock:
 
         # If everything work fine the command is still running and a timeout is raised
@@ -86,7 +88,12 @@ def test_startLocalServer(tmpdir, local_server, local_server_path):
                                  '--debug',
                                  '--log=' + str(tmpdir / "gns3_server.log"),
                                  '--pid=' + str(tmpdir / "gns3_server.pid")
-                                 ], stderr=unittest.mock.ANY, env=unittest.mock.ANY)
+                                 ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=unittest.mock.ANY)
+
+        LocalServer.instance()._output_reader.join(timeout=5)
+        assert LocalServer.instance()._output_reader.tail() == ["Server output"]
+        with open(str(tmpdir / "gns3_server_output.log")) as f:
+            assert "Server output" in f.read()
 
 
 def test_killAlreadyRunningServer(local_server):
@@ -98,3 +105,12 @@ def test_killAlreadyRunningServer(local_server):
         LocalServer.instance()._killAlreadyRunningServer()
         mock.assert_called_with(pid=42)
         assert mock_process.kill.called
+
+
+def test_isLocalServerRunning(local_server):
+
+    with patch("gns3.local_server.probe_server", return_value="ready") as mock:
+        assert local_server.isLocalServerRunning()
+        assert mock.call_args[0] == (local_server._settings["host"], local_server._settings["port"])
+    with patch("gns3.local_server.probe_server", return_value="listening"):
+        assert not local_server.isLocalServerRunning()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import tracemalloc
+
+from gns3.qt import QtCore, sip
+from gns3.console_cmd import ConsoleCmd
+from gns3.memory_monitor import MemoryMonitor, approximate_size
+
+
+class LeakedObject(QtCore.QObject):
+    pass
+
+
+def test_approximate_size():
+
+    data = {"name": "a" * 1000, "ports": [{"name": "b" * 1000}]}
+    assert approximate_size(data) > 2000
+    assert approximate_size(data, depth=0) == sys.getsizeof(data)
+
+    # shared objects are counted once
+    shared = "c" * 1000
+    assert approximate_size([shared, shared]) < 2 * sys.getsizeof(shared)
+
+
+def test_usage(controller):
+
+    monitor = MemoryMonitor()
+    monitor.addProbe("Test", lambda: (3, 42))
+    monitor.addProbe("Broken", lambda: 1 / 0)
+    usage = {name: (count, size) for name, count, size in monitor.usage()}
+    assert usage["Test"] == (3, 42)
+    assert "Broken" not in usage
+    assert "Topology" in usage
+    assert "HTTP buffers" in usage
+
+    controller._http_client._buffer = {"query": "{" * 100}
+    usage = {name: (count, size) for name, count, size in monitor.usage()}
+    assert usage["HTTP buffers"][0] == 1
+    assert usage["HTTP buffers"][1] > 100
+    assert "HTTP buffers" in monitor.report()
+
+
+def test_trace_diff():
+
+    monitor = MemoryMonitor()
+    assert "not started" in monitor.diff()
+    monitor.startTracing()
+    try:
+        assert tracemalloc.is_tracing()
+        allocated = [bytearray(1000) for _ in range(100)]
+        diff = monitor.diff()
+        assert "test_memory_monitor.py" in diff
+        assert len(allocated) == 100
+    finally:
+        monitor.stopTracing()
+    assert not tracemalloc.is_tracing()
+
+
+def test_deleted_qt_objects():
+
+    leaked = LeakedObject()
+    sip.delete(leaked)
+    leaks = MemoryMonitor.deletedQtObjects()
+    assert leaks["LeakedObject"] == 1
+    assert "LeakedObject" in MemoryMonitor.instance().leakReport()
+
+    del leaked
+    assert "LeakedObject" not in MemoryMonitor.deletedQtObjects()
+
+
+def test_console_memory(capsys):
+
+    ConsoleCmd().do_memory("")
+    out, _ = capsys.readouterr()
+    assert "Subsystem" in out
+
+    ConsoleCmd().do_memory("trace start")
+    ConsoleCmd().do_memory("diff")
+    out, _ = capsys.readouterr()
+    assert "Allocations since" in out
+    ConsoleCmd().do_memory("trace stop")
+    assert not tracemalloc.is_tracing()
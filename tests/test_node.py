@@ -143,6 +143,67 @@ def test_updatePorts_PortChange(vpcs_device):
     assert port.status() == Port.started
 
 
+def test_getPort(vpcs_device):
+    vpcs_device._updatePorts([
+        {
+            "name": "Ethernet{}".format(port_number),
+            "short_name": "e{}".format(port_number),
+            "data_link_types": {"Ethernet": "DLT_EN10MB"},
+            "port_number": port_number,
+            "adapter_number": 0,
+            "link_type": "ethernet"
+        } for port_number in range(64)
+    ])
+    port = vpcs_device.getPort(0, 42)
+    assert port.name() == "Ethernet42"
+    assert vpcs_device.getPortFromName("Ethernet42") == port
+    assert vpcs_device.getPort(1, 42) is None
+    assert vpcs_device.getPortFromName("Serial0") is None
+
+    # renamed port
+    port.setName("Gi42")
+    assert vpcs_device.getPortFromName("Gi42") == port
+    assert vpcs_device.getPortFromName("Ethernet42") is None
+
+    # ports added without updating the index
+    new_port = EthernetPort("Ethernet64")
+    new_port.setAdapterNumber(0)
+    new_port.setPortNumber(64)
+    vpcs_device._ports.append(new_port)
+    assert vpcs_device.getPort(0, 64) == new_port
+    assert not hasattr(new_port, "__dict__")
+
+
+def test_updateNodeCallback_changes(vpcs_device):
+    vpcs_device.createNodeCallback({
+        "name": "PC 1",
+        "node_id": str(uuid.uuid4()),
+        "status": "stopped",
+        "x": 10,
+        "y": 20,
+        "console": 5000,
+        "properties": {
+            "startup_script": "echo TEST"
+        }
+    })
+
+    changes = []
+    updated = MagicMock()
+    vpcs_device.changed_signal.connect(changes.append)
+    vpcs_device.updated_signal.connect(updated)
+
+    vpcs_device.updateNodeCallback({"name": "PC 1", "status": "started", "x": 10, "y": 20, "console": 5001})
+    assert changes == [frozenset({"status", "console"})]
+    assert updated.called
+
+    vpcs_device.updateNodeCallback({"name": "PC 2", "x": 15, "y": 20, "properties": {"startup_script": "echo TEST2"}})
+    assert changes[-1] == frozenset({"name", "position", "properties"})
+
+    # nothing has changed
+    vpcs_device.updateNodeCallback({"name": "PC 2", "status": "started", "x": 15, "y": 20})
+    assert len(changes) == 2
+
+
 def test_node_setGraphics(vpcs_device):
     node = MagicMock(
         pos=MagicMock(
@@ -180,4 +241,16 @@ def test_node_setGraphics(vpcs_device):
         vpcs_device.setSettingValue('label', node.label().dump())
 
         vpcs_device.setGraphics(node)
-        assert mock.call_count == 1
\ No newline at end of file
+        assert mock.call_count == 1
+
+def test_vpcs_device_start_callback(vpcs_device):
+
+    callback = MagicMock()
+    with patch('gns3.base_node.BaseNode.controllerHttpPost') as mock:
+        assert vpcs_device.start(callback=callback)
+        args, kwargs = mock.call_args
+        args[1]({"message": "error"}, error=True)
+        callback.assert_called_with({"message": "error"}, error=True)
+
+    vpcs_device.setStatus(Node.started)
+    assert vpcs_device.start() is False
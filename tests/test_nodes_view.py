@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from gns3.qt import QtCore
+from gns3.template_manager import TemplateManager
+from gns3.nodes_view import NodesView
+
+
+def _template(template_id, name, category="router"):
+    return {
+        "template_id": template_id,
+        "name": name,
+        "category": category,
+        "symbol": ":/symbols/router.svg",
+        "builtin": False,
+        "template_type": "vpcs"
+    }
+
+
+@pytest.fixture
+def template_manager(controller):
+
+    controller._connected = True
+    TemplateManager._instance = None
+    manager = TemplateManager.instance()
+    manager._listTemplatesCallback([
+        _template("a", "Router A"),
+        _template("b", "Switch B", "switch"),
+        _template("c", "Router C")
+    ])
+    yield manager
+    TemplateManager._instance = None
+
+
+def _names(view):
+    model = view.model()
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def test_populateNodesView(template_manager):
+
+    view = NodesView()
+    view.populateNodesView(None, "")
+    assert _names(view) == ["Router A", "Router C", "Switch B"]
+
+    view.populateNodesView("router", "")
+    assert _names(view) == ["Router A", "Router C"]
+
+
+def test_setCurrentSearch(template_manager):
+
+    view = NodesView()
+    view.populateNodesView(None, "")
+    view.setCurrentSearch("ROUTER")
+    assert _names(view) == ["Router A", "Router C"]
+    view.setCurrentSearch("router c")
+    assert _names(view) == ["Router C"]
+    view.setCurrentSearch("")
+    assert len(_names(view)) == 3
+
+
+def test_templateRowChanges(template_manager):
+
+    view = NodesView()
+    view.populateNodesView(None, "")
+    model = view._model
+
+    reset = []
+    model.modelReset.connect(lambda: reset.append(True))
+
+    template_manager.templateDataReceivedCallback(_template("d", "Cloud D", "guest"))
+    assert _names(view) == ["Cloud D", "Router A", "Router C", "Switch B"]
+
+    template_manager.templateDataReceivedCallback(_template("a", "Router Z"))
+    assert _names(view) == ["Cloud D", "Router C", "Router Z", "Switch B"]
+    assert model.searchIndex()["a"] == ("router z", "router")
+
+    template_manager.deleteTemplateCallback({"template_id": "c"})
+    assert _names(view) == ["Cloud D", "Router Z", "Switch B"]
+    assert reset == []
+
+
+def test_iconCachedPerSymbol(template_manager, controller):
+
+    view = NodesView()
+    view.populateNodesView(None, "")
+    for row in range(view.model().rowCount()):
+        view.model().index(row, 0).data(QtCore.Qt.ItemDataRole.DecorationRole)
+
+    # all the templates share the same symbol so only one download is queued
+    assert len(controller._static_asset_download_queue) == 1
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from unittest.mock import MagicMock
+
 from gns3.progress import Progress
 
 
@@ -38,3 +40,14 @@ def test_context():
         assert progress._allow_cancel_query is True
     assert progress._cancel_button_text == ""
     assert progress._allow_cancel_query is False
+
+
+def test_cancel_without_response():
+
+    progress = Progress(None)
+    response = MagicMock()
+    progress._queries["a"] = {"explanation": "Hello", "current": 0, "maximum": 0, "response": response}
+    progress._queries["b"] = {"explanation": "Hello", "current": 0, "maximum": 0, "response": None}
+    with progress.context(allow_cancel_query=True):
+        progress._cancelSlot()
+    assert response.abort.called
@@ -188,3 +188,24 @@ def test_project_update(controller):
     assert body['variables'] == [{'name': 'TEST'}]
     assert body['supplier'] == {'logo': 'test.png', 'url':  'http://domain'}
 
+
+
+def test_project_listing_reconciled_once(controller):
+
+    project = Project()
+    project.setId(str(uuid4()))
+    node = {"node_id": "n1", "name": "PC1"}
+    with patch("gns3.project.Topology") as topology_mock:
+        topo = topology_mock.instance.return_value
+        project._listNodesCallback([node])
+        project._event_received({"action": "node.updated", "event": {"node_id": "n1", "name": "PC2"}})
+        project._listLinksCallback([])
+        assert not topo.reconcileNodes.called
+        project._listDrawingsCallback([])
+
+    # the three listings are synchronized in a single bulk scene mutation
+    assert topo.bulkSceneMutation.call_count == 1
+    topo.reconcileNodes.assert_called_with([{"node_id": "n1", "name": "PC2"}])
+    topo.reconcileLinks.assert_called_with([])
+    topo.reconcileDrawings.assert_called_with([])
+    topo.setSyncing.assert_called_with(False)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import threading
+from unittest.mock import patch
+
+from gns3.qt import QtCore, qslot, running_slot
+from gns3.console_cmd import ConsoleCmd
+from gns3.stall_watchdog import StallWatchdog
+
+
+class BlockingObject(QtCore.QObject):
+
+    @qslot
+    def blockingSlot(self, duration):
+
+        assert running_slot(threading.get_ident()) == "BlockingObject.blockingSlot"
+        time.sleep(duration)
+
+
+def test_running_slot():
+
+    BlockingObject().blockingSlot(0)
+    assert running_slot(threading.get_ident()) is None
+
+
+def test_stall_recorded():
+
+    # the heartbeats are sent by the test instead of the event loop
+    watchdog = StallWatchdog(threshold=0.1)
+    watchdog.start()
+    try:
+        watchdog._heartbeatSlot()
+        assert watchdog.stalls() == []
+
+        BlockingObject().blockingSlot(0.6)
+        watchdog._heartbeatSlot()
+    finally:
+        watchdog.stop()
+
+    stalls = watchdog.stalls()
+    assert len(stalls) == 1
+    stall = stalls[0]
+    assert stall.duration >= 0.4
+    assert stall.slot == "BlockingObject.blockingSlot"
+    assert stall.samples > 0
+    assert "time.sleep(duration)" in "".join(stall.stack)
+    assert "blocked for" in watchdog.report()
+
+    watchdog.clear()
+    assert watchdog.stalls() == []
+    assert "No GUI stall" in watchdog.report()
+
+
+def test_ring_buffer():
+
+    with patch("gns3.stall_watchdog.StallWatchdog.MAX_STALLS", 2):
+        watchdog = StallWatchdog()
+    for index in range(3):
+        watchdog._samples[("stack {}".format(index),)] += 1
+        watchdog._heartbeatSlot()
+    assert [stall.stack for stall in watchdog.stalls()] == [["stack 1"], ["stack 2"]]
+
+    # without samples the heartbeat does not record a stall
+    watchdog._heartbeatSlot()
+    assert len(watchdog.stalls()) == 2
+
+
+def test_console_stalls(capsys):
+
+    watchdog = StallWatchdog.instance()
+    watchdog._samples[("  File \"test.py\", line 1, in slow\n",)] += 2
+    watchdog._heartbeatSlot()
+
+    ConsoleCmd().do_stalls("")
+    out, _ = capsys.readouterr()
+    assert "blocked for" in out
+    assert "in slow" in out
+
+    ConsoleCmd().do_stalls("clear")
+    assert watchdog.stalls() == []
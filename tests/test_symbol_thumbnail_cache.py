@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from unittest.mock import patch
+
+from gns3.symbol_thumbnail_cache import SymbolThumbnailCache
+
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}"><rect width="{size}" height="{size}" fill="red"/></svg>'
+
+
+def _symbol(tmpdir, name, size):
+    path = str(tmpdir / name)
+    with open(path, "w") as f:
+        f.write(SVG.format(size=size))
+    return path
+
+
+def test_update_and_thumbnail(tmpdir):
+
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    assert cache.thumbnail("router.svg") is None
+
+    icon = cache.update("router.svg", _symbol(tmpdir, "router.svg", 10))
+    assert not icon.isNull()
+    assert cache.thumbnail("router.svg") is icon
+    assert len([f for f in os.listdir(str(tmpdir / "cache")) if f.endswith(".png")]) == 1
+
+    # the thumbnails survive a restart
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    assert cache.thumbnail("router.svg") is not None
+
+
+def test_thumbnail_rendered_once_per_content(tmpdir):
+
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    with patch("gns3.symbol_thumbnail_cache.SymbolThumbnailCache._render", wraps=cache._render) as render:
+        cache.update("a.svg", _symbol(tmpdir, "a.svg", 10))
+        cache.update("b.svg", _symbol(tmpdir, "b.svg", 10))
+        assert render.call_count == 1
+        assert cache.contentHash("a.svg") == cache.contentHash("b.svg")
+
+        # the content of a symbol changed
+        cache.update("a.svg", _symbol(tmpdir, "a.svg", 20))
+        assert render.call_count == 2
+        assert cache.contentHash("a.svg") != cache.contentHash("b.svg")
+
+
+def test_invalidate(tmpdir):
+
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    cache.update("a.svg", _symbol(tmpdir, "a.svg", 10))
+    cache.invalidate("a.svg")
+    assert cache.thumbnail("a.svg") is None
+
+
+def test_thumbnail_version(tmpdir):
+
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    icon = cache.update(":/symbols/router.svg", _symbol(tmpdir, "router.svg", 10), "2.2.0")
+    assert cache.thumbnail(":/symbols/router.svg", "2.2.0") is icon
+
+    # the built-in symbols may have changed with the controller version
+    cache = SymbolThumbnailCache(directory=str(tmpdir / "cache"))
+    assert cache.thumbnail(":/symbols/router.svg", "2.3.0") is None
+    assert cache.thumbnail(":/symbols/router.svg") is None
+    cache.update(":/symbols/router.svg", _symbol(tmpdir, "router.svg", 20), "2.3.0")
+    assert cache.thumbnail(":/symbols/router.svg", "2.3.0") is not None
+    assert cache.thumbnail(":/symbols/router.svg", "2.2.0") is None
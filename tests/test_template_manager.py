@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from unittest.mock import MagicMock
+
+from gns3.template import Template
+from gns3.template_manager import TemplateManager
+
+
+def _template(template_id, name):
+    return {
+        "template_id": template_id,
+        "name": name,
+        "category": "router",
+        "symbol": ":/symbols/router.svg",
+        "builtin": False,
+        "template_type": "vpcs"
+    }
+
+
+@pytest.fixture
+def template_manager(controller):
+
+    controller._connected = True
+    TemplateManager._instance = None
+    yield TemplateManager.instance()
+    TemplateManager._instance = None
+
+
+def test_listTemplatesCallbackDiff(template_manager):
+
+    template_manager._listTemplatesCallback([_template("a", "A"), _template("b", "B")])
+
+    created = MagicMock()
+    updated = MagicMock()
+    deleted = MagicMock()
+    template_manager.created_signal.connect(created)
+    template_manager.updated_signal.connect(updated)
+    template_manager.deleted_signal.connect(deleted)
+
+    template_manager._listTemplatesCallback([_template("a", "A"), _template("b", "B2"), _template("c", "C")])
+    created.assert_called_once_with("c")
+    updated.assert_called_once_with("b")
+    assert not deleted.called
+    assert template_manager.getTemplate("b").name() == "B2"
+
+    template_manager._listTemplatesCallback([_template("c", "C")])
+    assert sorted(call[0][0] for call in deleted.call_args_list) == ["a", "b"]
+    assert list(template_manager.templates()) == ["c"]
+
+
+def test_updateList(template_manager, controller):
+
+    template_manager._listTemplatesCallback([_template("a", "A"), _template("b", "B")])
+    controller._http_client.createHTTPQuery.reset_mock()
+
+    template_manager.updateList([Template(_template("b", "B2")), Template(_template("c", "C"))])
+    calls = [call[0][:2] for call in controller._http_client.createHTTPQuery.call_args_list]
+    assert ("DELETE", "/templates/a") in calls
+    assert ("PUT", "/templates/b") in calls
+    assert ("POST", "/templates") in calls
+    assert len(calls) == 3
+
+
+def test_templatesCache(template_manager, controller):
+
+    template_manager._listTemplatesCallback([_template("a", "A"), _template("b", "B")])
+
+    # a new manager (e.g. on the next start) is populated from the cache
+    TemplateManager._instance = None
+    controller._connected = False
+    cached_manager = TemplateManager.instance()
+    assert sorted(cached_manager.templates()) == ["a", "b"]
+
+    # and is revalidated once the controller sends its list
+    controller._connected = True
+    cached_manager._listTemplatesCallback([_template("b", "B")])
+    assert list(cached_manager.templates()) == ["b"]
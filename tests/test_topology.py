@@ -32,6 +32,22 @@ def test_topology_node(vpcs_device):
     assert topology.getNode(vpcs_device.id()) == vpcs_device
     topology.removeNode(vpcs_device)
     assert len(topology.nodes()) == 0
+    assert topology.getNode(vpcs_device.id()) is None
+
+
+def test_topology_getNodeFromName(vpcs_device):
+    topology = Topology()
+    topology.addNode(vpcs_device)
+    assert topology.getNodeFromName("VPCS 1") == vpcs_device
+    assert topology.getNodeFromName("PC1") is None
+
+    # the index follows node renames
+    vpcs_device._settings["name"] = "PC1"
+    assert topology.getNodeFromName("PC1") == vpcs_device
+    assert topology.getNodeFromName("VPCS 1") is None
+
+    topology.removeNode(vpcs_device)
+    assert topology.getNodeFromName("PC1") is None
 
 
 def test_createDrawing_ellipse():
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import copy
+import uuid
+
+import pytest
+from unittest.mock import MagicMock
+
+from gns3.qt import QtWidgets
+from gns3.graphics_view import GraphicsView
+from gns3.project import Project
+from gns3.topology import Topology
+from gns3.topology_snapshot_cache import TopologySnapshotCache
+
+
+def _node(name, x, y):
+
+    return {
+        "node_id": str(uuid.uuid4()),
+        "node_type": "vpcs",
+        "compute_id": "local",
+        "name": name,
+        "status": "stopped",
+        "console": None,
+        "console_type": "telnet",
+        "command_line": "vpcs -p 5000",
+        "x": x,
+        "y": y,
+        "z": 1,
+        "locked": False,
+        "symbol": ":/symbols/vpcs_guest.svg",
+        "label": {"text": name, "x": 0, "y": -25, "rotation": 0, "style": ""},
+        "properties": {},
+        "ports": [{"name": "Ethernet0", "short_name": "e0", "adapter_number": 0, "port_number": 0,
+                   "link_type": "ethernet", "data_link_types": {"Ethernet": "DLT_EN10MB"}}]
+    }
+
+
+def _link(node1, node2):
+
+    return {
+        "link_id": str(uuid.uuid4()),
+        "link_type": "ethernet",
+        "capturing": False,
+        "filters": {},
+        "suspend": False,
+        "nodes": [
+            {"node_id": node1["node_id"], "adapter_number": 0, "port_number": 0, "label": {"text": "e0"}},
+            {"node_id": node2["node_id"], "adapter_number": 0, "port_number": 0, "label": {"text": "e0"}}
+        ]
+    }
+
+
+def _drawing(x, y, text):
+
+    return {
+        "drawing_id": str(uuid.uuid4()),
+        "x": x,
+        "y": y,
+        "z": 2,
+        "locked": False,
+        "rotation": 0,
+        "svg": '<svg height="50" width="100"><text>{}</text></svg>'.format(text)
+    }
+
+
+class StandInController:
+    """
+    Answers the project queries with a topology, the answers
+    are delivered when flush() is called.
+    """
+
+    def __init__(self, nodes, links, drawings):
+
+        self.topology = {"/nodes": nodes, "/links": links, "/drawings": drawings}
+        self._pending = []
+
+    def createHTTPQuery(self, method, path, callback, body=None, **kwargs):
+
+        if path.endswith("/open"):
+            self._pending.append((callback, {"project_id": path.split("/")[2], "name": "test", "status": "opened"}))
+        else:
+            for suffix, items in self.topology.items():
+                if path.endswith(suffix):
+                    # each answer is a new JSON document
+                    self._pending.append((callback, copy.deepcopy(items)))
+
+    def flush(self):
+
+        while self._pending:
+            callback, result = self._pending.pop(0)
+            callback(result)
+
+
+@pytest.fixture
+def scene(controller):
+
+    window = QtWidgets.QMainWindow()
+    window.uiTopologySummaryTreeWidget = MagicMock()
+    main_window = MagicMock()
+    main_window.uiGraphicsView = GraphicsView(QtWidgets.QWidget(window))
+    main_window.uiGraphicsView._main_window = main_window
+    topology = Topology.instance()
+    previous_main_window = topology._main_window
+    topology.setMainWindow(main_window)
+    yield main_window.uiGraphicsView
+    topology.setProject(None)
+    topology.reset()
+    topology.setMainWindow(previous_main_window)
+    window.deleteLater()
+
+
+def _open(controller, stand_in, project_id):
+
+    controller._http_client.createHTTPQuery.side_effect = stand_in.createHTTPQuery
+    project = Project()
+    project.setId(project_id)
+    Topology.instance().setProject(project)
+    project.load()
+    return project
+
+
+def _state():
+
+    topology = Topology.instance()
+    nodes = sorted((node.node_id(), node.name(), node.settings()["x"], node.settings()["y"], node.settings()["symbol"]) for node in topology.nodes())
+    links = sorted((link.link_id(), tuple(sorted([link.sourceNode().node_id(), link.destinationNode().node_id()]))) for link in topology.links())
+    drawings = sorted((drawing.drawing_id(), drawing.pos().x(), drawing.pos().y(), drawing.zValue()) for drawing in topology.drawings())
+    return {"nodes": nodes, "links": links, "drawings": drawings}
+
+
+def test_save_load(tmpdir):
+
+    cache = TopologySnapshotCache(str(tmpdir))
+    project_id = str(uuid.uuid4())
+    node = _node("PC1", 10, 20)
+    cache.save(project_id, [node], [], [_drawing(0, 0, "hello")])
+
+    snapshot = cache.load(project_id)
+    assert snapshot["nodes"][0]["name"] == "PC1"
+    assert "command_line" not in snapshot["nodes"][0]
+    assert snapshot["symbols"] == [":/symbols/vpcs_guest.svg"]
+    assert len(snapshot["drawings"]) == 1
+    assert cache.load(str(uuid.uuid4())) is None
+
+    cache.remove(project_id)
+    assert cache.load(project_id) is None
+
+
+def test_load_invalid(tmpdir):
+
+    cache = TopologySnapshotCache(str(tmpdir))
+    project_id = str(uuid.uuid4())
+    with open(os.path.join(str(tmpdir), project_id + ".json.gz"), "wb") as f:
+        f.write(b"not gzip")
+    assert cache.load(project_id) is None
+
+
+def test_prune(tmpdir):
+
+    cache = TopologySnapshotCache(str(tmpdir))
+    cache.MAX_PROJECTS = 2
+    project_ids = [str(uuid.uuid4()) for _ in range(3)]
+    for mtime, project_id in enumerate(project_ids):
+        cache.save(project_id, [], [], [])
+        os.utime(os.path.join(str(tmpdir), project_id + ".json.gz"), (mtime, mtime))
+    cache.save(project_ids[2], [], [], [])
+    assert cache.load(project_ids[0]) is None
+    assert cache.load(project_ids[1]) is not None
+    assert cache.load(project_ids[2]) is not None
+
+
+def _reopen(controller, last_seen, current):
+    """
+    Opens a project whose topology was last seen as last_seen and is now current,
+    returns the state after the reconciliation and the state after a cold load.
+    """
+
+    project_id = str(uuid.uuid4())
+
+    # cold load, without snapshot
+    stand_in = StandInController(*last_seen)
+    _open(controller, stand_in, project_id)
+    assert not Topology.instance().nodes()
+    stand_in.flush()
+    last_seen_state = _state()
+    assert TopologySnapshotCache.instance().load(project_id) is not None
+    Topology.instance().setProject(None)
+
+    # the last seen topology is displayed before any answer
+    stand_in = StandInController(*current)
+    _open(controller, stand_in, project_id)
+    assert _state() == last_seen_state
+    assert Topology.instance().syncing()
+    assert not Topology.instance()._main_window.uiGraphicsView.isInteractive()
+    stand_in.flush()
+    assert not Topology.instance().syncing()
+    assert Topology.instance()._main_window.uiGraphicsView.isInteractive()
+    reconciled_state = _state()
+    Topology.instance().setProject(None)
+
+    TopologySnapshotCache.instance().remove(project_id)
+    stand_in = StandInController(*current)
+    _open(controller, stand_in, project_id)
+    stand_in.flush()
+    return reconciled_state, _state()
+
+
+def test_reopen_from_snapshot_matches_cold_load(controller, local_server, main_window, scene):
+
+    main_window.uiSnapToGridAction.isChecked.return_value = False
+    pc1 = _node("PC1", 0, 0)
+    pc2 = _node("PC2", 100, 0)
+    pc3 = _node("PC3", 200, 0)
+    link = _link(pc1, pc2)
+    drawing = _drawing(50, 50, "lab")
+    stale_drawing = _drawing(0, 100, "old")
+    new_drawing = _drawing(10, 10, "new")
+
+    reconciled_state, cold_state = _reopen(controller,
+                                           ([pc1, pc2], [link], [drawing, stale_drawing]),
+                                           ([dict(pc1, x=300, y=400, name="PC1-renamed"), pc2, pc3], [_link(pc1, pc3)], [dict(drawing, x=70), new_drawing]))
+    assert reconciled_state == cold_state
+    assert len(cold_state["nodes"]) == 3
+    assert ("PC1-renamed", 300, 400) in [node[1:4] for node in cold_state["nodes"]]
+    assert len(cold_state["links"]) == 1
+    assert len(cold_state["drawings"]) == 2
+
+
+def test_reopen_from_snapshot_deleted_node(controller, local_server, main_window, scene):
+
+    main_window.uiSnapToGridAction.isChecked.return_value = False
+    pc1 = _node("PC1", 0, 0)
+    pc2 = _node("PC2", 100, 0)
+    pc3 = _node("PC3", 200, 0)
+
+    reconciled_state, cold_state = _reopen(controller,
+                                           ([pc1, pc2, pc3], [_link(pc2, pc3)], []),
+                                           ([pc1, pc2], [], []))
+    assert reconciled_state == cold_state
+    assert len(cold_state["nodes"]) == 2
+    assert cold_state["links"] == []
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2016 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from unittest.mock import MagicMock
+
+from gns3.qt import QtCore
+from gns3.transfer_manager import Transfer, TransferManager
+
+
+def test_transfer_throughput_and_eta():
+
+    transfer = Transfer("id", "Uploading IOSv.qcow2", "upload")
+    assert transfer.percent() is None
+    assert transfer.eta() is None
+
+    transfer.update(0, 1000, now=transfer._started)
+    transfer.update(100, 1000, now=transfer._started + 1)
+    assert transfer.throughput() == 100
+    assert transfer.percent() == 10
+    assert transfer.eta() == 9
+
+    # unknown size
+    transfer.update(200, -1, now=transfer._started + 2)
+    assert transfer.percent() is None
+    assert transfer.eta() is None
+
+
+def test_transfer_manager():
+
+    transfer_manager = TransferManager.instance()
+    added = MagicMock()
+    updated = MagicMock()
+    removed = MagicMock()
+    transfer_manager.transfer_added_signal.connect(added)
+    transfer_manager.transfer_updated_signal.connect(updated)
+    transfer_manager.transfer_removed_signal.connect(removed)
+
+    cancel = MagicMock()
+    transfer_manager.addTransfer("id", "Exporting project", "download", cancel_callback=cancel)
+    added.assert_called_with("id")
+    transfer_manager.updateTransfer("id", 42, 100)
+    updated.assert_called_with("id", 42, 100)
+    assert transfer_manager.transfer("id").current() == 42
+
+    transfer_manager.cancelTransfer("id")
+    assert cancel.called
+    transfer_manager.removeTransfer("id")
+    removed.assert_called_with("id")
+    assert transfer_manager.transfers() == []
+
+
+def test_run_worker():
+
+    class Worker(QtCore.QObject):
+        error = QtCore.Signal(str, bool)
+        finished = QtCore.Signal()
+        updated = QtCore.Signal(int)
+
+        def run(self):
+            self.error.emit("Can't export the project", True)
+            self.finished.emit()
+
+    transfer_manager = TransferManager.instance()
+    worker = Worker()
+    transfer_manager.runWorker(worker)
+    assert worker not in transfer_manager._workers
+
+
+def test_transfers_dock_node_operation():
+
+    from gns3.transfers_dock_widget import TransfersDockWidget
+
+    dock = TransfersDockWidget()
+    transfer_manager = TransferManager.instance()
+    transfer_manager.addTransfer("id", "Starting nodes", "start", unit="nodes")
+    transfer_manager.updateTransfer("id", 2, 5)
+    progress_bar = dock._tree.itemWidget(dock._items["id"], TransfersDockWidget.PROGRESS_COLUMN)
+    assert progress_bar.format() == "2 nodes / 5 nodes"
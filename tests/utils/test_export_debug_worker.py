@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import zipfile
+from unittest.mock import patch, MagicMock
+
+from gns3.utils.export_debug_worker import ExportDebugWorker
+
+
+def test_export_debug_worker(tmpdir):
+
+    log_path = str(tmpdir / "gns3_gui.log")
+    with open(log_path, "w") as f:
+        for i in range(100):
+            f.write("line {}\n".format(i))
+    pcap_path = str(tmpdir / "capture.pcap")
+    with open(pcap_path, "wb") as f:
+        f.write(b"\x00" * 1000)
+    image_path = str(tmpdir / "image.png")
+    with open(image_path, "wb") as f:
+        f.write(b"png")
+
+    path = str(tmpdir / "debug.zip")
+    files = [(log_path, "gns3_gui.log"), (pcap_path, "capture.pcap"), (image_path, "image.png"), (str(tmpdir / "missing"), "missing")]
+    finished = MagicMock()
+    with patch("gns3.utils.export_debug_worker.ExportDebugWorker.LOG_SIZE_LIMIT", 100):
+        with patch("gns3.utils.export_debug_worker.get_debug_data", return_value="Version: test\n"):
+            worker = ExportDebugWorker(path, files, [("stalls.txt", "No GUI stall\n")])
+            worker.finished.connect(finished)
+            worker.run()
+    assert finished.called
+
+    with zipfile.ZipFile(path) as zip_file:
+        assert sorted(zip_file.namelist()) == ["capture.pcap", "debug.txt", "gns3_gui.log", "image.png", "stalls.txt"]
+        assert zip_file.getinfo("capture.pcap").compress_type == zipfile.ZIP_DEFLATED
+        assert zip_file.getinfo("image.png").compress_type == zipfile.ZIP_STORED
+        assert zip_file.read("capture.pcap") == b"\x00" * 1000
+        assert zip_file.read("stalls.txt") == b"No GUI stall\n"
+
+        # only the tail of the log file is exported
+        log_lines = zip_file.read("gns3_gui.log").decode().splitlines()
+        assert "truncated" in log_lines[0]
+        assert log_lines[-1] == "line 99"
+        assert "line 0" not in log_lines
+        assert log_lines[1].startswith("line ")
+
+        debug = zip_file.read("debug.txt").decode()
+        assert debug.startswith("Version: test")
+        assert "missing" in debug
+
+
+def test_export_debug_worker_cancel(tmpdir):
+
+    source = str(tmpdir / "big.bin")
+    with open(source, "wb") as f:
+        f.write(os.urandom(4096))
+
+    path = str(tmpdir / "debug.zip")
+    worker = ExportDebugWorker(path, [(source, "big.bin")])
+    worker.CHUNK_SIZE = 1024
+    worker.updated.connect(lambda progress: worker.cancel())
+    with patch("gns3.utils.export_debug_worker.get_debug_data", return_value=""):
+        worker.run()
+    assert not os.path.exists(path)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import logging
+
+from gns3.utils.server_output_reader import ServerOutputReader
+
+
+def test_read_output(tmpdir, caplog):
+
+    path = str(tmpdir / "server.log")
+    reader = ServerOutputReader(io.BytesIO(b"line 1\n\nline 2\n"), path=path)
+    with caplog.at_level(logging.DEBUG, logger="gns3.utils.server_output_reader"):
+        reader.start()
+        reader.join(5)
+    assert reader.tail() == ["line 1", "line 2"]
+    with open(path, encoding="utf-8") as f:
+        assert "line 2" in f.read()
+
+    # the server output is only repeated in the GUI log in debug mode
+    records = [record for record in caplog.records if "line 1" in record.getMessage()]
+    assert [record.levelno for record in records] == [logging.DEBUG]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2017 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import socket
+import threading
+import http.server
+
+import pytest
+from unittest.mock import MagicMock
+
+from gns3.utils.wait_for_local_server_worker import WaitForLocalServerWorker, probe_server, PROBE_READY, PROBE_LISTENING, PROBE_UNREACHABLE
+
+
+class VersionHandler(http.server.BaseHTTPRequestHandler):
+
+    body = {"version": "2.2.0", "local": True}
+
+    def do_GET(self):
+        data = json.dumps(self.body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), VersionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _unused_port():
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_probe_server(http_server):
+
+    assert probe_server("127.0.0.1", http_server.server_port) == PROBE_READY
+    assert probe_server("127.0.0.1", _unused_port()) == PROBE_UNREACHABLE
+
+
+def test_probe_server_not_gns3(http_server):
+
+    VersionHandler.body = {"name": "something else"}
+    try:
+        assert probe_server("0.0.0.0", http_server.server_port) == PROBE_LISTENING
+    finally:
+        VersionHandler.body = {"version": "2.2.0", "local": True}
+
+
+def test_wait_for_local_server_worker(http_server):
+
+    worker = WaitForLocalServerWorker({"host": "127.0.0.1"}, http_server.server_port)
+    worker.finished = MagicMock()
+    worker.error = MagicMock()
+    worker.run()
+    assert worker.finished.emit.called
+    assert not worker.error.emit.called
+    assert set(worker.timings()) == {"port_open", "ready"}
+    assert worker.attempts() == 1
+
+
+def test_wait_for_local_server_worker_process_stopped():
+
+    process = MagicMock()
+    process.poll.return_value = 1
+    process.returncode = 1
+    output_reader = MagicMock()
+    output_reader.tail.return_value = ["Traceback (most recent call last):", "OSError: port already in use"]
+
+    worker = WaitForLocalServerWorker({"host": "127.0.0.1"}, _unused_port(), process=process, output_reader=output_reader)
+    worker.finished = MagicMock()
+    worker.error = MagicMock()
+    worker.run()
+    assert not worker.finished.emit.called
+    message, stop = worker.error.emit.call_args[0]
+    assert "exit code 1" in message
+    assert "OSError: port already in use" in message
+    assert stop is True